@@ -0,0 +1,155 @@
+"""Benchmark DocrioModels/DocrioService generation across spec sizes.
+
+Each (case, phase) runs in a fresh process so peak RSS is attributable to that phase.
+Results are written as JSON; pass --compare to flag regressions against the committed
+benchmarks/baseline.json, or --compare FILE against an earlier results file. Refresh the
+baseline with --quick --output benchmarks/baseline.json when a change is meant to move it.
+
+Usage:
+    python benchmarks/bench_codegen.py [--output FILE] [--compare [FILE]] [--quick]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from docrio_spec import DocrioSpec
+from generate_docrio_models import ApexGenerator
+from generate_docrio_service import ServiceGenerator
+from synthetic_spec import synthetic_swagger
+
+# swagger.json is the baseline fixture; synthetic cases scale every knob together
+CASES: List[Dict[str, Any]] = [
+    {'name': 'swagger.json', 'spec_file': os.path.join(ROOT, 'swagger.json')},
+    {'name': 'small', 'schemas': 100, 'properties': 12, 'depth': 2, 'ref_fanout': 2, 'array_density': 0.1, 'operations': 100},
+    {'name': 'medium', 'schemas': 500, 'properties': 20, 'depth': 3, 'ref_fanout': 3, 'array_density': 0.15, 'operations': 500},
+    {'name': 'large', 'schemas': 2000, 'properties': 30, 'depth': 4, 'ref_fanout': 4, 'array_density': 0.2, 'operations': 2000},
+    {'name': 'deep', 'schemas': 200, 'properties': 10, 'depth': 12, 'ref_fanout': 1, 'array_density': 0.3, 'operations': 200},
+    {'name': 'fanout', 'schemas': 500, 'properties': 5, 'depth': 1, 'ref_fanout': 40, 'array_density': 0.0, 'operations': 500},
+]
+QUICK_CASES = ('swagger.json', 'small')
+PHASES = ('models', 'service')
+SHAPE_KEYS = ('schemas', 'properties', 'depth', 'ref_fanout', 'array_density', 'operations')
+MIN_WALL_DELTA = 0.01
+OUTPUT_FILES = {'models': 'DocrioModels.cls', 'service': 'DocrioService.cls'}
+# Committed quick-run results that --compare checks against by default
+BASELINE_FILE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+
+
+def build_swagger(case: Dict[str, Any]) -> Dict[str, Any]:
+    """Load the fixture or synthesize a spec for a benchmark case"""
+    if 'spec_file' in case:
+        with open(case['spec_file'], 'r') as f:
+            return json.load(f)
+    return synthetic_swagger(**{key: case[key] for key in SHAPE_KEYS})
+
+
+def run_phase(case: Dict[str, Any], phase: str) -> Dict[str, Any]:
+    """Run one generator phase; executed in a fresh worker process"""
+    swagger = build_swagger(case)
+    start = time.perf_counter()
+    spec = DocrioSpec(swagger)
+    compile_seconds = time.perf_counter() - start
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    with tempfile.TemporaryDirectory() as output_dir:
+        generator = ApexGenerator(spec) if phase == 'models' else ServiceGenerator(spec)
+        generator.output_dir = output_dir
+        start = time.perf_counter()
+        generator.generate()
+        wall_seconds = time.perf_counter() - start
+        output_path = os.path.join(output_dir, OUTPUT_FILES[phase])
+        output_bytes = os.path.getsize(output_path)
+        with open(output_path, 'rb') as f:
+            output_lines = sum(1 for _ in f)
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return {
+        'case': case['name'],
+        'phase': phase,
+        'compile_seconds': round(compile_seconds, 6),
+        'wall_seconds': round(wall_seconds, 6),
+        'peak_rss_kib': rss_after,
+        'rss_growth_kib': rss_after - rss_before,
+        'output_bytes': output_bytes,
+        'output_lines': output_lines
+    }
+
+
+def run_isolated(case: Dict[str, Any], phase: str) -> Dict[str, Any]:
+    """Run a phase in a freshly spawned process so ru_maxrss is not shared between runs"""
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        return pool.apply(run_phase, (case, phase))
+
+
+def compare(results: List[Dict[str, Any]], baseline_file: str, threshold: float) -> List[str]:
+    """Return messages for results that regressed beyond threshold against a baseline file"""
+    with open(baseline_file, 'r') as f:
+        baseline = {(r['case'], r['phase']): r for r in json.load(f)['results']}
+    regressions = []
+    for result in results:
+        previous = baseline.get((result['case'], result['phase']))
+        if previous is None:
+            continue
+        for metric in ('wall_seconds', 'peak_rss_kib', 'output_bytes'):
+            before, after = previous[metric], result[metric]
+            if metric == 'wall_seconds' and after - before < MIN_WALL_DELTA:
+                continue  # Sub-10ms differences are timer noise
+            if before and (after - before) / before > threshold:
+                regressions.append(f"{result['case']}/{result['phase']} {metric}: {before} -> {after} "
+                                   f"(+{(after - before) / before:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Docrio code generation')
+    parser.add_argument('--output', default=os.path.join(ROOT, 'benchmarks', 'results', 'codegen.json'),
+                        help='Where to write the JSON results')
+    parser.add_argument('--compare', nargs='?', const=BASELINE_FILE,
+                        help='Results file to check for regressions (default benchmarks/baseline.json)')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Relative increase treated as a regression by --compare')
+    parser.add_argument('--quick', action='store_true', help='Only run the fixture and the small synthetic case')
+    args = parser.parse_args()
+
+    cases = [case for case in CASES if not args.quick or case['name'] in QUICK_CASES]
+    results = []
+    print(f"{'case':<14} {'phase':<8} {'seconds':>9} {'peak RSS MiB':>13} {'output KiB':>11} {'lines':>8}")
+    for case in cases:
+        for phase in PHASES:
+            result = run_isolated(case, phase)
+            result['shape'] = {key: case[key] for key in SHAPE_KEYS if key in case}
+            results.append(result)
+            print(f"{case['name']:<14} {phase:<8} {result['wall_seconds']:>9.3f} "
+                  f"{result['peak_rss_kib'] / 1024:>13.1f} {result['output_bytes'] / 1024:>11.1f} {result['output_lines']:>8}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump({
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'results': results
+        }, f, indent=2)
+        f.write('\n')
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
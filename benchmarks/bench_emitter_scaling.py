@@ -0,0 +1,52 @@
+"""Show that model/service generation scales linearly with the number of schemas.
+
+Usage: python benchmarks/bench_emitter_scaling.py [max_schemas]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from docrio_spec import DocrioSpec
+from generate_docrio_models import ApexGenerator
+from generate_docrio_service import ServiceGenerator
+from synthetic_spec import synthetic_swagger
+
+
+def run(schema_count: int, output_dir: str):
+    spec = DocrioSpec(synthetic_swagger(schemas=schema_count, properties=20, depth=1, ref_fanout=0,
+                                        array_density=0.0, operations=schema_count))
+    tracemalloc.start()
+    start = time.perf_counter()
+    models = ApexGenerator(spec)
+    models.output_dir = output_dir
+    models.generate()
+    service = ServiceGenerator(spec)
+    service.output_dir = output_dir
+    service.generate()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = sum(os.path.getsize(os.path.join(output_dir, name)) for name in ('DocrioModels.cls', 'DocrioService.cls'))
+    return elapsed, peak, size
+
+
+def main():
+    max_schemas = int(sys.argv[1]) if len(sys.argv) > 1 else 3200
+    sizes = []
+    count = 100
+    while count <= max_schemas:
+        sizes.append(count)
+        count *= 2
+    print(f"{'schemas':>8} {'seconds':>9} {'us/schema':>10} {'peak MiB':>9} {'output MiB':>11}")
+    with tempfile.TemporaryDirectory() as output_dir:
+        for count in sizes:
+            elapsed, peak, size = run(count, output_dir)
+            print(f"{count:>8} {elapsed:>9.3f} {elapsed / count * 1e6:>10.1f} {peak / 2**20:>9.2f} {size / 2**20:>11.2f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark decoding large responses into generated slotted models against plain dicts.
+
+For each response a JSON payload with --records FileRecordObject records is built from
+the spec. The 'dict' path is json.loads plus reading every record property by key; the
+'model' path is json.loads, Model.from_json and reading every attribute. Time is the
+best of --repeat runs; memory is measured with tracemalloc, as the peak while decoding
+and the size still held once only the decoded result is kept.
+
+Usage:
+    python benchmarks/bench_models.py [--records N] [--repeat N] [--output FILE]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from docrio_client import models
+from docrio_mock_server import SyntheticData
+from docrio_spec import DocrioSpec
+
+# Response model -> its records property and the cursor properties that come with a page
+CASES: Dict[str, Dict[str, Any]] = {
+    'FilesRelatedGetResponse': {'items': 'Records', 'extra': {'NextBatch': {'OffsetId': 'a1E', 'OffsetValue': '1'}}},
+    'SearchPostResponse': {'items': 'Records', 'extra': {'paginationToken': 'token'}},
+}
+
+
+def build_payload(spec: DocrioSpec, case: str, records: int) -> bytes:
+    """A response body holding records distinct FileRecordObject records"""
+    data = SyntheticData(spec, random.Random(1))
+    template = data.value(spec.schemas['FileRecordObject'])
+    page = []
+    for _ in range(records):
+        record = dict(template)
+        record['Id'] = data.record_id()
+        page.append(record)
+    body = dict(CASES[case]['extra'], **{CASES[case]['items']: page})
+    return json.dumps(body).encode('utf-8')
+
+
+def decoders(spec: DocrioSpec, case: str) -> Dict[str, Callable[[bytes], Any]]:
+    """The dict and model decode paths for a case; each reads every record property once"""
+    model = models.MODELS[case]
+    items = CASES[case]['items']
+    read_record = itemgetter(*spec.schemas['FileRecordObject']['properties'])
+    read_model = attrgetter(*models.FileRecordObject.__slots__)
+
+    def decode_dict(payload: bytes) -> Any:
+        page = json.loads(payload)
+        for record in page[items]:
+            read_record(record)
+        return page
+
+    def decode_model(payload: bytes) -> Any:
+        page = model.from_json(json.loads(payload))
+        for record in getattr(page, items):
+            read_model(record)
+        return page
+
+    return {'dict': decode_dict, 'model': decode_model}
+
+
+def best_time(decode: Callable[[bytes], Any], payload: bytes, repeat: int) -> float:
+    """Fastest of repeat decodes, in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        decode(payload)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def memory(decode: Callable[[bytes], Any], payload: bytes) -> Dict[str, int]:
+    """Peak bytes allocated while decoding, and bytes still held by the decoded result"""
+    gc.collect()
+    tracemalloc.start()
+    result = decode(payload)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {'peak_bytes': peak, 'retained_bytes': retained}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark generated model decoding against plain dicts')
+    parser.add_argument('--records', type=int, default=20000, help='Records per response')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per decoder (the best is kept)')
+    parser.add_argument('--output', default=os.path.join(ROOT, 'benchmarks', 'results', 'models.json'),
+                        help='Where to write the JSON results')
+    args = parser.parse_args()
+
+    spec = DocrioSpec.load(os.path.join(ROOT, 'swagger.json'))
+    results: List[Dict[str, Any]] = []
+    print(f"{'response':<26} {'decoder':<7} {'seconds':>9} {'us/record':>10} {'peak MiB':>9} {'held MiB':>9}")
+    for case in CASES:
+        payload = build_payload(spec, case, args.records)
+        for name, decode in decoders(spec, case).items():
+            seconds = best_time(decode, payload, args.repeat)
+            result = dict(memory(decode, payload), case=case, decoder=name, records=args.records,
+                          payload_bytes=len(payload), seconds=round(seconds, 6))
+            results.append(result)
+            print(f"{case:<26} {name:<7} {seconds:>9.3f} {seconds / args.records * 1e6:>10.2f} "
+                  f"{result['peak_bytes'] / 2 ** 20:>9.1f} {result['retained_bytes'] / 2 ** 20:>9.1f}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump({
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'results': results
+        }, f, indent=2)
+        f.write('\n')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark the adaptive scheduler against a server-side rate limit.
+
+The mock server answers --rate-limit requests per second and 429 with Retry-After
+beyond that. --calls getFiles calls are started at once through a client with each
+scheduler setup. 'adaptive' uses the defaults, so it has to find the limit from
+the 429s. 'paced' is told the limit up front, which is what hand-tuned sleeps
+approximate. The benchmark reports the wall time, the achieved rate as a share of the
+limit, and how many 429s were sent.
+
+Usage:
+    python benchmarks/bench_scheduler.py [--calls N] [--rate-limit R] [--latency DIST] [--output FILE]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from docrio_client import DocrioAsyncClient, RequestScheduler
+from docrio_mock_server import MockDocrioServer
+from docrio_spec import DocrioSpec
+
+
+async def run(spec: DocrioSpec, scheduler: RequestScheduler, calls: int, rate_limit: float,
+              latency: str) -> Dict[str, Any]:
+    server = MockDocrioServer(spec, latency=latency, rate_limit=rate_limit)
+    async with server as base_url:
+        async with DocrioAsyncClient('token', 'key', base_url, scheduler=scheduler) as client:
+            started = time.perf_counter()
+            await asyncio.gather(*(client.getFiles(Ids='a1D000000000001AAA') for _ in range(calls)))
+            seconds = time.perf_counter() - started
+    stats = server.stats()
+    return {'seconds': round(seconds, 3), 'rate': round(calls / seconds, 1),
+            'throttled': stats['statuses'].get(429, 0), 'retries': scheduler.retries,
+            'final_limit': scheduler.snapshot()['families']['files']['limit']}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the adaptive scheduler against a rate-limited mock')
+    parser.add_argument('--calls', type=int, default=400, help='getFiles calls started at once')
+    parser.add_argument('--rate-limit', type=float, default=100.0, help='Requests per second the mock allows')
+    parser.add_argument('--latency', default='lognormal:20:0.5', help='Mock latency distribution')
+    parser.add_argument('--output', default=os.path.join(ROOT, 'benchmarks', 'results', 'scheduler.json'),
+                        help='Where to write the JSON results')
+    args = parser.parse_args()
+
+    spec = DocrioSpec.load(os.path.join(ROOT, 'swagger.json'))
+    setups = {
+        'adaptive': lambda: RequestScheduler(max_retries=20, seed=1),
+        'paced': lambda: RequestScheduler(rate=args.rate_limit, burst=1, concurrency=64, max_retries=20, seed=1),
+    }
+    results: List[Dict[str, Any]] = []
+    print(f"{'scheduler':<10} {'seconds':>8} {'calls/s':>8} {'of limit':>9} {'429s':>6} {'limit':>6}")
+    for name, make in setups.items():
+        result = asyncio.run(run(spec, make(), args.calls, args.rate_limit, args.latency))
+        results.append(dict(result, scheduler=name, calls=args.calls, rate_limit=args.rate_limit))
+        print(f"{name:<10} {result['seconds']:>8.2f} {result['rate']:>8.1f} "
+              f"{result['rate'] / args.rate_limit:>9.0%} {result['throttled']:>6} {result['final_limit']:>6}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump({
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'results': results
+        }, f, indent=2)
+        f.write('\n')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark generator startup with and without the compiled-spec cache.
+
+Startup is everything before the first fragment is rendered: loading the spec and
+running the prepare() passes of the Apex and Python model backends. 'cold' parses and
+resolves the spec; 'warm' loads the entry a previous run left in the cache. Cases are
+those of bench_codegen.py, written to temporary files. Time is the best of --repeat runs.
+
+Usage:
+    python benchmarks/bench_spec_cache.py [--repeat N] [--quick] [--output FILE]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_codegen import CASES, QUICK_CASES, build_swagger
+from codegen_cache import SpecCache
+from docrio_spec import DocrioSpec
+from generate_docrio import spec_cache_sources
+from generate_docrio_models import ApexGenerator
+from generate_docrio_python_models import PythonModelGenerator
+
+
+def start(spec: DocrioSpec):
+    """Run the backends' preparation passes"""
+    ApexGenerator(spec).prepare()
+    PythonModelGenerator(spec).prepare()
+
+
+def best_time(run, repeat: int) -> float:
+    """Fastest of repeat runs, in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        began = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - began)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark generator startup with the compiled-spec cache')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per case (the best is kept)')
+    parser.add_argument('--quick', action='store_true', help='Only run the fixture and the small synthetic case')
+    parser.add_argument('--output', default=os.path.join(ROOT, 'benchmarks', 'results', 'spec_cache.json'),
+                        help='Where to write the JSON results')
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+    print(f"{'case':<14} {'cold s':>9} {'warm s':>9} {'speedup':>8} {'entry KiB':>10}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        for case in CASES:
+            if args.quick and case['name'] not in QUICK_CASES:
+                continue
+            spec_file = case.get('spec_file') or os.path.join(work_dir, f"{case['name']}.json")
+            if 'spec_file' not in case:
+                with open(spec_file, 'w') as f:
+                    json.dump(build_swagger(case), f)
+            cache_dir = os.path.join(work_dir, f"{case['name']}-cache")
+
+            def cold():
+                start(DocrioSpec.load(spec_file))
+
+            def warm():
+                start(SpecCache(cache_dir, *spec_cache_sources()).load(spec_file))
+
+            seed = SpecCache(cache_dir, *spec_cache_sources())
+            start(seed.load(spec_file))
+            seed.save()
+            cold_seconds, warm_seconds = best_time(cold, args.repeat), best_time(warm, args.repeat)
+            entry_bytes = os.path.getsize(seed.entry_file(spec_file, None, False))
+            results.append({'case': case['name'], 'cold_seconds': round(cold_seconds, 6),
+                            'warm_seconds': round(warm_seconds, 6), 'entry_bytes': entry_bytes})
+            print(f"{case['name']:<14} {cold_seconds:>9.3f} {warm_seconds:>9.3f} "
+                  f"{cold_seconds / warm_seconds:>7.1f}x {entry_bytes / 1024:>10.1f}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump({
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'results': results
+        }, f, indent=2)
+        f.write('\n')
+
+if __name__ == '__main__':
+    main()
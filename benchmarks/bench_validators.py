@@ -0,0 +1,158 @@
+"""Benchmark the generated request validators against interpreting the schemas per request.
+
+Bodies for each case are built from the spec with SyntheticData; array properties hold
+--items entries, so the 'large' cases show the cost per array item. The 'generated'
+validator is validate_<Name> from docrio_client/validators.py. The 'interpreted' one
+walks the schema at call time: jsonschema's Draft 7 validator when jsonschema is
+installed, otherwise the small interpreter below, which checks the same rules as the
+generated code. Time per request is the best of --repeat runs of --calls validations.
+
+Usage:
+    python benchmarks/bench_validators.py [--calls N] [--items N] [--repeat N] [--output FILE]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from docrio_client import validators
+from docrio_mock_server import SyntheticData
+from docrio_spec import DocrioSpec, placeholder_property, ref_name
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+# Case -> (request schema, array_items for SyntheticData; None = --items)
+CASES = {
+    'MergePostRequest': ('MergePostRequest', 3),
+    'ArchivePostRequest': ('ArchivePostRequest', 3),
+    'FilesCombineRequest': ('FilesCombineRequest', 3),
+    'FilesCombineRequest (large)': ('FilesCombineRequest', None),
+    'MergeCompletePostRequest (large)': ('MergeCompletePostRequest', None),
+}
+
+JSON_TYPES = {'string': str, 'integer': int, 'number': (int, float), 'boolean': bool,
+              'array': (list, tuple), 'object': dict}
+
+
+class SchemaInterpreter:
+    """Validates a value by walking its schema on every call"""
+
+    def __init__(self, spec: DocrioSpec):
+        self.spec = spec
+
+    def check(self, schema: Any, value: Any, path: str, errors: List[str]):
+        if not isinstance(schema, dict):
+            return
+        if '$ref' in schema:
+            self.check(self.spec.schemas.get(ref_name(schema['$ref'])), value, path, errors)
+            return
+        kind = schema.get('type', 'object' if 'properties' in schema else None)
+        if kind not in JSON_TYPES:
+            return
+        numeric = kind in ('integer', 'number')
+        if not isinstance(value, JSON_TYPES[kind]) or (numeric and isinstance(value, bool)):
+            errors.append(f"{path}: expected {kind}")
+        elif 'enum' in schema and value not in schema['enum']:
+            errors.append(f"{path}: must be one of {schema['enum']}")
+        elif kind == 'string' and 'pattern' in schema and not re.search(schema['pattern'], value):
+            errors.append(f"{path}: does not match {schema['pattern']}")
+        elif kind == 'array':
+            for index, item in enumerate(value):
+                self.check(schema.get('items'), item, f"{path}[{index}]", errors)
+        elif kind == 'object':
+            properties = schema.get('properties', {})
+            declared = [name for name in properties if not placeholder_property(name)]
+            for name in self.spec.required_properties(schema):
+                if value.get(name) is None:
+                    errors.append(f"{path}.{name}: required")
+            for name in declared:
+                if value.get(name) is not None:
+                    self.check(properties[name], value[name], f"{path}.{name}", errors)
+            others = next((properties[name] for name in properties if placeholder_property(name)),
+                          schema.get('additionalProperties'))
+            if isinstance(others, dict):
+                for key, item in value.items():
+                    if key not in declared:
+                        self.check(others, item, f"{path}.{key}", errors)
+
+    def validator(self, name: str) -> Callable[[Any], None]:
+        schema = self.spec.schemas[name]
+
+        def validate(value: Any):
+            errors: List[str] = []
+            self.check(schema, value, 'requestBody', errors)
+            if errors:
+                raise validators.RequestValidationError(errors)
+        return validate
+
+
+def jsonschema_validator(spec: DocrioSpec, name: str) -> Callable[[Any], None]:
+    """A jsonschema validator resolving #/components/schemas refs against the spec"""
+    schema = dict(spec.schemas[name], components={'schemas': spec.schemas})
+    return jsonschema.Draft7Validator(schema).validate
+
+
+def per_call(validate: Callable[[Any], None], body: Any, calls: int, repeat: int) -> float:
+    """Best time of repeat runs of calls validations, in seconds per validation"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            validate(body)
+        best = min(best, time.perf_counter() - start)
+    return best / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark generated request validators')
+    parser.add_argument('--calls', type=int, default=2000, help='Validations per timed run')
+    parser.add_argument('--items', type=int, default=1000, help='Array items in the large cases')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per validator (the best is kept)')
+    parser.add_argument('--output', default=os.path.join(ROOT, 'benchmarks', 'results', 'validators.json'),
+                        help='Where to write the JSON results')
+    args = parser.parse_args()
+
+    spec = DocrioSpec.load(os.path.join(ROOT, 'swagger.json'))
+    interpreter = SchemaInterpreter(spec)
+    interpreted_by = 'jsonschema' if jsonschema is not None else 'interpreter'
+    results: List[Dict[str, Any]] = []
+    print(f"{'request':<34} {'validator':<12} {'us/request':>11} {'speedup':>8}")
+    for case, (name, items) in CASES.items():
+        data = SyntheticData(spec, random.Random(5), array_items=items or args.items)
+        body = json.loads(json.dumps(data.value(spec.schemas[name])))
+        paths = {
+            'generated': getattr(validators, f"validate_{name}"),
+            interpreted_by: (jsonschema_validator(spec, name) if jsonschema is not None
+                             else interpreter.validator(name)),
+        }
+        # Large bodies take longer per call; keep each run to a similar amount of work
+        calls = max(1, args.calls // (args.items if items is None else 1))
+        timings = {path: per_call(validate, body, calls, args.repeat) for path, validate in paths.items()}
+        for path, seconds in timings.items():
+            speedup = timings[interpreted_by] / seconds
+            results.append({'case': case, 'validator': path, 'body_bytes': len(json.dumps(body)),
+                            'seconds_per_request': round(seconds, 9), 'speedup': round(speedup, 2)})
+            print(f"{case:<34} {path:<12} {seconds * 1e6:>11.2f} {speedup:>7.1f}x")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump({
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'results': results
+        }, f, indent=2)
+        f.write('\n')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Deterministic synthetic OpenAPI specs for exercising the Docrio generators at scale."""
+import random
+from typing import Any, Dict
+
+PRIMITIVES = ('string', 'integer', 'boolean', 'number')
+HTTP_METHODS = ('get', 'post', 'put', 'patch', 'delete')
+
+
+def inline_object(prefix: str, depth: int, rng: random.Random) -> Dict[str, Any]:
+    """Build an inline object nested depth levels deep"""
+    properties = {
+        f"{prefix}Id": {'type': 'string', 'example': 'a1E1U000001juz6UAA'},
+        f"{prefix}Count": {'type': 'integer'},
+        f"{prefix}Flag": {'type': 'boolean'}
+    }
+    if depth > 1:
+        properties[f"{prefix}Child"] = inline_object(f"{prefix}L{depth - 1}", depth - 1, rng)
+    return {'type': 'object', 'properties': properties}
+
+
+def synthetic_schema(index: int, schema_count: int, properties: int, depth: int, ref_fanout: int,
+                     array_density: float, rng: random.Random) -> Dict[str, Any]:
+    """Build one component schema using the given shape knobs"""
+    props = {}
+    for j in range(properties):
+        if rng.random() < array_density:
+            # Array of inline objects; shapes repeat every few schemas so interning has work to do
+            props[f"Items{j}"] = {'type': 'array', 'items': inline_object(f"Item{index % 7}", 1, rng)}
+        elif j % 10 == 9:
+            # Salesforce-style API name, exercising the DocrioField path
+            props[f"Custom_Field_{j}__c"] = {'type': 'string', 'description': f"Custom field {j}"}
+        else:
+            props[f"field{j}"] = {'type': PRIMITIVES[j % len(PRIMITIVES)], 'description': f"Field {j} of schema {index}"}
+    if depth > 0:
+        props['details'] = inline_object(f"S{index}", depth, rng)
+    for k in range(min(ref_fanout, schema_count - 1)):
+        target = rng.randrange(schema_count)
+        if target == index:
+            target = (target + 1) % schema_count
+        props[f"ref{k}"] = {'$ref': f"#/components/schemas/Schema{target}"}
+    return {'type': 'object', 'properties': props, 'required': [next(iter(props))] if props else []}
+
+
+def synthetic_operation(index: int, schema_count: int, rng: random.Random) -> Dict[str, Any]:
+    """Build one operation with query parameters and $ref request/response bodies"""
+    method = HTTP_METHODS[index % len(HTTP_METHODS)]
+    response = f"#/components/schemas/Schema{rng.randrange(schema_count)}"
+    operation = {
+        'tags': [f"Tag{index % 12}"],
+        'summary': f"Synthetic operation {index}",
+        'parameters': [
+            {'name': 'Ids', 'in': 'query', 'schema': {'type': 'string'}, 'description': 'Comma-separated ids'},
+            {'name': 'MaxFiles', 'in': 'query', 'schema': {'type': 'integer'}}
+        ],
+        'responses': {'200': {'description': 'OK', 'content': {'application/json': {'schema': {'$ref': response}}}}}
+    }
+    if method in ('post', 'put', 'patch'):
+        request = f"#/components/schemas/Schema{rng.randrange(schema_count)}"
+        operation['requestBody'] = {'content': {'application/json': {'schema': {'$ref': request}}}}
+    return method, operation
+
+
+def synthetic_swagger(schemas: int = 100, properties: int = 12, depth: int = 2, ref_fanout: int = 2,
+                      array_density: float = 0.1, operations: int = 100, seed: int = 0) -> Dict[str, Any]:
+    """Build a synthetic OpenAPI 3 spec.
+
+    Knobs: number of component schemas, properties per schema, nesting depth of inline
+    objects, $ref fan-out per schema, fraction of properties that are arrays of inline
+    objects, and number of operations. The same arguments always yield the same spec.
+    """
+    rng = random.Random(seed)
+    component_schemas = {
+        f"Schema{i}": synthetic_schema(i, schemas, properties, depth, ref_fanout, array_density, rng)
+        for i in range(schemas)
+    }
+    paths: Dict[str, Dict[str, Any]] = {}
+    for k in range(operations):
+        method, operation = synthetic_operation(k, schemas, rng)
+        path = f"/resource{k // len(HTTP_METHODS)}" + ('/{recordId}' if k % 3 == 0 else '')
+        paths.setdefault(path, {})[method] = operation
+    return {
+        'openapi': '3.0.0',
+        'info': {'title': 'Synthetic Docrio API', 'version': '1.0.0'},
+        'paths': paths,
+        'components': {'schemas': component_schemas}
+    }
@@ -0,0 +1,94 @@
+import os
+import pickle
+import sys
+from typing import Dict, Iterable, Optional, Tuple
+
+from codegen_manifest import content_hash, file_hash
+from docrio_spec import DocrioSpec
+
+# Leading bytes of every cache entry; bump when the entry layout changes
+CACHE_MAGIC = b'DOCRIOSPEC1\n'
+
+
+class SpecCache:
+    """On-disk cache of compiled specs, so warm generator runs skip parsing and resolution.
+
+    An entry is the pickled DocrioSpec (operations, resolved schemas, sharding) together
+    with whatever the backends stored in spec.resolved while preparing, such as the
+    Apex type table and interned anonymous shapes. Entries are keyed by the spec file's
+    content hash, the include/shard options and a hash of the generator sources, so
+    editing the spec or a generator simply misses. Only the newest max_entries entries
+    are kept. Entries are unpickled, so the cache directory must be private to the
+    checkout (the default, .codegen/, is).
+    """
+
+    def __init__(self, cache_dir: str, *generator_files: str, max_entries: int = 8):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        version = f"{sys.version_info.major}.{sys.version_info.minor}"
+        self.generator_hash = content_hash([version] + [file_hash(path) for path in generator_files])
+        self.loaded: Dict[str, Tuple[DocrioSpec, frozenset]] = {}  # Entry file -> spec and its resolved keys
+        self.hits = 0
+        self.misses = 0
+
+    def entry_file(self, spec_file: str, include: Optional[Iterable[str]], sharded: bool) -> str:
+        """Cache file for a spec loaded with the given options"""
+        key = content_hash([file_hash(spec_file), list(include or ()), sharded, self.generator_hash])
+        return os.path.join(self.cache_dir, f"{key[:32]}.spec")
+
+    def read(self, entry_file: str) -> Optional[DocrioSpec]:
+        """Unpickle an entry, or None if it is missing or unreadable"""
+        try:
+            with open(entry_file, 'rb') as f:
+                if f.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+                    return None
+                spec = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+        return spec if isinstance(spec, DocrioSpec) else None
+
+    def load(self, spec_file: str, include: Optional[Iterable[str]] = None,
+             sharded: bool = False) -> DocrioSpec:
+        """DocrioSpec.load, answered from the cache when the spec and generators are unchanged"""
+        entry_file = self.entry_file(spec_file, include, sharded)
+        spec = self.read(entry_file)
+        if spec is None:
+            self.misses += 1
+            spec = DocrioSpec.load(spec_file, include, sharded)
+            self.loaded[entry_file] = (spec, None)
+        else:
+            self.hits += 1
+            spec.source_file = os.path.abspath(spec_file)
+            os.utime(entry_file)  # Eviction keeps the most recently used entries
+            self.loaded[entry_file] = (spec, frozenset(spec.resolved))
+        return spec
+
+    def save(self):
+        """Write entries that were compiled this run or gained backend state, then evict old ones"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for entry_file, (spec, resolved) in self.loaded.items():
+            if resolved == frozenset(spec.resolved):
+                continue
+            # Write then rename, so a concurrent run never reads half an entry
+            temp_file = f"{entry_file}.{os.getpid()}.tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(CACHE_MAGIC)
+                pickle.dump(spec, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, entry_file)
+            self.loaded[entry_file] = (spec, frozenset(spec.resolved))
+        self.evict()
+
+    def evict(self):
+        """Remove all but the max_entries most recently used entries"""
+        entries = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                   if name.endswith('.spec')]
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for entry_file in entries[self.max_entries:]:
+            try:
+                os.remove(entry_file)
+            except OSError:
+                pass
+
+    def summary(self, label: str) -> str:
+        """Human-readable count of cached vs compiled specs"""
+        return f"{label}: {self.hits} loaded from cache, {self.misses} compiled"
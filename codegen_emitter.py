@@ -0,0 +1,86 @@
+import hashlib
+import os
+from typing import List, Optional, TextIO
+
+from codegen_manifest import file_hash
+
+
+class CodeEmitter:
+    """Collects generated code fragments without repeated string concatenation.
+
+    Fragments are either streamed straight to an open file handle or appended to a
+    chunk list that is joined exactly once, so building a class is linear in its size.
+    """
+
+    def __init__(self, out: Optional[TextIO] = None, indent_unit: str = "    "):
+        self.out = out
+        self.chunks: List[str] = []
+        self.indent_unit = indent_unit
+
+    def write(self, text: str):
+        """Emit a raw fragment"""
+        if self.out is not None:
+            self.out.write(text)
+        else:
+            self.chunks.append(text)
+
+    def line(self, level: int, text: str = ""):
+        """Emit a newline followed by text indented to the given level"""
+        self.write(f"\n{self.indent_unit * level}{text}")
+
+    def extend(self, other: 'CodeEmitter'):
+        """Append everything buffered in another emitter"""
+        for chunk in other.chunks:
+            self.write(chunk)
+
+    def getvalue(self) -> str:
+        """Join the buffered fragments (only valid for non-streaming emitters)"""
+        return ''.join(self.chunks)
+
+
+class CountingSink:
+    """Write target that only counts the characters and lines it receives"""
+
+    def __init__(self):
+        self.characters = 0
+        self.lines = 0
+
+    def write(self, text: str):
+        self.characters += len(text)
+        self.lines += text.count('\n')
+
+
+class StreamingOutput:
+    """Context manager that streams a generated file to disk, keeping the old file if unchanged.
+
+    Content is written to a temporary sibling file while its hash is computed; on exit
+    the temporary file replaces the target only if the bytes differ, so peak memory
+    does not depend on the size of the output.
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.tmp_path = f"{filepath}.tmp"
+        self.digest = hashlib.sha256()
+        self.handle = None
+        self.changed = False
+
+    def __enter__(self) -> CodeEmitter:
+        self.handle = open(self.tmp_path, 'w', encoding='utf-8', newline='')
+        return CodeEmitter(self)
+
+    def write(self, text: str):
+        self.digest.update(text.encode('utf-8'))
+        self.handle.write(text)
+
+    def __exit__(self, exc_type, exc, tb):
+        self.handle.close()
+        if exc_type is not None:
+            os.remove(self.tmp_path)
+            return False
+        if os.path.exists(self.filepath) and file_hash(self.filepath) == self.digest.hexdigest():
+            os.remove(self.tmp_path)
+        else:
+            os.replace(self.tmp_path, self.filepath)
+            self.changed = True
+        return False
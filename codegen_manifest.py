@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Set
+
+
+def content_hash(value: Any) -> str:
+    """Return a stable SHA-256 digest for any JSON-serializable value"""
+    canonical = json.dumps(value, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def file_hash(path: str, chunk_size: int = 1 << 16) -> str:
+    """Return the SHA-256 digest of a file's bytes, reading it in fixed-size chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_if_changed(filepath: str, content: str) -> bool:
+    """Write content to filepath unless the file already holds the same bytes.
+
+    Returns True when the file was written, False when it was left untouched.
+    """
+    encoded = content.encode('utf-8')
+    if os.path.exists(filepath):
+        with open(filepath, 'rb') as f:
+            if f.read() == encoded:
+                return False
+    with open(filepath, 'wb') as f:
+        f.write(encoded)
+    return True
+
+
+class CodegenManifest:
+    """Content-hash manifest of generated fragments used for incremental regeneration.
+
+    Each fragment (an inner class, a service method, ...) is stored with the hash
+    of the inputs it was rendered from. On the next run a fragment is only
+    re-rendered when its input hash changes; otherwise the cached text is reused.
+    Changing any of the generator source files invalidates every fragment.
+    """
+
+    def __init__(self, manifest_file: str, *generator_files: str):
+        self.manifest_file = manifest_file
+        self.generator_hash = content_hash([file_hash(path) for path in generator_files])
+        self.fragments: Dict[str, Dict[str, str]] = {}
+        self.used: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self):
+        """Load a previous manifest, discarding it if it came from another generator version"""
+        if not os.path.exists(self.manifest_file):
+            return
+        try:
+            with open(self.manifest_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('generator') == self.generator_hash:
+            self.fragments = data.get('fragments', {})
+
+    def lookup(self, key: str, inputs: Any) -> Optional[str]:
+        """Return the cached fragment for key if its inputs are unchanged, else None"""
+        self.used.add(key)
+        entry = self.fragments.get(key)
+        if entry is not None and entry.get('hash') == content_hash(inputs):
+            self.hits += 1
+            return entry['content']
+        return None
+
+    def store(self, key: str, inputs: Any, content: str):
+        """Record a freshly rendered fragment"""
+        self.used.add(key)
+        self.fragments[key] = {'hash': content_hash(inputs), 'content': content}
+        self.misses += 1
+
+    def fragment(self, key: str, inputs: Any, render: Callable[[], str]) -> str:
+        """Return the cached fragment for key if its inputs are unchanged, else render it"""
+        content = self.lookup(key, inputs)
+        if content is None:
+            content = render()
+            self.store(key, inputs, content)
+        return content
+
+    def save(self) -> bool:
+        """Persist the manifest, dropping fragments that were not used this run"""
+        fragments = {key: self.fragments[key] for key in sorted(self.used) if key in self.fragments}
+        data = {'generator': self.generator_hash, 'fragments': fragments}
+        directory = os.path.dirname(self.manifest_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return write_if_changed(self.manifest_file, json.dumps(data, indent=1, sort_keys=True) + '\n')
+
+    def summary(self, label: str) -> str:
+        """Human-readable count of regenerated vs reused fragments"""
+        return f"{label}: {self.misses} regenerated, {self.hits} reused"
@@ -0,0 +1,66 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from docrio_spec import DocrioSpec
+
+# A render task is (manifest key, manifest inputs, backend-specific task argument)
+RenderTask = Tuple[str, Any, Any]
+
+# Prepared backends cached inside each worker process, keyed by backend class and spec load arguments
+_worker_backends: Dict[Tuple[str, tuple], Any] = {}
+
+
+def _worker_backend(backend_cls: type, load_args: tuple) -> Any:
+    """Build (once per worker) a backend over the given spec and run its preparation pass"""
+    key = (f"{backend_cls.__module__}.{backend_cls.__qualname__}", load_args)
+    if key not in _worker_backends:
+        backend = backend_cls(DocrioSpec.load(*load_args))
+        backend.prepare()
+        _worker_backends[key] = backend
+    return _worker_backends[key]
+
+
+def _render_batch(backend_cls: type, load_args: tuple, batch: List[Any]) -> List[str]:
+    """Render a batch of task arguments inside a worker process"""
+    backend = _worker_backend(backend_cls, load_args)
+    return [backend.render_task(task) for task in batch]
+
+
+def create_pool(jobs: int) -> Optional[Executor]:
+    """Create a process pool for jobs workers (0 = one per core); 1 means run serially"""
+    if jobs == 1:
+        return None
+    return ProcessPoolExecutor(max_workers=jobs or os.cpu_count())
+
+
+def render_fragments(backend: Any, tasks: List[RenderTask], pool: Optional[Executor] = None,
+                     batch_size: int = 16) -> Iterator[str]:
+    """Yield rendered fragments in task order.
+
+    Fragments whose inputs are unchanged come from the backend's manifest. The rest are
+    rendered locally or, given a pool, fanned out in batches across worker processes.
+    Results are merged back in task order, so the output is identical to a serial run.
+    """
+    manifest = backend.manifest
+    cached = [manifest.lookup(key, inputs) if manifest is not None else None for key, inputs, _ in tasks]
+    misses = [index for index, content in enumerate(cached) if content is None]
+
+    spec_file = backend.spec.source_file
+    if pool is None or spec_file is None or len(misses) <= batch_size:
+        rendered = (backend.render_task(tasks[index][2]) for index in misses)
+    else:
+        batches = [misses[i:i + batch_size] for i in range(0, len(misses), batch_size)]
+        futures = [
+            pool.submit(_render_batch, type(backend), backend.spec.load_args(),
+                        [tasks[index][2] for index in batch])
+            for batch in batches
+        ]
+        rendered = (content for future in futures for content in future.result())
+
+    for (key, inputs, _), content in zip(tasks, cached):
+        if content is None:
+            content = next(rendered)
+            if manifest is not None:
+                manifest.store(key, inputs, content)
+        yield content
@@ -0,0 +1,27 @@
+"""Asynchronous Python client for the Docrio API.
+
+client.py, models.py and validators.py are generated from swagger.json by
+generate_docrio.py --python-client; transport.py is the hand-written pooled
+HTTP/1.1 transport the client runs on; uploads.py and downloads.py are the
+bulk transfer engines built on both, and jobs.py polls start-then-poll jobs.
+instrumentation.py keeps per-operation latency and payload histograms, and
+auth.py caches access tokens until they near expiry. scheduling.py paces calls
+per operation family and retries idempotent ones when the API throttles, and
+caching.py caches and coalesces reads.
+"""
+from docrio_client.auth import SalesforceTokenProvider, TokenProvider
+from docrio_client.caching import ResponseCache
+from docrio_client.client import DEFAULT_BASE_URL, DocrioAsyncClient
+from docrio_client.downloads import BulkDownloader, DownloadError
+from docrio_client.instrumentation import Histogram, MetricsRecorder
+from docrio_client.jobs import JobFailedError, JobPoller
+from docrio_client.scheduling import FamilyLimiter, RequestScheduler, TokenBucket
+from docrio_client.transport import ConnectionPool, DocrioApiError, DocrioTransport, Response
+from docrio_client.uploads import MultipartUploader, MultipartUploadError
+from docrio_client.validators import RequestValidationError
+
+__all__ = ['DEFAULT_BASE_URL', 'BulkDownloader', 'ConnectionPool', 'DocrioApiError', 'DocrioAsyncClient',
+           'DocrioTransport', 'DownloadError', 'FamilyLimiter', 'Histogram', 'JobFailedError', 'JobPoller',
+           'MetricsRecorder', 'MultipartUploadError', 'MultipartUploader', 'RequestScheduler',
+           'RequestValidationError', 'Response', 'ResponseCache', 'SalesforceTokenProvider', 'TokenBucket',
+           'TokenProvider']
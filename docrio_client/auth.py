@@ -0,0 +1,91 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+from docrio_client.transport import DocrioApiError, DocrioTransport
+
+
+class TokenProvider:
+    """Caches an access token and fetches a new one only when needed.
+
+    token() returns the cached token until refresh_margin seconds before it expires;
+    refresh(rejected) replaces a token the API answered 401 to. Both hold a lock
+    while fetching, so any number of concurrent calls share a single fetch.
+    Subclasses implement fetch().
+    """
+
+    def __init__(self, refresh_margin: float = 300.0):
+        self.refresh_margin = refresh_margin
+        self.access_token: Optional[str] = None
+        self.expires_at = 0.0  # time.monotonic() deadline of access_token
+        self.fetches = 0
+        self.lock: Optional[asyncio.Lock] = None
+
+    async def fetch(self) -> Tuple[str, float]:
+        """Request a new token; return it and its lifetime in seconds"""
+        raise NotImplementedError
+
+    def valid(self) -> bool:
+        return self.access_token is not None and time.monotonic() < self.expires_at - self.refresh_margin
+
+    async def token(self) -> str:
+        """The cached token, fetched first if there is none or it is about to expire"""
+        if self.valid():
+            return self.access_token
+        return await self.renew(None)
+
+    async def refresh(self, rejected: str) -> str:
+        """A token to replace one the API rejected; fetched once however many callers were rejected"""
+        return await self.renew(rejected)
+
+    async def renew(self, rejected: Optional[str]) -> str:
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            # Another caller may have fetched while this one waited for the lock
+            if self.valid() and self.access_token != rejected:
+                return self.access_token
+            started = time.monotonic()
+            access_token, lifetime = await self.fetch()
+            self.fetches += 1
+            self.access_token = access_token
+            self.expires_at = started + lifetime
+            return access_token
+
+    def invalidate(self):
+        """Forget the cached token, so the next call fetches a new one"""
+        self.access_token = None
+
+    async def close(self):
+        """Release anything held for fetching"""
+
+
+class SalesforceTokenProvider(TokenProvider):
+    """Tokens from the Salesforce OAuth 2.0 username-password flow, as DocrioClient.cls uses.
+
+    Salesforce does not say when these tokens expire, so lifetime (the org's session
+    timeout, in seconds) is assumed unless the token response has expires_in.
+    """
+
+    def __init__(self, token_url: str, client_id: str, client_secret: str, username: str, password: str,
+                 lifetime: float = 3600.0, refresh_margin: float = 300.0,
+                 transport: Optional[DocrioTransport] = None):
+        super().__init__(refresh_margin)
+        self.token_url = token_url
+        self.form: Dict[str, str] = {'grant_type': 'password', 'client_id': client_id,
+                                     'client_secret': client_secret, 'username': username, 'password': password}
+        self.lifetime = lifetime
+        self.transport = transport or DocrioTransport(token_url, limit_per_host=1)
+
+    async def fetch(self) -> Tuple[str, float]:
+        body = urlencode(self.form).encode('ascii')
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+        response = await self.transport.send('POST', self.token_url, body, headers, default_headers=False)
+        if not 200 <= response.status < 300:
+            raise DocrioApiError(response.status, response.body, 'POST', self.token_url)
+        result: Dict[str, Any] = response.json()
+        return result['access_token'], float(result.get('expires_in') or self.lifetime)
+
+    async def close(self):
+        await self.transport.close()
@@ -0,0 +1,103 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Sequence, TypeVar
+from urllib.parse import quote
+
+from docrio_client.transport import ConnectionPool
+
+T = TypeVar('T')
+
+# Ids per ?Ids= query string, and the encoded length the list may take up in the URL
+MAX_IDS_PER_REQUEST = 200
+MAX_IDS_QUERY_LENGTH = 6000
+# Items per request for operations whose body is an array
+MAX_ITEMS_PER_REQUEST = 100
+# Encoded length of the ',' separating Ids
+SEPARATOR_LENGTH = len(quote(','))
+
+
+def chunk_ids(ids: Iterable[str], max_ids: int = MAX_IDS_PER_REQUEST,
+              max_length: int = MAX_IDS_QUERY_LENGTH) -> List[List[str]]:
+    """Split Ids into chunks of at most max_ids whose URL-encoded, comma-joined form fits in max_length"""
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    length = 0
+    for record_id in ids:
+        encoded = len(quote(str(record_id), safe=''))
+        added = encoded + (SEPARATOR_LENGTH if current else 0)
+        if current and (len(current) >= max_ids or length + added > max_length):
+            chunks.append(current)
+            current, length, added = [], 0, encoded
+        current.append(record_id)
+        length += added
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def chunk_items(items: Sequence[T], max_items: int = MAX_ITEMS_PER_REQUEST) -> List[Sequence[T]]:
+    """Split a request body array into consecutive chunks of at most max_items"""
+    return [items[i:i + max_items] for i in range(0, len(items), max_items)]
+
+
+async def run_batches(chunks: Sequence[T], call: Callable[[T], Awaitable[Any]], concurrency: int) -> List[Any]:
+    """Await call(chunk) for every chunk, at most concurrency at a time; results come back in chunk order"""
+    slots = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run(chunk: T) -> Any:
+        async with slots:
+            return await call(chunk)
+
+    return await asyncio.gather(*(run(chunk) for chunk in chunks))
+
+
+def merge_responses(responses: Iterable[Any]) -> Any:
+    """Merge the responses of consecutive chunks into one.
+
+    Lists are concatenated; for objects, list values (Records, Successes, Failures, ...)
+    are concatenated key by key, new keys are added in order and other values keep the
+    first chunk's value.
+    """
+    merged: Any = None
+    for response in responses:
+        if response is None:
+            continue
+        if merged is None:
+            # Lists are copied before being extended so the chunk responses are never mutated
+            if isinstance(response, list):
+                merged = list(response)
+            elif isinstance(response, dict):
+                merged = {key: list(value) if isinstance(value, list) else value for key, value in response.items()}
+            else:
+                merged = response
+        elif isinstance(merged, list) and isinstance(response, list):
+            merged.extend(response)
+        elif isinstance(merged, dict) and isinstance(response, dict):
+            for key, value in response.items():
+                if key not in merged:
+                    merged[key] = list(value) if isinstance(value, list) else value
+                elif isinstance(merged[key], list) and isinstance(value, list):
+                    merged[key].extend(value)
+    return merged
+
+
+def merge_id_responses(ids: Sequence[str], responses: Iterable[Any]) -> Any:
+    """Merge chunk responses of an Ids-list read, ordering Records by the position of their Id in ids"""
+    merged = merge_responses(responses)
+    if isinstance(merged, dict) and isinstance(merged.get('Records'), list):
+        position: Dict[str, int] = {}
+        for index, record_id in enumerate(ids):
+            position.setdefault(record_id, index)
+        unmatched = len(position)
+
+        def order(record: Any) -> int:
+            record_id = record.get('Id') if isinstance(record, dict) else None
+            return position.get(record_id, unmatched)
+
+        # sorted() is stable, so records the API returned without a known Id keep their place at the end
+        merged['Records'] = sorted(merged['Records'], key=order)
+    return merged
+
+
+def default_concurrency(pool: ConnectionPool) -> int:
+    """Batches to run at once when the caller does not say: as many as the connection pool allows"""
+    return pool.limit_per_host or pool.limit or 10
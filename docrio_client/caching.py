@@ -0,0 +1,152 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Set, Tuple
+
+from docrio_client.transport import Response, encode_query_value
+
+# Seconds each read-mostly operation's responses are reused; other operations are never stored
+DEFAULT_TTLS = {
+    'getFilesInfo': 60.0,
+    'getVersions': 60.0,
+    'getVersion': 60.0,
+    'getMergeSchema': 300.0,
+    'getFavorites': 60.0,
+    'getExternallinkPreview': 60.0,
+}
+READ_METHODS = ('GET', 'HEAD')
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+def record_ids(value: Any, key: str = '') -> Set[str]:
+    """Every record Id in a query, body or response: string values of Id/Ids/...Id/...Ids keys"""
+    found: Set[str] = set()
+    stack = [(key, value)]
+    while stack:
+        name, node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.items())
+        elif isinstance(node, (list, tuple)):
+            stack.extend((name, item) for item in node)
+        elif isinstance(node, str) and name.endswith(('Id', 'Ids')):
+            found.update(part.strip() for part in node.split(',') if part.strip())
+    return found
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of read responses, with in-flight request coalescing.
+
+    Pass an instance as DocrioAsyncClient(..., cache=cache). Responses of the operations
+    in ttls (DEFAULT_TTLS unless given) are kept for that many seconds, keyed by the
+    operation, path and query parameters; at most max_entries are kept, least recently
+    used out first. Identical GETs made while one is in flight wait for it instead of
+    being sent again, whether or not their operation is cached. Each entry is indexed
+    by the record Ids in its query and response; any other call (PATCH/PUT /files,
+    /move, /files/checkin, ...) evicts the entries that share an Id with its query or
+    body, or its whole path family if it names none. Cached responses belong to one set
+    of credentials, so a cache must not be shared between clients of different users.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttls: Optional[Mapping[str, float]] = None):
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.entries: 'OrderedDict[CacheKey, Tuple[float, Response, Set[str]]]' = OrderedDict()
+        self.by_id: Dict[str, Set[CacheKey]] = {}
+        self.in_flight: Dict[CacheKey, asyncio.Future] = {}
+        self.generation = 0  # Bumped by every invalidation, so reads that overlapped one are not stored
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidated = 0
+        self.evicted = 0
+
+    def key(self, operation: str, path: str, query: Optional[Mapping[str, Any]]) -> CacheKey:
+        """Operation, path and the non-None query parameters sorted by name"""
+        params = tuple(sorted((name, encode_query_value(value)) for name, value in (query or {}).items()
+                              if value is not None))
+        return operation, path, params
+
+    async def fetch(self, method: str, path: str, query: Optional[Mapping[str, Any]], body: Any,
+                    operation: str, send: Callable[[], Awaitable[Response]]) -> Response:
+        """The cached response for a read, or send()'s; other calls invalidate what they touch"""
+        if method not in READ_METHODS:
+            self.invalidate(record_ids(query) | record_ids(body), path)
+            try:
+                return await send()
+            finally:
+                # Reads that started while this call was in flight may have seen the old state
+                self.invalidate(record_ids(query) | record_ids(body), path)
+
+        key = self.key(operation, path, query)
+        entry = self.entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.remove(key)
+        shared = self.in_flight.get(key)
+        if shared is not None:
+            self.coalesced += 1
+            return await asyncio.shield(shared)
+
+        self.misses += 1
+        generation = self.generation
+        shared = self.in_flight[key] = asyncio.ensure_future(send())
+        try:
+            response = await asyncio.shield(shared)
+        finally:
+            if self.in_flight.get(key) is shared:
+                del self.in_flight[key]
+        ttl = self.ttls.get(operation)
+        if ttl and 200 <= response.status < 300 and generation == self.generation:
+            self.store(key, ttl, response, query)
+        return response
+
+    def store(self, key: CacheKey, ttl: float, response: Response, query: Optional[Mapping[str, Any]]):
+        ids = record_ids(query)
+        if 'json' in response.headers.get('content-type', 'application/json') and response.body:
+            ids |= record_ids(response.json())
+        if key in self.entries:
+            self.remove(key)
+        self.entries[key] = (time.monotonic() + ttl, response, ids)
+        for record_id in ids:
+            self.by_id.setdefault(record_id, set()).add(key)
+        while len(self.entries) > self.max_entries:
+            self.remove(next(iter(self.entries)))
+            self.evicted += 1
+
+    def remove(self, key: CacheKey):
+        _, _, ids = self.entries.pop(key)
+        for record_id in ids:
+            keys = self.by_id.get(record_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.by_id[record_id]
+
+    def invalidate(self, ids: Set[str], path: str = ''):
+        """Evict entries that mention any of ids, or every entry in path's family if ids is empty"""
+        self.generation += 1
+        keys: Set[CacheKey] = set()
+        for record_id in ids:
+            keys |= self.by_id.get(record_id, set())
+        if not keys and not ids:
+            family = path.lstrip('/').split('/', 1)[0]
+            keys = {key for key in self.entries if key[1].lstrip('/').split('/', 1)[0] == family}
+        for key in keys:
+            self.remove(key)
+        self.invalidated += len(keys)
+        # Later identical reads must not join a request that started before this change
+        self.in_flight.clear()
+
+    def clear(self):
+        self.entries.clear()
+        self.by_id.clear()
+        self.in_flight.clear()
+        self.generation += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses,
+                'coalesced': self.coalesced, 'invalidated': self.invalidated, 'evicted': self.evicted}
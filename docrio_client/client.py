@@ -0,0 +1,764 @@
+"""Generated Docrio API async client; regenerate with generate_docrio.py --python-client"""
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+from urllib.parse import quote
+
+from docrio_client import validators
+from docrio_client.auth import TokenProvider
+from docrio_client.batching import (MAX_IDS_PER_REQUEST, MAX_ITEMS_PER_REQUEST, chunk_ids, chunk_items,
+                                    default_concurrency, merge_id_responses, merge_responses, run_batches)
+from docrio_client.pagination import paginate
+from docrio_client.transport import DocrioTransport
+
+DEFAULT_BASE_URL = 'https://api.000000000000.genesisapi.com/v1'
+
+
+class DocrioAsyncClient:
+    """Asynchronous Docrio API client with one coroutine per operation.
+
+    Every call goes through one pooled keep-alive DocrioTransport; limit and
+    limit_per_host (passed through to the transport) cap the connections in use.
+    Request bodies are checked against their schema before sending unless
+    validate_requests is False; invalid ones raise RequestValidationError.
+    An instrumentation callable (e.g. a MetricsRecorder), also passed through to
+    the transport, receives one record per call, named by its operation.
+    access_token is either a token string or a TokenProvider, whose token is
+    reused until it nears expiry and refreshed once when a call gets a 401.
+    A scheduler (a RequestScheduler) paces calls per operation family and retries
+    throttled idempotent calls, and a cache (a ResponseCache) reuses responses of
+    read-mostly operations and collapses identical concurrent reads.
+    """
+
+    def __init__(self, access_token: Union[str, TokenProvider], api_key: str,
+                 base_url: str = DEFAULT_BASE_URL, transport: Optional[DocrioTransport] = None,
+                 validate_requests: bool = True, **transport_options: Any):
+        headers = {'X-API-KEY': api_key}
+        if isinstance(access_token, TokenProvider):
+            transport_options['auth'] = access_token
+        else:
+            headers['Authorization'] = f"Bearer {access_token}"
+        self.transport = transport or DocrioTransport(base_url, headers, **transport_options)
+        self.validate_requests = validate_requests
+
+    async def __aenter__(self) -> 'DocrioAsyncClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the pooled connections"""
+        await self.transport.close()
+
+    # Archival Tool Methods
+
+    async def postArchive(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Archive files by file info or record id
+
+        Returns the parsed ArchivePostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_ArchivePostRequest(requestBody)
+        return await self.transport.request('POST', '/archive', body=requestBody, operation='postArchive')
+
+    async def postArchiveRestore(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Restore archived files by file info or record id
+
+        Returns the parsed ArchivePostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_ArchivePostRequest(requestBody)
+        return await self.transport.request('POST', '/archive/restore', body=requestBody,
+                                            operation='postArchiveRestore')
+
+    async def getArchiveStatus(self, externalJobId: str) -> Dict[str, Any]:
+        """Get the status of an existing archive job
+
+        Returns the parsed ArchiveStatusGetResponse response.
+        """
+        return await self.transport.request('GET', f"/archive/status/{quote(str(externalJobId), safe='')}",
+                                            operation='getArchiveStatus')
+
+    async def getArchiveRestoreStatus(self, externalJobId: str) -> Dict[str, Any]:
+        """Get the status of an existing restore job
+
+        Returns the parsed ArchiveStatusGetResponse response.
+        """
+        return await self.transport.request('GET', f"/archive/restore/status/{quote(str(externalJobId), safe='')}",
+                                            operation='getArchiveRestoreStatus')
+
+    # Document Generation Methods
+
+    async def postMerge(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Begins the process of merging a document with merge tags and an object containing the merge definitions
+
+        Returns the parsed MergePostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_MergePostRequest(requestBody)
+        return await self.transport.request('POST', '/merge', body=requestBody, operation='postMerge')
+
+    async def getMerge(self, TemplateId: str, RecordId: str) -> Dict[str, Any]:
+        """Returns the exact JSON containing metadata about the file being merged, required to call POST /merge.
+
+        Returns the parsed MergeGetResponse response.
+        """
+        query = {
+            'TemplateId': TemplateId,
+            'RecordId': RecordId
+        }
+        return await self.transport.request('GET', '/merge', query=query, operation='getMerge')
+
+    async def postMergeComplete(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Must be called after a file has been successfully merged.
+
+        Returns the parsed MergeCompletePostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_MergeCompletePostRequest(requestBody)
+        return await self.transport.request('POST', '/merge/complete', body=requestBody,
+                                            operation='postMergeComplete')
+
+    async def getMergeSchema(self, TemplateId: str) -> Dict[str, Any]:
+        """Returns JSON that describes the JSON returned by the GET /merge endpoint for a specific template.
+
+        Returns the parsed MergeSchemaGetResponse response.
+        """
+        return await self.transport.request('GET', '/merge/schema', query={'TemplateId': TemplateId},
+                                            operation='getMergeSchema')
+
+    # File Management Methods
+
+    async def getFiles(self,
+                       Ids: Optional[str] = None,
+                       Id: Optional[str] = None,
+                       VersionId: Optional[str] = None,
+                       FileName: Optional[str] = None,
+                       IsArchived: Optional[str] = None) -> Dict[str, Any]:
+        """Download files
+
+        Returns the parsed FilesGetResponse response.
+        """
+        query = {
+            'Ids': Ids,
+            'Id': Id,
+            'VersionId': VersionId,
+            'FileName': FileName,
+            'IsArchived': IsArchived
+        }
+        return await self.transport.request('GET', '/files', query=query, operation='getFiles')
+
+    async def getFilesBatched(self,
+                              Ids: Sequence[str],
+                              Id: Optional[str] = None,
+                              VersionId: Optional[str] = None,
+                              FileName: Optional[str] = None,
+                              IsArchived: Optional[str] = None,
+                              batch_size: int = MAX_IDS_PER_REQUEST,
+                              concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """getFiles for any number of Ids, sent in concurrent chunks; Records come back in input order"""
+        responses = await run_batches(chunk_ids(Ids, batch_size),
+                                      lambda chunk: self.getFiles(Ids=','.join(chunk),
+                                                                  Id=Id,
+                                                                  VersionId=VersionId,
+                                                                  FileName=FileName,
+                                                                  IsArchived=IsArchived),
+                                      concurrency or default_concurrency(self.transport.pool))
+        return merge_id_responses(Ids, responses)
+
+    async def deleteFiles(self, Ids: str) -> Dict[str, Any]:
+        """Marks one or more file records for deletion.
+
+        Returns the parsed FilesDeleteResponse response.
+        """
+        return await self.transport.request('DELETE', '/files', query={'Ids': Ids}, operation='deleteFiles')
+
+    async def deleteFilesBatched(self,
+                                 Ids: Sequence[str],
+                                 batch_size: int = MAX_IDS_PER_REQUEST,
+                                 concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """deleteFiles for any number of Ids, sent in concurrent chunks; Records come back in input order"""
+        responses = await run_batches(chunk_ids(Ids, batch_size),
+                                      lambda chunk: self.deleteFiles(Ids=','.join(chunk)),
+                                      concurrency or default_concurrency(self.transport.pool))
+        return merge_id_responses(Ids, responses)
+
+    async def patchFiles(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Updates field values on an existing file record without also making a corresponding change to the underlying file.
+
+        Returns the parsed FilesPatchResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FilesPatchRequest(requestBody)
+        return await self.transport.request('PATCH', '/files', body=requestBody, operation='patchFiles')
+
+    async def putFiles(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Creates a version of a specified file.
+
+        Returns the parsed FilesPutResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FilesPutRequest(requestBody)
+        return await self.transport.request('PUT', '/files', body=requestBody, operation='putFiles')
+
+    async def postFiles(self, requestBody: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Creates multiple or single salesforce file record ids and return signed urls.
+
+        Returns the parsed FilesPostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FilesPostRequest(requestBody)
+        return await self.transport.request('POST', '/files', body=requestBody, operation='postFiles')
+
+    async def postFilesBatched(self,
+                               requestBody: Sequence[Dict[str, Any]],
+                               batch_size: int = MAX_ITEMS_PER_REQUEST,
+                               concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """postFiles for any number of items, sent in concurrent chunks; responses are merged in input order"""
+        responses = await run_batches(chunk_items(requestBody, batch_size),
+                                      lambda chunk: self.postFiles(requestBody=list(chunk)),
+                                      concurrency or default_concurrency(self.transport.pool))
+        return merge_responses(responses)
+
+    async def postFilesTa(self, requestBody: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Creates multiple or single salesforce file record ids and return signed urls.
+
+        Returns the parsed FilesTAPostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FilesTAPostRequest(requestBody)
+        return await self.transport.request('POST', '/files/ta', body=requestBody, operation='postFilesTa')
+
+    async def postFilesTaBatched(self,
+                                 requestBody: Sequence[Dict[str, Any]],
+                                 batch_size: int = MAX_ITEMS_PER_REQUEST,
+                                 concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """postFilesTa for any number of items, sent in concurrent chunks; responses are merged in input order"""
+        responses = await run_batches(chunk_items(requestBody, batch_size),
+                                      lambda chunk: self.postFilesTa(requestBody=list(chunk)),
+                                      concurrency or default_concurrency(self.transport.pool))
+        return merge_responses(responses)
+
+    async def postFilesAssociates(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Creates multiple or single file relationships to signify whether pairs of files should be viewed or managed together.
+
+        Returns the parsed FilesAssociatePostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FilesAssociatePostRequest(requestBody)
+        return await self.transport.request('POST', '/files/associates', body=requestBody,
+                                            operation='postFilesAssociates')
+
+    async def deleteFilesAssociates(self, requestBody: Dict[str, Any]) -> Any:
+        """Marks one or more file relationships for deletion."""
+        if self.validate_requests:
+            validators.validate_FilesAssociateDeleteRequest(requestBody)
+        return await self.transport.request('DELETE', '/files/associates', body=requestBody,
+                                            operation='deleteFilesAssociates')
+
+    async def getFilesInfo(self, Ids: str, IsArchived: Optional[str] = None) -> Dict[str, Any]:
+        """Returns an array file records for the specified salesforce file record ids.
+
+        Returns the parsed FilesInfoGetResponse response.
+        """
+        query = {
+            'Ids': Ids,
+            'IsArchived': IsArchived
+        }
+        return await self.transport.request('GET', '/files/info', query=query, operation='getFilesInfo')
+
+    async def getFilesInfoBatched(self,
+                                  Ids: Sequence[str],
+                                  IsArchived: Optional[str] = None,
+                                  batch_size: int = MAX_IDS_PER_REQUEST,
+                                  concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """getFilesInfo for any number of Ids, sent in concurrent chunks; Records come back in input order"""
+        responses = await run_batches(chunk_ids(Ids, batch_size),
+                                      lambda chunk: self.getFilesInfo(Ids=','.join(chunk),
+                                                                      IsArchived=IsArchived),
+                                      concurrency or default_concurrency(self.transport.pool))
+        return merge_id_responses(Ids, responses)
+
+    async def postFilesComplete(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Must be called after a file has been successfully uploaded.
+
+        Returns the parsed FilesCompletePostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FilesCompletePostRequest(requestBody)
+        return await self.transport.request('POST', '/files/complete', body=requestBody,
+                                            operation='postFilesComplete')
+
+    async def getFilesRelated(self,
+                              RelatedRecordId: str,
+                              SortBy: Optional[str] = None,
+                              SortDirection: Optional[str] = None,
+                              OffsetId: Optional[str] = None,
+                              OffsetValue: Optional[str] = None,
+                              IncludeRelated: Optional[bool] = None,
+                              MaxFiles: Optional[int] = None,
+                              Fields: Optional[str] = None,
+                              IsArchived: Optional[str] = None) -> Dict[str, Any]:
+        """Returns a list of file records which are related to the specified related salesforce record id or to one of its child records.
+
+        Returns the parsed FilesRelatedGetResponse response.
+        """
+        query = {
+            'RelatedRecordId': RelatedRecordId,
+            'SortBy': SortBy,
+            'SortDirection': SortDirection,
+            'OffsetId': OffsetId,
+            'OffsetValue': OffsetValue,
+            'IncludeRelated': IncludeRelated,
+            'MaxFiles': MaxFiles,
+            'Fields': Fields,
+            'IsArchived': IsArchived
+        }
+        return await self.transport.request('GET', '/files/related', query=query, operation='getFilesRelated')
+
+    def getFilesRelatedIter(self,
+                            RelatedRecordId: str,
+                            SortBy: Optional[str] = None,
+                            SortDirection: Optional[str] = None,
+                            IncludeRelated: Optional[bool] = None,
+                            MaxFiles: Optional[int] = None,
+                            Fields: Optional[str] = None,
+                            IsArchived: Optional[str] = None,
+                            prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """Records of every getFilesRelated page, fetched lazily (MaxFiles per page).
+
+        With prefetch, the next page loads while this one is consumed.
+        """
+        return paginate(lambda offset: self.getFilesRelated(RelatedRecordId=RelatedRecordId,
+                                                            SortBy=SortBy,
+                                                            SortDirection=SortDirection,
+                                                            IncludeRelated=IncludeRelated,
+                                                            MaxFiles=MaxFiles,
+                                                            Fields=Fields,
+                                                            IsArchived=IsArchived,
+                                                            OffsetId=offset.get('OffsetId'),
+                                                            OffsetValue=offset.get('OffsetValue')),
+                        'NextBatch', 'Records', ('OffsetId', 'OffsetValue'), prefetch)
+
+    async def postFilesRestore(self, Ids: str) -> Dict[str, Any]:
+        """Restores one or more soft-deleted file info records.
+
+        Returns the parsed FilesRestoreResponse response.
+        """
+        return await self.transport.request('POST', '/files/restore', query={'Ids': Ids},
+                                            operation='postFilesRestore')
+
+    async def postFilesRestoreBatched(self,
+                                      Ids: Sequence[str],
+                                      batch_size: int = MAX_IDS_PER_REQUEST,
+                                      concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """postFilesRestore for any number of Ids, sent in concurrent chunks; Records come back in input order"""
+        responses = await run_batches(chunk_ids(Ids, batch_size),
+                                      lambda chunk: self.postFilesRestore(Ids=','.join(chunk)),
+                                      concurrency or default_concurrency(self.transport.pool))
+        return merge_id_responses(Ids, responses)
+
+    async def postFilesShare(self, requestBody: Dict[str, Any]) -> Any:
+        """Toggles the client portal share status of one or more files."""
+        if self.validate_requests:
+            validators.validate_FilesShareRequest(requestBody)
+        return await self.transport.request('POST', '/files/share', body=requestBody,
+                                            operation='postFilesShare')
+
+    async def postFilesCheckout(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Checks out files.
+
+        Returns the parsed FilesToggleResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FilesToggleRequest(requestBody)
+        return await self.transport.request('POST', '/files/checkout', body=requestBody,
+                                            operation='postFilesCheckout')
+
+    async def postFilesCheckin(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Checks in files.
+
+        Returns the parsed FilesToggleResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FilesToggleRequest(requestBody)
+        return await self.transport.request('POST', '/files/checkin', body=requestBody,
+                                            operation='postFilesCheckin')
+
+    async def postFilesCombine(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Initializes combine file process
+
+        Returns the parsed FilesCombineResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FilesCombineRequest(requestBody)
+        return await self.transport.request('POST', '/files/combine', body=requestBody,
+                                            operation='postFilesCombine')
+
+    async def postFilesCombineComplete(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Checks the status of the requested combine pdf
+
+        Returns the parsed FilesCombineCompleteResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FilesCombineCompleteRequest(requestBody)
+        return await self.transport.request('POST', '/files/combine/complete', body=requestBody,
+                                            operation='postFilesCombineComplete')
+
+    async def postFilesSplit(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Kicks off PDF split.
+
+        Returns the parsed FilesSplitResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FilesSplitRequest(requestBody)
+        return await self.transport.request('POST', '/files/split', body=requestBody,
+                                            operation='postFilesSplit')
+
+    async def postFilesSplitComplete(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Checks the status of all the split pdf.
+
+        Returns the parsed FilesSplitCompleteResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FilesSplitCompleteRequest(requestBody)
+        return await self.transport.request('POST', '/files/split/complete', body=requestBody,
+                                            operation='postFilesSplitComplete')
+
+    async def postMultipart(self, requestBody: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Initiates multipart upload process that creates multiple or single salesforce file record ids and return signed urls and upload Ids.
+
+        Returns the parsed MultipartFilesPostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_MultipartFilesPostRequest(requestBody)
+        return await self.transport.request('POST', '/multipart', body=requestBody, operation='postMultipart')
+
+    async def postMultipartBatched(self,
+                                   requestBody: Sequence[Dict[str, Any]],
+                                   batch_size: int = MAX_ITEMS_PER_REQUEST,
+                                   concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """postMultipart for any number of items, sent in concurrent chunks; responses are merged in input order"""
+        responses = await run_batches(chunk_items(requestBody, batch_size),
+                                      lambda chunk: self.postMultipart(requestBody=list(chunk)),
+                                      concurrency or default_concurrency(self.transport.pool))
+        return merge_responses(responses)
+
+    async def putMultipart(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Initiates multipart upload process that updates single salesforce file record id and return signed urls and upload Id.
+
+        Returns the parsed MultipartFilesPutResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_MultipartFilesPutRequest(requestBody)
+        return await self.transport.request('PUT', '/multipart', body=requestBody, operation='putMultipart')
+
+    async def postMultipartComplete(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Must be called after multipart part files have been successfully uploaded.
+
+        Returns the parsed MultipartFilesCompletePostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_MultipartFilesCompletePostRequest(requestBody)
+        return await self.transport.request('POST', '/multipart/complete', body=requestBody,
+                                            operation='postMultipartComplete')
+
+    async def putMultipartRefresh(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Optionally called to generate presigned URLs for an existing multipart upload using uploadId.
+
+        Returns the parsed MultipartFilesRefreshPutResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_MultipartFilesRefreshPutRequest(requestBody)
+        return await self.transport.request('PUT', '/multipart/refresh', body=requestBody,
+                                            operation='putMultipartRefresh')
+
+    async def getTextcontent(self, Id: str, IsArchived: Optional[str] = None) -> Dict[str, Any]:
+        """Returns the OCR'ed text content of a given file.
+
+        Returns the parsed TextContentPostResponse response.
+        """
+        return await self.transport.request('GET', '/textcontent', query={'Id': Id, 'IsArchived': IsArchived},
+                                            operation='getTextcontent')
+
+    async def postTextcontent(self, requestBody: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Returns the OCR'ed text content of multiple files."""
+        if self.validate_requests:
+            validators.validate_PostTextcontentBody(requestBody)
+        return await self.transport.request('POST', '/textcontent', body=requestBody,
+                                            operation='postTextcontent')
+
+    async def getVersions(self, Id: str) -> Dict[str, Any]:
+        """Returns a list of all versions that currently exist for a given file record.
+
+        Returns the parsed VersionsGetResponse response.
+        """
+        return await self.transport.request('GET', '/versions', query={'Id': Id}, operation='getVersions')
+
+    async def getVersion(self, Ids: str) -> List[Dict[str, Any]]:
+        """Returns the latest version of the specified salesforce file record ids.
+
+        Returns the parsed VersionGetResponse response.
+        """
+        return await self.transport.request('GET', '/version', query={'Ids': Ids}, operation='getVersion')
+
+    async def getVersionBatched(self,
+                                Ids: Sequence[str],
+                                batch_size: int = MAX_IDS_PER_REQUEST,
+                                concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """getVersion for any number of Ids, sent in concurrent chunks; Records come back in input order"""
+        responses = await run_batches(chunk_ids(Ids, batch_size),
+                                      lambda chunk: self.getVersion(Ids=','.join(chunk)),
+                                      concurrency or default_concurrency(self.transport.pool))
+        return merge_id_responses(Ids, responses)
+
+    async def getPreview(self,
+                         Id: str,
+                         PreviewType: str,
+                         VersionId: Optional[str] = None,
+                         IsArchived: Optional[str] = None) -> Dict[str, Any]:
+        """Returns a signed url to preview a file.
+
+        Returns the parsed PreviewGetResponse response.
+        """
+        query = {
+            'Id': Id,
+            'VersionId': VersionId,
+            'IsArchived': IsArchived,
+            'PreviewType': PreviewType
+        }
+        return await self.transport.request('GET', '/preview', query=query, operation='getPreview')
+
+    async def postPreview(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns an array of signed urls of files to preview and fail reasons for specific files.
+
+        Returns the parsed PreviewPostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_PreviewPostRequest(requestBody)
+        return await self.transport.request('POST', '/preview', body=requestBody, operation='postPreview')
+
+    async def postMove(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Moves the file records to the specified related salesforce record id.
+
+        Returns the parsed MovePostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_MovePostRequest(requestBody)
+        return await self.transport.request('POST', '/move', body=requestBody, operation='postMove')
+
+    async def postCopy(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Creates a duplicate of one or more existing files.
+
+        Returns the parsed CopyPostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_CopyPostRequest(requestBody)
+        return await self.transport.request('POST', '/copy', body=requestBody, operation='postCopy')
+
+    async def getHistory(self, Id: str) -> Dict[str, Any]:
+        """Returns an array of history records for the specified file.
+
+        Returns the parsed HistoryGetResponse response.
+        """
+        return await self.transport.request('GET', '/history', query={'Id': Id}, operation='getHistory')
+
+    async def postSearch(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns an array of file records matching the provided search criteria.
+
+        Returns the parsed SearchPostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_SearchPostRequest(requestBody)
+        return await self.transport.request('POST', '/search', body=requestBody, operation='postSearch')
+
+    async def getFavorites(self, RelatedRecordId: str) -> Dict[str, Any]:
+        """Returns an array of file records which the user has marked as "favorites."
+
+        Returns the parsed FavoritesGetResponse response.
+        """
+        return await self.transport.request('GET', '/favorites', query={'RelatedRecordId': RelatedRecordId},
+                                            operation='getFavorites')
+
+    async def getFolders(self, Id: str) -> List[Dict[str, Any]]:
+        """Returns folder structure for the given record
+
+        Returns the parsed FolderGetResponse response.
+        """
+        return await self.transport.request('GET', '/folders', query={'Id': Id}, operation='getFolders')
+
+    async def postFolders(self, requestBody: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Creates new folder
+
+        Returns the parsed FolderPostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FolderPostRequest(requestBody)
+        return await self.transport.request('POST', '/folders', body=requestBody, operation='postFolders')
+
+    async def postFoldersZipCreate(self,
+                                   requestBody: Dict[str, Any],
+                                   usePost: Optional[str] = None) -> Dict[str, Any]:
+        """Initial job process for downloading folders
+
+        Returns the parsed FolderZipCreatePostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FolderZipCreatePostRequest(requestBody)
+        query = {
+            'usePost': usePost
+        }
+        return await self.transport.request('POST', '/folders/zip/create', query=query, body=requestBody,
+                                            operation='postFoldersZipCreate')
+
+    async def postFoldersZipComplete(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """use to check status of the zip file
+
+        Returns the parsed FolderZipCompletePostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_FolderZipCompletePostRequest(requestBody)
+        return await self.transport.request('POST', '/folders/zip/complete', body=requestBody,
+                                            operation='postFoldersZipComplete')
+
+    async def postUnzipStatus(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """use to check status of the unzip jobs
+
+        Returns the parsed UnzipStatusPostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_UnzipStatusPostRequest(requestBody)
+        return await self.transport.request('POST', '/unzip/status', body=requestBody,
+                                            operation='postUnzipStatus')
+
+    async def postUnzipExisting(self, requestBody: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """use to unzip existing zip file.
+
+        Returns the parsed UnzipExistingPostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_UnzipExistingPostRequest(requestBody)
+        return await self.transport.request('POST', '/unzip/existing', body=requestBody,
+                                            operation='postUnzipExisting')
+
+    async def postUnzipExistingBatched(self,
+                                       requestBody: Sequence[Dict[str, Any]],
+                                       batch_size: int = MAX_ITEMS_PER_REQUEST,
+                                       concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """postUnzipExisting for any number of items, sent in concurrent chunks; responses are merged in input order"""
+        responses = await run_batches(chunk_items(requestBody, batch_size),
+                                      lambda chunk: self.postUnzipExisting(requestBody=list(chunk)),
+                                      concurrency or default_concurrency(self.transport.pool))
+        return merge_responses(responses)
+
+    async def postPdfConvert(self, requestBody: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert files to PDF by record id
+
+        Returns the parsed PdfConvertPostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_PdfConvertPostRequest(requestBody)
+        return await self.transport.request('POST', '/pdf/convert', body=requestBody,
+                                            operation='postPdfConvert')
+
+    async def postPdfConvertBatched(self,
+                                    requestBody: Sequence[Dict[str, Any]],
+                                    batch_size: int = MAX_ITEMS_PER_REQUEST,
+                                    concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """postPdfConvert for any number of items, sent in concurrent chunks; responses are merged in input order"""
+        responses = await run_batches(chunk_items(requestBody, batch_size),
+                                      lambda chunk: self.postPdfConvert(requestBody=list(chunk)),
+                                      concurrency or default_concurrency(self.transport.pool))
+        return merge_responses(responses)
+
+    async def postPdfConvertComplete(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the status of an existing pdf convert job.
+
+        Returns the parsed PdfConvertCompletePostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_PdfConvertCompletePostRequest(requestBody)
+        return await self.transport.request('POST', '/pdf/convert/complete', body=requestBody,
+                                            operation='postPdfConvertComplete')
+
+    # Sharing Methods
+
+    async def getExternallinkPreview(self, ShareId: str, FileId: str) -> Dict[str, Any]:
+        """Returns a preview link for the provided external link information. This action will search within the associated client's pdf rendition bucket.
+
+        Returns the parsed ExternalLinkPreviewResponse response.
+        """
+        query = {
+            'ShareId': ShareId,
+            'FileId': FileId
+        }
+        return await self.transport.request('GET', '/externallink/preview', query=query,
+                                            operation='getExternallinkPreview')
+
+    async def getExternallinkDownload(self,
+                                      ShareId: str,
+                                      FileIds: str,
+                                      FileNames: Optional[str] = None) -> Dict[str, Any]:
+        """Returns a presinged URL for the provided external link information. This action will search within the associated client's dedicated upload S3 bucket.
+
+        Returns the parsed ExternalLinkDownloadResponse response.
+        """
+        query = {
+            'ShareId': ShareId,
+            'FileIds': FileIds,
+            'FileNames': FileNames
+        }
+        return await self.transport.request('GET', '/externallink/download', query=query,
+                                            operation='getExternallinkDownload')
+
+    async def postExternallinkZip(self, ShareId: str, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Downloads multiple files and folders
+
+        Returns the parsed ExternalLinkZipResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_ExternalLinkZipRequest(requestBody)
+        query = {
+            'ShareId': ShareId
+        }
+        return await self.transport.request('POST', '/externallink/zip', query=query, body=requestBody,
+                                            operation='postExternallinkZip')
+
+    async def getExternallinkZip(self, ShareId: str, ZipFileId: str) -> Dict[str, Any]:
+        """Retrieves the status of a previously initiated zip download
+
+        Returns the parsed ExternalLinkZipStatusResponse response.
+        """
+        query = {
+            'ShareId': ShareId,
+            'ZipFileId': ZipFileId
+        }
+        return await self.transport.request('GET', '/externallink/zip', query=query,
+                                            operation='getExternallinkZip')
+
+    async def getExternallink(self, ShareId: str) -> Dict[str, Any]:
+        """Returns external link top level attributes along with associated Record(s) external link information.
+
+        Returns the parsed ExternalLinkGetResponse response.
+        """
+        return await self.transport.request('GET', '/externallink', query={'ShareId': ShareId},
+                                            operation='getExternallink')
+
+    # Sharing Management Methods
+
+    async def postExternallinkCreate(self, requestBody: Dict[str, Any]) -> Dict[str, Any]:
+        """Creates an external link for the provided FileInfoRecords and corresponding FileLinkRecord information.
+
+        Returns the parsed ExternalLinkPostResponse response.
+        """
+        if self.validate_requests:
+            validators.validate_ExternalLinkPostRequest(requestBody)
+        return await self.transport.request('POST', '/externallink/create', body=requestBody,
+                                            operation='postExternallinkCreate')
+
+    async def deleteExternallink(self, LinkId: str) -> Dict[str, Any]:
+        """Deletes the External Link associated with the provided LinkId.
+
+        Returns the parsed ExternalLinkDeleteResponse response.
+        """
+        return await self.transport.request('DELETE', '/externallink', query={'LinkId': LinkId},
+                                            operation='deleteExternallink')
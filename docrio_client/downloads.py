@@ -0,0 +1,145 @@
+import asyncio
+import os
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from docrio_client.batching import MAX_IDS_PER_REQUEST, chunk_ids
+from docrio_client.client import DocrioAsyncClient
+from docrio_client.transport import DocrioApiError
+
+PART_SUFFIX = '.part'
+# Characters not allowed in file names on common file systems
+UNSAFE_NAME = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+# Download statuses worth retrying after a pause; 403 is retried at once with a fresh URL
+RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+
+
+class DownloadError(Exception):
+    """Raised when a file cannot be downloaded intact"""
+
+
+def default_file_name(record: Dict[str, Any]) -> str:
+    """<Id>_<Name>, with characters that are unsafe in file names replaced"""
+    return f"{record['Id']}_{UNSAFE_NAME.sub('_', str(record.get('Name') or 'file'))}"
+
+
+class BulkDownloader:
+    """Downloads many Docrio files into a directory, streaming each body to disk.
+
+    Ids are resolved in batches: /files/info gives each file's name and size, and /files
+    its signed URL. At most concurrency files download at once. Each one is written in
+    fixed-size chunks to a .part file, which is renamed into place once its size matches
+    the metadata, so memory stays flat however large the files are. Files already on
+    disk with the expected size are skipped, so an interrupted export can be run again.
+    """
+
+    def __init__(self, client: DocrioAsyncClient, directory: str, concurrency: int = 8,
+                 batch_size: int = MAX_IDS_PER_REQUEST, retries: int = 3,
+                 file_name: Callable[[Dict[str, Any]], str] = default_file_name):
+        self.client = client
+        self.directory = directory
+        self.concurrency = max(concurrency, 1)
+        self.batch_size = batch_size
+        self.retries = retries
+        self.file_name = file_name
+
+    async def download(self, ids: Iterable[str]) -> Dict[str, Any]:
+        """Download every file in ids and return counts of downloaded, skipped and failed files"""
+        os.makedirs(self.directory, exist_ok=True)
+        summary: Dict[str, Any] = {'downloaded': 0, 'skipped': 0, 'bytes': 0, 'failed': {}}
+        # Bounded, so signed URLs are resolved shortly before they are used
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        async def produce():
+            for chunk in chunk_ids(ids, self.batch_size):
+                for job in await self.resolve(chunk, summary):
+                    await queue.put(job)
+
+        async def worker():
+            while True:
+                job = await queue.get()
+                if job is None:
+                    return
+                try:
+                    written = await self.download_file(*job)
+                except (DocrioApiError, DownloadError, ConnectionError, asyncio.TimeoutError, OSError) as e:
+                    summary['failed'][job[0]] = str(e)
+                    continue
+                # Counted after the await, since other workers update the summary meanwhile
+                summary['bytes'] += written
+                summary['downloaded'] += 1
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+        try:
+            await produce()
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return summary
+
+    async def resolve(self, ids: List[str],
+                      summary: Dict[str, Any]) -> List[Tuple[str, str, Optional[int], Optional[str]]]:
+        """(Id, path, expected size, signed URL) for each file of a batch that still needs downloading"""
+        info = await self.client.getFilesInfo(','.join(ids))
+        records = {record.get('Id'): record for record in (info or {}).get('Records') or []}
+        wanted = []
+        for file_id in ids:
+            record = records.get(file_id)
+            if record is None:
+                summary['failed'][file_id] = 'No file record'
+                continue
+            path = os.path.join(self.directory, self.file_name(record))
+            size = record.get('litify_docs__File_Size__c')
+            if size is not None and os.path.isfile(path) and os.path.getsize(path) == size:
+                summary['skipped'] += 1
+                continue
+            wanted.append((file_id, path, size))
+        urls = await self.signed_urls([file_id for file_id, _, _ in wanted]) if wanted else {}
+        return [(file_id, path, size, urls.get(file_id)) for file_id, path, size in wanted]
+
+    async def signed_urls(self, ids: List[str]) -> Dict[str, str]:
+        """Signed download URL of each Id that /files could sign"""
+        response = await self.client.getFiles(','.join(ids))
+        return {record['Id']: record['SignedUrl'] for record in (response or {}).get('Records') or []
+                if record.get('SignedUrl') and not record.get('FailReason')}
+
+    async def download_file(self, file_id: str, path: str, size: Optional[int], url: Optional[str]) -> int:
+        """Stream one file to path and return its size"""
+        part_path = path + PART_SUFFIX
+        error: Exception = DownloadError(f"No signed URL for {file_id}")
+        for attempt in range(self.retries + 1):
+            if url is None:
+                # The batch URL was missing or has expired
+                url = (await self.signed_urls([file_id])).get(file_id)
+                if url is None:
+                    raise error
+            try:
+                with open(part_path, 'wb') as out:
+                    response = await self.client.transport.send('GET', url, default_headers=False, sink=out.write)
+            except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+                error = DownloadError(f"{file_id}: {e}")
+            else:
+                if 200 <= response.status < 300:
+                    written = os.path.getsize(part_path)
+                    if size is None or written == size:
+                        os.replace(part_path, path)
+                        return written
+                    error = DownloadError(f"{file_id}: got {written} bytes, /files/info says {size}")
+                elif response.status == 403:
+                    url = None
+                    error = DocrioApiError(response.status, response.body, 'GET', f"signed URL of {file_id}")
+                    continue
+                elif response.status in RETRY_STATUSES:
+                    error = DocrioApiError(response.status, response.body, 'GET', f"signed URL of {file_id}")
+                else:
+                    os.remove(part_path)
+                    raise DocrioApiError(response.status, response.body, 'GET', f"signed URL of {file_id}")
+            if attempt < self.retries:
+                await asyncio.sleep(min(0.1 * 2 ** attempt, 5.0))
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise error
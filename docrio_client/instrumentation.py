@@ -0,0 +1,130 @@
+import json
+import os
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+from docrio_client.transport import DocrioTransport
+
+# Bucket upper bounds: latency in milliseconds, payload sizes in bytes (64 B to 256 MiB)
+LATENCY_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+SIZE_BOUNDS = tuple(4 ** n for n in range(3, 15))
+
+
+class Histogram:
+    """Fixed-bucket histogram; a quantile is estimated as the upper bound of the bucket it falls in"""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # The last bucket holds values above every bound
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated q-quantile (0 < q <= 1), never above the largest value seen"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                bound = self.bounds[index] if index < len(self.bounds) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def to_json(self) -> Dict[str, Any]:
+        buckets = [[bound, count] for bound, count in zip(self.bounds, self.counts) if count]
+        if self.counts[-1]:
+            buckets.append(['+Inf', self.counts[-1]])
+        return {
+            'count': self.count,
+            'sum': round(self.total, 3),
+            'min': self.min,
+            'max': self.max,
+            'p50': self.quantile(0.5),
+            'p90': self.quantile(0.9),
+            'p99': self.quantile(0.99),
+            'buckets': buckets
+        }
+
+
+class MetricsRecorder:
+    """Instrumentation sink that keeps latency and payload size histograms per operation.
+
+    Pass an instance as DocrioAsyncClient(..., instrumentation=recorder). The transport
+    calls it once per API call with a record holding the operation, method, path,
+    status (None if no response arrived), seconds, request_bytes, response_bytes,
+    retries and error; bodies and headers are never part of a record. snapshot() lists
+    operations by total time, so the endpoints that dominate latency come first, and
+    export() / push() write it to a local JSON file or POST it to a collector.
+    """
+
+    def __init__(self):
+        self.operations: Dict[str, Dict[str, Any]] = {}
+
+    def __call__(self, call: Dict[str, Any]):
+        stats = self.operations.get(call['operation'])
+        if stats is None:
+            stats = self.operations[call['operation']] = {
+                'method': call['method'],
+                'latency_ms': Histogram(LATENCY_BOUNDS_MS),
+                'request_bytes': Histogram(SIZE_BOUNDS),
+                'response_bytes': Histogram(SIZE_BOUNDS),
+                'statuses': {},
+                'errors': 0,
+                'retries': 0
+            }
+        stats['latency_ms'].add(call['seconds'] * 1000.0)
+        stats['request_bytes'].add(call['request_bytes'])
+        stats['response_bytes'].add(call['response_bytes'])
+        status = str(call['status'])
+        stats['statuses'][status] = stats['statuses'].get(status, 0) + 1
+        if call['error'] is not None:
+            stats['errors'] += 1
+        stats['retries'] += call['retries']
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Statistics of every operation seen, slowest in total first"""
+        ranked = sorted(self.operations.items(), key=lambda item: -item[1]['latency_ms'].total)
+        return {'operations': {
+            operation: dict(stats, **{name: stats[name].to_json()
+                                      for name in ('latency_ms', 'request_bytes', 'response_bytes')})
+            for operation, stats in ranked
+        }}
+
+    def report(self) -> List[str]:
+        """One line per operation: calls, total and percentile latency, mean payload sizes"""
+        lines = [f"{'operation':<32} {'calls':>6} {'total s':>8} {'p50 ms':>7} {'p99 ms':>7} "
+                 f"{'req KiB':>8} {'resp KiB':>9} {'errors':>6}"]
+        for operation, stats in self.snapshot()['operations'].items():
+            latency = stats['latency_ms']
+            calls = latency['count']
+            lines.append(f"{operation:<32} {calls:>6} {latency['sum'] / 1000:>8.2f} {latency['p50']:>7.1f} "
+                         f"{latency['p99']:>7.1f} {stats['request_bytes']['sum'] / calls / 1024:>8.1f} "
+                         f"{stats['response_bytes']['sum'] / calls / 1024:>9.1f} {stats['errors']:>6}")
+        return lines
+
+    def export(self, path: str):
+        """Write the snapshot to a JSON file, replacing it atomically"""
+        temp_file = f"{path}.tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+            f.write('\n')
+        os.replace(temp_file, path)
+
+    async def push(self, url: str, headers: Optional[Dict[str, str]] = None):
+        """POST the snapshot as JSON to a collector URL"""
+        transport = DocrioTransport(url)
+        try:
+            await transport.request('POST', url, body=self.snapshot(), headers=headers)
+        finally:
+            await transport.close()
@@ -0,0 +1,379 @@
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from docrio_client.client import DocrioAsyncClient
+from docrio_client.transport import DocrioApiError
+
+# Statuses that end a job; anything else means it is still running
+SUCCEEDED_STATUSES = {'COMPLETE', 'COMPLETED', 'SUCCESS', 'SUCCEEDED', 'DONE'}
+FAILED_STATUSES = {'FAILED', 'FAILURE', 'ERROR', 'CANCELLED', 'CANCELED', 'EXPIRED', 'NOT_FOUND'}
+# Status check errors after which polling carries on with a longer interval
+RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+
+JobKey = Tuple[str, str]
+
+logger = logging.getLogger(__name__)
+
+
+class JobFailedError(Exception):
+    """Raised for a job whose status check reports a failure"""
+
+    def __init__(self, kind: str, job_id: str, status: Optional[str], detail: Any = None):
+        self.kind = kind
+        self.job_id = job_id
+        self.status = status
+        self.detail = detail
+        super().__init__(f"{kind} job {job_id} ended with status {status}: {detail!r}")
+
+
+# How each kind of job is checked, how many of its ids one status request can carry,
+# and the params track() must be given for it
+JOB_KINDS: Dict[str, Dict[str, Any]] = {
+    'archive': {
+        'check': lambda client, ids, params: client.getArchiveStatus(ids[0]),
+        'batch_size': 1
+    },
+    'archive_restore': {
+        'check': lambda client, ids, params: client.getArchiveRestoreStatus(ids[0]),
+        'batch_size': 1
+    },
+    'unzip': {
+        'check': lambda client, ids, params: client.postUnzipStatus({'jobIds': list(ids)}),
+        'batch_size': 100
+    },
+    'folder_zip': {
+        'check': lambda client, ids, params: client.postFoldersZipComplete(dict(params, jobId=ids[0])),
+        'batch_size': 1
+    },
+    'combine': {
+        'check': lambda client, ids, params: client.postFilesCombineComplete({'Id': ids[0]}),
+        'batch_size': 1
+    },
+    'split': {
+        'check': lambda client, ids, params: client.postFilesSplitComplete({'Ids': list(ids)}),
+        'batch_size': 100
+    },
+    'pdf_convert': {
+        'check': lambda client, ids, params: client.postPdfConvertComplete({'jobIds': list(ids)}),
+        'batch_size': 100
+    },
+    'externallink_zip': {
+        'check': lambda client, ids, params: client.getExternallinkZip(params['ShareId'], ids[0]),
+        'batch_size': 1,
+        'params': ('ShareId',)
+    }
+}
+
+
+def missing_params(kind: str, params: Optional[Dict[str, Any]]) -> List[str]:
+    """Names of the params a job of this kind needs but was not given"""
+    return [name for name in JOB_KINDS[kind].get('params', ()) if (params or {}).get(name) is None]
+
+
+def short_job_id(job_id: str) -> str:
+    """Job id without a kind prefix: status responses report unzip/<uuid> jobs as <uuid>"""
+    return str(job_id).rsplit('/', 1)[-1]
+
+
+def read_statuses(response: Any, ids: Sequence[str]) -> Dict[str, Tuple[Optional[str], Any]]:
+    """(status, detail) of each job id in a status response; (None, None) when it is not mentioned.
+
+    Handles the three shapes the spec uses: a single job object with status/Status,
+    a jobStatuses list, and a Statuses list next to an Errors map.
+    """
+    response = response if isinstance(response, dict) else {}
+    listed = {}
+    for entry in response.get('jobStatuses') or response.get('Statuses') or []:
+        if isinstance(entry, dict):
+            listed[short_job_id(entry.get('jobId', ''))] = (entry.get('status'), entry)
+    errors = response.get('Errors') if isinstance(response.get('Errors'), dict) else {}
+    statuses = {}
+    for job_id in ids:
+        short = short_job_id(job_id)
+        if job_id in errors or short in errors:
+            statuses[job_id] = ('ERROR', {'Error': errors.get(job_id, errors.get(short))})
+        elif short in listed:
+            statuses[job_id] = listed[short]
+        elif len(ids) == 1 and ('status' in response or 'Status' in response):
+            statuses[job_id] = (response.get('status') or response.get('Status'), response)
+        else:
+            statuses[job_id] = (None, None)
+    return statuses
+
+
+class Job:
+    """One tracked job and its polling state"""
+
+    def __init__(self, kind: str, job_id: str, params: Optional[Dict[str, Any]] = None, interval: float = 1.0,
+                 next_poll: float = 0.0, status: Optional[str] = None, polls: int = 0):
+        self.kind = kind
+        self.job_id = job_id
+        self.params = dict(params or {})
+        self.interval = interval
+        self.next_poll = next_poll
+        self.status = status
+        self.polls = polls
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+        self.future: Optional[asyncio.Future] = None
+        self.callbacks: List[Callable[['Job'], Any]] = []
+
+    @property
+    def key(self) -> JobKey:
+        return self.kind, self.job_id
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'kind': self.kind, 'job_id': self.job_id, 'params': self.params, 'interval': self.interval,
+                'next_poll': self.next_poll, 'status': self.status, 'polls': self.polls}
+
+
+class JobPoller:
+    """Polls any number of start-then-poll jobs (archive, unzip, zip, combine, ...) from one event loop.
+
+    Each job backs off on its own: the interval grows by backoff while its status stays
+    the same, up to max_interval, and drops back to min_interval when the status moves.
+    Jobs of kinds whose status endpoint takes a list of ids are checked together, up to
+    the kind's batch size per request. track() returns a future for the job's final
+    status detail, and callbacks run when it finishes. With a state_file, outstanding
+    jobs are saved after every round of checks and picked up again on restart.
+    """
+
+    def __init__(self, client: DocrioAsyncClient, state_file: Optional[str] = None, min_interval: float = 1.0,
+                 max_interval: float = 60.0, backoff: float = 1.6, concurrency: int = 8, coalesce: float = 0.25,
+                 on_complete: Optional[Callable[[Job], Any]] = None, seed: Optional[int] = None):
+        self.client = client
+        self.state_file = state_file
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.concurrency = max(concurrency, 1)
+        # Jobs due within this many seconds are checked in the same round, filling status batches
+        self.coalesce = coalesce
+        self.on_complete = on_complete
+        self.rng = random.Random(seed)
+        self.jobs: Dict[JobKey, Job] = {}
+        self.schedule: List[Tuple[float, int, JobKey]] = []
+        self.sequence = itertools.count()
+        self.wakeup = asyncio.Event()
+        self.dirty = False
+        self.task: Optional[asyncio.Task] = None
+        self.status_requests = 0
+        if state_file is not None:
+            self.load()
+
+    # Tracking
+
+    def track(self, kind: str, job_id: str, params: Optional[Dict[str, Any]] = None,
+              callback: Optional[Callable[[Job], Any]] = None) -> asyncio.Future:
+        """Start polling a job (or join one already tracked, e.g. after a restart) and return its future"""
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind {kind!r}; expected one of {', '.join(sorted(JOB_KINDS))}")
+        job = self.jobs.get((kind, job_id))
+        if job is None:
+            missing = missing_params(kind, params)
+            if missing:
+                raise ValueError(f"{kind} job {job_id} needs params {', '.join(missing)}")
+            job = Job(kind, job_id, params, self.min_interval, time.time() + self.min_interval)
+            self.jobs[job.key] = job
+            self.push(job)
+            self.dirty = True
+            self.wakeup.set()
+        if callback is not None:
+            job.callbacks.append(callback)
+        if job.future is None:
+            job.future = asyncio.get_running_loop().create_future()
+        return job.future
+
+    def push(self, job: Job):
+        heapq.heappush(self.schedule, (job.next_poll, next(self.sequence), job.key))
+
+    def reschedule(self, job: Job, interval: float):
+        # Jitter keeps jobs started together from being checked in lockstep forever
+        job.interval = min(max(interval, self.min_interval), self.max_interval)
+        job.next_poll = time.time() + job.interval * self.rng.uniform(0.9, 1.1)
+        self.push(job)
+        self.dirty = True
+
+    def finish(self, job: Job, result: Any = None, error: Optional[Exception] = None):
+        """Stop tracking a job and settle its future; its callbacks are run by notify()"""
+        del self.jobs[job.key]
+        self.dirty = True
+        job.result, job.error = result, error
+        if job.future is not None and not job.future.done():
+            if error is not None:
+                job.future.set_exception(error)
+            else:
+                job.future.set_result(result)
+
+    def notify(self, jobs: List[Job]):
+        """Run the callbacks of finished jobs; one that raises is logged and does not stop the others"""
+        for job in jobs:
+            for callback in job.callbacks + ([self.on_complete] if self.on_complete else []):
+                try:
+                    callback(job)
+                except Exception:
+                    logger.exception("Callback for %s job %s failed", job.kind, job.job_id)
+
+    # Polling
+
+    def due_jobs(self) -> List[Job]:
+        """Pop every job due now (or within the coalescing window) off the schedule"""
+        horizon = time.time() + self.coalesce
+        due = []
+        while self.schedule and self.schedule[0][0] <= horizon:
+            next_poll, _, key = heapq.heappop(self.schedule)
+            job = self.jobs.get(key)
+            # Entries of finished or rescheduled jobs are stale
+            if job is not None and job.next_poll == next_poll:
+                due.append(job)
+        return due
+
+    async def poll_due(self):
+        """Check every due job once, batching ids where the status endpoint allows"""
+        groups: Dict[Tuple[str, str], List[Job]] = {}
+        for job in self.due_jobs():
+            groups.setdefault((job.kind, json.dumps(job.params, sort_keys=True)), []).append(job)
+        batches = []
+        for (kind, _), jobs in groups.items():
+            size = JOB_KINDS[kind]['batch_size']
+            batches.extend(jobs[i:i + size] for i in range(0, len(jobs), size))
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def check(batch: List[Job]):
+            async with slots:
+                await self.check(batch)
+
+        await asyncio.gather(*(check(batch) for batch in batches))
+        self.save()
+
+    async def check(self, jobs: List[Job]):
+        """One status request for jobs of the same kind and parameters"""
+        kind = jobs[0].kind
+        ids = [job.job_id for job in jobs]
+        finished = []
+        try:
+            self.status_requests += 1
+            response = await JOB_KINDS[kind]['check'](self.client, ids, jobs[0].params)
+        except DocrioApiError as e:
+            for job in jobs:
+                if e.status in RETRY_STATUSES:
+                    self.reschedule(job, job.interval * 2)
+                else:
+                    self.finish(job, error=e)
+                    finished.append(job)
+            self.notify(finished)
+            return
+        except (ConnectionError, asyncio.TimeoutError):
+            for job in jobs:
+                self.reschedule(job, job.interval * 2)
+            return
+        except Exception as e:
+            # Anything else (an invalid request body, a bad param) will not get better by retrying
+            for job in jobs:
+                self.finish(job, error=e)
+            self.notify(jobs)
+            return
+
+        statuses = read_statuses(response, ids)
+        for job in jobs:
+            status, detail = statuses[job.job_id]
+            job.polls += 1
+            normalized = str(status or '').upper()
+            if normalized in SUCCEEDED_STATUSES:
+                job.status = status
+                self.finish(job, result=detail)
+                finished.append(job)
+            elif normalized in FAILED_STATUSES:
+                job.status = status
+                self.finish(job, error=JobFailedError(kind, job.job_id, status, detail))
+                finished.append(job)
+            else:
+                # Progress resets the backoff; a status that does not move stretches it
+                interval = self.min_interval if status != job.status else job.interval * self.backoff
+                job.status = status
+                self.reschedule(job, interval)
+        # Every job of the batch is settled or rescheduled before any callback runs
+        self.notify(finished)
+
+    async def run(self):
+        """Poll until every tracked job has finished"""
+        while self.jobs:
+            delay = self.schedule[0][0] - time.time() - self.coalesce if self.schedule else self.max_interval
+            if delay > 0:
+                self.save()
+                self.wakeup.clear()
+                try:
+                    # track() wakes the loop early so new jobs get their own schedule
+                    await asyncio.wait_for(self.wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self.poll_due()
+        self.save()
+
+    def start(self) -> asyncio.Task:
+        """Run the polling loop in the background until stop()"""
+        if self.task is None or self.task.done():
+            self.task = asyncio.ensure_future(self.run_forever())
+        return self.task
+
+    async def run_forever(self):
+        while True:
+            await self.run()
+            self.wakeup.clear()
+            await self.wakeup.wait()
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+        self.save()
+
+    async def __aenter__(self) -> 'JobPoller':
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    # Persistence
+
+    def load(self):
+        """Pick up the jobs a previous poller saved; their futures are created by track()"""
+        try:
+            with open(self.state_file, 'r') as state:
+                saved = json.load(state)
+        except (OSError, ValueError):
+            return
+        for entry in saved.get('jobs', []):
+            if entry.get('kind') in JOB_KINDS and missing_params(entry['kind'], entry.get('params')):
+                logger.warning("Dropping saved %s job %s: missing params %s", entry['kind'], entry.get('job_id'),
+                               ', '.join(missing_params(entry['kind'], entry.get('params'))))
+                self.dirty = True
+            elif entry.get('kind') in JOB_KINDS and (entry['kind'], entry['job_id']) not in self.jobs:
+                job = Job(entry['kind'], entry['job_id'], entry.get('params'),
+                          entry.get('interval', self.min_interval), entry.get('next_poll', 0.0),
+                          entry.get('status'), entry.get('polls', 0))
+                self.jobs[job.key] = job
+                self.push(job)
+
+    def save(self):
+        """Write outstanding jobs to the state file if anything changed"""
+        if self.state_file is None or not self.dirty:
+            return
+        temporary = f"{self.state_file}.tmp"
+        with open(temporary, 'w') as state:
+            json.dump({'jobs': [job.to_dict() for job in self.jobs.values()]}, state)
+        os.replace(temporary, self.state_file)
+        self.dirty = False
@@ -0,0 +1,4526 @@
+"""Generated Docrio API models; regenerate with generate_docrio.py --python-client"""
+from typing import Any, Dict, List, Optional
+
+_new = object.__new__
+
+
+class SearchPostRequest:
+    """SearchPostRequest model"""
+    __slots__ = ('Name',
+                 'CreatedDate',
+                 'Author',
+                 'litify_docs__Related_To__c',
+                 'Custom_Field__c',
+                 'IsArchived',
+                 'paginationState',
+                 'paginationToken',
+                 'sortState')
+
+    def __init__(self,
+                 *,
+                 Name: Optional[str] = None,
+                 CreatedDate: Optional['Anonymous685CC7A3'] = None,
+                 Author: Optional[str] = None,
+                 litify_docs__Related_To__c: Optional[str] = None,
+                 Custom_Field__c: Optional[str] = None,
+                 IsArchived: Optional[str] = None,
+                 paginationState: Optional['AnonymousA7A225DF'] = None,
+                 paginationToken: Optional[str] = None,
+                 sortState: Optional['Anonymous23BC28E2'] = None):
+        self.Name = Name
+        self.CreatedDate = CreatedDate
+        self.Author = Author
+        self.litify_docs__Related_To__c = litify_docs__Related_To__c
+        self.Custom_Field__c = Custom_Field__c
+        self.IsArchived = IsArchived
+        self.paginationState = paginationState
+        self.paginationToken = paginationToken
+        self.sortState = sortState
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'SearchPostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Name = get('Name')
+        value = get('CreatedDate')
+        if value is not None:
+            value = Anonymous685CC7A3.from_json(value)
+        obj.CreatedDate = value
+        obj.Author = get('Author')
+        obj.litify_docs__Related_To__c = get('litify_docs__Related_To__c')
+        obj.Custom_Field__c = get('Custom_Field__c')
+        obj.IsArchived = get('IsArchived')
+        value = get('paginationState')
+        if value is not None:
+            value = AnonymousA7A225DF.from_json(value)
+        obj.paginationState = value
+        obj.paginationToken = get('paginationToken')
+        value = get('sortState')
+        if value is not None:
+            value = Anonymous23BC28E2.from_json(value)
+        obj.sortState = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Name
+        if value is not None:
+            data['Name'] = value
+        value = self.CreatedDate
+        if value is not None:
+            data['CreatedDate'] = value.to_json()
+        value = self.Author
+        if value is not None:
+            data['Author'] = value
+        value = self.litify_docs__Related_To__c
+        if value is not None:
+            data['litify_docs__Related_To__c'] = value
+        value = self.Custom_Field__c
+        if value is not None:
+            data['Custom_Field__c'] = value
+        value = self.IsArchived
+        if value is not None:
+            data['IsArchived'] = value
+        value = self.paginationState
+        if value is not None:
+            data['paginationState'] = value.to_json()
+        value = self.paginationToken
+        if value is not None:
+            data['paginationToken'] = value
+        value = self.sortState
+        if value is not None:
+            data['sortState'] = value.to_json()
+        return data
+
+
+class SearchPostResponse:
+    """SearchPostResponse model"""
+    __slots__ = ('Records', 'paginationState', 'paginationToken')
+
+    def __init__(self,
+                 *,
+                 Records: Optional[List['FileRecordObject']] = None,
+                 paginationState: Optional['AnonymousA7A225DF'] = None,
+                 paginationToken: Optional[str] = None):
+        self.Records = Records
+        self.paginationState = paginationState
+        self.paginationToken = paginationToken
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'SearchPostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Records')
+        if value is not None:
+            value = [FileRecordObject.from_json(item) for item in value]
+        obj.Records = value
+        value = get('paginationState')
+        if value is not None:
+            value = AnonymousA7A225DF.from_json(value)
+        obj.paginationState = value
+        obj.paginationToken = get('paginationToken')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Records
+        if value is not None:
+            data['Records'] = [item.to_json() for item in value]
+        value = self.paginationState
+        if value is not None:
+            data['paginationState'] = value.to_json()
+        value = self.paginationToken
+        if value is not None:
+            data['paginationToken'] = value
+        return data
+
+
+class MovePostRequest:
+    """MovePostRequest model"""
+    __slots__ = ('Ids', 'RelatedRecordId')
+
+    def __init__(self, *, Ids: Optional[List[str]] = None, RelatedRecordId: Optional[str] = None):
+        self.Ids = Ids
+        self.RelatedRecordId = RelatedRecordId
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MovePostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Ids = get('Ids')
+        obj.RelatedRecordId = get('RelatedRecordId')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Ids
+        if value is not None:
+            data['Ids'] = value
+        value = self.RelatedRecordId
+        if value is not None:
+            data['RelatedRecordId'] = value
+        return data
+
+
+class MovePostResponse:
+    """MovePostResponse model"""
+    __slots__ = ('Failures',)
+
+    def __init__(self, *, Failures: Optional[List[str]] = None):
+        self.Failures = Failures
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MovePostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Failures = get('Failures')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Failures
+        if value is not None:
+            data['Failures'] = value
+        return data
+
+
+class MergePostRequest:
+    """MergePostRequest model"""
+    __slots__ = ('Templates',)
+
+    def __init__(self, *, Templates: Optional[List['Anonymous02332DDD']] = None):
+        self.Templates = Templates
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MergePostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Templates')
+        if value is not None:
+            value = [Anonymous02332DDD.from_json(item) for item in value]
+        obj.Templates = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Templates
+        if value is not None:
+            data['Templates'] = [item.to_json() for item in value]
+        return data
+
+
+class MergePostResponse:
+    """MergePostResponse model"""
+    __slots__ = ('Records',)
+
+    def __init__(self, *, Records: Optional[List['AnonymousD870485B']] = None):
+        self.Records = Records
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MergePostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Records')
+        if value is not None:
+            value = [AnonymousD870485B.from_json(item) for item in value]
+        obj.Records = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Records
+        if value is not None:
+            data['Records'] = [item.to_json() for item in value]
+        return data
+
+
+class MergeGetResponse:
+    """MergeGetResponse model"""
+    __slots__ = ('Templates',)
+
+    def __init__(self, *, Templates: Optional[List['Anonymous3F57AA5C']] = None):
+        self.Templates = Templates
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MergeGetResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Templates')
+        if value is not None:
+            value = [Anonymous3F57AA5C.from_json(item) for item in value]
+        obj.Templates = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Templates
+        if value is not None:
+            data['Templates'] = [item.to_json() for item in value]
+        return data
+
+
+class MergeCompletePostRequest:
+    """MergeCompletePostRequest model"""
+    __slots__ = ('Ids',)
+
+    def __init__(self, *, Ids: Optional[List[str]] = None):
+        self.Ids = Ids
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MergeCompletePostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Ids = get('Ids')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Ids
+        if value is not None:
+            data['Ids'] = value
+        return data
+
+
+class MergeCompletePostResponse:
+    """MergeCompletePostResponse model"""
+    __slots__ = ('Statuses',)
+
+    def __init__(self, *, Statuses: Optional[Dict[str, Any]] = None):
+        self.Statuses = Statuses
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MergeCompletePostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Statuses = get('Statuses')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Statuses
+        if value is not None:
+            data['Statuses'] = value
+        return data
+
+
+class MergeSchemaGetResponse:
+    """MergeSchemaGetResponse model"""
+    __slots__ = ('_schema', 'type', 'properties')
+
+    def __init__(self,
+                 *,
+                 _schema: Optional[str] = None,
+                 type: Optional[str] = None,
+                 properties: Optional['AnonymousD6892853'] = None):
+        self._schema = _schema
+        self.type = type
+        self.properties = properties
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MergeSchemaGetResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj._schema = get('$schema')
+        obj.type = get('type')
+        value = get('properties')
+        if value is not None:
+            value = AnonymousD6892853.from_json(value)
+        obj.properties = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self._schema
+        if value is not None:
+            data['$schema'] = value
+        value = self.type
+        if value is not None:
+            data['type'] = value
+        value = self.properties
+        if value is not None:
+            data['properties'] = value.to_json()
+        return data
+
+
+class CopyPostRequest:
+    """CopyPostRequest model"""
+    __slots__ = ('Records', 'RelatedRecordId')
+
+    def __init__(self,
+                 *,
+                 Records: Optional[List['Anonymous4B1399C5']] = None,
+                 RelatedRecordId: Optional[str] = None):
+        self.Records = Records
+        self.RelatedRecordId = RelatedRecordId
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'CopyPostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Records')
+        if value is not None:
+            value = [Anonymous4B1399C5.from_json(item) for item in value]
+        obj.Records = value
+        obj.RelatedRecordId = get('RelatedRecordId')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Records
+        if value is not None:
+            data['Records'] = [item.to_json() for item in value]
+        value = self.RelatedRecordId
+        if value is not None:
+            data['RelatedRecordId'] = value
+        return data
+
+
+class CopyPostResponse:
+    """CopyPostResponse model"""
+    __slots__ = ('Copies',)
+
+    def __init__(self, *, Copies: Optional[List['AnonymousA0BEC8AD']] = None):
+        self.Copies = Copies
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'CopyPostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Copies')
+        if value is not None:
+            value = [AnonymousA0BEC8AD.from_json(item) for item in value]
+        obj.Copies = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Copies
+        if value is not None:
+            data['Copies'] = [item.to_json() for item in value]
+        return data
+
+
+class HistoryGetResponse:
+    """HistoryGetResponse model"""
+    __slots__ = ('Records',)
+
+    def __init__(self, *, Records: Optional[List['HistoryRecordObject']] = None):
+        self.Records = Records
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'HistoryGetResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Records')
+        if value is not None:
+            value = [HistoryRecordObject.from_json(item) for item in value]
+        obj.Records = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Records
+        if value is not None:
+            data['Records'] = [item.to_json() for item in value]
+        return data
+
+
+class FavoritesGetResponse:
+    """FavoritesGetResponse model"""
+    __slots__ = ('Records',)
+
+    def __init__(self, *, Records: Optional[List['FileRecordObject']] = None):
+        self.Records = Records
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FavoritesGetResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Records')
+        if value is not None:
+            value = [FileRecordObject.from_json(item) for item in value]
+        obj.Records = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Records
+        if value is not None:
+            data['Records'] = [item.to_json() for item in value]
+        return data
+
+
+class FolderPostRequest:
+    """FolderPostRequest model"""
+    __slots__ = ('recordId', 'folderPath')
+
+    def __init__(self, *, recordId: Optional[str] = None, folderPath: Optional[str] = None):
+        self.recordId = recordId
+        self.folderPath = folderPath
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FolderPostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.recordId = get('recordId')
+        obj.folderPath = get('folderPath')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.recordId
+        if value is not None:
+            data['recordId'] = value
+        value = self.folderPath
+        if value is not None:
+            data['folderPath'] = value
+        return data
+
+
+class FolderZipCreatePostRequest:
+    """FolderZipCreatePostRequest model"""
+    __slots__ = ('fileInfoIds', 'IsArchived')
+
+    def __init__(self, *, fileInfoIds: Optional[List[str]] = None, IsArchived: Optional[str] = None):
+        self.fileInfoIds = fileInfoIds
+        self.IsArchived = IsArchived
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FolderZipCreatePostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.fileInfoIds = get('fileInfoIds')
+        obj.IsArchived = get('IsArchived')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.fileInfoIds
+        if value is not None:
+            data['fileInfoIds'] = value
+        value = self.IsArchived
+        if value is not None:
+            data['IsArchived'] = value
+        return data
+
+
+class FolderZipCreatePostResponse:
+    """FolderZipCreatePostResponse model"""
+    __slots__ = ('jobId', 'presignedUrl')
+
+    def __init__(self, *, jobId: Optional[str] = None, presignedUrl: Optional[str] = None):
+        self.jobId = jobId
+        self.presignedUrl = presignedUrl
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FolderZipCreatePostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.jobId = get('jobId')
+        obj.presignedUrl = get('presignedUrl')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.jobId
+        if value is not None:
+            data['jobId'] = value
+        value = self.presignedUrl
+        if value is not None:
+            data['presignedUrl'] = value
+        return data
+
+
+class FolderZipCompletePostRequest:
+    """FolderZipCompletePostRequest model"""
+    __slots__ = ('jobId', 'IsArchived')
+
+    def __init__(self, *, jobId: Optional[str] = None, IsArchived: Optional[str] = None):
+        self.jobId = jobId
+        self.IsArchived = IsArchived
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FolderZipCompletePostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.jobId = get('jobId')
+        obj.IsArchived = get('IsArchived')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.jobId
+        if value is not None:
+            data['jobId'] = value
+        value = self.IsArchived
+        if value is not None:
+            data['IsArchived'] = value
+        return data
+
+
+class UnzipStatusPostRequest:
+    """UnzipStatusPostRequest model"""
+    __slots__ = ('jobIds',)
+
+    def __init__(self, *, jobIds: Optional[List[str]] = None):
+        self.jobIds = jobIds
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'UnzipStatusPostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.jobIds = get('jobIds')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.jobIds
+        if value is not None:
+            data['jobIds'] = value
+        return data
+
+
+class PdfConvertCompletePostRequest:
+    """PdfConvertCompletePostRequest model"""
+    __slots__ = ('jobIds',)
+
+    def __init__(self, *, jobIds: Optional[List[str]] = None):
+        self.jobIds = jobIds
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'PdfConvertCompletePostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.jobIds = get('jobIds')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.jobIds
+        if value is not None:
+            data['jobIds'] = value
+        return data
+
+
+class FolderZipCompletePostResponse:
+    """FolderZipCompletePostResponse model"""
+    __slots__ = ('jobId', 'expirationTime', 'status', 'fileInfoIds', 'presignedUrl')
+
+    def __init__(self,
+                 *,
+                 jobId: Optional[str] = None,
+                 expirationTime: Optional[int] = None,
+                 status: Optional[str] = None,
+                 fileInfoIds: Optional[List[str]] = None,
+                 presignedUrl: Optional[str] = None):
+        self.jobId = jobId
+        self.expirationTime = expirationTime
+        self.status = status
+        self.fileInfoIds = fileInfoIds
+        self.presignedUrl = presignedUrl
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FolderZipCompletePostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.jobId = get('jobId')
+        obj.expirationTime = get('expirationTime')
+        obj.status = get('status')
+        obj.fileInfoIds = get('fileInfoIds')
+        obj.presignedUrl = get('presignedUrl')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.jobId
+        if value is not None:
+            data['jobId'] = value
+        value = self.expirationTime
+        if value is not None:
+            data['expirationTime'] = value
+        value = self.status
+        if value is not None:
+            data['status'] = value
+        value = self.fileInfoIds
+        if value is not None:
+            data['fileInfoIds'] = value
+        value = self.presignedUrl
+        if value is not None:
+            data['presignedUrl'] = value
+        return data
+
+
+class UnzipExistingPostResponse:
+    """UnzipExistingPostResponse model"""
+    __slots__ = ('name_of_file_zip',)
+
+    def __init__(self, *, name_of_file_zip: Optional['AnonymousEE9E98D8'] = None):
+        self.name_of_file_zip = name_of_file_zip
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'UnzipExistingPostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('name-of-file.zip')
+        if value is not None:
+            value = AnonymousEE9E98D8.from_json(value)
+        obj.name_of_file_zip = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.name_of_file_zip
+        if value is not None:
+            data['name-of-file.zip'] = value.to_json()
+        return data
+
+
+class UnzipStatusPostResponse:
+    """UnzipStatusPostResponse model"""
+    __slots__ = ('jobStatuses',)
+
+    def __init__(self, *, jobStatuses: Optional[List['Anonymous2D4AF8A1']] = None):
+        self.jobStatuses = jobStatuses
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'UnzipStatusPostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('jobStatuses')
+        if value is not None:
+            value = [Anonymous2D4AF8A1.from_json(item) for item in value]
+        obj.jobStatuses = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.jobStatuses
+        if value is not None:
+            data['jobStatuses'] = [item.to_json() for item in value]
+        return data
+
+
+class PdfConvertPostResponse:
+    """PdfConvertPostResponse model"""
+    __slots__ = ('ConvertedFiles',)
+
+    def __init__(self, *, ConvertedFiles: Optional[List['Anonymous72AE4D3A']] = None):
+        self.ConvertedFiles = ConvertedFiles
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'PdfConvertPostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('ConvertedFiles')
+        if value is not None:
+            value = [Anonymous72AE4D3A.from_json(item) for item in value]
+        obj.ConvertedFiles = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.ConvertedFiles
+        if value is not None:
+            data['ConvertedFiles'] = [item.to_json() for item in value]
+        return data
+
+
+class PdfConvertCompletePostResponse:
+    """PdfConvertCompletePostResponse model"""
+    __slots__ = ('jobStatuses',)
+
+    def __init__(self, *, jobStatuses: Optional[List['Anonymous2D4AF8A1']] = None):
+        self.jobStatuses = jobStatuses
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'PdfConvertCompletePostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('jobStatuses')
+        if value is not None:
+            value = [Anonymous2D4AF8A1.from_json(item) for item in value]
+        obj.jobStatuses = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.jobStatuses
+        if value is not None:
+            data['jobStatuses'] = [item.to_json() for item in value]
+        return data
+
+
+class VersionsGetResponse:
+    """VersionsGetResponse model"""
+    __slots__ = ('Versions',)
+
+    def __init__(self, *, Versions: Optional[List[str]] = None):
+        self.Versions = Versions
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'VersionsGetResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Versions = get('Versions')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Versions
+        if value is not None:
+            data['Versions'] = value
+        return data
+
+
+class PreviewPostRequest:
+    """PreviewPostRequest model"""
+    __slots__ = ('Records', 'IsArchived')
+
+    def __init__(self,
+                 *,
+                 Records: Optional[List['AnonymousBE572634']] = None,
+                 IsArchived: Optional[str] = None):
+        self.Records = Records
+        self.IsArchived = IsArchived
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'PreviewPostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Records')
+        if value is not None:
+            value = [AnonymousBE572634.from_json(item) for item in value]
+        obj.Records = value
+        obj.IsArchived = get('IsArchived')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Records
+        if value is not None:
+            data['Records'] = [item.to_json() for item in value]
+        value = self.IsArchived
+        if value is not None:
+            data['IsArchived'] = value
+        return data
+
+
+class PreviewPostResponse:
+    """PreviewPostResponse model"""
+    __slots__ = ('Records',)
+
+    def __init__(self, *, Records: Optional[List['SignedUrlObject']] = None):
+        self.Records = Records
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'PreviewPostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Records')
+        if value is not None:
+            value = [SignedUrlObject.from_json(item) for item in value]
+        obj.Records = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Records
+        if value is not None:
+            data['Records'] = [item.to_json() for item in value]
+        return data
+
+
+class FilesInfoGetResponse:
+    """FilesInfoGetResponse model"""
+    __slots__ = ('Records',)
+
+    def __init__(self, *, Records: Optional[List['FileRecordObject']] = None):
+        self.Records = Records
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesInfoGetResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Records')
+        if value is not None:
+            value = [FileRecordObject.from_json(item) for item in value]
+        obj.Records = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Records
+        if value is not None:
+            data['Records'] = [item.to_json() for item in value]
+        return data
+
+
+class FilesGetResponse:
+    """FilesGetResponse model"""
+    __slots__ = ('Records',)
+
+    def __init__(self, *, Records: Optional[List['SignedUrlObject']] = None):
+        self.Records = Records
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesGetResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Records')
+        if value is not None:
+            value = [SignedUrlObject.from_json(item) for item in value]
+        obj.Records = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Records
+        if value is not None:
+            data['Records'] = [item.to_json() for item in value]
+        return data
+
+
+class FilesDeleteResponse:
+    """FilesDeleteResponse model"""
+    __slots__ = ('Failures',)
+
+    def __init__(self, *, Failures: Optional[List[str]] = None):
+        self.Failures = Failures
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesDeleteResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Failures = get('Failures')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Failures
+        if value is not None:
+            data['Failures'] = value
+        return data
+
+
+class FilesPatchRequest:
+    """FilesPatchRequest model"""
+    __slots__ = ('Id',
+                 'Name',
+                 'litify_docs__Author__c',
+                 'litify_docs__Description__c',
+                 'litify_docs__External_File_Path__c',
+                 'litify_docs__External_ID__c',
+                 'litify_docs__Folder_Path__c',
+                 'litify_docs__From__c',
+                 'litify_docs__To__c',
+                 'litify_docs__Related_To_Api_Name__c',
+                 'litify_docs__Related_To__c',
+                 'litify_docs__File_Type__c',
+                 'Custom_Field__c')
+
+    def __init__(self,
+                 *,
+                 Id: Optional[str] = None,
+                 Name: Optional[str] = None,
+                 litify_docs__Author__c: Optional[str] = None,
+                 litify_docs__Description__c: Optional[str] = None,
+                 litify_docs__External_File_Path__c: Optional[str] = None,
+                 litify_docs__External_ID__c: Optional[str] = None,
+                 litify_docs__Folder_Path__c: Optional[str] = None,
+                 litify_docs__From__c: Optional[str] = None,
+                 litify_docs__To__c: Optional[str] = None,
+                 litify_docs__Related_To_Api_Name__c: Optional[str] = None,
+                 litify_docs__Related_To__c: Optional[str] = None,
+                 litify_docs__File_Type__c: Optional[str] = None,
+                 Custom_Field__c: Optional[str] = None):
+        self.Id = Id
+        self.Name = Name
+        self.litify_docs__Author__c = litify_docs__Author__c
+        self.litify_docs__Description__c = litify_docs__Description__c
+        self.litify_docs__External_File_Path__c = litify_docs__External_File_Path__c
+        self.litify_docs__External_ID__c = litify_docs__External_ID__c
+        self.litify_docs__Folder_Path__c = litify_docs__Folder_Path__c
+        self.litify_docs__From__c = litify_docs__From__c
+        self.litify_docs__To__c = litify_docs__To__c
+        self.litify_docs__Related_To_Api_Name__c = litify_docs__Related_To_Api_Name__c
+        self.litify_docs__Related_To__c = litify_docs__Related_To__c
+        self.litify_docs__File_Type__c = litify_docs__File_Type__c
+        self.Custom_Field__c = Custom_Field__c
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesPatchRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Id = get('Id')
+        obj.Name = get('Name')
+        obj.litify_docs__Author__c = get('litify_docs__Author__c')
+        obj.litify_docs__Description__c = get('litify_docs__Description__c')
+        obj.litify_docs__External_File_Path__c = get('litify_docs__External_File_Path__c')
+        obj.litify_docs__External_ID__c = get('litify_docs__External_ID__c')
+        obj.litify_docs__Folder_Path__c = get('litify_docs__Folder_Path__c')
+        obj.litify_docs__From__c = get('litify_docs__From__c')
+        obj.litify_docs__To__c = get('litify_docs__To__c')
+        obj.litify_docs__Related_To_Api_Name__c = get('litify_docs__Related_To_Api_Name__c')
+        obj.litify_docs__Related_To__c = get('litify_docs__Related_To__c')
+        obj.litify_docs__File_Type__c = get('litify_docs__File_Type__c')
+        obj.Custom_Field__c = get('Custom_Field__c')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        value = self.Name
+        if value is not None:
+            data['Name'] = value
+        value = self.litify_docs__Author__c
+        if value is not None:
+            data['litify_docs__Author__c'] = value
+        value = self.litify_docs__Description__c
+        if value is not None:
+            data['litify_docs__Description__c'] = value
+        value = self.litify_docs__External_File_Path__c
+        if value is not None:
+            data['litify_docs__External_File_Path__c'] = value
+        value = self.litify_docs__External_ID__c
+        if value is not None:
+            data['litify_docs__External_ID__c'] = value
+        value = self.litify_docs__Folder_Path__c
+        if value is not None:
+            data['litify_docs__Folder_Path__c'] = value
+        value = self.litify_docs__From__c
+        if value is not None:
+            data['litify_docs__From__c'] = value
+        value = self.litify_docs__To__c
+        if value is not None:
+            data['litify_docs__To__c'] = value
+        value = self.litify_docs__Related_To_Api_Name__c
+        if value is not None:
+            data['litify_docs__Related_To_Api_Name__c'] = value
+        value = self.litify_docs__Related_To__c
+        if value is not None:
+            data['litify_docs__Related_To__c'] = value
+        value = self.litify_docs__File_Type__c
+        if value is not None:
+            data['litify_docs__File_Type__c'] = value
+        value = self.Custom_Field__c
+        if value is not None:
+            data['Custom_Field__c'] = value
+        return data
+
+
+class FilesPutRequest:
+    """FilesPutRequest model"""
+    __slots__ = ('Id',)
+
+    def __init__(self, *, Id: Optional[str] = None):
+        self.Id = Id
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesPutRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Id = get('Id')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        return data
+
+
+class FilesPostResponse:
+    """FilesPostResponse model"""
+    __slots__ = ('name_of_file_png',)
+
+    def __init__(self, *, name_of_file_png: Optional['SignedUrlObject'] = None):
+        self.name_of_file_png = name_of_file_png
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesPostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('name-of-file.png')
+        if value.__class__ is list:
+            value = [SignedUrlObject.from_json(item) for item in value]
+        elif value is not None:
+            value = SignedUrlObject.from_json(value)
+        obj.name_of_file_png = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.name_of_file_png
+        if value.__class__ is list:
+            data['name-of-file.png'] = [item.to_json() for item in value]
+        elif value is not None:
+            data['name-of-file.png'] = value.to_json()
+        return data
+
+
+class FilesTAPostResponse:
+    """FilesTAPostResponse model"""
+    __slots__ = ('name_of_file_png',)
+
+    def __init__(self, *, name_of_file_png: Optional['SignedUrlObject'] = None):
+        self.name_of_file_png = name_of_file_png
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesTAPostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('name-of-file.png')
+        if value.__class__ is list:
+            value = [SignedUrlObject.from_json(item) for item in value]
+        elif value is not None:
+            value = SignedUrlObject.from_json(value)
+        obj.name_of_file_png = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.name_of_file_png
+        if value.__class__ is list:
+            data['name-of-file.png'] = [item.to_json() for item in value]
+        elif value is not None:
+            data['name-of-file.png'] = value.to_json()
+        return data
+
+
+class MultipartFilesPutRequest:
+    """MultipartFilesPutRequest model"""
+    __slots__ = ('Id', 'Parts', 'ContentType', 'fileVersionNumber')
+
+    def __init__(self,
+                 *,
+                 Id: Optional[str] = None,
+                 Parts: Optional[int] = None,
+                 ContentType: Optional[str] = None,
+                 fileVersionNumber: Optional[int] = None):
+        self.Id = Id
+        self.Parts = Parts
+        self.ContentType = ContentType
+        self.fileVersionNumber = fileVersionNumber
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MultipartFilesPutRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Id = get('Id')
+        obj.Parts = get('Parts')
+        obj.ContentType = get('ContentType')
+        obj.fileVersionNumber = get('fileVersionNumber')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        value = self.Parts
+        if value is not None:
+            data['Parts'] = value
+        value = self.ContentType
+        if value is not None:
+            data['ContentType'] = value
+        value = self.fileVersionNumber
+        if value is not None:
+            data['fileVersionNumber'] = value
+        return data
+
+
+class MultipartFilesPostResponse:
+    """MultipartFilesPostResponse model"""
+    __slots__ = ('name_of_file_png',)
+
+    def __init__(self, *, name_of_file_png: Optional['MultipartSignedUrlObject'] = None):
+        self.name_of_file_png = name_of_file_png
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MultipartFilesPostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('name-of-file.png')
+        if value.__class__ is list:
+            value = [MultipartSignedUrlObject.from_json(item) for item in value]
+        elif value is not None:
+            value = MultipartSignedUrlObject.from_json(value)
+        obj.name_of_file_png = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.name_of_file_png
+        if value.__class__ is list:
+            data['name-of-file.png'] = [item.to_json() for item in value]
+        elif value is not None:
+            data['name-of-file.png'] = value.to_json()
+        return data
+
+
+class MultipartFilesPutResponse:
+    """MultipartFilesPutResponse model"""
+    __slots__ = ('name_of_file_png',)
+
+    def __init__(self, *, name_of_file_png: Optional['MultipartSignedUrlObject'] = None):
+        self.name_of_file_png = name_of_file_png
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MultipartFilesPutResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('name-of-file.png')
+        if value.__class__ is list:
+            value = [MultipartSignedUrlObject.from_json(item) for item in value]
+        elif value is not None:
+            value = MultipartSignedUrlObject.from_json(value)
+        obj.name_of_file_png = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.name_of_file_png
+        if value.__class__ is list:
+            data['name-of-file.png'] = [item.to_json() for item in value]
+        elif value is not None:
+            data['name-of-file.png'] = value.to_json()
+        return data
+
+
+class MultipartFilesCompletePostRequest:
+    """MultipartFilesCompletePostRequest model"""
+    __slots__ = ('Ids', 'a1E1U000001juz6UAA')
+
+    def __init__(self,
+                 *,
+                 Ids: Optional[List[str]] = None,
+                 a1E1U000001juz6UAA: Optional['Anonymous6AEC0B9F'] = None):
+        self.Ids = Ids
+        self.a1E1U000001juz6UAA = a1E1U000001juz6UAA
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MultipartFilesCompletePostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Ids = get('Ids')
+        value = get('a1E1U000001juz6UAA')
+        if value is not None:
+            value = Anonymous6AEC0B9F.from_json(value)
+        obj.a1E1U000001juz6UAA = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Ids
+        if value is not None:
+            data['Ids'] = value
+        value = self.a1E1U000001juz6UAA
+        if value is not None:
+            data['a1E1U000001juz6UAA'] = value.to_json()
+        return data
+
+
+class MultipartFilesCompletePostResponse:
+    """MultipartFilesCompletePostResponse model"""
+    __slots__ = ('Message', 'Successes', 'Failures')
+
+    def __init__(self,
+                 *,
+                 Message: Optional[str] = None,
+                 Successes: Optional[List['MultipartFileRecordObject']] = None,
+                 Failures: Optional[List[str]] = None):
+        self.Message = Message
+        self.Successes = Successes
+        self.Failures = Failures
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MultipartFilesCompletePostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Message = get('Message')
+        value = get('Successes')
+        if value is not None:
+            value = [MultipartFileRecordObject.from_json(item) for item in value]
+        obj.Successes = value
+        obj.Failures = get('Failures')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Message
+        if value is not None:
+            data['Message'] = value
+        value = self.Successes
+        if value is not None:
+            data['Successes'] = [item.to_json() for item in value]
+        value = self.Failures
+        if value is not None:
+            data['Failures'] = value
+        return data
+
+
+class MultipartRefreshUrlsPutResponse:
+    """MultipartRefreshUrlsPutResponse model"""
+    __slots__ = ('name_of_file_png',)
+
+    def __init__(self, *, name_of_file_png: Optional['MultipartSignedUrlObject'] = None):
+        self.name_of_file_png = name_of_file_png
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MultipartRefreshUrlsPutResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('name-of-file.png')
+        if value.__class__ is list:
+            value = [MultipartSignedUrlObject.from_json(item) for item in value]
+        elif value is not None:
+            value = MultipartSignedUrlObject.from_json(value)
+        obj.name_of_file_png = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.name_of_file_png
+        if value.__class__ is list:
+            data['name-of-file.png'] = [item.to_json() for item in value]
+        elif value is not None:
+            data['name-of-file.png'] = value.to_json()
+        return data
+
+
+class MultipartFilesRefreshPutRequest:
+    """MultipartFilesRefreshPutRequest model"""
+    __slots__ = ('Id', 'UploadId', 'StartIndex', 'EndIndex')
+
+    def __init__(self,
+                 *,
+                 Id: Optional[str] = None,
+                 UploadId: Optional[str] = None,
+                 StartIndex: Optional[int] = None,
+                 EndIndex: Optional[int] = None):
+        self.Id = Id
+        self.UploadId = UploadId
+        self.StartIndex = StartIndex
+        self.EndIndex = EndIndex
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MultipartFilesRefreshPutRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Id = get('Id')
+        obj.UploadId = get('UploadId')
+        obj.StartIndex = get('StartIndex')
+        obj.EndIndex = get('EndIndex')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        value = self.UploadId
+        if value is not None:
+            data['UploadId'] = value
+        value = self.StartIndex
+        if value is not None:
+            data['StartIndex'] = value
+        value = self.EndIndex
+        if value is not None:
+            data['EndIndex'] = value
+        return data
+
+
+class MultipartFilesRefreshPutResponse:
+    """MultipartFilesRefreshPutResponse model"""
+    __slots__ = ('Message', 'Successes', 'Failures')
+
+    def __init__(self,
+                 *,
+                 Message: Optional[str] = None,
+                 Successes: Optional[List['MultipartFileRecordObject']] = None,
+                 Failures: Optional[List[str]] = None):
+        self.Message = Message
+        self.Successes = Successes
+        self.Failures = Failures
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MultipartFilesRefreshPutResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Message = get('Message')
+        value = get('Successes')
+        if value is not None:
+            value = [MultipartFileRecordObject.from_json(item) for item in value]
+        obj.Successes = value
+        obj.Failures = get('Failures')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Message
+        if value is not None:
+            data['Message'] = value
+        value = self.Successes
+        if value is not None:
+            data['Successes'] = [item.to_json() for item in value]
+        value = self.Failures
+        if value is not None:
+            data['Failures'] = value
+        return data
+
+
+class FilesAssociatePostRequest:
+    """FilesAssociatePostRequest model"""
+    __slots__ = ('fileRelationships', 'relationshipType')
+
+    def __init__(self,
+                 *,
+                 fileRelationships: Optional[List['AnonymousD44DFA09']] = None,
+                 relationshipType: Optional[str] = None):
+        self.fileRelationships = fileRelationships
+        self.relationshipType = relationshipType
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesAssociatePostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('fileRelationships')
+        if value is not None:
+            value = [AnonymousD44DFA09.from_json(item) for item in value]
+        obj.fileRelationships = value
+        obj.relationshipType = get('relationshipType')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.fileRelationships
+        if value is not None:
+            data['fileRelationships'] = [item.to_json() for item in value]
+        value = self.relationshipType
+        if value is not None:
+            data['relationshipType'] = value
+        return data
+
+
+class FilesAssociatePostResponse:
+    """FilesAssociatePostResponse model"""
+    __slots__ = ('Message',)
+
+    def __init__(self, *, Message: Optional[str] = None):
+        self.Message = Message
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesAssociatePostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Message = get('Message')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Message
+        if value is not None:
+            data['Message'] = value
+        return data
+
+
+class FilesAssociateDeleteRequest:
+    """FilesAssociateDeleteRequest model"""
+    __slots__ = ('fileRelationships',)
+
+    def __init__(self, *, fileRelationships: Optional[List['AnonymousD44DFA09']] = None):
+        self.fileRelationships = fileRelationships
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesAssociateDeleteRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('fileRelationships')
+        if value is not None:
+            value = [AnonymousD44DFA09.from_json(item) for item in value]
+        obj.fileRelationships = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.fileRelationships
+        if value is not None:
+            data['fileRelationships'] = [item.to_json() for item in value]
+        return data
+
+
+class FilesCompletePostRequest:
+    """FilesCompletePostRequest model"""
+    __slots__ = ('Ids', 'CheckIn')
+
+    def __init__(self, *, Ids: Optional[List[str]] = None, CheckIn: Optional[bool] = None):
+        self.Ids = Ids
+        self.CheckIn = CheckIn
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesCompletePostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Ids = get('Ids')
+        obj.CheckIn = get('CheckIn')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Ids
+        if value is not None:
+            data['Ids'] = value
+        value = self.CheckIn
+        if value is not None:
+            data['CheckIn'] = value
+        return data
+
+
+class FilesCompletePostResponse:
+    """FilesCompletePostResponse model"""
+    __slots__ = ('Message', 'Successes', 'Failures')
+
+    def __init__(self,
+                 *,
+                 Message: Optional[str] = None,
+                 Successes: Optional[List['FileRecordObject']] = None,
+                 Failures: Optional[List[str]] = None):
+        self.Message = Message
+        self.Successes = Successes
+        self.Failures = Failures
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesCompletePostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Message = get('Message')
+        value = get('Successes')
+        if value is not None:
+            value = [FileRecordObject.from_json(item) for item in value]
+        obj.Successes = value
+        obj.Failures = get('Failures')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Message
+        if value is not None:
+            data['Message'] = value
+        value = self.Successes
+        if value is not None:
+            data['Successes'] = [item.to_json() for item in value]
+        value = self.Failures
+        if value is not None:
+            data['Failures'] = value
+        return data
+
+
+class FilesRelatedGetResponse:
+    """FilesRelatedGetResponse model"""
+    __slots__ = ('Records', 'NextBatch')
+
+    def __init__(self,
+                 *,
+                 Records: Optional['FileRecordObject'] = None,
+                 NextBatch: Optional['NextBatchObject'] = None):
+        self.Records = Records
+        self.NextBatch = NextBatch
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesRelatedGetResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Records')
+        if value.__class__ is list:
+            value = [FileRecordObject.from_json(item) for item in value]
+        elif value is not None:
+            value = FileRecordObject.from_json(value)
+        obj.Records = value
+        value = get('NextBatch')
+        if value.__class__ is list:
+            value = [NextBatchObject.from_json(item) for item in value]
+        elif value is not None:
+            value = NextBatchObject.from_json(value)
+        obj.NextBatch = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Records
+        if value.__class__ is list:
+            data['Records'] = [item.to_json() for item in value]
+        elif value is not None:
+            data['Records'] = value.to_json()
+        value = self.NextBatch
+        if value.__class__ is list:
+            data['NextBatch'] = [item.to_json() for item in value]
+        elif value is not None:
+            data['NextBatch'] = value.to_json()
+        return data
+
+
+class FilesToggleRequest:
+    """Array of salesforce file Ids."""
+    __slots__ = ('Ids',)
+
+    def __init__(self, *, Ids: Optional[List[str]] = None):
+        self.Ids = Ids
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesToggleRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Ids = get('Ids')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Ids
+        if value is not None:
+            data['Ids'] = value
+        return data
+
+
+class FilesToggleResponse:
+    """FilesToggleResponse model"""
+    __slots__ = ('Message',)
+
+    def __init__(self, *, Message: Optional[str] = None):
+        self.Message = Message
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesToggleResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Message = get('Message')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Message
+        if value is not None:
+            data['Message'] = value
+        return data
+
+
+class FilesCombineRequest:
+    """FilesCombineRequest model"""
+    __slots__ = ('relatedToApiName', 'fileRelatedTo', 'fileName', 'folderPath', 'combineFiles')
+
+    def __init__(self,
+                 *,
+                 relatedToApiName: Optional[str] = None,
+                 fileRelatedTo: Optional[str] = None,
+                 fileName: Optional[str] = None,
+                 folderPath: Optional[str] = None,
+                 combineFiles: Optional[List['Anonymous03F41BF3']] = None):
+        self.relatedToApiName = relatedToApiName
+        self.fileRelatedTo = fileRelatedTo
+        self.fileName = fileName
+        self.folderPath = folderPath
+        self.combineFiles = combineFiles
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesCombineRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.relatedToApiName = get('relatedToApiName')
+        obj.fileRelatedTo = get('fileRelatedTo')
+        obj.fileName = get('fileName')
+        obj.folderPath = get('folderPath')
+        value = get('combineFiles')
+        if value is not None:
+            value = [Anonymous03F41BF3.from_json(item) for item in value]
+        obj.combineFiles = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.relatedToApiName
+        if value is not None:
+            data['relatedToApiName'] = value
+        value = self.fileRelatedTo
+        if value is not None:
+            data['fileRelatedTo'] = value
+        value = self.fileName
+        if value is not None:
+            data['fileName'] = value
+        value = self.folderPath
+        if value is not None:
+            data['folderPath'] = value
+        value = self.combineFiles
+        if value is not None:
+            data['combineFiles'] = [item.to_json() for item in value]
+        return data
+
+
+class FilesSplitRequest:
+    """FilesSplitRequest model"""
+    __slots__ = ('originalFileId',
+                 'originalFileRelatedTo',
+                 'originalFolderPath',
+                 'relatedToApiName',
+                 'originalFileType',
+                 'sections')
+
+    def __init__(self,
+                 *,
+                 originalFileId: Optional[str] = None,
+                 originalFileRelatedTo: Optional[str] = None,
+                 originalFolderPath: Optional[str] = None,
+                 relatedToApiName: Optional[str] = None,
+                 originalFileType: Optional[str] = None,
+                 sections: Optional[List['AnonymousBDCD31B0']] = None):
+        self.originalFileId = originalFileId
+        self.originalFileRelatedTo = originalFileRelatedTo
+        self.originalFolderPath = originalFolderPath
+        self.relatedToApiName = relatedToApiName
+        self.originalFileType = originalFileType
+        self.sections = sections
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesSplitRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.originalFileId = get('originalFileId')
+        obj.originalFileRelatedTo = get('originalFileRelatedTo')
+        obj.originalFolderPath = get('originalFolderPath')
+        obj.relatedToApiName = get('relatedToApiName')
+        obj.originalFileType = get('originalFileType')
+        value = get('sections')
+        if value is not None:
+            value = [AnonymousBDCD31B0.from_json(item) for item in value]
+        obj.sections = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.originalFileId
+        if value is not None:
+            data['originalFileId'] = value
+        value = self.originalFileRelatedTo
+        if value is not None:
+            data['originalFileRelatedTo'] = value
+        value = self.originalFolderPath
+        if value is not None:
+            data['originalFolderPath'] = value
+        value = self.relatedToApiName
+        if value is not None:
+            data['relatedToApiName'] = value
+        value = self.originalFileType
+        if value is not None:
+            data['originalFileType'] = value
+        value = self.sections
+        if value is not None:
+            data['sections'] = [item.to_json() for item in value]
+        return data
+
+
+class FilesCombineResponse:
+    """FilesCombineResponse model"""
+    __slots__ = ('Name', 'Id', 'litify_docs__File_Type__c')
+
+    def __init__(self,
+                 *,
+                 Name: Optional[str] = None,
+                 Id: Optional[str] = None,
+                 litify_docs__File_Type__c: Optional[str] = None):
+        self.Name = Name
+        self.Id = Id
+        self.litify_docs__File_Type__c = litify_docs__File_Type__c
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesCombineResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Name = get('Name')
+        obj.Id = get('Id')
+        obj.litify_docs__File_Type__c = get('litify_docs__File_Type__c')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Name
+        if value is not None:
+            data['Name'] = value
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        value = self.litify_docs__File_Type__c
+        if value is not None:
+            data['litify_docs__File_Type__c'] = value
+        return data
+
+
+class FilesCombineCompleteRequest:
+    """FilesCombineCompleteRequest model"""
+    __slots__ = ('Id',)
+
+    def __init__(self, *, Id: Optional[str] = None):
+        self.Id = Id
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesCombineCompleteRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Id = get('Id')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        return data
+
+
+class FilesCombineCompleteResponse:
+    """FilesCombineCompleteResponse model"""
+    __slots__ = ('Errors', 'Statuses')
+
+    def __init__(self,
+                 *,
+                 Errors: Optional[Dict[str, Any]] = None,
+                 Statuses: Optional[List['Anonymous9ED021A1']] = None):
+        self.Errors = Errors
+        self.Statuses = Statuses
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesCombineCompleteResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Errors = get('Errors')
+        value = get('Statuses')
+        if value is not None:
+            value = [Anonymous9ED021A1.from_json(item) for item in value]
+        obj.Statuses = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Errors
+        if value is not None:
+            data['Errors'] = value
+        value = self.Statuses
+        if value is not None:
+            data['Statuses'] = [item.to_json() for item in value]
+        return data
+
+
+class FilesSplitResponse:
+    """FilesSplitResponse model"""
+    __slots__ = ('fileInfoRecords',)
+
+    def __init__(self, *, fileInfoRecords: Optional[Any] = None):
+        self.fileInfoRecords = fileInfoRecords
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesSplitResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.fileInfoRecords = get('fileInfoRecords')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.fileInfoRecords
+        if value is not None:
+            data['fileInfoRecords'] = value
+        return data
+
+
+class FilesSplitCompleteRequest:
+    """FilesSplitCompleteRequest model"""
+    __slots__ = ('Ids',)
+
+    def __init__(self, *, Ids: Optional[Any] = None):
+        self.Ids = Ids
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesSplitCompleteRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Ids = get('Ids')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Ids
+        if value is not None:
+            data['Ids'] = value
+        return data
+
+
+class FilesSplitCompleteResponse:
+    """FilesSplitCompleteResponse model"""
+    __slots__ = ('Errors', 'Statuses')
+
+    def __init__(self, *, Errors: Optional[Dict[str, Any]] = None, Statuses: Optional[Any] = None):
+        self.Errors = Errors
+        self.Statuses = Statuses
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesSplitCompleteResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Errors = get('Errors')
+        obj.Statuses = get('Statuses')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Errors
+        if value is not None:
+            data['Errors'] = value
+        value = self.Statuses
+        if value is not None:
+            data['Statuses'] = value
+        return data
+
+
+class ErrorMessageResponse:
+    """ErrorMessageResponse model"""
+    __slots__ = ('Message',)
+
+    def __init__(self, *, Message: Optional[str] = None):
+        self.Message = Message
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ErrorMessageResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Message = get('Message')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Message
+        if value is not None:
+            data['Message'] = value
+        return data
+
+
+class ErrorMessageResponseWithFailReason:
+    """ErrorMessageResponseWithFailReason model"""
+    __slots__ = ('Message', 'FailReason')
+
+    def __init__(self, *, Message: Optional[str] = None, FailReason: Optional[str] = None):
+        self.Message = Message
+        self.FailReason = FailReason
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ErrorMessageResponseWithFailReason':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Message = get('Message')
+        obj.FailReason = get('FailReason')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Message
+        if value is not None:
+            data['Message'] = value
+        value = self.FailReason
+        if value is not None:
+            data['FailReason'] = value
+        return data
+
+
+class ExternalLinkPostRequest:
+    """ExternalLinkPostRequest model"""
+    __slots__ = ('FileInfoRecords', 'FileLinkRecord')
+
+    def __init__(self,
+                 *,
+                 FileInfoRecords: Optional[List['FileRecordObject']] = None,
+                 FileLinkRecord: Optional['Anonymous07B7C06C'] = None):
+        self.FileInfoRecords = FileInfoRecords
+        self.FileLinkRecord = FileLinkRecord
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ExternalLinkPostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('FileInfoRecords')
+        if value is not None:
+            value = [FileRecordObject.from_json(item) for item in value]
+        obj.FileInfoRecords = value
+        value = get('FileLinkRecord')
+        if value is not None:
+            value = Anonymous07B7C06C.from_json(value)
+        obj.FileLinkRecord = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.FileInfoRecords
+        if value is not None:
+            data['FileInfoRecords'] = [item.to_json() for item in value]
+        value = self.FileLinkRecord
+        if value is not None:
+            data['FileLinkRecord'] = value.to_json()
+        return data
+
+
+class ExternalLinkPostResponse:
+    """ExternalLinkPostResponse model"""
+    __slots__ = ('CreatedByName', 'OrganizationName', 'Records')
+
+    def __init__(self,
+                 *,
+                 CreatedByName: Optional[str] = None,
+                 OrganizationName: Optional[str] = None,
+                 Records: Optional[List['Anonymous9F3348ED']] = None):
+        self.CreatedByName = CreatedByName
+        self.OrganizationName = OrganizationName
+        self.Records = Records
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ExternalLinkPostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.CreatedByName = get('CreatedByName')
+        obj.OrganizationName = get('OrganizationName')
+        value = get('Records')
+        if value is not None:
+            value = [Anonymous9F3348ED.from_json(item) for item in value]
+        obj.Records = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.CreatedByName
+        if value is not None:
+            data['CreatedByName'] = value
+        value = self.OrganizationName
+        if value is not None:
+            data['OrganizationName'] = value
+        value = self.Records
+        if value is not None:
+            data['Records'] = [item.to_json() for item in value]
+        return data
+
+
+class ExternalLinkDownloadResponse:
+    """ExternalLinkDownloadResponse model"""
+    __slots__ = ('FileId',)
+
+    def __init__(self, *, FileId: Optional[str] = None):
+        self.FileId = FileId
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ExternalLinkDownloadResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.FileId = get('FileId')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.FileId
+        if value is not None:
+            data['FileId'] = value
+        return data
+
+
+class ExternalLinkPreviewResponse:
+    """ExternalLinkPreviewResponse model"""
+    __slots__ = ('SignedUrl', 'Expires')
+
+    def __init__(self, *, SignedUrl: Optional[str] = None, Expires: Optional[str] = None):
+        self.SignedUrl = SignedUrl
+        self.Expires = Expires
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ExternalLinkPreviewResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.SignedUrl = get('SignedUrl')
+        obj.Expires = get('Expires')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.SignedUrl
+        if value is not None:
+            data['SignedUrl'] = value
+        value = self.Expires
+        if value is not None:
+            data['Expires'] = value
+        return data
+
+
+class ExternalLinkGetResponse:
+    """ExternalLinkGetResponse model"""
+    __slots__ = ('Expires', 'SharedBy', 'OrgName', 'Records', 'FolderReference')
+
+    def __init__(self,
+                 *,
+                 Expires: Optional[str] = None,
+                 SharedBy: Optional[str] = None,
+                 OrgName: Optional[str] = None,
+                 Records: Optional[List[Any]] = None,
+                 FolderReference: Optional['AnonymousBDD82738'] = None):
+        self.Expires = Expires
+        self.SharedBy = SharedBy
+        self.OrgName = OrgName
+        self.Records = Records
+        self.FolderReference = FolderReference
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ExternalLinkGetResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Expires = get('Expires')
+        obj.SharedBy = get('SharedBy')
+        obj.OrgName = get('OrgName')
+        obj.Records = get('Records')
+        value = get('FolderReference')
+        if value is not None:
+            value = AnonymousBDD82738.from_json(value)
+        obj.FolderReference = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Expires
+        if value is not None:
+            data['Expires'] = value
+        value = self.SharedBy
+        if value is not None:
+            data['SharedBy'] = value
+        value = self.OrgName
+        if value is not None:
+            data['OrgName'] = value
+        value = self.Records
+        if value is not None:
+            data['Records'] = value
+        value = self.FolderReference
+        if value is not None:
+            data['FolderReference'] = value.to_json()
+        return data
+
+
+class ExternalLinkZipStatusResponse:
+    """ExternalLinkZipStatusResponse model"""
+    __slots__ = ('ZipFileId', 'Status', 'SignedUrl')
+
+    def __init__(self,
+                 *,
+                 ZipFileId: Optional[str] = None,
+                 Status: Optional[str] = None,
+                 SignedUrl: Optional[str] = None):
+        self.ZipFileId = ZipFileId
+        self.Status = Status
+        self.SignedUrl = SignedUrl
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ExternalLinkZipStatusResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.ZipFileId = get('ZipFileId')
+        obj.Status = get('Status')
+        obj.SignedUrl = get('SignedUrl')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.ZipFileId
+        if value is not None:
+            data['ZipFileId'] = value
+        value = self.Status
+        if value is not None:
+            data['Status'] = value
+        value = self.SignedUrl
+        if value is not None:
+            data['SignedUrl'] = value
+        return data
+
+
+class ExternalLinkDeleteResponse:
+    """ExternalLinkDeleteResponse model"""
+    __slots__ = ('Successes', 'Failures')
+
+    def __init__(self, *, Successes: Optional[List[str]] = None, Failures: Optional[List[str]] = None):
+        self.Successes = Successes
+        self.Failures = Failures
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ExternalLinkDeleteResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Successes = get('Successes')
+        obj.Failures = get('Failures')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Successes
+        if value is not None:
+            data['Successes'] = value
+        value = self.Failures
+        if value is not None:
+            data['Failures'] = value
+        return data
+
+
+class ExternalLinkZipRequest:
+    """ExternalLinkZipRequest model"""
+    __slots__ = ('FileIds', 'FileIdsWithFolderPath')
+
+    def __init__(self,
+                 *,
+                 FileIds: Optional[List[str]] = None,
+                 FileIdsWithFolderPath: Optional['AnonymousD60A108B'] = None):
+        self.FileIds = FileIds
+        self.FileIdsWithFolderPath = FileIdsWithFolderPath
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ExternalLinkZipRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.FileIds = get('FileIds')
+        value = get('FileIdsWithFolderPath')
+        if value is not None:
+            value = AnonymousD60A108B.from_json(value)
+        obj.FileIdsWithFolderPath = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.FileIds
+        if value is not None:
+            data['FileIds'] = value
+        value = self.FileIdsWithFolderPath
+        if value is not None:
+            data['FileIdsWithFolderPath'] = value.to_json()
+        return data
+
+
+class ExternalLinkZipResponse:
+    """ExternalLinkZipResponse model"""
+    __slots__ = ('ZipFileId', 'Status')
+
+    def __init__(self, *, ZipFileId: Optional[str] = None, Status: Optional[str] = None):
+        self.ZipFileId = ZipFileId
+        self.Status = Status
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ExternalLinkZipResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.ZipFileId = get('ZipFileId')
+        obj.Status = get('Status')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.ZipFileId
+        if value is not None:
+            data['ZipFileId'] = value
+        value = self.Status
+        if value is not None:
+            data['Status'] = value
+        return data
+
+
+class ArchivePostRequest:
+    """ArchivePostRequest model"""
+    __slots__ = ('FileInfoIds', 'RecordIds')
+
+    def __init__(self, *, FileInfoIds: Optional[Any] = None, RecordIds: Optional[Any] = None):
+        self.FileInfoIds = FileInfoIds
+        self.RecordIds = RecordIds
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ArchivePostRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.FileInfoIds = get('FileInfoIds')
+        obj.RecordIds = get('RecordIds')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.FileInfoIds
+        if value is not None:
+            data['FileInfoIds'] = value
+        value = self.RecordIds
+        if value is not None:
+            data['RecordIds'] = value
+        return data
+
+
+class ArchivePostResponse:
+    """ArchivePostResponse model"""
+    __slots__ = ('externalJobId',)
+
+    def __init__(self, *, externalJobId: Optional[str] = None):
+        self.externalJobId = externalJobId
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ArchivePostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.externalJobId = get('externalJobId')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.externalJobId
+        if value is not None:
+            data['externalJobId'] = value
+        return data
+
+
+class ArchiveStatusGetResponse:
+    """ArchiveStatusGetResponse model"""
+    __slots__ = ('externalJobId', 'status', 'results')
+
+    def __init__(self,
+                 *,
+                 externalJobId: Optional[str] = None,
+                 status: Optional[str] = None,
+                 results: Optional[str] = None):
+        self.externalJobId = externalJobId
+        self.status = status
+        self.results = results
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ArchiveStatusGetResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.externalJobId = get('externalJobId')
+        obj.status = get('status')
+        obj.results = get('results')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.externalJobId
+        if value is not None:
+            data['externalJobId'] = value
+        value = self.status
+        if value is not None:
+            data['status'] = value
+        value = self.results
+        if value is not None:
+            data['results'] = value
+        return data
+
+
+class FilesShareRequest:
+    """FilesShareRequest model"""
+    __slots__ = ('Ids', 'share')
+
+    def __init__(self, *, Ids: Optional[List[str]] = None, share: Optional[bool] = None):
+        self.Ids = Ids
+        self.share = share
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesShareRequest':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Ids = get('Ids')
+        obj.share = get('share')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Ids
+        if value is not None:
+            data['Ids'] = value
+        value = self.share
+        if value is not None:
+            data['share'] = value
+        return data
+
+
+class FilesRestoreResponse:
+    """FilesRestoreResponse model"""
+    __slots__ = ('Successes', 'Failures')
+
+    def __init__(self, *, Successes: Optional[List[str]] = None, Failures: Optional[List[str]] = None):
+        self.Successes = Successes
+        self.Failures = Failures
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilesRestoreResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Successes = get('Successes')
+        obj.Failures = get('Failures')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Successes
+        if value is not None:
+            data['Successes'] = value
+        value = self.Failures
+        if value is not None:
+            data['Failures'] = value
+        return data
+
+
+class TextContentPostResponse:
+    """TextContentPostResponse model"""
+    __slots__ = ('SignedUrl',)
+
+    def __init__(self, *, SignedUrl: Optional[str] = None):
+        self.SignedUrl = SignedUrl
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'TextContentPostResponse':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.SignedUrl = get('SignedUrl')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.SignedUrl
+        if value is not None:
+            data['SignedUrl'] = value
+        return data
+
+
+class HistoryRecordObject:
+    """HistoryRecordObject model"""
+    __slots__ = ('Id',
+                 'OwnerId',
+                 'IsDeleted',
+                 'Name',
+                 'CreatedDate',
+                 'CreatedById',
+                 'LastModifiedDate',
+                 'LastModifiedById',
+                 'SystemModstamp',
+                 'LastViewedDate',
+                 'LastReferencedDate',
+                 'litify_docs__File_Info__c',
+                 'litify_docs__File_Info__c__User__c',
+                 'litify_docs__File_Info__c__Date__c',
+                 'litify_docs__File_Info__c__Action__c')
+
+    def __init__(self,
+                 *,
+                 Id: Optional[str] = None,
+                 OwnerId: Optional[str] = None,
+                 IsDeleted: Optional[bool] = None,
+                 Name: Optional[str] = None,
+                 CreatedDate: Optional[str] = None,
+                 CreatedById: Optional[str] = None,
+                 LastModifiedDate: Optional[str] = None,
+                 LastModifiedById: Optional[str] = None,
+                 SystemModstamp: Optional[str] = None,
+                 LastViewedDate: Optional[str] = None,
+                 LastReferencedDate: Optional[str] = None,
+                 litify_docs__File_Info__c: Optional[str] = None,
+                 litify_docs__File_Info__c__User__c: Optional[str] = None,
+                 litify_docs__File_Info__c__Date__c: Optional[str] = None,
+                 litify_docs__File_Info__c__Action__c: Optional[str] = None):
+        self.Id = Id
+        self.OwnerId = OwnerId
+        self.IsDeleted = IsDeleted
+        self.Name = Name
+        self.CreatedDate = CreatedDate
+        self.CreatedById = CreatedById
+        self.LastModifiedDate = LastModifiedDate
+        self.LastModifiedById = LastModifiedById
+        self.SystemModstamp = SystemModstamp
+        self.LastViewedDate = LastViewedDate
+        self.LastReferencedDate = LastReferencedDate
+        self.litify_docs__File_Info__c = litify_docs__File_Info__c
+        self.litify_docs__File_Info__c__User__c = litify_docs__File_Info__c__User__c
+        self.litify_docs__File_Info__c__Date__c = litify_docs__File_Info__c__Date__c
+        self.litify_docs__File_Info__c__Action__c = litify_docs__File_Info__c__Action__c
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'HistoryRecordObject':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Id = get('Id')
+        obj.OwnerId = get('OwnerId')
+        obj.IsDeleted = get('IsDeleted')
+        obj.Name = get('Name')
+        obj.CreatedDate = get('CreatedDate')
+        obj.CreatedById = get('CreatedById')
+        obj.LastModifiedDate = get('LastModifiedDate')
+        obj.LastModifiedById = get('LastModifiedById')
+        obj.SystemModstamp = get('SystemModstamp')
+        obj.LastViewedDate = get('LastViewedDate')
+        obj.LastReferencedDate = get('LastReferencedDate')
+        obj.litify_docs__File_Info__c = get('litify_docs__File_Info__c')
+        obj.litify_docs__File_Info__c__User__c = get('litify_docs__File_Info__c__User__c')
+        obj.litify_docs__File_Info__c__Date__c = get('litify_docs__File_Info__c__Date__c')
+        obj.litify_docs__File_Info__c__Action__c = get('litify_docs__File_Info__c__Action__c')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        value = self.OwnerId
+        if value is not None:
+            data['OwnerId'] = value
+        value = self.IsDeleted
+        if value is not None:
+            data['IsDeleted'] = value
+        value = self.Name
+        if value is not None:
+            data['Name'] = value
+        value = self.CreatedDate
+        if value is not None:
+            data['CreatedDate'] = value
+        value = self.CreatedById
+        if value is not None:
+            data['CreatedById'] = value
+        value = self.LastModifiedDate
+        if value is not None:
+            data['LastModifiedDate'] = value
+        value = self.LastModifiedById
+        if value is not None:
+            data['LastModifiedById'] = value
+        value = self.SystemModstamp
+        if value is not None:
+            data['SystemModstamp'] = value
+        value = self.LastViewedDate
+        if value is not None:
+            data['LastViewedDate'] = value
+        value = self.LastReferencedDate
+        if value is not None:
+            data['LastReferencedDate'] = value
+        value = self.litify_docs__File_Info__c
+        if value is not None:
+            data['litify_docs__File_Info__c'] = value
+        value = self.litify_docs__File_Info__c__User__c
+        if value is not None:
+            data['litify_docs__File_Info__c__User__c'] = value
+        value = self.litify_docs__File_Info__c__Date__c
+        if value is not None:
+            data['litify_docs__File_Info__c__Date__c'] = value
+        value = self.litify_docs__File_Info__c__Action__c
+        if value is not None:
+            data['litify_docs__File_Info__c__Action__c'] = value
+        return data
+
+
+class FolderStructureObject:
+    """FolderStructureObject model"""
+    __slots__ = ('name', 'subfolders')
+
+    def __init__(self, *, name: Optional[str] = None, subfolders: Optional[List['AnonymousF703761E']] = None):
+        self.name = name
+        self.subfolders = subfolders
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FolderStructureObject':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.name = get('name')
+        value = get('subfolders')
+        if value is not None:
+            value = [AnonymousF703761E.from_json(item) for item in value]
+        obj.subfolders = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.name
+        if value is not None:
+            data['name'] = value
+        value = self.subfolders
+        if value is not None:
+            data['subfolders'] = [item.to_json() for item in value]
+        return data
+
+
+class NextBatchObject:
+    """NextBatchObject model"""
+    __slots__ = ('OffsetId', 'OffsetValue')
+
+    def __init__(self, *, OffsetId: Optional[str] = None, OffsetValue: Optional[str] = None):
+        self.OffsetId = OffsetId
+        self.OffsetValue = OffsetValue
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'NextBatchObject':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.OffsetId = get('OffsetId')
+        obj.OffsetValue = get('OffsetValue')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.OffsetId
+        if value is not None:
+            data['OffsetId'] = value
+        value = self.OffsetValue
+        if value is not None:
+            data['OffsetValue'] = value
+        return data
+
+
+class FileRecordObject:
+    """FileRecordObject model"""
+    __slots__ = ('attributes',
+                 'Id',
+                 'OwnerId',
+                 'IsDeleted',
+                 'Name',
+                 'CreatedDate',
+                 'CreatedById',
+                 'LastModifiedDate',
+                 'LastModifiedById',
+                 'LastReferencedDate',
+                 'LastViewedDate',
+                 'SystemModstamp',
+                 'litify_docs__Author__c',
+                 'litify_docs__Description__c',
+                 'litify_docs__External_File_Path__c',
+                 'litify_docs__External_ID__c',
+                 'litify_docs__Folder_Path__c',
+                 'litify_docs__From__c',
+                 'litify_docs__To__c',
+                 'litify_docs__Latest_Version__c',
+                 'litify_docs__Complete__c',
+                 'litify_docs__File_Link__c',
+                 'litify_docs__Related_To_Api_Name__c',
+                 'litify_docs__File_Type__c',
+                 'litify_docs__File_Size__c',
+                 'litify_docs__Related_To__c',
+                 'Duplicates',
+                 'Checksum')
+
+    def __init__(self,
+                 *,
+                 attributes: Optional['AnonymousDC4DA072'] = None,
+                 Id: Optional[str] = None,
+                 OwnerId: Optional[str] = None,
+                 IsDeleted: Optional[bool] = None,
+                 Name: Optional[str] = None,
+                 CreatedDate: Optional[str] = None,
+                 CreatedById: Optional[str] = None,
+                 LastModifiedDate: Optional[str] = None,
+                 LastModifiedById: Optional[str] = None,
+                 LastReferencedDate: Optional[str] = None,
+                 LastViewedDate: Optional[str] = None,
+                 SystemModstamp: Optional[str] = None,
+                 litify_docs__Author__c: Optional[str] = None,
+                 litify_docs__Description__c: Optional[str] = None,
+                 litify_docs__External_File_Path__c: Optional[str] = None,
+                 litify_docs__External_ID__c: Optional[str] = None,
+                 litify_docs__Folder_Path__c: Optional[str] = None,
+                 litify_docs__From__c: Optional[str] = None,
+                 litify_docs__To__c: Optional[str] = None,
+                 litify_docs__Latest_Version__c: Optional[str] = None,
+                 litify_docs__Complete__c: Optional[bool] = None,
+                 litify_docs__File_Link__c: Optional[str] = None,
+                 litify_docs__Related_To_Api_Name__c: Optional[str] = None,
+                 litify_docs__File_Type__c: Optional[str] = None,
+                 litify_docs__File_Size__c: Optional[int] = None,
+                 litify_docs__Related_To__c: Optional[str] = None,
+                 Duplicates: Optional[List[str]] = None,
+                 Checksum: Optional[str] = None):
+        self.attributes = attributes
+        self.Id = Id
+        self.OwnerId = OwnerId
+        self.IsDeleted = IsDeleted
+        self.Name = Name
+        self.CreatedDate = CreatedDate
+        self.CreatedById = CreatedById
+        self.LastModifiedDate = LastModifiedDate
+        self.LastModifiedById = LastModifiedById
+        self.LastReferencedDate = LastReferencedDate
+        self.LastViewedDate = LastViewedDate
+        self.SystemModstamp = SystemModstamp
+        self.litify_docs__Author__c = litify_docs__Author__c
+        self.litify_docs__Description__c = litify_docs__Description__c
+        self.litify_docs__External_File_Path__c = litify_docs__External_File_Path__c
+        self.litify_docs__External_ID__c = litify_docs__External_ID__c
+        self.litify_docs__Folder_Path__c = litify_docs__Folder_Path__c
+        self.litify_docs__From__c = litify_docs__From__c
+        self.litify_docs__To__c = litify_docs__To__c
+        self.litify_docs__Latest_Version__c = litify_docs__Latest_Version__c
+        self.litify_docs__Complete__c = litify_docs__Complete__c
+        self.litify_docs__File_Link__c = litify_docs__File_Link__c
+        self.litify_docs__Related_To_Api_Name__c = litify_docs__Related_To_Api_Name__c
+        self.litify_docs__File_Type__c = litify_docs__File_Type__c
+        self.litify_docs__File_Size__c = litify_docs__File_Size__c
+        self.litify_docs__Related_To__c = litify_docs__Related_To__c
+        self.Duplicates = Duplicates
+        self.Checksum = Checksum
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FileRecordObject':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('attributes')
+        if value is not None:
+            value = AnonymousDC4DA072.from_json(value)
+        obj.attributes = value
+        obj.Id = get('Id')
+        obj.OwnerId = get('OwnerId')
+        obj.IsDeleted = get('IsDeleted')
+        obj.Name = get('Name')
+        obj.CreatedDate = get('CreatedDate')
+        obj.CreatedById = get('CreatedById')
+        obj.LastModifiedDate = get('LastModifiedDate')
+        obj.LastModifiedById = get('LastModifiedById')
+        obj.LastReferencedDate = get('LastReferencedDate')
+        obj.LastViewedDate = get('LastViewedDate')
+        obj.SystemModstamp = get('SystemModstamp')
+        obj.litify_docs__Author__c = get('litify_docs__Author__c')
+        obj.litify_docs__Description__c = get('litify_docs__Description__c')
+        obj.litify_docs__External_File_Path__c = get('litify_docs__External_File_Path__c')
+        obj.litify_docs__External_ID__c = get('litify_docs__External_ID__c')
+        obj.litify_docs__Folder_Path__c = get('litify_docs__Folder_Path__c')
+        obj.litify_docs__From__c = get('litify_docs__From__c')
+        obj.litify_docs__To__c = get('litify_docs__To__c')
+        obj.litify_docs__Latest_Version__c = get('litify_docs__Latest_Version__c')
+        obj.litify_docs__Complete__c = get('litify_docs__Complete__c')
+        obj.litify_docs__File_Link__c = get('litify_docs__File_Link__c')
+        obj.litify_docs__Related_To_Api_Name__c = get('litify_docs__Related_To_Api_Name__c')
+        obj.litify_docs__File_Type__c = get('litify_docs__File_Type__c')
+        obj.litify_docs__File_Size__c = get('litify_docs__File_Size__c')
+        obj.litify_docs__Related_To__c = get('litify_docs__Related_To__c')
+        obj.Duplicates = get('Duplicates')
+        obj.Checksum = get('Checksum')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.attributes
+        if value is not None:
+            data['attributes'] = value.to_json()
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        value = self.OwnerId
+        if value is not None:
+            data['OwnerId'] = value
+        value = self.IsDeleted
+        if value is not None:
+            data['IsDeleted'] = value
+        value = self.Name
+        if value is not None:
+            data['Name'] = value
+        value = self.CreatedDate
+        if value is not None:
+            data['CreatedDate'] = value
+        value = self.CreatedById
+        if value is not None:
+            data['CreatedById'] = value
+        value = self.LastModifiedDate
+        if value is not None:
+            data['LastModifiedDate'] = value
+        value = self.LastModifiedById
+        if value is not None:
+            data['LastModifiedById'] = value
+        value = self.LastReferencedDate
+        if value is not None:
+            data['LastReferencedDate'] = value
+        value = self.LastViewedDate
+        if value is not None:
+            data['LastViewedDate'] = value
+        value = self.SystemModstamp
+        if value is not None:
+            data['SystemModstamp'] = value
+        value = self.litify_docs__Author__c
+        if value is not None:
+            data['litify_docs__Author__c'] = value
+        value = self.litify_docs__Description__c
+        if value is not None:
+            data['litify_docs__Description__c'] = value
+        value = self.litify_docs__External_File_Path__c
+        if value is not None:
+            data['litify_docs__External_File_Path__c'] = value
+        value = self.litify_docs__External_ID__c
+        if value is not None:
+            data['litify_docs__External_ID__c'] = value
+        value = self.litify_docs__Folder_Path__c
+        if value is not None:
+            data['litify_docs__Folder_Path__c'] = value
+        value = self.litify_docs__From__c
+        if value is not None:
+            data['litify_docs__From__c'] = value
+        value = self.litify_docs__To__c
+        if value is not None:
+            data['litify_docs__To__c'] = value
+        value = self.litify_docs__Latest_Version__c
+        if value is not None:
+            data['litify_docs__Latest_Version__c'] = value
+        value = self.litify_docs__Complete__c
+        if value is not None:
+            data['litify_docs__Complete__c'] = value
+        value = self.litify_docs__File_Link__c
+        if value is not None:
+            data['litify_docs__File_Link__c'] = value
+        value = self.litify_docs__Related_To_Api_Name__c
+        if value is not None:
+            data['litify_docs__Related_To_Api_Name__c'] = value
+        value = self.litify_docs__File_Type__c
+        if value is not None:
+            data['litify_docs__File_Type__c'] = value
+        value = self.litify_docs__File_Size__c
+        if value is not None:
+            data['litify_docs__File_Size__c'] = value
+        value = self.litify_docs__Related_To__c
+        if value is not None:
+            data['litify_docs__Related_To__c'] = value
+        value = self.Duplicates
+        if value is not None:
+            data['Duplicates'] = value
+        value = self.Checksum
+        if value is not None:
+            data['Checksum'] = value
+        return data
+
+
+class MultipartFileRecordObject:
+    """MultipartFileRecordObject model"""
+    __slots__ = ('Id',
+                 'OwnerId',
+                 'IsDeleted',
+                 'Name',
+                 'CreatedDate',
+                 'CreatedById',
+                 'LastModifiedDate',
+                 'LastModifiedById',
+                 'SystemModstamp',
+                 'litify_docs__Complete__c',
+                 'litify_docs__File_Link__c',
+                 'litify_docs__File_Type__c',
+                 'litify_docs__Folder_Path_First_255__c',
+                 'litify_docs__Folder_Path_Last_255__c',
+                 'litify_docs__Folder_Path__c',
+                 'litify_docs__Latest_Version_Formula__c',
+                 'litify_docs__OCR_Compatible__c',
+                 'litify_docs__Related_To_Api_Name__c',
+                 'litify_docs__Related_To__c',
+                 'litify_docs__Latest_Version__c',
+                 'litify_docs__Updated_By__c',
+                 'litify_docs__Updated_On__c',
+                 'litify_docs__Updated_By_Name__c',
+                 'litify_docs__Delete__c',
+                 'litify_docs__Has_Attachments_Legacy__c',
+                 'litify_docs__File_Size__c',
+                 'litify_docs__Source__c',
+                 'litify_docs__Version_Id__c',
+                 'Duplicates',
+                 'Checksum')
+
+    def __init__(self,
+                 *,
+                 Id: Optional[str] = None,
+                 OwnerId: Optional[str] = None,
+                 IsDeleted: Optional[bool] = None,
+                 Name: Optional[str] = None,
+                 CreatedDate: Optional[str] = None,
+                 CreatedById: Optional[str] = None,
+                 LastModifiedDate: Optional[str] = None,
+                 LastModifiedById: Optional[str] = None,
+                 SystemModstamp: Optional[str] = None,
+                 litify_docs__Complete__c: Optional[bool] = None,
+                 litify_docs__File_Link__c: Optional[str] = None,
+                 litify_docs__File_Type__c: Optional[str] = None,
+                 litify_docs__Folder_Path_First_255__c: Optional[str] = None,
+                 litify_docs__Folder_Path_Last_255__c: Optional[str] = None,
+                 litify_docs__Folder_Path__c: Optional[str] = None,
+                 litify_docs__Latest_Version_Formula__c: Optional[int] = None,
+                 litify_docs__OCR_Compatible__c: Optional[bool] = None,
+                 litify_docs__Related_To_Api_Name__c: Optional[str] = None,
+                 litify_docs__Related_To__c: Optional[str] = None,
+                 litify_docs__Latest_Version__c: Optional[int] = None,
+                 litify_docs__Updated_By__c: Optional[str] = None,
+                 litify_docs__Updated_On__c: Optional[str] = None,
+                 litify_docs__Updated_By_Name__c: Optional[str] = None,
+                 litify_docs__Delete__c: Optional[bool] = None,
+                 litify_docs__Has_Attachments_Legacy__c: Optional[bool] = None,
+                 litify_docs__File_Size__c: Optional[int] = None,
+                 litify_docs__Source__c: Optional[str] = None,
+                 litify_docs__Version_Id__c: Optional[str] = None,
+                 Duplicates: Optional[List[str]] = None,
+                 Checksum: Optional[str] = None):
+        self.Id = Id
+        self.OwnerId = OwnerId
+        self.IsDeleted = IsDeleted
+        self.Name = Name
+        self.CreatedDate = CreatedDate
+        self.CreatedById = CreatedById
+        self.LastModifiedDate = LastModifiedDate
+        self.LastModifiedById = LastModifiedById
+        self.SystemModstamp = SystemModstamp
+        self.litify_docs__Complete__c = litify_docs__Complete__c
+        self.litify_docs__File_Link__c = litify_docs__File_Link__c
+        self.litify_docs__File_Type__c = litify_docs__File_Type__c
+        self.litify_docs__Folder_Path_First_255__c = litify_docs__Folder_Path_First_255__c
+        self.litify_docs__Folder_Path_Last_255__c = litify_docs__Folder_Path_Last_255__c
+        self.litify_docs__Folder_Path__c = litify_docs__Folder_Path__c
+        self.litify_docs__Latest_Version_Formula__c = litify_docs__Latest_Version_Formula__c
+        self.litify_docs__OCR_Compatible__c = litify_docs__OCR_Compatible__c
+        self.litify_docs__Related_To_Api_Name__c = litify_docs__Related_To_Api_Name__c
+        self.litify_docs__Related_To__c = litify_docs__Related_To__c
+        self.litify_docs__Latest_Version__c = litify_docs__Latest_Version__c
+        self.litify_docs__Updated_By__c = litify_docs__Updated_By__c
+        self.litify_docs__Updated_On__c = litify_docs__Updated_On__c
+        self.litify_docs__Updated_By_Name__c = litify_docs__Updated_By_Name__c
+        self.litify_docs__Delete__c = litify_docs__Delete__c
+        self.litify_docs__Has_Attachments_Legacy__c = litify_docs__Has_Attachments_Legacy__c
+        self.litify_docs__File_Size__c = litify_docs__File_Size__c
+        self.litify_docs__Source__c = litify_docs__Source__c
+        self.litify_docs__Version_Id__c = litify_docs__Version_Id__c
+        self.Duplicates = Duplicates
+        self.Checksum = Checksum
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MultipartFileRecordObject':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Id = get('Id')
+        obj.OwnerId = get('OwnerId')
+        obj.IsDeleted = get('IsDeleted')
+        obj.Name = get('Name')
+        obj.CreatedDate = get('CreatedDate')
+        obj.CreatedById = get('CreatedById')
+        obj.LastModifiedDate = get('LastModifiedDate')
+        obj.LastModifiedById = get('LastModifiedById')
+        obj.SystemModstamp = get('SystemModstamp')
+        obj.litify_docs__Complete__c = get('litify_docs__Complete__c')
+        obj.litify_docs__File_Link__c = get('litify_docs__File_Link__c')
+        obj.litify_docs__File_Type__c = get('litify_docs__File_Type__c')
+        obj.litify_docs__Folder_Path_First_255__c = get('litify_docs__Folder_Path_First_255__c')
+        obj.litify_docs__Folder_Path_Last_255__c = get('litify_docs__Folder_Path_Last_255__c')
+        obj.litify_docs__Folder_Path__c = get('litify_docs__Folder_Path__c')
+        obj.litify_docs__Latest_Version_Formula__c = get('litify_docs__Latest_Version_Formula__c')
+        obj.litify_docs__OCR_Compatible__c = get('litify_docs__OCR_Compatible__c')
+        obj.litify_docs__Related_To_Api_Name__c = get('litify_docs__Related_To_Api_Name__c')
+        obj.litify_docs__Related_To__c = get('litify_docs__Related_To__c')
+        obj.litify_docs__Latest_Version__c = get('litify_docs__Latest_Version__c')
+        obj.litify_docs__Updated_By__c = get('litify_docs__Updated_By__c')
+        obj.litify_docs__Updated_On__c = get('litify_docs__Updated_On__c')
+        obj.litify_docs__Updated_By_Name__c = get('litify_docs__Updated_By_Name__c')
+        obj.litify_docs__Delete__c = get('litify_docs__Delete__c')
+        obj.litify_docs__Has_Attachments_Legacy__c = get('litify_docs__Has_Attachments_Legacy__c')
+        obj.litify_docs__File_Size__c = get('litify_docs__File_Size__c')
+        obj.litify_docs__Source__c = get('litify_docs__Source__c')
+        obj.litify_docs__Version_Id__c = get('litify_docs__Version_Id__c')
+        obj.Duplicates = get('Duplicates')
+        obj.Checksum = get('Checksum')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        value = self.OwnerId
+        if value is not None:
+            data['OwnerId'] = value
+        value = self.IsDeleted
+        if value is not None:
+            data['IsDeleted'] = value
+        value = self.Name
+        if value is not None:
+            data['Name'] = value
+        value = self.CreatedDate
+        if value is not None:
+            data['CreatedDate'] = value
+        value = self.CreatedById
+        if value is not None:
+            data['CreatedById'] = value
+        value = self.LastModifiedDate
+        if value is not None:
+            data['LastModifiedDate'] = value
+        value = self.LastModifiedById
+        if value is not None:
+            data['LastModifiedById'] = value
+        value = self.SystemModstamp
+        if value is not None:
+            data['SystemModstamp'] = value
+        value = self.litify_docs__Complete__c
+        if value is not None:
+            data['litify_docs__Complete__c'] = value
+        value = self.litify_docs__File_Link__c
+        if value is not None:
+            data['litify_docs__File_Link__c'] = value
+        value = self.litify_docs__File_Type__c
+        if value is not None:
+            data['litify_docs__File_Type__c'] = value
+        value = self.litify_docs__Folder_Path_First_255__c
+        if value is not None:
+            data['litify_docs__Folder_Path_First_255__c'] = value
+        value = self.litify_docs__Folder_Path_Last_255__c
+        if value is not None:
+            data['litify_docs__Folder_Path_Last_255__c'] = value
+        value = self.litify_docs__Folder_Path__c
+        if value is not None:
+            data['litify_docs__Folder_Path__c'] = value
+        value = self.litify_docs__Latest_Version_Formula__c
+        if value is not None:
+            data['litify_docs__Latest_Version_Formula__c'] = value
+        value = self.litify_docs__OCR_Compatible__c
+        if value is not None:
+            data['litify_docs__OCR_Compatible__c'] = value
+        value = self.litify_docs__Related_To_Api_Name__c
+        if value is not None:
+            data['litify_docs__Related_To_Api_Name__c'] = value
+        value = self.litify_docs__Related_To__c
+        if value is not None:
+            data['litify_docs__Related_To__c'] = value
+        value = self.litify_docs__Latest_Version__c
+        if value is not None:
+            data['litify_docs__Latest_Version__c'] = value
+        value = self.litify_docs__Updated_By__c
+        if value is not None:
+            data['litify_docs__Updated_By__c'] = value
+        value = self.litify_docs__Updated_On__c
+        if value is not None:
+            data['litify_docs__Updated_On__c'] = value
+        value = self.litify_docs__Updated_By_Name__c
+        if value is not None:
+            data['litify_docs__Updated_By_Name__c'] = value
+        value = self.litify_docs__Delete__c
+        if value is not None:
+            data['litify_docs__Delete__c'] = value
+        value = self.litify_docs__Has_Attachments_Legacy__c
+        if value is not None:
+            data['litify_docs__Has_Attachments_Legacy__c'] = value
+        value = self.litify_docs__File_Size__c
+        if value is not None:
+            data['litify_docs__File_Size__c'] = value
+        value = self.litify_docs__Source__c
+        if value is not None:
+            data['litify_docs__Source__c'] = value
+        value = self.litify_docs__Version_Id__c
+        if value is not None:
+            data['litify_docs__Version_Id__c'] = value
+        value = self.Duplicates
+        if value is not None:
+            data['Duplicates'] = value
+        value = self.Checksum
+        if value is not None:
+            data['Checksum'] = value
+        return data
+
+
+class SignedUrlObject:
+    """SignedUrlObject model"""
+    __slots__ = ('SignedUrl',
+                 'Expires',
+                 'Id',
+                 'FailReason',
+                 'litify_docs__Related_To__c',
+                 'litify_docs__External_Id__c')
+
+    def __init__(self,
+                 *,
+                 SignedUrl: Optional[str] = None,
+                 Expires: Optional[str] = None,
+                 Id: Optional[str] = None,
+                 FailReason: Optional[str] = None,
+                 litify_docs__Related_To__c: Optional[str] = None,
+                 litify_docs__External_Id__c: Optional[str] = None):
+        self.SignedUrl = SignedUrl
+        self.Expires = Expires
+        self.Id = Id
+        self.FailReason = FailReason
+        self.litify_docs__Related_To__c = litify_docs__Related_To__c
+        self.litify_docs__External_Id__c = litify_docs__External_Id__c
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'SignedUrlObject':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.SignedUrl = get('SignedUrl')
+        obj.Expires = get('Expires')
+        obj.Id = get('Id')
+        obj.FailReason = get('FailReason')
+        obj.litify_docs__Related_To__c = get('litify_docs__Related_To__c')
+        obj.litify_docs__External_Id__c = get('litify_docs__External_Id__c')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.SignedUrl
+        if value is not None:
+            data['SignedUrl'] = value
+        value = self.Expires
+        if value is not None:
+            data['Expires'] = value
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        value = self.FailReason
+        if value is not None:
+            data['FailReason'] = value
+        value = self.litify_docs__Related_To__c
+        if value is not None:
+            data['litify_docs__Related_To__c'] = value
+        value = self.litify_docs__External_Id__c
+        if value is not None:
+            data['litify_docs__External_Id__c'] = value
+        return data
+
+
+class MultipartSignedUrlObject:
+    """MultipartSignedUrlObject model"""
+    __slots__ = ('SignedUrls', 'Expires', 'Id', 'UploadId')
+
+    def __init__(self,
+                 *,
+                 SignedUrls: Optional[List[str]] = None,
+                 Expires: Optional[str] = None,
+                 Id: Optional[str] = None,
+                 UploadId: Optional[str] = None):
+        self.SignedUrls = SignedUrls
+        self.Expires = Expires
+        self.Id = Id
+        self.UploadId = UploadId
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'MultipartSignedUrlObject':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.SignedUrls = get('SignedUrls')
+        obj.Expires = get('Expires')
+        obj.Id = get('Id')
+        obj.UploadId = get('UploadId')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.SignedUrls
+        if value is not None:
+            data['SignedUrls'] = value
+        value = self.Expires
+        if value is not None:
+            data['Expires'] = value
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        value = self.UploadId
+        if value is not None:
+            data['UploadId'] = value
+        return data
+
+
+class Anonymous02332DDD:
+    """Anonymous02332DDD model"""
+    __slots__ = ('Flatten',
+                 'Name',
+                 'SourceId',
+                 'Tags',
+                 'litify_docs__File_Type__c',
+                 'litify_docs__Folder_Path__c',
+                 'litify_docs__Related_To__c')
+
+    def __init__(self,
+                 *,
+                 Flatten: Optional[bool] = None,
+                 Name: Optional[str] = None,
+                 SourceId: Optional[str] = None,
+                 Tags: Optional[Dict[str, Any]] = None,
+                 litify_docs__File_Type__c: Optional[str] = None,
+                 litify_docs__Folder_Path__c: Optional[str] = None,
+                 litify_docs__Related_To__c: Optional[str] = None):
+        self.Flatten = Flatten
+        self.Name = Name
+        self.SourceId = SourceId
+        self.Tags = Tags
+        self.litify_docs__File_Type__c = litify_docs__File_Type__c
+        self.litify_docs__Folder_Path__c = litify_docs__Folder_Path__c
+        self.litify_docs__Related_To__c = litify_docs__Related_To__c
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous02332DDD':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Flatten = get('Flatten')
+        obj.Name = get('Name')
+        obj.SourceId = get('SourceId')
+        obj.Tags = get('Tags')
+        obj.litify_docs__File_Type__c = get('litify_docs__File_Type__c')
+        obj.litify_docs__Folder_Path__c = get('litify_docs__Folder_Path__c')
+        obj.litify_docs__Related_To__c = get('litify_docs__Related_To__c')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Flatten
+        if value is not None:
+            data['Flatten'] = value
+        value = self.Name
+        if value is not None:
+            data['Name'] = value
+        value = self.SourceId
+        if value is not None:
+            data['SourceId'] = value
+        value = self.Tags
+        if value is not None:
+            data['Tags'] = value
+        value = self.litify_docs__File_Type__c
+        if value is not None:
+            data['litify_docs__File_Type__c'] = value
+        value = self.litify_docs__Folder_Path__c
+        if value is not None:
+            data['litify_docs__Folder_Path__c'] = value
+        value = self.litify_docs__Related_To__c
+        if value is not None:
+            data['litify_docs__Related_To__c'] = value
+        return data
+
+
+class Anonymous03F41BF3:
+    """Anonymous03F41BF3 model"""
+    __slots__ = ('fileInfoId', 'fileType', 'name')
+
+    def __init__(self,
+                 *,
+                 fileInfoId: Optional[str] = None,
+                 fileType: Optional[str] = None,
+                 name: Optional[str] = None):
+        self.fileInfoId = fileInfoId
+        self.fileType = fileType
+        self.name = name
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous03F41BF3':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.fileInfoId = get('fileInfoId')
+        obj.fileType = get('fileType')
+        obj.name = get('name')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.fileInfoId
+        if value is not None:
+            data['fileInfoId'] = value
+        value = self.fileType
+        if value is not None:
+            data['fileType'] = value
+        value = self.name
+        if value is not None:
+            data['name'] = value
+        return data
+
+
+class Anonymous07B7C06C:
+    """Anonymous07B7C06C model"""
+    __slots__ = ('litify_docs__Expiration_Date__c',
+                 'litify_docs__File_Size__c',
+                 'litify_docs__File_Type__c',
+                 'litify_docs__Password__c',
+                 'litify_docs__Unique_Id__c')
+
+    def __init__(self,
+                 *,
+                 litify_docs__Expiration_Date__c: Optional[str] = None,
+                 litify_docs__File_Size__c: Optional[int] = None,
+                 litify_docs__File_Type__c: Optional[str] = None,
+                 litify_docs__Password__c: Optional[str] = None,
+                 litify_docs__Unique_Id__c: Optional[str] = None):
+        self.litify_docs__Expiration_Date__c = litify_docs__Expiration_Date__c
+        self.litify_docs__File_Size__c = litify_docs__File_Size__c
+        self.litify_docs__File_Type__c = litify_docs__File_Type__c
+        self.litify_docs__Password__c = litify_docs__Password__c
+        self.litify_docs__Unique_Id__c = litify_docs__Unique_Id__c
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous07B7C06C':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.litify_docs__Expiration_Date__c = get('litify_docs__Expiration_Date__c')
+        obj.litify_docs__File_Size__c = get('litify_docs__File_Size__c')
+        obj.litify_docs__File_Type__c = get('litify_docs__File_Type__c')
+        obj.litify_docs__Password__c = get('litify_docs__Password__c')
+        obj.litify_docs__Unique_Id__c = get('litify_docs__Unique_Id__c')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.litify_docs__Expiration_Date__c
+        if value is not None:
+            data['litify_docs__Expiration_Date__c'] = value
+        value = self.litify_docs__File_Size__c
+        if value is not None:
+            data['litify_docs__File_Size__c'] = value
+        value = self.litify_docs__File_Type__c
+        if value is not None:
+            data['litify_docs__File_Type__c'] = value
+        value = self.litify_docs__Password__c
+        if value is not None:
+            data['litify_docs__Password__c'] = value
+        value = self.litify_docs__Unique_Id__c
+        if value is not None:
+            data['litify_docs__Unique_Id__c'] = value
+        return data
+
+
+class Anonymous23BC28E2:
+    """Anonymous23BC28E2 model"""
+    __slots__ = ('sortDirection', 'sortField')
+
+    def __init__(self, *, sortDirection: Optional[str] = None, sortField: Optional[str] = None):
+        self.sortDirection = sortDirection
+        self.sortField = sortField
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous23BC28E2':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.sortDirection = get('sortDirection')
+        obj.sortField = get('sortField')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.sortDirection
+        if value is not None:
+            data['sortDirection'] = value
+        value = self.sortField
+        if value is not None:
+            data['sortField'] = value
+        return data
+
+
+class Anonymous2D4AF8A1:
+    """Anonymous2D4AF8A1 model"""
+    __slots__ = ('jobId', 'status')
+
+    def __init__(self, *, jobId: Optional[str] = None, status: Optional[str] = None):
+        self.jobId = jobId
+        self.status = status
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous2D4AF8A1':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.jobId = get('jobId')
+        obj.status = get('status')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.jobId
+        if value is not None:
+            data['jobId'] = value
+        value = self.status
+        if value is not None:
+            data['status'] = value
+        return data
+
+
+class Anonymous3B300D72:
+    """Anonymous3B300D72 model"""
+    __slots__ = ('ETag', 'PartNumber')
+
+    def __init__(self, *, ETag: Optional[str] = None, PartNumber: Optional[int] = None):
+        self.ETag = ETag
+        self.PartNumber = PartNumber
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous3B300D72':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.ETag = get('ETag')
+        obj.PartNumber = get('PartNumber')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.ETag
+        if value is not None:
+            data['ETag'] = value
+        value = self.PartNumber
+        if value is not None:
+            data['PartNumber'] = value
+        return data
+
+
+class Anonymous3F57AA5C:
+    """Anonymous3F57AA5C model"""
+    __slots__ = ('Name',
+                 'SourceId',
+                 'Tags',
+                 'litify_docs__Bulk_Merge_Job__c',
+                 'litify_docs__File_Type__c',
+                 'litify_docs__Folder_Path__c',
+                 'litify_docs__Origin_Merge_Template__c',
+                 'litify_docs__Related_To__c')
+
+    def __init__(self,
+                 *,
+                 Name: Optional[str] = None,
+                 SourceId: Optional[str] = None,
+                 Tags: Optional[Dict[str, Any]] = None,
+                 litify_docs__Bulk_Merge_Job__c: Optional[str] = None,
+                 litify_docs__File_Type__c: Optional[str] = None,
+                 litify_docs__Folder_Path__c: Optional[str] = None,
+                 litify_docs__Origin_Merge_Template__c: Optional[str] = None,
+                 litify_docs__Related_To__c: Optional[str] = None):
+        self.Name = Name
+        self.SourceId = SourceId
+        self.Tags = Tags
+        self.litify_docs__Bulk_Merge_Job__c = litify_docs__Bulk_Merge_Job__c
+        self.litify_docs__File_Type__c = litify_docs__File_Type__c
+        self.litify_docs__Folder_Path__c = litify_docs__Folder_Path__c
+        self.litify_docs__Origin_Merge_Template__c = litify_docs__Origin_Merge_Template__c
+        self.litify_docs__Related_To__c = litify_docs__Related_To__c
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous3F57AA5C':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Name = get('Name')
+        obj.SourceId = get('SourceId')
+        obj.Tags = get('Tags')
+        obj.litify_docs__Bulk_Merge_Job__c = get('litify_docs__Bulk_Merge_Job__c')
+        obj.litify_docs__File_Type__c = get('litify_docs__File_Type__c')
+        obj.litify_docs__Folder_Path__c = get('litify_docs__Folder_Path__c')
+        obj.litify_docs__Origin_Merge_Template__c = get('litify_docs__Origin_Merge_Template__c')
+        obj.litify_docs__Related_To__c = get('litify_docs__Related_To__c')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Name
+        if value is not None:
+            data['Name'] = value
+        value = self.SourceId
+        if value is not None:
+            data['SourceId'] = value
+        value = self.Tags
+        if value is not None:
+            data['Tags'] = value
+        value = self.litify_docs__Bulk_Merge_Job__c
+        if value is not None:
+            data['litify_docs__Bulk_Merge_Job__c'] = value
+        value = self.litify_docs__File_Type__c
+        if value is not None:
+            data['litify_docs__File_Type__c'] = value
+        value = self.litify_docs__Folder_Path__c
+        if value is not None:
+            data['litify_docs__Folder_Path__c'] = value
+        value = self.litify_docs__Origin_Merge_Template__c
+        if value is not None:
+            data['litify_docs__Origin_Merge_Template__c'] = value
+        value = self.litify_docs__Related_To__c
+        if value is not None:
+            data['litify_docs__Related_To__c'] = value
+        return data
+
+
+class Anonymous416F2D6B:
+    """Anonymous416F2D6B model"""
+    __slots__ = ('example', 'type')
+
+    def __init__(self, *, example: Optional[Dict[str, Any]] = None, type: Optional[Any] = None):
+        self.example = example
+        self.type = type
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous416F2D6B':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.example = get('example')
+        obj.type = get('type')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.example
+        if value is not None:
+            data['example'] = value
+        value = self.type
+        if value is not None:
+            data['type'] = value
+        return data
+
+
+class Anonymous46E253D8:
+    """Anonymous46E253D8 model"""
+    __slots__ = ('properties', 'required', 'type')
+
+    def __init__(self,
+                 *,
+                 properties: Optional['Anonymous416F2D6B'] = None,
+                 required: Optional[List[str]] = None,
+                 type: Optional[str] = None):
+        self.properties = properties
+        self.required = required
+        self.type = type
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous46E253D8':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('properties')
+        if value is not None:
+            value = Anonymous416F2D6B.from_json(value)
+        obj.properties = value
+        obj.required = get('required')
+        obj.type = get('type')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.properties
+        if value is not None:
+            data['properties'] = value.to_json()
+        value = self.required
+        if value is not None:
+            data['required'] = value
+        value = self.type
+        if value is not None:
+            data['type'] = value
+        return data
+
+
+class Anonymous4B1399C5:
+    """Anonymous4B1399C5 model"""
+    __slots__ = ('Id', 'Name')
+
+    def __init__(self, *, Id: Optional[str] = None, Name: Optional[str] = None):
+        self.Id = Id
+        self.Name = Name
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous4B1399C5':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Id = get('Id')
+        obj.Name = get('Name')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        value = self.Name
+        if value is not None:
+            data['Name'] = value
+        return data
+
+
+class Anonymous5FDA991C:
+    """Anonymous5FDA991C model"""
+    __slots__ = ('const', 'description', 'type')
+
+    def __init__(self,
+                 *,
+                 const: Optional[str] = None,
+                 description: Optional[str] = None,
+                 type: Optional[str] = None):
+        self.const = const
+        self.description = description
+        self.type = type
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous5FDA991C':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.const = get('const')
+        obj.description = get('description')
+        obj.type = get('type')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.const
+        if value is not None:
+            data['const'] = value
+        value = self.description
+        if value is not None:
+            data['description'] = value
+        value = self.type
+        if value is not None:
+            data['type'] = value
+        return data
+
+
+class Anonymous685CC7A3:
+    """Anonymous685CC7A3 model"""
+    __slots__ = ('EndValue', 'StartValue')
+
+    def __init__(self, *, EndValue: Optional[str] = None, StartValue: Optional[str] = None):
+        self.EndValue = EndValue
+        self.StartValue = StartValue
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous685CC7A3':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.EndValue = get('EndValue')
+        obj.StartValue = get('StartValue')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.EndValue
+        if value is not None:
+            data['EndValue'] = value
+        value = self.StartValue
+        if value is not None:
+            data['StartValue'] = value
+        return data
+
+
+class Anonymous6AEC0B9F:
+    """Anonymous6AEC0B9F model"""
+    __slots__ = ('Parts', 'UploadId')
+
+    def __init__(self, *, Parts: Optional[List['Anonymous3B300D72']] = None, UploadId: Optional[str] = None):
+        self.Parts = Parts
+        self.UploadId = UploadId
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous6AEC0B9F':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Parts')
+        if value is not None:
+            value = [Anonymous3B300D72.from_json(item) for item in value]
+        obj.Parts = value
+        obj.UploadId = get('UploadId')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Parts
+        if value is not None:
+            data['Parts'] = [item.to_json() for item in value]
+        value = self.UploadId
+        if value is not None:
+            data['UploadId'] = value
+        return data
+
+
+class Anonymous72AE4D3A:
+    """Anonymous72AE4D3A model"""
+    __slots__ = ('PDFConvertId', 'Status')
+
+    def __init__(self, *, PDFConvertId: Optional[str] = None, Status: Optional[str] = None):
+        self.PDFConvertId = PDFConvertId
+        self.Status = Status
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous72AE4D3A':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.PDFConvertId = get('PDFConvertId')
+        obj.Status = get('Status')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.PDFConvertId
+        if value is not None:
+            data['PDFConvertId'] = value
+        value = self.Status
+        if value is not None:
+            data['Status'] = value
+        return data
+
+
+class Anonymous9ED021A1:
+    """Anonymous9ED021A1 model"""
+    __slots__ = ('expirationTime', 'jobId', 'status')
+
+    def __init__(self,
+                 *,
+                 expirationTime: Optional[int] = None,
+                 jobId: Optional[str] = None,
+                 status: Optional[str] = None):
+        self.expirationTime = expirationTime
+        self.jobId = jobId
+        self.status = status
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous9ED021A1':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.expirationTime = get('expirationTime')
+        obj.jobId = get('jobId')
+        obj.status = get('status')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.expirationTime
+        if value is not None:
+            data['expirationTime'] = value
+        value = self.jobId
+        if value is not None:
+            data['jobId'] = value
+        value = self.status
+        if value is not None:
+            data['status'] = value
+        return data
+
+
+class Anonymous9F3348ED:
+    """Anonymous9F3348ED model"""
+    __slots__ = ('Id',
+                 'litify_docs__Expiration_Date__c',
+                 'litify_docs__Password__c',
+                 'litify_docs__Unique_Id__c')
+
+    def __init__(self,
+                 *,
+                 Id: Optional[str] = None,
+                 litify_docs__Expiration_Date__c: Optional[str] = None,
+                 litify_docs__Password__c: Optional[bool] = None,
+                 litify_docs__Unique_Id__c: Optional[str] = None):
+        self.Id = Id
+        self.litify_docs__Expiration_Date__c = litify_docs__Expiration_Date__c
+        self.litify_docs__Password__c = litify_docs__Password__c
+        self.litify_docs__Unique_Id__c = litify_docs__Unique_Id__c
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Anonymous9F3348ED':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Id = get('Id')
+        obj.litify_docs__Expiration_Date__c = get('litify_docs__Expiration_Date__c')
+        obj.litify_docs__Password__c = get('litify_docs__Password__c')
+        obj.litify_docs__Unique_Id__c = get('litify_docs__Unique_Id__c')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        value = self.litify_docs__Expiration_Date__c
+        if value is not None:
+            data['litify_docs__Expiration_Date__c'] = value
+        value = self.litify_docs__Password__c
+        if value is not None:
+            data['litify_docs__Password__c'] = value
+        value = self.litify_docs__Unique_Id__c
+        if value is not None:
+            data['litify_docs__Unique_Id__c'] = value
+        return data
+
+
+class AnonymousA0BEC8AD:
+    """AnonymousA0BEC8AD model"""
+    __slots__ = ('FailReason', 'NewId', 'OriginalId')
+
+    def __init__(self,
+                 *,
+                 FailReason: Optional[str] = None,
+                 NewId: Optional[str] = None,
+                 OriginalId: Optional[str] = None):
+        self.FailReason = FailReason
+        self.NewId = NewId
+        self.OriginalId = OriginalId
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousA0BEC8AD':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.FailReason = get('FailReason')
+        obj.NewId = get('NewId')
+        obj.OriginalId = get('OriginalId')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.FailReason
+        if value is not None:
+            data['FailReason'] = value
+        value = self.NewId
+        if value is not None:
+            data['NewId'] = value
+        value = self.OriginalId
+        if value is not None:
+            data['OriginalId'] = value
+        return data
+
+
+class AnonymousA7A225DF:
+    """AnonymousA7A225DF model"""
+    __slots__ = ('offsetSortId', 'offsetSortValue')
+
+    def __init__(self, *, offsetSortId: Optional[str] = None, offsetSortValue: Optional[str] = None):
+        self.offsetSortId = offsetSortId
+        self.offsetSortValue = offsetSortValue
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousA7A225DF':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.offsetSortId = get('offsetSortId')
+        obj.offsetSortValue = get('offsetSortValue')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.offsetSortId
+        if value is not None:
+            data['offsetSortId'] = value
+        value = self.offsetSortValue
+        if value is not None:
+            data['offsetSortValue'] = value
+        return data
+
+
+class AnonymousB24F690A:
+    """AnonymousB24F690A model"""
+    __slots__ = ('SourceId', 'Tags', 'type')
+
+    def __init__(self,
+                 *,
+                 SourceId: Optional['Anonymous5FDA991C'] = None,
+                 Tags: Optional['Anonymous46E253D8'] = None,
+                 type: Optional[Any] = None):
+        self.SourceId = SourceId
+        self.Tags = Tags
+        self.type = type
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousB24F690A':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('SourceId')
+        if value is not None:
+            value = Anonymous5FDA991C.from_json(value)
+        obj.SourceId = value
+        value = get('Tags')
+        if value is not None:
+            value = Anonymous46E253D8.from_json(value)
+        obj.Tags = value
+        obj.type = get('type')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.SourceId
+        if value is not None:
+            data['SourceId'] = value.to_json()
+        value = self.Tags
+        if value is not None:
+            data['Tags'] = value.to_json()
+        value = self.type
+        if value is not None:
+            data['type'] = value
+        return data
+
+
+class AnonymousBDCD31B0:
+    """AnonymousBDCD31B0 model"""
+    __slots__ = ('fileName', 'fileType', 'pages')
+
+    def __init__(self,
+                 *,
+                 fileName: Optional[str] = None,
+                 fileType: Optional[str] = None,
+                 pages: Optional[Any] = None):
+        self.fileName = fileName
+        self.fileType = fileType
+        self.pages = pages
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousBDCD31B0':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.fileName = get('fileName')
+        obj.fileType = get('fileType')
+        obj.pages = get('pages')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.fileName
+        if value is not None:
+            data['fileName'] = value
+        value = self.fileType
+        if value is not None:
+            data['fileType'] = value
+        value = self.pages
+        if value is not None:
+            data['pages'] = value
+        return data
+
+
+class AnonymousBDD82738:
+    """AnonymousBDD82738 model"""
+    __slots__ = ('a1D52000001Thq9EAC',)
+
+    def __init__(self, *, a1D52000001Thq9EAC: Optional['AnonymousC49A9C6B'] = None):
+        self.a1D52000001Thq9EAC = a1D52000001Thq9EAC
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousBDD82738':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('a1D52000001Thq9EAC')
+        if value is not None:
+            value = AnonymousC49A9C6B.from_json(value)
+        obj.a1D52000001Thq9EAC = value
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.a1D52000001Thq9EAC
+        if value is not None:
+            data['a1D52000001Thq9EAC'] = value.to_json()
+        return data
+
+
+class AnonymousBE572634:
+    """AnonymousBE572634 model"""
+    __slots__ = ('Id', 'PreviewType', 'VersionId')
+
+    def __init__(self,
+                 *,
+                 Id: Optional[str] = None,
+                 PreviewType: Optional[str] = None,
+                 VersionId: Optional[str] = None):
+        self.Id = Id
+        self.PreviewType = PreviewType
+        self.VersionId = VersionId
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousBE572634':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Id = get('Id')
+        obj.PreviewType = get('PreviewType')
+        obj.VersionId = get('VersionId')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        value = self.PreviewType
+        if value is not None:
+            data['PreviewType'] = value
+        value = self.VersionId
+        if value is not None:
+            data['VersionId'] = value
+        return data
+
+
+class AnonymousC49A9C6B:
+    """AnonymousC49A9C6B model"""
+    __slots__ = ('files', 'folders')
+
+    def __init__(self, *, files: Optional[List[Any]] = None, folders: Optional[List[Any]] = None):
+        self.files = files
+        self.folders = folders
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousC49A9C6B':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.files = get('files')
+        obj.folders = get('folders')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.files
+        if value is not None:
+            data['files'] = value
+        value = self.folders
+        if value is not None:
+            data['folders'] = value
+        return data
+
+
+class AnonymousC6A48742:
+    """AnonymousC6A48742 model"""
+    __slots__ = ('a1D52000001Thq9EAC',)
+
+    def __init__(self, *, a1D52000001Thq9EAC: Optional[str] = None):
+        self.a1D52000001Thq9EAC = a1D52000001Thq9EAC
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousC6A48742':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.a1D52000001Thq9EAC = get('a1D52000001Thq9EAC')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.a1D52000001Thq9EAC
+        if value is not None:
+            data['a1D52000001Thq9EAC'] = value
+        return data
+
+
+class AnonymousD44DFA09:
+    """AnonymousD44DFA09 model"""
+    __slots__ = ('fileOne', 'fileTwo')
+
+    def __init__(self, *, fileOne: Optional[str] = None, fileTwo: Optional[str] = None):
+        self.fileOne = fileOne
+        self.fileTwo = fileTwo
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousD44DFA09':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.fileOne = get('fileOne')
+        obj.fileTwo = get('fileTwo')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.fileOne
+        if value is not None:
+            data['fileOne'] = value
+        value = self.fileTwo
+        if value is not None:
+            data['fileTwo'] = value
+        return data
+
+
+class AnonymousD60A108B:
+    """AnonymousD60A108B model"""
+    __slots__ = ('filePathReference', 'files')
+
+    def __init__(self,
+                 *,
+                 filePathReference: Optional['AnonymousC6A48742'] = None,
+                 files: Optional[List[str]] = None):
+        self.filePathReference = filePathReference
+        self.files = files
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousD60A108B':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('filePathReference')
+        if value is not None:
+            value = AnonymousC6A48742.from_json(value)
+        obj.filePathReference = value
+        obj.files = get('files')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.filePathReference
+        if value is not None:
+            data['filePathReference'] = value.to_json()
+        value = self.files
+        if value is not None:
+            data['files'] = value
+        return data
+
+
+class AnonymousD6892853:
+    """AnonymousD6892853 model"""
+    __slots__ = ('Templates', 'type')
+
+    def __init__(self, *, Templates: Optional[List['AnonymousB24F690A']] = None, type: Optional[Any] = None):
+        self.Templates = Templates
+        self.type = type
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousD6892853':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        value = get('Templates')
+        if value is not None:
+            value = [AnonymousB24F690A.from_json(item) for item in value]
+        obj.Templates = value
+        obj.type = get('type')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Templates
+        if value is not None:
+            data['Templates'] = [item.to_json() for item in value]
+        value = self.type
+        if value is not None:
+            data['type'] = value
+        return data
+
+
+class AnonymousD870485B:
+    """AnonymousD870485B model"""
+    __slots__ = ('Id',
+                 'Name',
+                 'litify_docs__File_Type__c',
+                 'litify_docs__Folder_Path__c',
+                 'litify_docs__Merge_Id__c',
+                 'litify_docs__Related_To__c')
+
+    def __init__(self,
+                 *,
+                 Id: Optional[str] = None,
+                 Name: Optional[str] = None,
+                 litify_docs__File_Type__c: Optional[str] = None,
+                 litify_docs__Folder_Path__c: Optional[str] = None,
+                 litify_docs__Merge_Id__c: Optional[str] = None,
+                 litify_docs__Related_To__c: Optional[str] = None):
+        self.Id = Id
+        self.Name = Name
+        self.litify_docs__File_Type__c = litify_docs__File_Type__c
+        self.litify_docs__Folder_Path__c = litify_docs__Folder_Path__c
+        self.litify_docs__Merge_Id__c = litify_docs__Merge_Id__c
+        self.litify_docs__Related_To__c = litify_docs__Related_To__c
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousD870485B':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Id = get('Id')
+        obj.Name = get('Name')
+        obj.litify_docs__File_Type__c = get('litify_docs__File_Type__c')
+        obj.litify_docs__Folder_Path__c = get('litify_docs__Folder_Path__c')
+        obj.litify_docs__Merge_Id__c = get('litify_docs__Merge_Id__c')
+        obj.litify_docs__Related_To__c = get('litify_docs__Related_To__c')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Id
+        if value is not None:
+            data['Id'] = value
+        value = self.Name
+        if value is not None:
+            data['Name'] = value
+        value = self.litify_docs__File_Type__c
+        if value is not None:
+            data['litify_docs__File_Type__c'] = value
+        value = self.litify_docs__Folder_Path__c
+        if value is not None:
+            data['litify_docs__Folder_Path__c'] = value
+        value = self.litify_docs__Merge_Id__c
+        if value is not None:
+            data['litify_docs__Merge_Id__c'] = value
+        value = self.litify_docs__Related_To__c
+        if value is not None:
+            data['litify_docs__Related_To__c'] = value
+        return data
+
+
+class AnonymousDC4DA072:
+    """AnonymousDC4DA072 model"""
+    __slots__ = ('type', 'url')
+
+    def __init__(self, *, type: Optional[str] = None, url: Optional[str] = None):
+        self.type = type
+        self.url = url
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousDC4DA072':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.type = get('type')
+        obj.url = get('url')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.type
+        if value is not None:
+            data['type'] = value
+        value = self.url
+        if value is not None:
+            data['url'] = value
+        return data
+
+
+class AnonymousEE9E98D8:
+    """AnonymousEE9E98D8 model"""
+    __slots__ = ('Name', 'jobId', 'litify_docs__Related_To__c', 'originalId')
+
+    def __init__(self,
+                 *,
+                 Name: Optional[str] = None,
+                 jobId: Optional[str] = None,
+                 litify_docs__Related_To__c: Optional[str] = None,
+                 originalId: Optional[str] = None):
+        self.Name = Name
+        self.jobId = jobId
+        self.litify_docs__Related_To__c = litify_docs__Related_To__c
+        self.originalId = originalId
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousEE9E98D8':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.Name = get('Name')
+        obj.jobId = get('jobId')
+        obj.litify_docs__Related_To__c = get('litify_docs__Related_To__c')
+        obj.originalId = get('originalId')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.Name
+        if value is not None:
+            data['Name'] = value
+        value = self.jobId
+        if value is not None:
+            data['jobId'] = value
+        value = self.litify_docs__Related_To__c
+        if value is not None:
+            data['litify_docs__Related_To__c'] = value
+        value = self.originalId
+        if value is not None:
+            data['originalId'] = value
+        return data
+
+
+class AnonymousF703761E:
+    """AnonymousF703761E model"""
+    __slots__ = ('name', 'subfolders')
+
+    def __init__(self, *, name: Optional[str] = None, subfolders: Optional[List[Dict[str, Any]]] = None):
+        self.name = name
+        self.subfolders = subfolders
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'AnonymousF703761E':
+        """Decode a parsed JSON object; missing properties are None"""
+        obj = _new(cls)
+        get = data.get
+        obj.name = get('name')
+        obj.subfolders = get('subfolders')
+        return obj
+
+    def to_json(self) -> Dict[str, Any]:
+        """Encode as a JSON-ready dict, leaving out properties that are None"""
+        data = {}
+        value = self.name
+        if value is not None:
+            data['name'] = value
+        value = self.subfolders
+        if value is not None:
+            data['subfolders'] = value
+        return data
+
+
+# Model class of each components.schemas object schema
+MODELS = {
+    'SearchPostRequest': SearchPostRequest,
+    'SearchPostResponse': SearchPostResponse,
+    'MovePostRequest': MovePostRequest,
+    'MovePostResponse': MovePostResponse,
+    'MergePostRequest': MergePostRequest,
+    'MergePostResponse': MergePostResponse,
+    'MergeGetResponse': MergeGetResponse,
+    'MergeCompletePostRequest': MergeCompletePostRequest,
+    'MergeCompletePostResponse': MergeCompletePostResponse,
+    'MergeSchemaGetResponse': MergeSchemaGetResponse,
+    'CopyPostRequest': CopyPostRequest,
+    'CopyPostResponse': CopyPostResponse,
+    'HistoryGetResponse': HistoryGetResponse,
+    'FavoritesGetResponse': FavoritesGetResponse,
+    'FolderPostRequest': FolderPostRequest,
+    'FolderZipCreatePostRequest': FolderZipCreatePostRequest,
+    'FolderZipCreatePostResponse': FolderZipCreatePostResponse,
+    'FolderZipCompletePostRequest': FolderZipCompletePostRequest,
+    'UnzipStatusPostRequest': UnzipStatusPostRequest,
+    'PdfConvertCompletePostRequest': PdfConvertCompletePostRequest,
+    'FolderZipCompletePostResponse': FolderZipCompletePostResponse,
+    'UnzipExistingPostResponse': UnzipExistingPostResponse,
+    'UnzipStatusPostResponse': UnzipStatusPostResponse,
+    'PdfConvertPostResponse': PdfConvertPostResponse,
+    'PdfConvertCompletePostResponse': PdfConvertCompletePostResponse,
+    'VersionsGetResponse': VersionsGetResponse,
+    'PreviewPostRequest': PreviewPostRequest,
+    'PreviewPostResponse': PreviewPostResponse,
+    'FilesInfoGetResponse': FilesInfoGetResponse,
+    'FilesGetResponse': FilesGetResponse,
+    'FilesDeleteResponse': FilesDeleteResponse,
+    'FilesPatchRequest': FilesPatchRequest,
+    'FilesPutRequest': FilesPutRequest,
+    'FilesPostResponse': FilesPostResponse,
+    'FilesTAPostResponse': FilesTAPostResponse,
+    'MultipartFilesPutRequest': MultipartFilesPutRequest,
+    'MultipartFilesPostResponse': MultipartFilesPostResponse,
+    'MultipartFilesPutResponse': MultipartFilesPutResponse,
+    'MultipartFilesCompletePostRequest': MultipartFilesCompletePostRequest,
+    'MultipartFilesCompletePostResponse': MultipartFilesCompletePostResponse,
+    'MultipartRefreshUrlsPutResponse': MultipartRefreshUrlsPutResponse,
+    'MultipartFilesRefreshPutRequest': MultipartFilesRefreshPutRequest,
+    'MultipartFilesRefreshPutResponse': MultipartFilesRefreshPutResponse,
+    'FilesAssociatePostRequest': FilesAssociatePostRequest,
+    'FilesAssociatePostResponse': FilesAssociatePostResponse,
+    'FilesAssociateDeleteRequest': FilesAssociateDeleteRequest,
+    'FilesCompletePostRequest': FilesCompletePostRequest,
+    'FilesCompletePostResponse': FilesCompletePostResponse,
+    'FilesRelatedGetResponse': FilesRelatedGetResponse,
+    'FilesToggleRequest': FilesToggleRequest,
+    'FilesToggleResponse': FilesToggleResponse,
+    'FilesCombineRequest': FilesCombineRequest,
+    'FilesSplitRequest': FilesSplitRequest,
+    'FilesCombineResponse': FilesCombineResponse,
+    'FilesCombineCompleteRequest': FilesCombineCompleteRequest,
+    'FilesCombineCompleteResponse': FilesCombineCompleteResponse,
+    'FilesSplitResponse': FilesSplitResponse,
+    'FilesSplitCompleteRequest': FilesSplitCompleteRequest,
+    'FilesSplitCompleteResponse': FilesSplitCompleteResponse,
+    'ErrorMessageResponse': ErrorMessageResponse,
+    'ErrorMessageResponseWithFailReason': ErrorMessageResponseWithFailReason,
+    'ExternalLinkPostRequest': ExternalLinkPostRequest,
+    'ExternalLinkPostResponse': ExternalLinkPostResponse,
+    'ExternalLinkDownloadResponse': ExternalLinkDownloadResponse,
+    'ExternalLinkPreviewResponse': ExternalLinkPreviewResponse,
+    'ExternalLinkGetResponse': ExternalLinkGetResponse,
+    'ExternalLinkZipStatusResponse': ExternalLinkZipStatusResponse,
+    'ExternalLinkDeleteResponse': ExternalLinkDeleteResponse,
+    'ExternalLinkZipRequest': ExternalLinkZipRequest,
+    'ExternalLinkZipResponse': ExternalLinkZipResponse,
+    'ArchivePostRequest': ArchivePostRequest,
+    'ArchivePostResponse': ArchivePostResponse,
+    'ArchiveStatusGetResponse': ArchiveStatusGetResponse,
+    'FilesShareRequest': FilesShareRequest,
+    'FilesRestoreResponse': FilesRestoreResponse,
+    'TextContentPostResponse': TextContentPostResponse,
+    'HistoryRecordObject': HistoryRecordObject,
+    'FolderStructureObject': FolderStructureObject,
+    'NextBatchObject': NextBatchObject,
+    'FileRecordObject': FileRecordObject,
+    'MultipartFileRecordObject': MultipartFileRecordObject,
+    'SignedUrlObject': SignedUrlObject,
+    'MultipartSignedUrlObject': MultipartSignedUrlObject,
+}
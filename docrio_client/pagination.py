@@ -0,0 +1,58 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence
+
+
+def next_offset(page: Any, cursor: str, offsets: Sequence[str]) -> Optional[Dict[str, Any]]:
+    """Offset* query values for the page after this one, or None on the last page"""
+    batch = page.get(cursor) if isinstance(page, dict) else None
+    if not isinstance(batch, dict):
+        return None
+    offset = {name: batch.get(name) for name in offsets}
+    if all(value in (None, '') for value in offset.values()):
+        return None
+    return offset
+
+
+def page_items(page: Any, items: str) -> List[Any]:
+    """Records of a page; a single record object counts as a page of one"""
+    records = page.get(items) if isinstance(page, dict) else None
+    if records is None:
+        return []
+    return records if isinstance(records, list) else [records]
+
+
+async def paginate(fetch: Callable[[Dict[str, Any]], Awaitable[Any]], cursor: str, items: str,
+                   offsets: Sequence[str], prefetch: bool = True) -> AsyncIterator[Any]:
+    """Yield the records of every page of an Offset*-paginated operation.
+
+    fetch(offset) requests one page, with offset holding the Offset* query values
+    ({} for the first page). With prefetch, the next page is requested as soon as a
+    page arrives, so its latency overlaps with the caller working through the current
+    one. At most two pages are held at a time, however many records there are.
+    """
+    pending: Optional[asyncio.Future] = asyncio.ensure_future(fetch({}))
+    previous: Optional[Dict[str, Any]] = None
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            offset = next_offset(page, cursor, offsets)
+            records = page_items(page, items)
+            # Stop on an empty page or a cursor that does not move, rather than loop forever
+            if offset is not None and (not records or offset == previous):
+                offset = None
+            previous = offset
+            if offset is not None and prefetch:
+                pending = asyncio.ensure_future(fetch(offset))
+            for record in records:
+                yield record
+            if offset is not None and not prefetch:
+                pending = asyncio.ensure_future(fetch(offset))
+    finally:
+        if pending is not None:
+            # The caller stopped early; drop the prefetched page
+            pending.cancel()
+            try:
+                await pending
+            except (asyncio.CancelledError, Exception):
+                pass
@@ -0,0 +1,201 @@
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional
+
+from docrio_client.transport import Response
+
+# Methods that may be sent again without changing the outcome (RFC 9110 9.2.2)
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+# Statuses that mean the API is overloaded: concurrency is cut and idempotent calls are retried
+THROTTLE_STATUSES = (429, 503)
+RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date) into a delay in seconds"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def operation_family(path: str) -> str:
+    """The family an operation is scheduled in: the first segment of its path (files, archive, ...)"""
+    return path.lstrip('/').split('/', 1)[0].split('?', 1)[0] or '/'
+
+
+class TokenBucket:
+    """Admits at most rate calls per second on average, with bursts of up to burst calls (rate 0 = unlimited)"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def take(self):
+        """Wait until a token is available and take it"""
+        if not self.rate:
+            return
+        self.refill()
+        while self.tokens < 1:
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+            self.refill()
+        self.tokens -= 1
+
+    def drain(self):
+        """Drop saved-up tokens, so calls resume at rate rather than in a burst"""
+        self.refill()
+        self.tokens = min(self.tokens, 0.0)
+
+
+class FamilyLimiter:
+    """Rate and concurrency limits for one operation family.
+
+    The concurrency limit grows by one for every limit successful calls and halves
+    (decrease) on a throttled or failed call, as in TCP congestion control. Calls that
+    started before the last cut do not cut it again, so one burst of 429s counts once.
+    A Retry-After pauses the whole family until it has passed.
+    """
+
+    def __init__(self, rate: float = 0.0, burst: float = 10.0, concurrency: int = 8, min_concurrency: int = 1,
+                 max_concurrency: int = 64, decrease: float = 0.5):
+        self.bucket = TokenBucket(rate, burst)
+        self.limit = float(min(max(concurrency, min_concurrency), max_concurrency))
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease = decrease
+        self.active = 0
+        self.epoch = 0  # Bumped on every cut; calls remember the epoch they started in
+        self.paused_until = 0.0
+        self.changed: Optional[asyncio.Condition] = None
+        self.calls = 0
+        self.throttled = 0
+        self.peak_active = 0
+
+    async def acquire(self) -> int:
+        """Wait for a concurrency slot, any Retry-After pause and a rate token; return the call's epoch"""
+        if self.changed is None:
+            self.changed = asyncio.Condition()
+        async with self.changed:
+            await self.changed.wait_for(lambda: self.active < int(self.limit))
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+        try:
+            while True:
+                delay = self.paused_until - time.monotonic()
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            await self.bucket.take()
+        except BaseException:
+            await self.release(epoch=None, ok=None)
+            raise
+        self.calls += 1
+        return self.epoch
+
+    async def release(self, epoch: Optional[int], ok: Optional[bool], retry_after: Optional[float] = None):
+        """Free a slot and adjust the limit: ok grows it, not ok cuts it (None leaves it)"""
+        async with self.changed:
+            self.active -= 1
+            if ok:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            elif ok is not None:
+                self.throttled += 1
+                if epoch == self.epoch:
+                    self.limit = max(self.min_concurrency, self.limit * self.decrease)
+                    self.epoch += 1
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+                self.bucket.drain()
+            self.changed.notify_all()
+
+    def to_json(self) -> Dict[str, Any]:
+        return {'limit': round(self.limit, 2), 'active': self.active, 'peak_active': self.peak_active,
+                'calls': self.calls, 'throttled': self.throttled}
+
+
+class RequestScheduler:
+    """Paces API calls per operation family and retries idempotent ones.
+
+    Pass an instance as DocrioAsyncClient(..., scheduler=scheduler). Every request()
+    first waits for its family's limiter (see FamilyLimiter). 429 and 503 responses
+    cut the family's concurrency, and a Retry-After pauses the family. GET, HEAD,
+    OPTIONS, PUT and DELETE calls that get a 408, 429 or 5xx, or lose their
+    connection, are retried up to max_retries times. The wait is at least Retry-After,
+    otherwise a random delay of up to backoff * 2 ** attempt, capped at max_backoff.
+    POST and PATCH calls are never retried, because sending them again may repeat
+    their effect. families maps a family name to FamilyLimiter options that replace
+    the defaults for it.
+    """
+
+    def __init__(self, rate: float = 0.0, burst: float = 10.0, concurrency: int = 8, min_concurrency: int = 1,
+                 max_concurrency: int = 64, max_retries: int = 5, backoff: float = 0.5, max_backoff: float = 30.0,
+                 families: Optional[Mapping[str, Mapping[str, Any]]] = None, seed: Optional[int] = None):
+        self.defaults = {'rate': rate, 'burst': burst, 'concurrency': concurrency,
+                         'min_concurrency': min_concurrency, 'max_concurrency': max_concurrency}
+        self.family_options = {name: dict(options) for name, options in (families or {}).items()}
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.rng = random.Random(seed)
+        self.limiters: Dict[str, FamilyLimiter] = {}
+        self.retries = 0
+
+    def limiter(self, family: str) -> FamilyLimiter:
+        if family not in self.limiters:
+            self.limiters[family] = FamilyLimiter(**dict(self.defaults, **self.family_options.get(family, {})))
+        return self.limiters[family]
+
+    def delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        """Full-jitter backoff before retry number attempt (0-based), never shorter than Retry-After"""
+        jitter = self.rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        return max(jitter, retry_after or 0.0)
+
+    async def run(self, method: str, path: str, send: Callable[[], Awaitable[Response]]) -> Response:
+        """Await send() under the limits of path's family, retrying it if the method is idempotent"""
+        limiter = self.limiter(operation_family(path))
+        retryable = method.upper() in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            epoch = await limiter.acquire()
+            retry_after = None
+            try:
+                response = await send()
+            except (ConnectionError, asyncio.TimeoutError):
+                await limiter.release(epoch, ok=False)
+                if not retryable or attempt == self.max_retries:
+                    raise
+            except BaseException:
+                await limiter.release(epoch, ok=None)
+                raise
+            else:
+                if response.status in THROTTLE_STATUSES:
+                    retry_after = retry_after_seconds(response.headers.get('retry-after'))
+                    await limiter.release(epoch, ok=False, retry_after=retry_after)
+                else:
+                    await limiter.release(epoch, ok=response.status < 500)
+                if not retryable or attempt == self.max_retries or response.status not in RETRY_STATUSES:
+                    response.retries += attempt
+                    return response
+            await asyncio.sleep(self.delay(attempt, retry_after))
+            attempt += 1
+            self.retries += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current limits and counters of every family seen"""
+        return {'retries': self.retries,
+                'families': {name: limiter.to_json() for name, limiter in sorted(self.limiters.items())}}
@@ -0,0 +1,405 @@
+import asyncio
+import json
+import ssl
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+# (scheme, host, port) a connection is bound to
+HostKey = Tuple[str, str, int]
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+NO_BODY_STATUSES = (204, 304)
+# Largest piece of a response body read from the socket at once
+STREAM_CHUNK_SIZE = 256 * 1024
+
+
+class DocrioApiError(Exception):
+    """Raised when the Docrio API answers with a non-2xx status"""
+
+    def __init__(self, status: int, body: bytes, method: str = '', url: str = ''):
+        self.status = status
+        self.body = body
+        self.method = method
+        self.url = url
+        super().__init__(f"{method} {url} failed. Status: {status}, Body: {body[:500].decode('utf-8', 'replace')}")
+
+
+class Response:
+    """Status, headers (lower-cased names) and body of a completed HTTP response"""
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.retries = 0  # Requests resent because a kept-alive connection had been dropped
+
+    def json(self) -> Any:
+        """Parse the body as JSON; an empty body parses to None"""
+        if not self.body:
+            return None
+        return json.loads(self.body)
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection"""
+
+    def __init__(self, key: HostKey, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.key = key
+        self.reader = reader
+        self.writer = writer
+        self.reusable = True
+        self.requests = 0
+        self.idle_since = 0.0
+        self.read_timeout: Optional[float] = None
+        self.response_started = False
+
+    async def request(self, method: str, target: str, headers: Dict[str, str], body: bytes,
+                      sink: Optional[Callable[[bytes], Any]] = None, read_timeout: Optional[float] = None) -> Response:
+        """Send one request and read the complete response.
+
+        With a sink, the body of a 2xx response is passed to it chunk by chunk instead of
+        being collected, and read_timeout bounds each read rather than the whole exchange.
+        """
+        self.read_timeout = read_timeout
+        self.response_started = False
+        lines = [f"{method} {target} HTTP/1.1"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        # Written separately so large bodies (upload parts) are not copied into the header buffer
+        self.writer.write(body)
+        await self.writer.drain()
+        self.requests += 1
+
+        status_line = await self.read(self.reader.readline())
+        if not status_line:
+            raise ConnectionResetError('Connection closed before a response was received')
+        self.response_started = True
+        version, status = status_line.decode('latin-1').split(' ', 2)[:2]
+        response_headers = {}
+        while True:
+            line = await self.read(self.reader.readline())
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+
+        status_code = int(status)
+        response_body = b''
+        if not (method == 'HEAD' or status_code in NO_BODY_STATUSES or 100 <= status_code < 200):
+            chunks = self.body_chunks(response_headers)
+            if sink is not None and 200 <= status_code < 300:
+                async for chunk in chunks:
+                    sink(chunk)
+            else:
+                response_body = b''.join([chunk async for chunk in chunks])
+
+        connection_header = response_headers.get('connection', '').lower()
+        if connection_header == 'close' or (version == 'HTTP/1.0' and connection_header != 'keep-alive'):
+            self.reusable = False
+        return Response(status_code, response_headers, response_body)
+
+    async def read(self, awaitable: Awaitable[bytes]) -> bytes:
+        if self.read_timeout is None:
+            return await awaitable
+        return await asyncio.wait_for(awaitable, self.read_timeout)
+
+    async def body_chunks(self, response_headers: Dict[str, str]) -> AsyncIterator[bytes]:
+        """Yield the response body in pieces of at most STREAM_CHUNK_SIZE bytes"""
+        if response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            while True:
+                size_line = await self.read(self.reader.readline())
+                size = int(size_line.split(b';', 1)[0].strip() or b'0', 16)
+                if size == 0:
+                    # Skip trailers up to the blank line
+                    while (await self.read(self.reader.readline())) not in (b'\r\n', b'\n', b''):
+                        pass
+                    return
+                while size:
+                    chunk = await self.read(self.reader.readexactly(min(size, STREAM_CHUNK_SIZE)))
+                    size -= len(chunk)
+                    yield chunk
+                await self.read(self.reader.readexactly(2))
+        elif 'content-length' in response_headers:
+            remaining = int(response_headers['content-length'])
+            while remaining:
+                chunk = await self.read(self.reader.read(min(remaining, STREAM_CHUNK_SIZE)))
+                if not chunk:
+                    raise asyncio.IncompleteReadError(b'', remaining)
+                remaining -= len(chunk)
+                yield chunk
+        else:
+            # No framing: the body runs until the server closes the connection
+            self.reusable = False
+            while True:
+                chunk = await self.read(self.reader.read(STREAM_CHUNK_SIZE))
+                if not chunk:
+                    return
+                yield chunk
+
+    def close(self):
+        self.reusable = False
+        self.writer.close()
+
+
+class ConnectionPool:
+    """Keep-alive connections shared by every request of a transport.
+
+    At most `limit` connections are in use at once, and at most `limit_per_host` to any
+    one host; callers beyond that wait for a connection to be released. Idle
+    connections are reused (most recently used first) until `keepalive_timeout`.
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 10, keepalive_timeout: float = 30.0,
+                 ssl_context: Optional[ssl.SSLContext] = None):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ssl_context = ssl_context
+        self.idle: Dict[HostKey, List[Connection]] = {}
+        self.total_slots = asyncio.Semaphore(limit) if limit else None
+        self.host_slots: Dict[HostKey, asyncio.Semaphore] = {}
+        self.opened = 0
+        self.reused = 0
+
+    def host_semaphore(self, key: HostKey) -> Optional[asyncio.Semaphore]:
+        if not self.limit_per_host:
+            return None
+        if key not in self.host_slots:
+            self.host_slots[key] = asyncio.Semaphore(self.limit_per_host)
+        return self.host_slots[key]
+
+    async def acquire(self, key: HostKey) -> Connection:
+        """Wait for a free slot for key, then return an idle connection or open a new one"""
+        host_slots = self.host_semaphore(key)
+        if host_slots is not None:
+            await host_slots.acquire()
+        if self.total_slots is not None:
+            try:
+                await self.total_slots.acquire()
+            except BaseException:
+                if host_slots is not None:
+                    host_slots.release()
+                raise
+        try:
+            connection = self.pop_idle(key)
+            if connection is not None:
+                self.reused += 1
+                return connection
+            scheme, host, port = key
+            context = None
+            if scheme == 'https':
+                context = self.ssl_context or ssl.create_default_context()
+            reader, writer = await asyncio.open_connection(host, port, ssl=context)
+            self.opened += 1
+            return Connection(key, reader, writer)
+        except BaseException:
+            self.release_slots(key)
+            raise
+
+    def pop_idle(self, key: HostKey) -> Optional[Connection]:
+        """Take the most recently used live idle connection for key, closing expired ones"""
+        idle = self.idle.get(key)
+        now = asyncio.get_running_loop().time()
+        while idle:
+            connection = idle.pop()
+            if now - connection.idle_since < self.keepalive_timeout and not connection.reader.at_eof():
+                return connection
+            connection.close()
+        return None
+
+    def release(self, connection: Connection):
+        """Return a connection to the pool, or close it if it cannot be reused"""
+        if connection.reusable:
+            connection.idle_since = asyncio.get_running_loop().time()
+            self.idle.setdefault(connection.key, []).append(connection)
+        else:
+            connection.close()
+        self.release_slots(connection.key)
+
+    def release_slots(self, key: HostKey):
+        if self.total_slots is not None:
+            self.total_slots.release()
+        host_slots = self.host_slots.get(key)
+        if host_slots is not None:
+            host_slots.release()
+
+    def close(self):
+        """Close every idle connection"""
+        for connections in self.idle.values():
+            for connection in connections:
+                connection.close()
+        self.idle.clear()
+
+
+class DocrioTransport:
+    """HTTP/1.1 transport for the generated async client, built on asyncio streams.
+
+    Requests share one ConnectionPool, so thousands of concurrent coroutines are
+    multiplexed over a bounded set of keep-alive connections. With instrumentation,
+    every request() call is reported to it as a record of its operation, timing,
+    payload sizes, status and retries (see instrumentation.MetricsRecorder). With
+    auth (an auth.TokenProvider), request() sends its cached token and, when the API
+    answers 401, refreshes the token once and resends. With a scheduler (a
+    scheduling.RequestScheduler), request() calls are paced per operation family and
+    idempotent ones are retried when throttled. With a cache (a
+    caching.ResponseCache), identical reads are answered from it or coalesced.
+    """
+
+    def __init__(self, base_url: str, headers: Optional[Mapping[str, str]] = None, limit: int = 100,
+                 limit_per_host: int = 10, timeout: Optional[float] = 60.0, keepalive_timeout: float = 30.0,
+                 ssl_context: Optional[ssl.SSLContext] = None,
+                 instrumentation: Optional[Callable[[Dict[str, Any]], Any]] = None, auth: Any = None,
+                 scheduler: Any = None, cache: Any = None):
+        self.base_url = base_url.rstrip('/')
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.instrumentation = instrumentation
+        self.auth = auth
+        self.scheduler = scheduler
+        self.cache = cache
+        self.pool = ConnectionPool(limit, limit_per_host, keepalive_timeout, ssl_context)
+
+    def build_url(self, path: str, query: Optional[Mapping[str, Any]] = None) -> str:
+        """Join path onto the base URL (absolute URLs are used as-is) and append non-None query values"""
+        url = path if '://' in path else f"{self.base_url}{path}"
+        params = [(name, encode_query_value(value)) for name, value in (query or {}).items() if value is not None]
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+        return url
+
+    async def send(self, method: str, url: str, body: bytes = b'',
+                   headers: Optional[Mapping[str, str]] = None, default_headers: bool = True,
+                   sink: Optional[Callable[[bytes], Any]] = None) -> Response:
+        """Send a request to an absolute URL and return the raw response, whatever its status.
+
+        Pass default_headers=False for pre-signed URLs, which reject the API's auth headers.
+        With a sink, a 2xx body is streamed to it and the returned Response has an empty body;
+        the timeout then applies to each read, since a large download may take longer in total.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        key = (scheme, parts.hostname, parts.port or DEFAULT_PORTS[scheme])
+        target = parts.path or '/'
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        request_headers = {'Host': parts.netloc, 'Connection': 'keep-alive', 'Accept': '*/*'}
+        if default_headers:
+            request_headers.update(self.headers)
+        request_headers.update(headers or {})
+        request_headers['Content-Length'] = str(len(body))
+
+        retries = 0
+        while True:
+            connection = await self.pool.acquire(key)
+            reused = connection.requests > 0
+            try:
+                if sink is None:
+                    response = await asyncio.wait_for(connection.request(method, target, request_headers, body),
+                                                      self.timeout)
+                else:
+                    response = await connection.request(method, target, request_headers, body, sink, self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError) as e:
+                connection.close()
+                self.pool.release(connection)
+                if reused and not connection.response_started:
+                    # The server dropped an idle keep-alive connection; retry on a fresh one
+                    retries += 1
+                    continue
+                raise ConnectionError(f"{method} {url} failed: {e}") from e
+            except BaseException:
+                connection.close()
+                self.pool.release(connection)
+                raise
+            self.pool.release(connection)
+            response.retries = retries
+            return response
+
+    async def request(self, method: str, path: str, query: Optional[Mapping[str, Any]] = None,
+                      body: Any = None, headers: Optional[Mapping[str, str]] = None,
+                      operation: Optional[str] = None) -> Any:
+        """Send a JSON API request and return the parsed response body.
+
+        Raises DocrioApiError for non-2xx responses. Bodies that are not JSON are
+        returned as bytes; empty bodies as None. operation names the call in
+        instrumentation records (default 'METHOD path').
+        """
+        url = self.build_url(path, query)
+        request_headers = dict(headers or {})
+        payload = b''
+        if body is not None:
+            payload = json.dumps(body, separators=(',', ':')).encode('utf-8')
+            request_headers.setdefault('Content-Type', 'application/json')
+        operation = operation or f"{method} {path}"
+        if self.cache is None:
+            response = await self.exchange(operation, method, path, url, payload, request_headers)
+        else:
+            response = await self.cache.fetch(method, path, query, body, operation, lambda: self.exchange(
+                operation, method, path, url, payload, request_headers))
+        if not 200 <= response.status < 300:
+            raise DocrioApiError(response.status, response.body, method, url)
+        if not response.body:
+            return None
+        if 'json' in response.headers.get('content-type', 'application/json'):
+            return response.json()
+        return response.body
+
+    async def exchange(self, operation: str, method: str, path: str, url: str, payload: bytes,
+                       headers: Dict[str, str]) -> Response:
+        """Send a request() call through the scheduler, auth and instrumentation in use"""
+        if self.instrumentation is None:
+            return await self.scheduled_send(method, path, url, payload, headers)
+        return await self.instrumented_send(operation, method, path, url, payload, headers)
+
+    async def scheduled_send(self, method: str, path: str, url: str, payload: bytes,
+                             headers: Dict[str, str]) -> Response:
+        """authorized_send(), paced and retried by the scheduler if there is one"""
+        if self.scheduler is None:
+            return await self.authorized_send(method, url, payload, headers)
+        return await self.scheduler.run(method, path,
+                                        lambda: self.authorized_send(method, url, payload, headers))
+
+    async def authorized_send(self, method: str, url: str, payload: bytes, headers: Dict[str, str]) -> Response:
+        """send() with the auth provider's token; a 401 refreshes the token and resends once"""
+        if self.auth is None:
+            return await self.send(method, url, payload, headers)
+        token = await self.auth.token()
+        response = await self.send(method, url, payload, dict(headers, Authorization=f"Bearer {token}"))
+        if response.status != 401:
+            return response
+        token = await self.auth.refresh(token)
+        retried = await self.send(method, url, payload, dict(headers, Authorization=f"Bearer {token}"))
+        retried.retries += response.retries + 1
+        return retried
+
+    async def instrumented_send(self, operation: str, method: str, path: str, url: str, payload: bytes,
+                                headers: Dict[str, str]) -> Response:
+        """scheduled_send(), reporting the call to the instrumentation sink whether or not a response arrives"""
+        call = {'operation': operation, 'method': method, 'path': path, 'status': None, 'seconds': 0.0,
+                'request_bytes': len(payload), 'response_bytes': 0, 'retries': 0, 'error': None}
+        started = time.perf_counter()
+        try:
+            response = await self.scheduled_send(method, path, url, payload, headers)
+        except BaseException as e:
+            call['error'] = type(e).__name__
+            raise
+        else:
+            call.update(status=response.status, response_bytes=len(response.body), retries=response.retries)
+            if not 200 <= response.status < 300:
+                call['error'] = 'DocrioApiError'
+            return response
+        finally:
+            call['seconds'] = time.perf_counter() - started
+            self.instrumentation(call)
+
+    async def close(self):
+        self.pool.close()
+
+
+def encode_query_value(value: Any) -> str:
+    """Render a query parameter value: booleans as true/false, sequences comma-separated"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (list, tuple)):
+        return ','.join(encode_query_value(item) for item in value)
+    return str(value)
@@ -0,0 +1,292 @@
+import asyncio
+import json
+import mimetypes
+import mmap
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from docrio_client.client import DocrioAsyncClient
+from docrio_client.transport import DocrioApiError
+
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+# Most parts a multipart upload may have; larger files get larger parts
+MAX_PARTS = 10000
+# Part URLs expiring within this many seconds are refreshed before use
+REFRESH_MARGIN = 60.0
+# Part URLs requested per /multipart/refresh call
+REFRESH_WINDOW = 100
+JOURNAL_SUFFIX = '.docrio-upload'
+# Part statuses worth retrying after a pause; 403 is retried at once with a fresh URL
+RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+
+
+class MultipartUploadError(Exception):
+    """Raised when /multipart/complete does not report the upload as a success"""
+
+
+def part_size_for(size: int, part_size: int = DEFAULT_PART_SIZE) -> int:
+    """part_size, doubled until a file of size bytes fits in MAX_PARTS parts"""
+    while size > part_size * MAX_PARTS:
+        part_size *= 2
+    return part_size
+
+
+def part_count(size: int, part_size: int) -> int:
+    """Number of parts a file of size bytes is split into; an empty file is still one part"""
+    return max(1, -(-size // part_size))
+
+
+def parse_expires(value: Any) -> Optional[float]:
+    """Epoch seconds of an ISO 8601 Expires value, or None when it cannot be parsed"""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+def signed_url_object(response: Any) -> Dict[str, Any]:
+    """The MultipartSignedUrlObject in a /multipart or /multipart/refresh response, keyed by file name or not"""
+    if isinstance(response, dict):
+        if 'SignedUrls' in response:
+            return response
+        for value in response.values():
+            if isinstance(value, dict) and 'SignedUrls' in value:
+                return value
+    raise MultipartUploadError(f"No signed part URLs in response: {response!r}")
+
+
+class UploadJournal:
+    """Append-only record of the parts of one multipart upload that reached the server.
+
+    The first line identifies the source file and the upload; every uploaded part adds
+    one line with its ETag, so an interrupted upload resumes with the missing parts only.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.header: Dict[str, Any] = {}
+        self.parts: Dict[int, str] = {}
+
+    def load(self, source: Mapping[str, Any]) -> bool:
+        """Load the journal if it was written for the same source file; False otherwise"""
+        try:
+            with open(self.path, 'r') as journal:
+                lines = journal.read().splitlines()
+        except OSError:
+            return False
+        try:
+            header = json.loads(lines[0])
+        except (IndexError, ValueError):
+            return False
+        if any(header.get(key) != value for key, value in source.items()):
+            return False
+        parts = {}
+        for line in lines[1:]:
+            try:
+                part = json.loads(line)
+            except ValueError:
+                # A line cut short by the interruption; that part is uploaded again
+                break
+            parts[part['PartNumber']] = part['ETag']
+        self.header, self.parts = header, parts
+        return True
+
+    def start(self, source: Mapping[str, Any], file_id: str, upload_id: str):
+        """Begin a new journal for an upload the server just started"""
+        self.header = dict(source, Id=file_id, UploadId=upload_id)
+        self.parts = {}
+        with open(self.path, 'w') as journal:
+            journal.write(json.dumps(self.header) + '\n')
+
+    def record(self, number: int, etag: str):
+        """Persist an uploaded part before it is counted as done"""
+        self.parts[number] = etag
+        with open(self.path, 'a') as journal:
+            journal.write(json.dumps({'PartNumber': number, 'ETag': etag}) + '\n')
+
+    def remove(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class PartUrls:
+    """Signed part URLs of one upload, fetched through /multipart/refresh when missing or about to expire"""
+
+    def __init__(self, client: DocrioAsyncClient, file_id: str, upload_id: str, parts: int,
+                 margin: float = REFRESH_MARGIN, window: int = REFRESH_WINDOW):
+        self.client = client
+        self.file_id = file_id
+        self.upload_id = upload_id
+        self.parts = parts
+        self.margin = margin
+        self.window = window
+        self.urls: Dict[int, Tuple[str, Optional[float]]] = {}
+        self.lock = asyncio.Lock()
+        self.refreshes = 0
+
+    def add(self, signed: Dict[str, Any], start: int):
+        """Store the URLs of a MultipartSignedUrlObject covering parts start+1, start+2, ..."""
+        expires = parse_expires(signed.get('Expires'))
+        for offset, url in enumerate(signed.get('SignedUrls') or []):
+            self.urls[start + offset + 1] = (url, expires)
+
+    def fresh(self, number: int) -> bool:
+        entry = self.urls.get(number)
+        return entry is not None and (entry[1] is None or entry[1] - time.time() > self.margin)
+
+    def expire(self, number: int):
+        """Forget a URL the server rejected, so the next get() refreshes it"""
+        self.urls.pop(number, None)
+
+    async def get(self, number: int) -> str:
+        if not self.fresh(number):
+            async with self.lock:
+                # Another worker may have refreshed this part while we waited
+                if not self.fresh(number):
+                    await self.refresh(number)
+        return self.urls[number][0]
+
+    async def refresh(self, number: int):
+        """Fetch URLs for a window of parts starting at number"""
+        start = number - 1
+        response = await self.client.putMultipartRefresh({'Id': self.file_id, 'UploadId': self.upload_id,
+                                                          'StartIndex': start,
+                                                          'EndIndex': min(start + self.window, self.parts)})
+        self.refreshes += 1
+        self.add(signed_url_object(response), start)
+
+
+class MultipartUploader:
+    """Uploads files through /multipart with concurrent parts read from a memory map.
+
+    At most concurrency parts are in flight, so memory stays near concurrency * part_size
+    whatever the file size. Part URLs that are about to expire, or that the storage
+    rejects, are renewed through /multipart/refresh. Progress is journaled next to the
+    file, and calling upload() again after an interruption sends only the missing parts.
+    """
+
+    def __init__(self, client: DocrioAsyncClient, part_size: int = DEFAULT_PART_SIZE, concurrency: int = 4,
+                 retries: int = 3, refresh_margin: float = REFRESH_MARGIN, refresh_window: int = REFRESH_WINDOW):
+        self.client = client
+        self.part_size = part_size
+        self.concurrency = max(concurrency, 1)
+        self.retries = retries
+        self.refresh_margin = refresh_margin
+        self.refresh_window = refresh_window
+        self.parts_uploaded = 0
+        self.bytes_uploaded = 0
+        self.refreshes = 0
+
+    async def upload(self, path: str, name: Optional[str] = None, journal_path: Optional[str] = None,
+                     **fields: Any) -> Dict[str, Any]:
+        """Upload the file at path as a new Docrio file and return its record from /multipart/complete.
+
+        name defaults to the file's base name; fields are extra MultipartFilesPostRequest
+        properties such as litify_docs__Related_To__c. litify_docs__File_Type__c, which the
+        API requires, defaults to the type guessed from name.
+        """
+        name = name or os.path.basename(path)
+        fields.setdefault('litify_docs__File_Type__c', mimetypes.guess_type(name)[0] or 'application/octet-stream')
+        stat = os.stat(path)
+        part_size = part_size_for(stat.st_size, self.part_size)
+        parts = part_count(stat.st_size, part_size)
+        source = {'Path': os.path.abspath(path), 'Name': name, 'Size': stat.st_size,
+                  'Modified': stat.st_mtime_ns, 'PartSize': part_size}
+        journal = UploadJournal(journal_path or path + JOURNAL_SUFFIX)
+
+        urls = await self.resume(journal, source, parts)
+        if urls is None:
+            started = signed_url_object(await self.client.postMultipart([dict(fields, Name=name, Parts=parts)]))
+            journal.start(source, started['Id'], started['UploadId'])
+            urls = PartUrls(self.client, started['Id'], started['UploadId'], parts,
+                            self.refresh_margin, self.refresh_window)
+            urls.add(started, 0)
+
+        with open(path, 'rb') as file:
+            # mmap cannot map an empty file; its single part is empty
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b''
+            try:
+                await self.upload_parts(data, part_size, parts, urls, journal)
+            finally:
+                self.refreshes += urls.refreshes
+                if isinstance(data, mmap.mmap):
+                    data.close()
+
+        file_id = journal.header['Id']
+        completed = await self.client.postMultipartComplete({
+            'Ids': [file_id],
+            file_id: {'UploadId': journal.header['UploadId'],
+                      'Parts': [{'PartNumber': number, 'ETag': etag} for number, etag in sorted(journal.parts.items())]}})
+        for record in (completed or {}).get('Successes') or []:
+            if record.get('Id') == file_id:
+                journal.remove()
+                return record
+        raise MultipartUploadError(f"Multipart upload of {path} was not completed: {completed!r}")
+
+    async def resume(self, journal: UploadJournal, source: Mapping[str, Any], parts: int) -> Optional[PartUrls]:
+        """Part URLs for the upload in the journal, or None when there is nothing to resume"""
+        if not journal.load(source):
+            return None
+        urls = PartUrls(self.client, journal.header['Id'], journal.header['UploadId'], parts,
+                        self.refresh_margin, self.refresh_window)
+        pending = [number for number in range(1, parts + 1) if number not in journal.parts]
+        if pending:
+            try:
+                # URLs from the interrupted run have likely expired; this also checks the upload is still open
+                await urls.refresh(pending[0])
+            except DocrioApiError as e:
+                if e.status not in (400, 403, 404):
+                    raise
+                journal.remove()
+                return None
+        return urls
+
+    async def upload_parts(self, data: Any, part_size: int, parts: int, urls: PartUrls, journal: UploadJournal):
+        """Upload every part missing from the journal, concurrency at a time"""
+        pending = deque(number for number in range(1, parts + 1) if number not in journal.parts)
+
+        async def worker():
+            while pending:
+                number = pending.popleft()
+                start = (number - 1) * part_size
+                await self.upload_part(data[start:start + part_size], number, urls, journal)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(self.concurrency, len(pending)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # One failed part stops the rest; the journal keeps what already succeeded
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def upload_part(self, body: bytes, number: int, urls: PartUrls, journal: UploadJournal):
+        """PUT one part to its signed URL and journal its ETag"""
+        for attempt in range(self.retries + 1):
+            url = await urls.get(number)
+            try:
+                response = await self.client.transport.send('PUT', url, body, default_headers=False)
+            except ConnectionError:
+                if attempt == self.retries:
+                    raise
+                await asyncio.sleep(min(0.1 * 2 ** attempt, 5.0))
+                continue
+            if 200 <= response.status < 300:
+                journal.record(number, response.headers.get('etag', ''))
+                self.parts_uploaded += 1
+                self.bytes_uploaded += len(body)
+                return
+            if attempt == self.retries or (response.status != 403 and response.status not in RETRY_STATUSES):
+                raise DocrioApiError(response.status, response.body, 'PUT', url.split('?')[0])
+            if response.status == 403:
+                # Expired or revoked signature
+                urls.expire(number)
+            else:
+                await asyncio.sleep(min(0.1 * 2 ** attempt, 5.0))
@@ -0,0 +1,1422 @@
+"""Generated Docrio API request validators; regenerate with generate_docrio.py --python-client"""
+from typing import Any, List
+
+
+class RequestValidationError(ValueError):
+    """Raised before sending a request whose body does not match its schema"""
+
+    def __init__(self, errors: List[str]):
+        super().__init__('; '.join(errors))
+        self.errors = errors
+
+
+def check_SearchPostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a SearchPostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Name')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.Name: expected a string')
+        field1 = value.get('CreatedDate')
+        if field1 is not None:
+            if not isinstance(field1, dict):
+                errors.append(f'{path}.CreatedDate: expected an object')
+            else:
+                field2 = field1.get('StartValue')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}.CreatedDate.StartValue: expected a string')
+                field2 = field1.get('EndValue')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}.CreatedDate.EndValue: expected a string')
+        field1 = value.get('Author')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.Author: expected a string')
+        field1 = value.get('litify_docs__Related_To__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__Related_To__c: expected a string')
+        field1 = value.get('Custom_Field__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.Custom_Field__c: expected a string')
+        field1 = value.get('IsArchived')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.IsArchived: expected a string')
+        field1 = value.get('paginationState')
+        if field1 is not None:
+            if not isinstance(field1, dict):
+                errors.append(f'{path}.paginationState: expected an object')
+            else:
+                field2 = field1.get('offsetSortValue')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}.paginationState.offsetSortValue: expected a string')
+                field2 = field1.get('offsetSortId')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}.paginationState.offsetSortId: expected a string')
+        field1 = value.get('paginationToken')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.paginationToken: expected a string')
+        field1 = value.get('sortState')
+        if field1 is not None:
+            if not isinstance(field1, dict):
+                errors.append(f'{path}.sortState: expected an object')
+            else:
+                field2 = field1.get('sortField')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}.sortState.sortField: expected a string')
+                field2 = field1.get('sortDirection')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}.sortState.sortDirection: expected a string')
+
+
+def validate_SearchPostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid SearchPostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_SearchPostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_MovePostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a MovePostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Ids')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.Ids: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, str):
+                        errors.append(f'{path}.Ids[{index2}]: expected a string')
+        field1 = value.get('RelatedRecordId')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.RelatedRecordId: expected a string')
+
+
+def validate_MovePostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid MovePostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_MovePostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_MergePostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a MergePostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Templates')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.Templates: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, dict):
+                        errors.append(f'{path}.Templates[{index2}]: expected an object')
+                    else:
+                        field3 = item2.get('Flatten')
+                        if field3 is not None and not isinstance(field3, bool):
+                            errors.append(f'{path}.Templates[{index2}].Flatten: expected a boolean')
+                        field3 = item2.get('SourceId')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.Templates[{index2}].SourceId: expected a string')
+                        field3 = item2.get('Tags')
+                        if field3 is not None:
+                            if not isinstance(field3, dict):
+                                errors.append(f'{path}.Templates[{index2}].Tags: expected an object')
+                            else:
+                                for key4, item4 in field3.items():
+                                    if not isinstance(item4, str):
+                                        errors.append(f'{path}.Templates[{index2}].Tags.{key4}'
+                                                      f': expected a string')
+                        field3 = item2.get('litify_docs__Related_To__c')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.Templates[{index2}].litify_docs__Related_To__c'
+                                          f': expected a string')
+                        field3 = item2.get('litify_docs__Folder_Path__c')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.Templates[{index2}].litify_docs__Folder_Path__c'
+                                          f': expected a string')
+                        field3 = item2.get('litify_docs__File_Type__c')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.Templates[{index2}].litify_docs__File_Type__c'
+                                          f': expected a string')
+                        field3 = item2.get('Name')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.Templates[{index2}].Name: expected a string')
+
+
+def validate_MergePostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid MergePostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_MergePostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_MergeCompletePostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a MergeCompletePostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Ids')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.Ids: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, str):
+                        errors.append(f'{path}.Ids[{index2}]: expected a string')
+
+
+def validate_MergeCompletePostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid MergeCompletePostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_MergeCompletePostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_CopyPostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a CopyPostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Records')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.Records: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, dict):
+                        errors.append(f'{path}.Records[{index2}]: expected an object')
+                    else:
+                        field3 = item2.get('Id')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.Records[{index2}].Id: expected a string')
+                        field3 = item2.get('Name')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.Records[{index2}].Name: expected a string')
+        field1 = value.get('RelatedRecordId')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.RelatedRecordId: expected a string')
+
+
+def validate_CopyPostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid CopyPostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_CopyPostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FolderPostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FolderPostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('recordId')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.recordId: expected a string')
+        field1 = value.get('folderPath')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.folderPath: expected a string')
+
+
+def validate_FolderPostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FolderPostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FolderPostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FolderZipCreatePostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FolderZipCreatePostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('fileInfoIds')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.fileInfoIds: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, str):
+                        errors.append(f'{path}.fileInfoIds[{index2}]: expected a string')
+        field1 = value.get('IsArchived')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.IsArchived: expected a string')
+
+
+def validate_FolderZipCreatePostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FolderZipCreatePostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FolderZipCreatePostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FolderZipCompletePostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FolderZipCompletePostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('jobId')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.jobId: expected a string')
+        field1 = value.get('IsArchived')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.IsArchived: expected a string')
+
+
+def validate_FolderZipCompletePostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FolderZipCompletePostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FolderZipCompletePostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_UnzipExistingPostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a UnzipExistingPostRequest value to errors"""
+    if not isinstance(value, (list, tuple)):
+        errors.append(f'{path}: expected an array')
+    else:
+        for index1, item1 in enumerate(value):
+            if not isinstance(item1, dict):
+                errors.append(f'{path}[{index1}]: expected an object')
+            else:
+                field2 = item1.get('Name')
+                if field2 is None:
+                    errors.append(f'{path}[{index1}].Name: required')
+                elif not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].Name: expected a string')
+                field2 = item1.get('originalId')
+                if field2 is None:
+                    errors.append(f'{path}[{index1}].originalId: required')
+                elif not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].originalId: expected a string')
+                field2 = item1.get('litify_docs__Folder_Path__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Folder_Path__c: expected a string')
+                field2 = item1.get('litify_docs__Related_To_Api_Name__c')
+                if field2 is None:
+                    errors.append(f'{path}[{index1}].litify_docs__Related_To_Api_Name__c: required')
+                elif not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Related_To_Api_Name__c: expected a string')
+                field2 = item1.get('litify_docs__Related_To__c')
+                if field2 is None:
+                    errors.append(f'{path}[{index1}].litify_docs__Related_To__c: required')
+                elif not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Related_To__c: expected a string')
+                field2 = item1.get('litify_docs__File_Type__c')
+                if field2 is None:
+                    errors.append(f'{path}[{index1}].litify_docs__File_Type__c: required')
+                elif not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__File_Type__c: expected a string')
+
+
+def validate_UnzipExistingPostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid UnzipExistingPostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_UnzipExistingPostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_UnzipStatusPostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a UnzipStatusPostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('jobIds')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.jobIds: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, str):
+                        errors.append(f'{path}.jobIds[{index2}]: expected a string')
+
+
+def validate_UnzipStatusPostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid UnzipStatusPostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_UnzipStatusPostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_PdfConvertPostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a PdfConvertPostRequest value to errors"""
+    if not isinstance(value, (list, tuple)):
+        errors.append(f'{path}: expected an array')
+    else:
+        for index1, item1 in enumerate(value):
+            if not isinstance(item1, dict):
+                errors.append(f'{path}[{index1}]: expected an object')
+            else:
+                field2 = item1.get('recordId')
+                if field2 is None:
+                    errors.append(f'{path}[{index1}].recordId: required')
+                elif not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].recordId: expected a string')
+                field2 = item1.get('versionId')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].versionId: expected a string')
+
+
+def validate_PdfConvertPostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid PdfConvertPostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_PdfConvertPostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_PdfConvertCompletePostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a PdfConvertCompletePostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('jobIds')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.jobIds: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, str):
+                        errors.append(f'{path}.jobIds[{index2}]: expected a string')
+
+
+def validate_PdfConvertCompletePostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid PdfConvertCompletePostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_PdfConvertCompletePostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_PreviewPostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a PreviewPostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Records')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.Records: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, dict):
+                        errors.append(f'{path}.Records[{index2}]: expected an object')
+                    else:
+                        field3 = item2.get('PreviewType')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.Records[{index2}].PreviewType: expected a string')
+                        field3 = item2.get('Id')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.Records[{index2}].Id: expected a string')
+                        field3 = item2.get('VersionId')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.Records[{index2}].VersionId: expected a string')
+        field1 = value.get('IsArchived')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.IsArchived: expected a string')
+
+
+def validate_PreviewPostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid PreviewPostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_PreviewPostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FilesPatchRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FilesPatchRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Id')
+        if field1 is None:
+            errors.append(f'{path}.Id: required')
+        elif not isinstance(field1, str):
+            errors.append(f'{path}.Id: expected a string')
+        field1 = value.get('Name')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.Name: expected a string')
+        field1 = value.get('litify_docs__Author__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__Author__c: expected a string')
+        field1 = value.get('litify_docs__Description__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__Description__c: expected a string')
+        field1 = value.get('litify_docs__External_File_Path__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__External_File_Path__c: expected a string')
+        field1 = value.get('litify_docs__External_ID__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__External_ID__c: expected a string')
+        field1 = value.get('litify_docs__Folder_Path__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__Folder_Path__c: expected a string')
+        field1 = value.get('litify_docs__From__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__From__c: expected a string')
+        field1 = value.get('litify_docs__To__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__To__c: expected a string')
+        field1 = value.get('litify_docs__Related_To_Api_Name__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__Related_To_Api_Name__c: expected a string')
+        field1 = value.get('litify_docs__Related_To__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__Related_To__c: expected a string')
+        field1 = value.get('litify_docs__File_Type__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__File_Type__c: expected a string')
+        field1 = value.get('Custom_Field__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.Custom_Field__c: expected a string')
+
+
+def validate_FilesPatchRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FilesPatchRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FilesPatchRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FilesPutRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FilesPutRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Id')
+        if field1 is None:
+            errors.append(f'{path}.Id: required')
+        elif not isinstance(field1, str):
+            errors.append(f'{path}.Id: expected a string')
+
+
+def validate_FilesPutRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FilesPutRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FilesPutRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FilesPostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FilesPostRequest value to errors"""
+    if not isinstance(value, (list, tuple)):
+        errors.append(f'{path}: expected an array')
+    else:
+        for index1, item1 in enumerate(value):
+            if not isinstance(item1, dict):
+                errors.append(f'{path}[{index1}]: expected an object')
+            else:
+                field2 = item1.get('Name')
+                if field2 is None:
+                    errors.append(f'{path}[{index1}].Name: required')
+                elif not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].Name: expected a string')
+                field2 = item1.get('litify_docs__Author__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Author__c: expected a string')
+                field2 = item1.get('litify_docs__Description__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Description__c: expected a string')
+                field2 = item1.get('litify_docs__External_File_Path__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__External_File_Path__c: expected a string')
+                field2 = item1.get('litify_docs__External_ID__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__External_ID__c: expected a string')
+                field2 = item1.get('litify_docs__Folder_Path__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Folder_Path__c: expected a string')
+                field2 = item1.get('litify_docs__From__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__From__c: expected a string')
+                field2 = item1.get('litify_docs__To__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__To__c: expected a string')
+                field2 = item1.get('litify_docs__Related_To_Api_Name__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Related_To_Api_Name__c: expected a string')
+                field2 = item1.get('litify_docs__Related_To__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Related_To__c: expected a string')
+                field2 = item1.get('litify_docs__File_Type__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__File_Type__c: expected a string')
+                field2 = item1.get('isUnzip')
+                if field2 is not None and not isinstance(field2, bool):
+                    errors.append(f'{path}[{index1}].isUnzip: expected a boolean')
+
+
+def validate_FilesPostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FilesPostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FilesPostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FilesTAPostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FilesTAPostRequest value to errors"""
+    if not isinstance(value, (list, tuple)):
+        errors.append(f'{path}: expected an array')
+    else:
+        for index1, item1 in enumerate(value):
+            if not isinstance(item1, dict):
+                errors.append(f'{path}[{index1}]: expected an object')
+            else:
+                field2 = item1.get('Name')
+                if field2 is None:
+                    errors.append(f'{path}[{index1}].Name: required')
+                elif not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].Name: expected a string')
+                field2 = item1.get('litify_docs__Author__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Author__c: expected a string')
+                field2 = item1.get('litify_docs__Description__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Description__c: expected a string')
+                field2 = item1.get('litify_docs__External_File_Path__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__External_File_Path__c: expected a string')
+                field2 = item1.get('litify_docs__External_ID__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__External_ID__c: expected a string')
+                field2 = item1.get('litify_docs__Folder_Path__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Folder_Path__c: expected a string')
+                field2 = item1.get('litify_docs__From__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__From__c: expected a string')
+                field2 = item1.get('litify_docs__To__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__To__c: expected a string')
+                field2 = item1.get('litify_docs__Related_To_Api_Name__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Related_To_Api_Name__c: expected a string')
+                field2 = item1.get('litify_docs__Related_To__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Related_To__c: expected a string')
+                field2 = item1.get('litify_docs__File_Type__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__File_Type__c: expected a string')
+
+
+def validate_FilesTAPostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FilesTAPostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FilesTAPostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_MultipartFilesPutRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a MultipartFilesPutRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Id')
+        if field1 is None:
+            errors.append(f'{path}.Id: required')
+        elif not isinstance(field1, str):
+            errors.append(f'{path}.Id: expected a string')
+        field1 = value.get('Parts')
+        if field1 is None:
+            errors.append(f'{path}.Parts: required')
+        elif not isinstance(field1, int) or isinstance(field1, bool):
+            errors.append(f'{path}.Parts: expected an integer')
+        field1 = value.get('ContentType')
+        if field1 is None:
+            errors.append(f'{path}.ContentType: required')
+        elif not isinstance(field1, str):
+            errors.append(f'{path}.ContentType: expected a string')
+        field1 = value.get('fileVersionNumber')
+        if field1 is not None and (not isinstance(field1, int) or isinstance(field1, bool)):
+            errors.append(f'{path}.fileVersionNumber: expected an integer')
+
+
+def validate_MultipartFilesPutRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid MultipartFilesPutRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_MultipartFilesPutRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_MultipartFilesPostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a MultipartFilesPostRequest value to errors"""
+    if not isinstance(value, (list, tuple)):
+        errors.append(f'{path}: expected an array')
+    else:
+        for index1, item1 in enumerate(value):
+            if not isinstance(item1, dict):
+                errors.append(f'{path}[{index1}]: expected an object')
+            else:
+                field2 = item1.get('Name')
+                if field2 is None:
+                    errors.append(f'{path}[{index1}].Name: required')
+                elif not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].Name: expected a string')
+                field2 = item1.get('Parts')
+                if field2 is None:
+                    errors.append(f'{path}[{index1}].Parts: required')
+                elif not isinstance(field2, int) or isinstance(field2, bool):
+                    errors.append(f'{path}[{index1}].Parts: expected an integer')
+                field2 = item1.get('litify_docs__Author__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Author__c: expected a string')
+                field2 = item1.get('litify_docs__Description__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Description__c: expected a string')
+                field2 = item1.get('litify_docs__External_File_Path__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__External_File_Path__c: expected a string')
+                field2 = item1.get('litify_docs__External_ID__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__External_ID__c: expected a string')
+                field2 = item1.get('litify_docs__Folder_Path__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Folder_Path__c: expected a string')
+                field2 = item1.get('litify_docs__From__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__From__c: expected a string')
+                field2 = item1.get('litify_docs__To__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__To__c: expected a string')
+                field2 = item1.get('litify_docs__Related_To_Api_Name__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Related_To_Api_Name__c: expected a string')
+                field2 = item1.get('litify_docs__Related_To__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__Related_To__c: expected a string')
+                field2 = item1.get('litify_docs__File_Type__c')
+                if field2 is None:
+                    errors.append(f'{path}[{index1}].litify_docs__File_Type__c: required')
+                elif not isinstance(field2, str):
+                    errors.append(f'{path}[{index1}].litify_docs__File_Type__c: expected a string')
+
+
+def validate_MultipartFilesPostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid MultipartFilesPostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_MultipartFilesPostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_MultipartFilesCompletePostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a MultipartFilesCompletePostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Ids')
+        if field1 is None:
+            errors.append(f'{path}.Ids: required')
+        elif not isinstance(field1, (list, tuple)):
+            errors.append(f'{path}.Ids: expected an array')
+        else:
+            for index2, item2 in enumerate(field1):
+                if not isinstance(item2, str):
+                    errors.append(f'{path}.Ids[{index2}]: expected a string')
+        for key1, item1 in value.items():
+            if key1 in ('Ids',):
+                continue
+            if not isinstance(item1, dict):
+                errors.append(f'{path}.{key1}: expected an object')
+            else:
+                field2 = item1.get('UploadId')
+                if field2 is None:
+                    errors.append(f'{path}.{key1}.UploadId: required')
+                elif not isinstance(field2, str):
+                    errors.append(f'{path}.{key1}.UploadId: expected a string')
+                field2 = item1.get('Parts')
+                if field2 is None:
+                    errors.append(f'{path}.{key1}.Parts: required')
+                elif not isinstance(field2, (list, tuple)):
+                    errors.append(f'{path}.{key1}.Parts: expected an array')
+                else:
+                    for index3, item3 in enumerate(field2):
+                        if not isinstance(item3, dict):
+                            errors.append(f'{path}.{key1}.Parts[{index3}]: expected an object')
+                        else:
+                            field4 = item3.get('PartNumber')
+                            if field4 is None:
+                                errors.append(f'{path}.{key1}.Parts[{index3}].PartNumber: required')
+                            elif not isinstance(field4, int) or isinstance(field4, bool):
+                                errors.append(f'{path}.{key1}.Parts[{index3}].PartNumber'
+                                              f': expected an integer')
+                            field4 = item3.get('ETag')
+                            if field4 is None:
+                                errors.append(f'{path}.{key1}.Parts[{index3}].ETag: required')
+                            elif not isinstance(field4, str):
+                                errors.append(f'{path}.{key1}.Parts[{index3}].ETag: expected a string')
+
+
+def validate_MultipartFilesCompletePostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid MultipartFilesCompletePostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_MultipartFilesCompletePostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_MultipartFilesRefreshPutRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a MultipartFilesRefreshPutRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Id')
+        if field1 is None:
+            errors.append(f'{path}.Id: required')
+        elif not isinstance(field1, str):
+            errors.append(f'{path}.Id: expected a string')
+        field1 = value.get('UploadId')
+        if field1 is None:
+            errors.append(f'{path}.UploadId: required')
+        elif not isinstance(field1, str):
+            errors.append(f'{path}.UploadId: expected a string')
+        field1 = value.get('StartIndex')
+        if field1 is not None and (not isinstance(field1, int) or isinstance(field1, bool)):
+            errors.append(f'{path}.StartIndex: expected an integer')
+        field1 = value.get('EndIndex')
+        if field1 is None:
+            errors.append(f'{path}.EndIndex: required')
+        elif not isinstance(field1, int) or isinstance(field1, bool):
+            errors.append(f'{path}.EndIndex: expected an integer')
+
+
+def validate_MultipartFilesRefreshPutRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid MultipartFilesRefreshPutRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_MultipartFilesRefreshPutRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FilesAssociatePostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FilesAssociatePostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('fileRelationships')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.fileRelationships: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, dict):
+                        errors.append(f'{path}.fileRelationships[{index2}]: expected an object')
+                    else:
+                        field3 = item2.get('fileOne')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.fileRelationships[{index2}].fileOne: expected a string')
+                        field3 = item2.get('fileTwo')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.fileRelationships[{index2}].fileTwo: expected a string')
+        field1 = value.get('relationshipType')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.relationshipType: expected a string')
+
+
+def validate_FilesAssociatePostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FilesAssociatePostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FilesAssociatePostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FilesAssociateDeleteRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FilesAssociateDeleteRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('fileRelationships')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.fileRelationships: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, dict):
+                        errors.append(f'{path}.fileRelationships[{index2}]: expected an object')
+                    else:
+                        field3 = item2.get('fileOne')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.fileRelationships[{index2}].fileOne: expected a string')
+                        field3 = item2.get('fileTwo')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.fileRelationships[{index2}].fileTwo: expected a string')
+
+
+def validate_FilesAssociateDeleteRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FilesAssociateDeleteRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FilesAssociateDeleteRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FilesCompletePostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FilesCompletePostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Ids')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.Ids: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, str):
+                        errors.append(f'{path}.Ids[{index2}]: expected a string')
+        field1 = value.get('CheckIn')
+        if field1 is not None and not isinstance(field1, bool):
+            errors.append(f'{path}.CheckIn: expected a boolean')
+
+
+def validate_FilesCompletePostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FilesCompletePostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FilesCompletePostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FilesToggleRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FilesToggleRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Ids')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.Ids: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, str):
+                        errors.append(f'{path}.Ids[{index2}]: expected a string')
+
+
+def validate_FilesToggleRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FilesToggleRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FilesToggleRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FilesCombineRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FilesCombineRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('relatedToApiName')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.relatedToApiName: expected a string')
+        field1 = value.get('fileRelatedTo')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.fileRelatedTo: expected a string')
+        field1 = value.get('fileName')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.fileName: expected a string')
+        field1 = value.get('folderPath')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.folderPath: expected a string')
+        field1 = value.get('combineFiles')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.combineFiles: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, dict):
+                        errors.append(f'{path}.combineFiles[{index2}]: expected an object')
+                    else:
+                        field3 = item2.get('name')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.combineFiles[{index2}].name: expected a string')
+                        field3 = item2.get('fileInfoId')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.combineFiles[{index2}].fileInfoId: expected a string')
+                        field3 = item2.get('fileType')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.combineFiles[{index2}].fileType: expected a string')
+
+
+def validate_FilesCombineRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FilesCombineRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FilesCombineRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FilesSplitRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FilesSplitRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('originalFileId')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.originalFileId: expected a string')
+        field1 = value.get('originalFileRelatedTo')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.originalFileRelatedTo: expected a string')
+        field1 = value.get('originalFolderPath')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.originalFolderPath: expected a string')
+        field1 = value.get('relatedToApiName')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.relatedToApiName: expected a string')
+        field1 = value.get('originalFileType')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.originalFileType: expected a string')
+        field1 = value.get('sections')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.sections: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, dict):
+                        errors.append(f'{path}.sections[{index2}]: expected an object')
+                    else:
+                        field3 = item2.get('fileName')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.sections[{index2}].fileName: expected a string')
+                        field3 = item2.get('pages')
+                        if field3 is not None and not isinstance(field3, (list, tuple)):
+                            errors.append(f'{path}.sections[{index2}].pages: expected an array')
+                        field3 = item2.get('fileType')
+                        if field3 is not None and not isinstance(field3, str):
+                            errors.append(f'{path}.sections[{index2}].fileType: expected a string')
+
+
+def validate_FilesSplitRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FilesSplitRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FilesSplitRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FilesCombineCompleteRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FilesCombineCompleteRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Id')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.Id: expected a string')
+
+
+def validate_FilesCombineCompleteRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FilesCombineCompleteRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FilesCombineCompleteRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FilesSplitCompleteRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FilesSplitCompleteRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Ids')
+        if field1 is not None and not isinstance(field1, (list, tuple)):
+            errors.append(f'{path}.Ids: expected an array')
+
+
+def validate_FilesSplitCompleteRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FilesSplitCompleteRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FilesSplitCompleteRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_ExternalLinkPostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a ExternalLinkPostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('FileInfoRecords')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.FileInfoRecords: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    check_FileRecordObject(item2, f'{path}.FileInfoRecords[{index2}]', errors)
+        field1 = value.get('FileLinkRecord')
+        if field1 is not None:
+            if not isinstance(field1, dict):
+                errors.append(f'{path}.FileLinkRecord: expected an object')
+            else:
+                field2 = field1.get('litify_docs__Expiration_Date__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}.FileLinkRecord.litify_docs__Expiration_Date__c: expected a string')
+                field2 = field1.get('litify_docs__File_Size__c')
+                if field2 is not None and (not isinstance(field2, int) or isinstance(field2, bool)):
+                    errors.append(f'{path}.FileLinkRecord.litify_docs__File_Size__c: expected an integer')
+                field2 = field1.get('litify_docs__File_Type__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}.FileLinkRecord.litify_docs__File_Type__c: expected a string')
+                field2 = field1.get('litify_docs__Password__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}.FileLinkRecord.litify_docs__Password__c: expected a string')
+                field2 = field1.get('litify_docs__Unique_Id__c')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}.FileLinkRecord.litify_docs__Unique_Id__c: expected a string')
+
+
+def validate_ExternalLinkPostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid ExternalLinkPostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_ExternalLinkPostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_ExternalLinkZipRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a ExternalLinkZipRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('FileIds')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.FileIds: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, str):
+                        errors.append(f'{path}.FileIds[{index2}]: expected a string')
+        field1 = value.get('FileIdsWithFolderPath')
+        if field1 is not None:
+            if not isinstance(field1, dict):
+                errors.append(f'{path}.FileIdsWithFolderPath: expected an object')
+            else:
+                field2 = field1.get('files')
+                if field2 is not None:
+                    if not isinstance(field2, (list, tuple)):
+                        errors.append(f'{path}.FileIdsWithFolderPath.files: expected an array')
+                    else:
+                        for index3, item3 in enumerate(field2):
+                            if not isinstance(item3, str):
+                                errors.append(f'{path}.FileIdsWithFolderPath.files[{index3}]'
+                                              f': expected a string')
+                field2 = field1.get('filePathReference')
+                if field2 is not None:
+                    if not isinstance(field2, dict):
+                        errors.append(f'{path}.FileIdsWithFolderPath.filePathReference: expected an object')
+                    else:
+                        for key3, item3 in field2.items():
+                            if not isinstance(item3, str):
+                                errors.append(f'{path}.FileIdsWithFolderPath.filePathReference.{key3}'
+                                              f': expected a string')
+
+
+def validate_ExternalLinkZipRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid ExternalLinkZipRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_ExternalLinkZipRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_ArchivePostRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a ArchivePostRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('FileInfoIds')
+        if field1 is not None and not isinstance(field1, (list, tuple)):
+            errors.append(f'{path}.FileInfoIds: expected an array')
+        field1 = value.get('RecordIds')
+        if field1 is not None and not isinstance(field1, (list, tuple)):
+            errors.append(f'{path}.RecordIds: expected an array')
+
+
+def validate_ArchivePostRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid ArchivePostRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_ArchivePostRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FilesShareRequest(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FilesShareRequest value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Ids')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.Ids: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, str):
+                        errors.append(f'{path}.Ids[{index2}]: expected a string')
+        field1 = value.get('share')
+        if field1 is not None and not isinstance(field1, bool):
+            errors.append(f'{path}.share: expected a boolean')
+
+
+def validate_FilesShareRequest(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FilesShareRequest"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FilesShareRequest(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_FileRecordObject(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a FileRecordObject value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('attributes')
+        if field1 is not None:
+            if not isinstance(field1, dict):
+                errors.append(f'{path}.attributes: expected an object')
+            else:
+                field2 = field1.get('type')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}.attributes.type: expected a string')
+                field2 = field1.get('url')
+                if field2 is not None and not isinstance(field2, str):
+                    errors.append(f'{path}.attributes.url: expected a string')
+        field1 = value.get('Id')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.Id: expected a string')
+        field1 = value.get('OwnerId')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.OwnerId: expected a string')
+        field1 = value.get('IsDeleted')
+        if field1 is not None and not isinstance(field1, bool):
+            errors.append(f'{path}.IsDeleted: expected a boolean')
+        field1 = value.get('Name')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.Name: expected a string')
+        field1 = value.get('CreatedDate')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.CreatedDate: expected a string')
+        field1 = value.get('CreatedById')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.CreatedById: expected a string')
+        field1 = value.get('LastModifiedDate')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.LastModifiedDate: expected a string')
+        field1 = value.get('LastModifiedById')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.LastModifiedById: expected a string')
+        field1 = value.get('LastReferencedDate')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.LastReferencedDate: expected a string')
+        field1 = value.get('LastViewedDate')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.LastViewedDate: expected a string')
+        field1 = value.get('SystemModstamp')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.SystemModstamp: expected a string')
+        field1 = value.get('litify_docs__Author__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__Author__c: expected a string')
+        field1 = value.get('litify_docs__Description__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__Description__c: expected a string')
+        field1 = value.get('litify_docs__External_File_Path__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__External_File_Path__c: expected a string')
+        field1 = value.get('litify_docs__External_ID__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__External_ID__c: expected a string')
+        field1 = value.get('litify_docs__Folder_Path__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__Folder_Path__c: expected a string')
+        field1 = value.get('litify_docs__From__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__From__c: expected a string')
+        field1 = value.get('litify_docs__To__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__To__c: expected a string')
+        field1 = value.get('litify_docs__Latest_Version__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__Latest_Version__c: expected a string')
+        field1 = value.get('litify_docs__Complete__c')
+        if field1 is not None and not isinstance(field1, bool):
+            errors.append(f'{path}.litify_docs__Complete__c: expected a boolean')
+        field1 = value.get('litify_docs__File_Link__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__File_Link__c: expected a string')
+        field1 = value.get('litify_docs__Related_To_Api_Name__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__Related_To_Api_Name__c: expected a string')
+        field1 = value.get('litify_docs__File_Type__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__File_Type__c: expected a string')
+        field1 = value.get('litify_docs__File_Size__c')
+        if field1 is not None and (not isinstance(field1, int) or isinstance(field1, bool)):
+            errors.append(f'{path}.litify_docs__File_Size__c: expected an integer')
+        field1 = value.get('litify_docs__Related_To__c')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.litify_docs__Related_To__c: expected a string')
+        field1 = value.get('Duplicates')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.Duplicates: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, str):
+                        errors.append(f'{path}.Duplicates[{index2}]: expected a string')
+        field1 = value.get('Checksum')
+        if field1 is not None and not isinstance(field1, str):
+            errors.append(f'{path}.Checksum: expected a string')
+
+
+def validate_FileRecordObject(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid FileRecordObject"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_FileRecordObject(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
+
+
+def check_PostTextcontentBody(value: Any, path: str, errors: List[str]):
+    """Append what is wrong with a PostTextcontentBody value to errors"""
+    if not isinstance(value, dict):
+        errors.append(f'{path}: expected an object')
+    else:
+        field1 = value.get('Ids')
+        if field1 is not None:
+            if not isinstance(field1, (list, tuple)):
+                errors.append(f'{path}.Ids: expected an array')
+            else:
+                for index2, item2 in enumerate(field1):
+                    if not isinstance(item2, str):
+                        errors.append(f'{path}.Ids[{index2}]: expected a string')
+
+
+def validate_PostTextcontentBody(value: Any, path: str = 'requestBody'):
+    """Raise RequestValidationError unless value is a valid PostTextcontentBody"""
+    errors: List[str] = []
+    if value is None:
+        errors.append(f'{path}: required')
+    else:
+        check_PostTextcontentBody(value, path, errors)
+    if errors:
+        raise RequestValidationError(errors)
@@ -0,0 +1,736 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from docrio_spec import DocrioSpec
+
+SIGNED_PREFIX = '/_signed/'
+TOKEN_PATH = '/services/oauth2/token'
+MAX_SCHEMA_DEPTH = 8
+STATUS_TEXT = {200: 'OK', 201: 'Created', 202: 'Accepted', 204: 'No Content', 400: 'Bad Request',
+               401: 'Unauthorized', 403: 'Forbidden', 404: 'Not Found', 429: 'Too Many Requests',
+               500: 'Internal Server Error', 503: 'Service Unavailable'}
+RECORD_ID_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
+EXAMPLE_TYPES = {'string': str, 'integer': int, 'number': (int, float), 'boolean': bool}
+# Status checks of start-then-poll jobs; a job reports PROCESSING for its first job_polls checks
+JOB_STATUS_OPERATIONS = {('get', '/archive/status/{externalJobId}'),
+                         ('get', '/archive/restore/status/{externalJobId}'),
+                         ('post', '/unzip/status'), ('post', '/folders/zip/complete'),
+                         ('post', '/files/combine/complete'), ('post', '/files/split/complete'),
+                         ('post', '/pdf/convert/complete'), ('get', '/externallink/zip')}
+
+
+class LatencyModel:
+    """Per-request latency drawn from a named distribution, in milliseconds.
+
+    Specs are 'fixed:MS', 'uniform:LOW:HIGH', 'normal:MEAN:STDDEV',
+    'lognormal:MEDIAN:SIGMA' or 'exponential:MEAN'; negative draws are clamped to 0.
+    """
+
+    DISTRIBUTIONS = {'fixed': 1, 'uniform': 2, 'normal': 2, 'lognormal': 2, 'exponential': 1}
+
+    def __init__(self, spec: str = 'fixed:0'):
+        kind, *args = spec.split(':')
+        if kind not in self.DISTRIBUTIONS or len(args) != self.DISTRIBUTIONS[kind]:
+            raise ValueError(f"Invalid latency spec {spec!r}")
+        self.spec = spec
+        self.kind = kind
+        self.args = [float(arg) for arg in args]
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds"""
+        if self.kind == 'fixed':
+            ms = self.args[0]
+        elif self.kind == 'uniform':
+            ms = rng.uniform(*self.args)
+        elif self.kind == 'normal':
+            ms = rng.gauss(*self.args)
+        elif self.kind == 'lognormal':
+            ms = rng.lognormvariate(math.log(self.args[0]), self.args[1])
+        else:
+            ms = rng.expovariate(1 / self.args[0]) if self.args[0] else 0.0
+        return max(ms, 0.0) / 1000
+
+
+class SyntheticData:
+    """Builds schema-conformant values from component schemas, preferring the spec's examples"""
+
+    def __init__(self, spec: DocrioSpec, rng: random.Random, array_items: int = 2):
+        self.spec = spec
+        self.rng = rng
+        self.array_items = array_items
+
+    def record_id(self, prefix: str = 'a1E') -> str:
+        """A random 18-character Salesforce-style record Id"""
+        return prefix + ''.join(self.rng.choice(RECORD_ID_CHARS) for _ in range(18 - len(prefix)))
+
+    def example_conforms(self, schema: Dict[str, Any]) -> bool:
+        """True if a primitive schema's example has its declared type (the spec has a few that do not)"""
+        kind = schema.get('type')
+        example = schema['example']
+        if kind not in EXAMPLE_TYPES:
+            return kind is None
+        if kind != 'boolean' and isinstance(example, bool):
+            return False
+        return isinstance(example, EXAMPLE_TYPES[kind])
+
+    def value(self, schema: Any, depth: int = 0) -> Any:
+        """Synthesize a value for a schema (depth-limited, so $ref cycles terminate)"""
+        schema = self.spec.resolve_schema(schema)
+        if not isinstance(schema, dict):
+            return None
+        if 'example' in schema and self.example_conforms(schema):
+            return schema['example']
+        if 'enum' in schema:
+            return schema['enum'][0]
+        kind = schema.get('type', 'object' if 'properties' in schema else None)
+        if kind == 'array':
+            if depth >= MAX_SCHEMA_DEPTH:
+                return []
+            count = max(self.array_items, schema.get('minItems', 0))
+            return [self.value(schema.get('items'), depth + 1) for _ in range(count)]
+        if kind == 'object':
+            if depth >= MAX_SCHEMA_DEPTH:
+                return {}
+            if 'properties' not in schema and 'example' in schema:
+                return schema['example']
+            return {name: self.value(prop, depth + 1) for name, prop in schema.get('properties', {}).items()}
+        if kind == 'string':
+            if schema.get('format') == 'date-time':
+                return datetime.now(timezone.utc).isoformat()
+            if schema.get('pattern', '').startswith('^[a-zA-Z0-9]{18}'):
+                return self.record_id()
+            return 'string'
+        if kind == 'integer':
+            return int(schema.get('minimum', 1))
+        if kind == 'number':
+            return float(schema.get('minimum', 1.0))
+        if kind == 'boolean':
+            return True
+        return None
+
+
+class MockRequest:
+    """A parsed request as seen by the route handlers"""
+
+    def __init__(self, method: str, path: str, query: Dict[str, str], headers: Dict[str, str], body: bytes):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+
+class MockDocrioServer:
+    """Local HTTP/1.1 stand-in for the Docrio API, driven entirely by swagger.json.
+
+    Every operation in the spec answers with a synthetic body that conforms to its
+    success response schema; Ids-list reads return one record per requested Id. The
+    three-step signed-URL upload (POST /files, PUT to the signed URL, POST
+    /files/complete) and the multipart flow (POST or PUT /multipart, PUT each part,
+    PUT /multipart/refresh, POST /multipart/complete) are simulated with state, and
+    signed URLs point back at this server and expire after signed_url_ttl seconds.
+    GET /files/related pages through related_files stable records per related record
+    with MaxFiles, OffsetId/OffsetValue and NextBatch, honouring SortBy and Fields.
+    Job status checks (archive, unzip, zip, combine, split, PDF convert) report each
+    job as PROCESSING for its first job_polls checks and complete afterwards.
+    POST /services/oauth2/token (outside base_path) issues tokens that expire after
+    token_ttl seconds and are then answered with 401; other tokens are accepted.
+
+    Latency, random 5xx errors, 429 throttling (random or a requests-per-second
+    budget) and the number of concurrently served connections are configurable, so
+    generated clients can be load-tested without any network. Connections beyond
+    max_connections wait; while any wait, served connections close after their
+    current response instead of being kept alive.
+    """
+
+    def __init__(self, spec: DocrioSpec, host: str = '127.0.0.1', port: int = 0, base_path: str = '/v1',
+                 latency: str = 'fixed:0', operation_latency: Optional[Mapping[str, str]] = None,
+                 error_rate: float = 0.0, throttle_rate: float = 0.0, rate_limit: float = 0.0,
+                 retry_after: float = 1.0, max_connections: int = 0, require_auth: bool = True,
+                 signed_url_ttl: float = 900.0, download_size: int = 1024, related_files: int = 250,
+                 job_polls: int = 2, token_ttl: float = 3600.0, seed: int = 0):
+        self.spec = spec
+        self.host = host
+        self.port = port
+        self.base_path = base_path.rstrip('/')
+        self.latency = LatencyModel(latency)
+        self.operation_latency = {name: LatencyModel(value) for name, value in (operation_latency or {}).items()}
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.max_connections = max_connections
+        self.require_auth = require_auth
+        self.signed_url_ttl = signed_url_ttl
+        self.download_size = download_size
+        self.related_files = related_files
+        self.job_polls = job_polls
+        self.token_ttl = token_ttl
+        self.rng = random.Random(seed)
+        self.data = SyntheticData(spec, self.rng)
+        self.routes = self.compile_routes()
+        self.static_bodies: Dict[int, bytes] = {}
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.connection_slots: Optional[asyncio.Semaphore] = None
+        self.handlers: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self.waiting_connections = 0
+        self.origin = ''
+        # Rate-limit token bucket
+        self.tokens = rate_limit
+        self.refilled_at = 0.0
+        # Upload state
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.uploads: Dict[str, Dict[str, Any]] = {}
+        self.signed_urls: Dict[str, Dict[str, Any]] = {}
+        self.related: Dict[str, List[Dict[str, Any]]] = {}
+        self.job_checks: Counter = Counter()
+        # Access tokens issued by TOKEN_PATH -> time.monotonic() expiry
+        self.issued_tokens: Dict[str, float] = {}
+        # Statistics
+        self.requests: Counter = Counter()
+        self.statuses: Counter = Counter()
+        self.connections = 0
+        self.active_connections = 0
+        self.peak_connections = 0
+
+    def compile_routes(self) -> List[Tuple[str, Any, Dict[str, Any]]]:
+        """(HTTP method, path regex, endpoint) for every operation, literal paths first"""
+        routes = []
+        for endpoint in self.spec.endpoints:
+            pattern = re.sub(r'\\{([^}]+)\\}', r'(?P<\1>[^/]+)', re.escape(endpoint['path']))
+            routes.append((endpoint['method'].upper(), re.compile(f"^{pattern}$"), endpoint))
+        routes.sort(key=lambda route: (route[2]['path'].count('{'), -len(route[2]['path'])))
+        return routes
+
+    # Server lifecycle
+
+    async def start(self) -> str:
+        """Start listening and return the API base URL"""
+        self.connection_slots = asyncio.Semaphore(self.max_connections) if self.max_connections else None
+        self.refilled_at = time.monotonic()
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        host, port = self.server.sockets[0].getsockname()[:2]
+        self.origin = f"http://{host}:{port}"
+        return f"{self.origin}{self.base_path}"
+
+    async def stop(self):
+        """Stop listening, close open connections and wait for their handlers to finish"""
+        if self.server is None:
+            return
+        self.server.close()
+        for writer in self.handlers.values():
+            writer.close()
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        await self.server.wait_closed()
+
+    async def __aenter__(self) -> str:
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters collected since the server started"""
+        return {
+            'requests': dict(self.requests),
+            'statuses': dict(self.statuses),
+            'connections': self.connections,
+            'peak_connections': self.peak_connections
+        }
+
+    # HTTP handling
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve keep-alive requests on one connection, waiting for a slot when the cap is reached"""
+        task = asyncio.current_task()
+        self.handlers[task] = writer
+        if self.connection_slots is not None:
+            self.waiting_connections += 1
+            try:
+                await self.connection_slots.acquire()
+            finally:
+                self.waiting_connections -= 1
+        self.connections += 1
+        self.active_connections += 1
+        self.peak_connections = max(self.peak_connections, self.active_connections)
+        try:
+            while True:
+                request = await self.read_request(reader)
+                if request is None:
+                    break
+                status, headers, body = await self.dispatch(request)
+                self.statuses[status] += 1
+                # At the connection cap, hand the slot to a waiting connection instead of keeping this one alive
+                closing = (request.headers.get('connection', '').lower() == 'close'
+                           or self.waiting_connections > 0)
+                if closing:
+                    headers = dict(headers, Connection='close')
+                writer.write(self.format_response(status, headers, body))
+                await writer.drain()
+                if closing:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.active_connections -= 1
+            if self.connection_slots is not None:
+                self.connection_slots.release()
+            del self.handlers[task]
+            writer.close()
+
+    async def read_request(self, reader: asyncio.StreamReader) -> Optional[MockRequest]:
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        method, target, _ = request_line.decode('latin-1').split(' ', 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';', 1)[0].strip() or b'0', 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b''.join(chunks)
+        else:
+            body = await reader.readexactly(int(headers.get('content-length', '0')))
+        parts = urlsplit(target)
+        return MockRequest(method.upper(), parts.path, dict(parse_qsl(parts.query, keep_blank_values=True)),
+                           headers, body)
+
+    def format_response(self, status: int, headers: Dict[str, str], body: bytes) -> bytes:
+        lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'Unknown')}"]
+        headers = dict(headers)
+        headers.setdefault('Content-Type', 'application/json')
+        headers['Content-Length'] = str(len(body))
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+    def json_response(self, status: int, value: Any,
+                      headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, str], bytes]:
+        return status, headers or {}, json.dumps(value).encode('utf-8')
+
+    def error(self, status: int, message: str,
+              headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, str], bytes]:
+        return self.json_response(status, {'message': message}, headers)
+
+    async def dispatch(self, request: MockRequest) -> Tuple[int, Dict[str, str], bytes]:
+        """Apply latency and fault injection, then route the request"""
+        if request.path.startswith(SIGNED_PREFIX):
+            self.requests['signedUrl'] += 1
+            await asyncio.sleep(self.latency.sample(self.rng))
+            return self.handle_signed_url(request)
+
+        if request.path == TOKEN_PATH and request.method == 'POST':
+            self.requests['oauthToken'] += 1
+            await asyncio.sleep(self.latency.sample(self.rng))
+            return self.issue_token(request)
+
+        if not request.path.startswith(self.base_path):
+            return self.error(404, f"No route for {request.path}")
+        path = request.path[len(self.base_path):] or '/'
+        for method, pattern, endpoint in self.routes:
+            match = pattern.match(path) if method == request.method else None
+            if match is not None:
+                break
+        else:
+            return self.error(404, f"No operation for {request.method} {path}")
+
+        name = endpoint['method_name']
+        self.requests[name] += 1
+        await asyncio.sleep(self.operation_latency.get(name, self.latency).sample(self.rng))
+
+        if self.require_auth and not (request.headers.get('authorization') and request.headers.get('x-api-key')):
+            return self.error(401, 'Missing Authorization or X-API-KEY header')
+        if self.require_auth and not self.token_accepted(request.headers['authorization']):
+            return self.error(401, 'Session expired or invalid')
+        throttled = self.consume_rate_limit()
+        if throttled is None and self.throttle_rate and self.rng.random() < self.throttle_rate:
+            throttled = self.retry_after
+        if throttled is not None:
+            return self.error(429, 'Rate limit exceeded', {'Retry-After': f"{math.ceil(throttled)}"})
+        if self.error_rate and self.rng.random() < self.error_rate:
+            return self.error(500, 'Injected server error')
+
+        missing = [param['name'] for param in endpoint['parameters']
+                   if param.get('in') == 'query' and param.get('required') and param['name'] not in request.query]
+        if missing:
+            return self.error(400, f"Missing required query parameter(s): {', '.join(missing)}")
+        try:
+            return self.handle_operation(endpoint, request, match.groupdict())
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            return self.error(400, f"Invalid request: {e}")
+
+    def issue_token(self, request: MockRequest) -> Tuple[int, Dict[str, str], bytes]:
+        """Answer the OAuth password grant with a new token that expires after token_ttl seconds"""
+        form = dict(parse_qsl(request.body.decode('utf-8')))
+        if form.get('grant_type') != 'password' or not form.get('client_id'):
+            return self.json_response(400, {'error': 'invalid_grant'})
+        token = ''.join(self.rng.choice(RECORD_ID_CHARS) for _ in range(40))
+        self.issued_tokens[token] = time.monotonic() + self.token_ttl
+        return self.json_response(200, {'access_token': token, 'instance_url': self.origin,
+                                        'token_type': 'Bearer', 'expires_in': int(self.token_ttl)})
+
+    def token_accepted(self, authorization: str) -> bool:
+        """Tokens this server issued must be unexpired; any other token is accepted as-is"""
+        token = authorization[len('Bearer '):] if authorization.startswith('Bearer ') else authorization
+        expires_at = self.issued_tokens.get(token)
+        return expires_at is None or time.monotonic() < expires_at
+
+    def revoke_tokens(self):
+        """Expire every issued token, as a password reset or session timeout would"""
+        for token in self.issued_tokens:
+            self.issued_tokens[token] = 0.0
+
+    def consume_rate_limit(self) -> Optional[float]:
+        """Take a token from the rate-limit bucket; return the wait in seconds if none is left"""
+        if not self.rate_limit:
+            return None
+        now = time.monotonic()
+        self.tokens = min(self.rate_limit, self.tokens + (now - self.refilled_at) * self.rate_limit)
+        self.refilled_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return None
+        return (1 - self.tokens) / self.rate_limit
+
+    # Operations
+
+    def handle_operation(self, endpoint: Dict[str, Any], request: MockRequest,
+                         path_params: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """Answer an operation, with stateful handlers for the upload flows"""
+        key = (endpoint['method'], endpoint['path'])
+        if key == ('post', '/files'):
+            return self.create_files(request.json())
+        if key == ('post', '/files/complete'):
+            return self.complete_files(request.json())
+        if key == ('post', '/multipart'):
+            return self.create_multipart(request.json())
+        if key == ('put', '/multipart'):
+            return self.update_multipart(request.json())
+        if key == ('put', '/multipart/refresh'):
+            return self.refresh_multipart(request.json())
+        if key == ('post', '/multipart/complete'):
+            return self.complete_multipart(request.json())
+        if key == ('get', '/files'):
+            return self.signed_downloads(request.query.get('Ids', ''))
+        if key == ('get', '/files/related'):
+            return self.related_page(request.query)
+        if key in JOB_STATUS_OPERATIONS:
+            return self.job_statuses(endpoint, request, path_params)
+        return self.synthetic_response(endpoint, request)
+
+    def synthetic_response(self, endpoint: Dict[str, Any],
+                           request: MockRequest) -> Tuple[int, Dict[str, str], bytes]:
+        """Schema-conformant body for an operation; Ids-list reads get one record per Id, in order"""
+        status = int(endpoint['response_code'] or 200)
+        schema = endpoint['response_schema']
+        if schema is None or status == 204:
+            return status, {}, b''
+        ids = [value for value in request.query.get('Ids', '').split(',') if value.strip()]
+        records_schema = self.spec.resolve_schema(schema).get('properties', {}).get('Records', {})
+        if ids and records_schema.get('type') == 'array':
+            records = []
+            for record_id in ids:
+                record = self.data.value(records_schema.get('items'))
+                if isinstance(record, dict):
+                    record['Id'] = record_id.strip()
+                    if 'litify_docs__File_Size__c' in record:
+                        # Agree with what a download of this file returns
+                        record.update(self.file_record(record['Id']) if record['Id'] in self.files
+                                      else {'litify_docs__File_Size__c': self.download_size})
+                records.append(record)
+            return self.json_response(status, {'Records': records})
+        index = id(endpoint)
+        if index not in self.static_bodies:
+            self.static_bodies[index] = json.dumps(self.data.value(schema)).encode('utf-8')
+        return status, {}, self.static_bodies[index]
+
+    def expires(self) -> str:
+        return (datetime.now(timezone.utc) + timedelta(seconds=self.signed_url_ttl)).isoformat()
+
+    def sign(self, **target: Any) -> str:
+        """Create a signed URL on this server for an upload or download target"""
+        token = hashlib.sha256(f"{self.rng.random()}{target}".encode('utf-8')).hexdigest()[:32]
+        target['expires_at'] = time.monotonic() + self.signed_url_ttl
+        self.signed_urls[token] = target
+        return f"{self.origin}{SIGNED_PREFIX}{token}"
+
+    def file_record(self, file_id: str) -> Dict[str, Any]:
+        """FileRecordObject-shaped record for a stored file"""
+        stored = self.files[file_id]
+        record = self.data.value({'$ref': '#/components/schemas/FileRecordObject'})
+        record.update({'Id': file_id, 'Name': stored['name'], 'litify_docs__Complete__c': stored['complete'],
+                       'litify_docs__File_Size__c': len(stored['content'] or b'')})
+        return record
+
+    def new_file(self, item: Dict[str, Any]) -> str:
+        file_id = self.data.record_id()
+        self.files[file_id] = {'name': item['Name'], 'content': None, 'complete': False,
+                               'content_type': item.get('litify_docs__File_Type__c', 'application/octet-stream')}
+        return file_id
+
+    def create_files(self, items: List[Dict[str, Any]]) -> Tuple[int, Dict[str, str], bytes]:
+        """POST /files: create records and hand out one signed PUT URL per file, keyed by name"""
+        result = {}
+        for item in items:
+            file_id = self.new_file(item)
+            result[item['Name']] = {'SignedUrl': self.sign(kind='file', file_id=file_id, method='PUT'),
+                                    'Expires': self.expires(), 'Id': file_id}
+        return self.json_response(200, result)
+
+    def complete_files(self, request: Dict[str, Any]) -> Tuple[int, Dict[str, str], bytes]:
+        """POST /files/complete: files whose content was PUT succeed, the rest fail"""
+        successes, failures = [], []
+        for file_id in request.get('Ids', []):
+            stored = self.files.get(file_id)
+            if stored is None or stored['content'] is None:
+                failures.append(file_id)
+                continue
+            stored['complete'] = True
+            successes.append(self.file_record(file_id))
+        return self.json_response(201, {'Message': 'Files successfully uploaded.',
+                                        'Successes': successes, 'Failures': failures})
+
+    def multipart_urls(self, file_id: str, upload_id: str, start: int, end: int) -> Dict[str, Any]:
+        """MultipartSignedUrlObject with signed part URLs for parts start+1..end"""
+        urls = [self.sign(kind='part', file_id=file_id, upload_id=upload_id, part=part, method='PUT')
+                for part in range(start + 1, end + 1)]
+        return {'SignedUrls': urls, 'Expires': self.expires(), 'Id': file_id, 'UploadId': upload_id}
+
+    def start_upload(self, file_id: str, parts: int) -> Dict[str, Any]:
+        upload_id = hashlib.sha256(f"{file_id}{self.rng.random()}".encode('utf-8')).hexdigest()
+        self.uploads[upload_id] = {'file_id': file_id, 'parts': int(parts), 'received': {}}
+        return self.multipart_urls(file_id, upload_id, 0, int(parts))
+
+    def create_multipart(self, items: List[Dict[str, Any]]) -> Tuple[int, Dict[str, str], bytes]:
+        """POST /multipart: create records and start one multipart upload per file"""
+        result = {}
+        for item in items:
+            result[item['Name']] = self.start_upload(self.new_file(item), item['Parts'])
+        return self.json_response(200, result)
+
+    def update_multipart(self, request: Dict[str, Any]) -> Tuple[int, Dict[str, str], bytes]:
+        """PUT /multipart: start a multipart upload of a new version of an existing file"""
+        file_id = request['Id']
+        if file_id not in self.files:
+            return self.error(403, f"Unknown file {file_id}")
+        return self.json_response(200, {self.files[file_id]['name']: self.start_upload(file_id, request['Parts'])})
+
+    def refresh_multipart(self, request: Dict[str, Any]) -> Tuple[int, Dict[str, str], bytes]:
+        """PUT /multipart/refresh: new signed URLs for parts StartIndex+1..EndIndex of an open upload"""
+        upload = self.uploads.get(request['UploadId'])
+        if upload is None or upload['file_id'] != request['Id']:
+            return self.error(403, 'Unknown upload')
+        start = int(request.get('StartIndex', 0))
+        end = min(int(request['EndIndex']), upload['parts'])
+        urls = self.multipart_urls(upload['file_id'], request['UploadId'], start, end)
+        return self.json_response(201, {self.files[upload['file_id']]['name']: urls})
+
+    def complete_multipart(self, request: Dict[str, Any]) -> Tuple[int, Dict[str, str], bytes]:
+        """POST /multipart/complete: assemble files whose parts all arrived with matching ETags"""
+        successes, failures = [], []
+        for file_id in request.get('Ids', []):
+            entry = request.get(file_id) or {}
+            upload = self.uploads.get(entry.get('UploadId', ''))
+            parts = {part['PartNumber']: part['ETag'] for part in entry.get('Parts', [])}
+            if (upload is None or upload['file_id'] != file_id or sorted(parts) != list(range(1, upload['parts'] + 1))
+                    or any(upload['received'].get(number, (None,))[0] != etag for number, etag in parts.items())):
+                failures.append(file_id)
+                continue
+            stored = self.files[file_id]
+            stored['content'] = b''.join(upload['received'][number][1] for number in sorted(parts))
+            stored['complete'] = True
+            del self.uploads[entry['UploadId']]
+            successes.append(self.file_record(file_id))
+        return self.json_response(201, {'Message': 'Files successfully uploaded.',
+                                        'Successes': successes, 'Failures': failures})
+
+    def signed_downloads(self, ids: str) -> Tuple[int, Dict[str, str], bytes]:
+        """GET /files: one SignedUrlObject per requested Id, pointing at a download URL"""
+        records = []
+        for file_id in (value.strip() for value in ids.split(',') if value.strip()):
+            records.append({'SignedUrl': self.sign(kind='download', file_id=file_id, method='GET'),
+                            'Expires': self.expires(), 'Id': file_id})
+        return self.json_response(200, {'Records': records})
+
+    def related_page(self, query: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """GET /files/related: one page of a related record's files, after OffsetValue/OffsetId"""
+        related_id = query['RelatedRecordId']
+        if related_id not in self.related:
+            records = []
+            for number in range(self.related_files):
+                record = self.data.value({'$ref': '#/components/schemas/FileRecordObject'})
+                record.update({'Id': self.data.record_id(), 'Name': f"File {number:06d}.pdf",
+                               'litify_docs__Related_To__c': related_id})
+                records.append(record)
+            self.related[related_id] = records
+        sort_by = query.get('SortBy') or 'Name'
+        descending = (query.get('SortDirection') or 'ASC').upper() == 'DESC'
+
+        def sort_key(record: Dict[str, Any]) -> Tuple[str, str]:
+            return str(record.get(sort_by, '')), record['Id']
+
+        records = sorted(self.related[related_id], key=sort_key, reverse=descending)
+        if query.get('OffsetId'):
+            offset = (query.get('OffsetValue', ''), query['OffsetId'])
+            records = [record for record in records if (sort_key(record) < offset if descending
+                                                        else sort_key(record) > offset)]
+        page_size = int(query.get('MaxFiles') or 2000)
+        page = records[:page_size]
+        body: Dict[str, Any] = {'Records': page}
+        if len(records) > page_size:
+            body['NextBatch'] = {'OffsetId': page[-1]['Id'], 'OffsetValue': str(page[-1].get(sort_by, ''))}
+        if query.get('Fields'):
+            fields = {'Id'} | {field.strip() for field in query['Fields'].split(',')}
+            body['Records'] = [{name: value for name, value in record.items() if name in fields} for record in page]
+        return self.json_response(200, body)
+
+    def job_statuses(self, endpoint: Dict[str, Any], request: MockRequest,
+                     path_params: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """Status of the jobs a status check names, in whichever shape its response schema uses"""
+        body = request.json() if request.method == 'POST' else None
+        body = body if isinstance(body, dict) else {}
+        ids = body.get('jobIds') or body.get('Ids') or []
+        single = path_params.get('externalJobId') or body.get('Id') or body.get('jobId') or request.query.get('ZipFileId')
+        if single:
+            ids = [single]
+        schema = self.spec.resolve_schema(endpoint['response_schema'])
+        done = self.status_example(schema) or 'COMPLETED'
+        statuses = []
+        for job_id in ids:
+            self.job_checks[job_id] += 1
+            statuses.append((job_id, done if self.job_checks[job_id] > self.job_polls else 'PROCESSING'))
+
+        properties = schema.get('properties', {})
+        response = self.data.value(schema)
+        list_key = next((name for name in ('jobStatuses', 'Statuses') if name in properties), None)
+        if list_key is not None:
+            response[list_key] = [{'jobId': job_id, 'status': status} for job_id, status in statuses]
+            if 'Errors' in properties:
+                response['Errors'] = {}
+        elif statuses:
+            response['status' if 'status' in properties else 'Status'] = statuses[0][1]
+            for name in ('externalJobId', 'jobId', 'ZipFileId'):
+                if name in properties:
+                    response[name] = statuses[0][0]
+        return self.json_response(int(endpoint['response_code'] or 200), response)
+
+    def status_example(self, schema: Any, depth: int = 0) -> Optional[str]:
+        """Example value of the first status property in a schema, searched depth-first"""
+        schema = self.spec.resolve_schema(schema)
+        if not isinstance(schema, dict) or depth > MAX_SCHEMA_DEPTH:
+            return None
+        for name, prop in schema.get('properties', {}).items():
+            prop = self.spec.resolve_schema(prop)
+            if name.lower() == 'status' and isinstance(prop.get('example'), str):
+                return prop['example']
+            found = self.status_example(prop.get('items', prop) if prop.get('type') == 'array' else prop, depth + 1)
+            if found is not None:
+                return found
+        return None
+
+    def handle_signed_url(self, request: MockRequest) -> Tuple[int, Dict[str, str], bytes]:
+        """PUT file content or parts to, or GET file content from, a signed URL"""
+        target = self.signed_urls.get(request.path[len(SIGNED_PREFIX):])
+        if target is None or target['method'] != request.method:
+            return self.error(403, 'SignatureDoesNotMatch')
+        if time.monotonic() > target['expires_at']:
+            return self.error(403, 'Request has expired')
+        if target['kind'] == 'file':
+            self.files[target['file_id']]['content'] = request.body
+            return 200, {'ETag': f'"{hashlib.md5(request.body).hexdigest()}"'}, b''
+        if target['kind'] == 'part':
+            upload = self.uploads.get(target['upload_id'])
+            if upload is None:
+                return self.error(404, 'NoSuchUpload')
+            etag = hashlib.md5(request.body).hexdigest()
+            upload['received'][target['part']] = (etag, request.body)
+            return 200, {'ETag': etag}, b''
+        stored = self.files.get(target['file_id'])
+        if stored is not None and stored['content'] is not None:
+            return 200, {'Content-Type': stored['content_type']}, stored['content']
+        # Files the mock never received download as deterministic filler of download_size bytes
+        seed = hashlib.sha256(target['file_id'].encode('utf-8')).digest()
+        content = (seed * (self.download_size // len(seed) + 1))[:self.download_size]
+        return 200, {'Content-Type': 'application/octet-stream'}, content
+
+
+def server_from_args(argv: Optional[List[str]] = None) -> MockDocrioServer:
+    """Build a MockDocrioServer from command-line arguments"""
+    parser = argparse.ArgumentParser(description='Serve a local mock of the Docrio API generated from swagger.json')
+    parser.add_argument('--spec', default='swagger.json', help='OpenAPI spec to serve')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--base-path', default='/v1', help='Path prefix the API is served under')
+    parser.add_argument('--latency', default='fixed:0',
+                        help='Latency distribution in ms: fixed:MS, uniform:LOW:HIGH, normal:MEAN:SD, '
+                             'lognormal:MEDIAN:SIGMA or exponential:MEAN')
+    parser.add_argument('--operation-latency', action='append', default=[], metavar='METHOD=DISTRIBUTION',
+                        help='Latency override for one operation, e.g. postSearch=lognormal:200:0.6 (repeatable)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with a 500')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction of requests answered with a 429')
+    parser.add_argument('--retry-after', type=float, default=1.0,
+                        help='Seconds sent in Retry-After with --throttle-rate 429s (rounded up)')
+    parser.add_argument('--rate-limit', type=float, default=0.0,
+                        help='Requests per second before answering 429 with Retry-After (0 = unlimited)')
+    parser.add_argument('--max-connections', type=int, default=0,
+                        help='Connections served at once; further connections wait (0 = unlimited)')
+    parser.add_argument('--related-files', type=int, default=250,
+                        help='Files related to each record served by GET /files/related')
+    parser.add_argument('--job-polls', type=int, default=2,
+                        help='Status checks a job reports PROCESSING for before it completes')
+    parser.add_argument('--token-ttl', type=float, default=3600.0,
+                        help=f"Seconds before tokens issued by POST {TOKEN_PATH} expire")
+    parser.add_argument('--no-auth', action='store_true', help='Do not require Authorization and X-API-KEY headers')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    return MockDocrioServer(
+        DocrioSpec.load(args.spec), args.host, args.port, args.base_path, args.latency,
+        dict(value.split('=', 1) for value in args.operation_latency), args.error_rate, args.throttle_rate,
+        args.rate_limit, retry_after=args.retry_after, max_connections=args.max_connections,
+        require_auth=not args.no_auth, related_files=args.related_files, job_polls=args.job_polls,
+        token_ttl=args.token_ttl, seed=args.seed
+    )
+
+
+def main():
+    server = server_from_args()
+
+    async def serve():
+        base_url = await server.start()
+        print(f"Mock Docrio API listening on {base_url}")
+        try:
+            await server.server.serve_forever()
+        finally:
+            print(json.dumps(server.stats(), indent=2))
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
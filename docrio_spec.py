@@ -0,0 +1,294 @@
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'patch', 'head', 'options')
+SUCCESS_CODES = ('200', '201', '202', '204', '207')
+MODELS_CLASS = 'DocrioModels'
+COMMON_MODELS_CLASS = 'DocrioCommonModels'
+# Sample keys the spec uses as property names of map-like objects: a record Id or a file name
+PLACEHOLDER_PROPERTY = re.compile(r'(?=[a-zA-Z]*[0-9])[a-zA-Z0-9]{18}|[^.]+\.[A-Za-z0-9]+')
+
+
+def ref_name(ref: str) -> str:
+    """Return the component name a '#/components/...' reference points at"""
+    return ref.split('/')[-1]
+
+
+def method_name(path: str, method: str) -> str:
+    """Derive the generated method name for an operation, e.g. GET /files/related -> getFilesRelated"""
+    parts = [p for p in path.strip('/').split('/') if not p.startswith('{')]
+    return f"{method.lower()}{''.join(p.capitalize() for p in parts)}"
+
+
+def tag_models_class(tag: str) -> str:
+    """Name of the sharded model class for a tag, e.g. 'Archival Tool' -> DocrioArchivalToolModels"""
+    words = re.findall(r'[A-Za-z0-9]+', tag)
+    return f"Docrio{''.join(w[0].upper() + w[1:] for w in words)}Models"
+
+
+def placeholder_property(name: str) -> bool:
+    """True for a property name that stands for any key (e.g. a1E1U000001juz6UAA or name-of-file.png)"""
+    return PLACEHOLDER_PROPERTY.fullmatch(name) is not None
+
+
+def schema_refs(schema: Any) -> Set[str]:
+    """Collect the names of every component schema referenced anywhere inside a schema"""
+    refs = set()
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if isinstance(node.get('$ref'), str):
+                refs.add(ref_name(node['$ref']))
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return refs
+
+
+class DocrioSpec:
+    """Compiled intermediate representation of a Docrio OpenAPI spec.
+
+    The spec is parsed and resolved once and then shared by every generator backend:
+    resolved component schemas, the table of model class names, and all operations
+    (with resolved parameters and request/response schemas) grouped by tag.
+    """
+
+    def __init__(self, swagger: Dict[str, Any], source_file: Optional[str] = None,
+                 include: Optional[Tuple[str, ...]] = None):
+        self.swagger = swagger
+        self.source_file = source_file  # Set when loaded from disk, so workers can reload it
+        self.include = include  # Operation selection this spec was narrowed to, if any
+        self.cycles: List[List[str]] = []  # $ref cycles met while narrowing to include
+        self.sharded = False
+        self.model_classes: Dict[str, str] = {}  # Schema name -> outer model class when sharded
+        self.common_model_class = MODELS_CLASS  # Outer class for models shared across shards
+        self.resolved: Dict[str, Any] = {}  # Backend preparation results, persisted by SpecCache
+        components = swagger.get('components', {})
+        self.schemas: Dict[str, Any] = components.get('schemas', {})
+        self.parameters: Dict[str, Any] = components.get('parameters', {})
+        # Schemas that become DocrioModels inner classes
+        self.model_names: Set[str] = {
+            name for name, schema in self.schemas.items()
+            if isinstance(schema, dict) and schema.get('type') == 'object'
+        }
+        self.endpoints: List[Dict[str, Any]] = []
+        self.endpoints_by_tag: Dict[str, List[Dict[str, Any]]] = {}
+        self.compile_operations()
+
+    @classmethod
+    def load(cls, swagger_file: str, include: Optional[Iterable[str]] = None, sharded: bool = False) -> 'DocrioSpec':
+        """Parse a swagger/OpenAPI JSON file into the IR, optionally narrowed and sharded"""
+        with open(swagger_file, 'r') as f:
+            spec = cls(json.load(f), os.path.abspath(swagger_file))
+        if include:
+            spec = spec.select(include)
+        if sharded:
+            spec.shard_models()
+        return spec
+
+    def load_args(self) -> Tuple[Optional[str], Optional[Tuple[str, ...]], bool]:
+        """Arguments that make DocrioSpec.load rebuild this exact IR (used by worker processes)"""
+        return self.source_file, self.include, self.sharded
+
+    def model_class(self, name: str) -> str:
+        """Outer Apex class holding the model for a component schema"""
+        return self.model_classes.get(name, self.common_model_class)
+
+    def qualified_model(self, name: str) -> str:
+        """Fully qualified Apex type of a component schema model, e.g. DocrioModels.FilesGetResponse"""
+        return f"{self.model_class(name)}.{name}"
+
+    def resolve_schema(self, schema: Any) -> Any:
+        """Follow a top-level $ref chain to the referenced component schema"""
+        seen = set()
+        while isinstance(schema, dict) and '$ref' in schema:
+            name = ref_name(schema['$ref'])
+            if name in seen or name not in self.schemas:
+                break
+            seen.add(name)
+            schema = self.schemas[name]
+        return schema
+
+    def required_properties(self, schema: Any) -> List[str]:
+        """Properties an object schema requires, leaving out placeholder keys"""
+        schema = self.resolve_schema(schema)
+        if not isinstance(schema, dict) or not isinstance(schema.get('required'), list):
+            return []
+        return [name for name in schema['required'] if not placeholder_property(name)]
+
+    def resolve_parameter(self, param: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve a '#/components/parameters/...' reference to its definition"""
+        if '$ref' in param:
+            return self.parameters.get(ref_name(param['$ref']), {})
+        return param
+
+    def json_schema(self, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the application/json schema of a request body or response, if any"""
+        content = body.get('content', {})
+        if 'application/json' in content:
+            return content['application/json'].get('schema')
+        return None
+
+    def compile_operation(self, path: str, method: str, operation: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the IR entry for a single path/method pair"""
+        endpoint = {
+            'path': path,
+            'method': method,
+            'operation': operation,
+            'operation_id': operation.get('operationId'),
+            'method_name': method_name(path, method),
+            'parameters': [self.resolve_parameter(p) for p in operation.get('parameters', [])],
+            'request_schema': None,
+            'response_code': None,
+            'response_schema': None,
+            'id_list_parameter': None,
+            'array_body': False,
+            'pagination': None
+        }
+        endpoint['id_list_parameter'] = self.id_list_parameter(endpoint['parameters'])
+        if 'requestBody' in operation:
+            endpoint['request_schema'] = self.json_schema(operation['requestBody'])
+            endpoint['array_body'] = self.resolve_schema(endpoint['request_schema'] or {}).get('type') == 'array'
+        responses = operation.get('responses', {})
+        for code in SUCCESS_CODES:
+            if code in responses:
+                endpoint['response_code'] = code
+                endpoint['response_schema'] = self.json_schema(responses[code])
+                break
+        endpoint['pagination'] = self.pagination(endpoint)
+        return endpoint
+
+    def id_list_parameter(self, parameters: List[Dict[str, Any]]) -> Optional[str]:
+        """Name of the query parameter that takes a comma-separated list of record Ids, if any"""
+        for param in parameters:
+            if param.get('in') != 'query' or 'id' not in param.get('name', '').lower():
+                continue
+            schema = self.resolve_schema(param.get('schema', {}))
+            description = f"{param.get('description', '')} {schema.get('description', '')}".lower()
+            if schema.get('type') == 'string' and 'comma-separated' in description:
+                return param['name']
+        return None
+
+    def pagination(self, endpoint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """How a GET operation pages with Offset* query parameters, if it does.
+
+        The response must carry a cursor object (e.g. NextBatch) whose properties are
+        the Offset* parameters, next to the array (or record) property holding the page.
+        """
+        if endpoint['method'] != 'get' or endpoint['response_schema'] is None:
+            return None
+        query = [param for param in endpoint['parameters'] if param.get('in') == 'query']
+        offsets = [param['name'] for param in query if param['name'].startswith('Offset')]
+        if not offsets:
+            return None
+        properties = self.resolve_schema(endpoint['response_schema']).get('properties', {})
+        cursor = next((name for name, prop in properties.items()
+                       if set(offsets) <= set(self.resolve_schema(prop).get('properties', {}))), None)
+        items = next((name for name in properties if name != cursor), None)
+        if cursor is None or items is None:
+            return None
+        page_size = next((param['name'] for param in query if param['name'].startswith(('Max', 'Limit'))
+                          and self.resolve_schema(param.get('schema', {})).get('type') == 'integer'), None)
+        return {'offsets': offsets, 'cursor': cursor, 'items': items, 'page_size': page_size}
+
+    def compile_operations(self):
+        """Compile every operation and group the results by tag"""
+        for path, methods in self.swagger.get('paths', {}).items():
+            for method, operation in methods.items():
+                if method not in HTTP_METHODS:
+                    continue
+                endpoint = self.compile_operation(path, method, operation)
+                self.endpoints.append(endpoint)
+                for tag in operation.get('tags', ['Default']):
+                    self.endpoints_by_tag.setdefault(tag, []).append(endpoint)
+
+    def endpoint_refs(self, endpoint: Dict[str, Any]) -> Set[str]:
+        """Component schemas an operation's parameters and request/response bodies refer to directly"""
+        roots = [endpoint['request_schema'], endpoint['response_schema']]
+        roots.extend(param.get('schema') for param in endpoint['parameters'])
+        return schema_refs(roots)
+
+    def dependency_graph(self) -> Dict[str, Set[str]]:
+        """Map each component schema to the component schemas it references"""
+        return {name: schema_refs(schema) for name, schema in self.schemas.items()}
+
+    def reachable_schemas(self, roots: Iterable[str]) -> Tuple[Set[str], List[List[str]]]:
+        """Return the schemas transitively reachable from roots, plus any $ref cycles found on the way"""
+        graph = self.dependency_graph()
+        reachable: Set[str] = set()
+        cycles: List[List[str]] = []
+        for root in sorted(set(roots)):
+            if root in reachable or root not in graph:
+                continue
+            # Iterative DFS; a reference back into the current path is a cycle
+            path = [root]
+            on_path = {root}
+            reachable.add(root)
+            iterators = [iter(sorted(graph[root]))]
+            while iterators:
+                child = next(iterators[-1], None)
+                if child is None:
+                    iterators.pop()
+                    on_path.discard(path.pop())
+                    continue
+                if child in on_path:
+                    cycles.append(path[path.index(child):] + [child])
+                elif child not in reachable and child in graph:
+                    reachable.add(child)
+                    path.append(child)
+                    on_path.add(child)
+                    iterators.append(iter(sorted(graph[child])))
+        return reachable, cycles
+
+    def matches(self, endpoint: Dict[str, Any], selector: str) -> bool:
+        """True if an include selector names this endpoint by path prefix, operationId, method name, or
+        case-insensitively by tag, a word of its tag, or its first path segment ("Files" for /files/...)"""
+        if selector.startswith('/'):
+            prefix = selector.rstrip('/')
+            return endpoint['path'] == prefix or endpoint['path'].startswith(prefix + '/')
+        if selector in (endpoint['operation_id'], endpoint['method_name']):
+            return True
+        word = selector.lower()
+        tags = [tag.lower() for tag in endpoint['operation'].get('tags', ['Default'])]
+        return (word in tags or any(word in tag.split() for tag in tags)
+                or word == endpoint['path'].lstrip('/').split('/', 1)[0].lower())
+
+    def select(self, include: Iterable[str]) -> 'DocrioSpec':
+        """Narrow the spec to the matching operations and the schemas they transitively reach"""
+        include = tuple(include)
+        selected = [e for e in self.endpoints if any(self.matches(e, selector) for selector in include)]
+        roots = set()
+        for endpoint in selected:
+            roots |= self.endpoint_refs(endpoint)
+        reachable, cycles = self.reachable_schemas(roots)
+
+        paths: Dict[str, Dict[str, Any]] = {}
+        for endpoint in selected:
+            paths.setdefault(endpoint['path'], {})[endpoint['method']] = endpoint['operation']
+        components = dict(self.swagger.get('components', {}))
+        components['schemas'] = {name: schema for name, schema in self.schemas.items() if name in reachable}
+        swagger = dict(self.swagger, paths=paths, components=components)
+        subset = DocrioSpec(swagger, self.source_file, include)
+        subset.cycles = cycles
+        return subset
+
+    def shard_models(self):
+        """Assign each schema to a per-tag model class, or to the common class if several tags reach it"""
+        owners: Dict[str, Set[str]] = {}
+        for tag, endpoints in self.endpoints_by_tag.items():
+            roots = set()
+            for endpoint in endpoints:
+                roots |= self.endpoint_refs(endpoint)
+            reachable, _ = self.reachable_schemas(roots)
+            for name in reachable:
+                owners.setdefault(name, set()).add(tag_models_class(tag))
+        self.sharded = True
+        self.resolved = {}  # Prepared types depend on which class owns each model
+        self.common_model_class = COMMON_MODELS_CLASS
+        self.model_classes = {
+            name: next(iter(owners[name])) if len(owners.get(name, ())) == 1 else COMMON_MODELS_CLASS
+            for name in self.schemas
+        }
@@ -0,0 +1,255 @@
+import argparse
+import os
+import re
+from typing import List, Optional, Tuple
+
+from codegen_cache import SpecCache
+from codegen_emitter import CodeEmitter, CountingSink
+from codegen_manifest import CodegenManifest, write_if_changed
+from codegen_parallel import create_pool
+from docrio_spec import DocrioSpec
+from generate_docrio_models import ApexGenerator
+from generate_docrio_python import DEFAULT_PYTHON_DIR, PythonClientGenerator
+from generate_docrio_python_models import PythonModelGenerator
+from generate_docrio_python_validators import PythonValidatorGenerator
+from generate_docrio_service import ServiceGenerator
+
+GENERATOR_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT_DIR = 'force-app/main/default/classes'
+# Apex limits: characters per class, and characters of Apex code per org
+APEX_CLASS_CHAR_LIMIT = 1000000
+APEX_ORG_CHAR_LIMIT = 6000000
+# First lines of every generated model class (DocrioModels, DocrioCommonModels, Docrio<Tag>Models)
+MODELS_CLASS_HEADER = '/**\n * Generated Docrio API models\n'
+# A reference to a model through any of the model classes, e.g. DocrioModels.MovePostRequest
+MODEL_REFERENCE = re.compile(r"\bDocrio\w*Models\.(\w+)")
+MODEL_CLASS_NAME = re.compile(r"Docrio\w*Models")
+
+
+def generator_sources(*modules: str) -> list:
+    """Source files whose contents invalidate a backend's incremental manifest"""
+    return [os.path.join(GENERATOR_DIR, module) for module in ('docrio_spec.py',) + modules]
+
+
+def spec_cache_sources() -> list:
+    """Source files whose contents invalidate cached compiled specs (the compiler and prepare() passes)"""
+    return generator_sources('codegen_cache.py', 'generate_docrio_models.py', 'generate_docrio_python.py',
+                             'generate_docrio_python_models.py')
+
+
+def parse_spec_targets(values: List[str]) -> List[Tuple[str, str]]:
+    """Turn --spec arguments of the form PATH or PATH=OUTPUT_DIR into (spec, output dir) pairs"""
+    targets = []
+    for value in values or ['swagger.json']:
+        spec_file, _, output_dir = value.partition('=')
+        targets.append((spec_file, output_dir or DEFAULT_OUTPUT_DIR))
+    output_dirs = [output_dir for _, output_dir in targets]
+    if len(set(output_dirs)) != len(output_dirs):
+        raise SystemExit('Each --spec needs its own output directory (use PATH=OUTPUT_DIR)')
+    return targets
+
+
+def measure_output(spec: DocrioSpec) -> Tuple[int, int]:
+    """Render the generated Apex classes for a spec into a counter and return (lines, characters)"""
+    sink = CountingSink()
+    models = ApexGenerator(spec)
+    for outer_class in models.model_class_names():
+        models.generate_model_classes(CodeEmitter(sink), outer_class=outer_class)
+    service = ServiceGenerator(spec)
+    service.generate_service_class(CodeEmitter(sink))
+    service.generate_bulk_class(CodeEmitter(sink))
+    return sink.lines, sink.characters
+
+
+def report_tree_shaking(full: DocrioSpec, subset: DocrioSpec):
+    """Print what narrowing the spec to an operation subset kept and saved"""
+    full_lines, full_chars = measure_output(full)
+    kept_lines, kept_chars = measure_output(subset)
+    print(f"Kept {len(subset.endpoints)}/{len(full.endpoints)} operations and "
+          f"{len(subset.model_names)}/{len(full.model_names)} model classes")
+    if full_chars:
+        print(f"Saved {full_lines - kept_lines} lines and {full_chars - kept_chars} characters "
+              f"({(full_chars - kept_chars) / full_chars:.0%})")
+    for cycle in subset.cycles:
+        print(f"$ref cycle: {' -> '.join(cycle)}")
+
+
+def retire_model_classes(output_dir: str, model_classes: List[str]) -> List[str]:
+    """Delete generated model classes this run no longer writes, e.g. DocrioModels once models are sharded"""
+    retired = []
+    for filename in sorted(os.listdir(output_dir)):
+        class_name = filename[:-len('.cls')]
+        if not filename.endswith('.cls') or class_name in model_classes:
+            continue
+        if not MODEL_CLASS_NAME.fullmatch(class_name):
+            continue
+        filepath = os.path.join(output_dir, filename)
+        with open(filepath, 'r') as f:
+            if f.read(len(MODELS_CLASS_HEADER)) != MODELS_CLASS_HEADER:
+                continue
+        os.remove(filepath)
+        if os.path.exists(f"{filepath}-meta.xml"):
+            os.remove(f"{filepath}-meta.xml")
+        retired.append(class_name)
+    return retired
+
+
+def update_model_references(output_dir: str, spec: DocrioSpec, generated: List[str]) -> List[str]:
+    """Point model references in other Apex classes (tests, controllers) at the classes now holding them"""
+    def qualified(match: 're.Match') -> str:
+        name = match.group(1)
+        return spec.qualified_model(name) if name in spec.model_names else match.group(0)
+
+    updated = []
+    for filename in sorted(os.listdir(output_dir)):
+        if not filename.endswith('.cls') or filename[:-len('.cls')] in generated:
+            continue
+        filepath = os.path.join(output_dir, filename)
+        with open(filepath, 'r', newline='') as f:
+            content = f.read()
+        if write_if_changed(filepath, MODEL_REFERENCE.sub(qualified, content)):
+            updated.append(filename[:-len('.cls')])
+    return updated
+
+
+def report_size_budget(output_dir: str, class_names: List[str]):
+    """Print the size of each generated class against the Apex per-class and per-org limits"""
+    total = 0
+    print(f"{'class':<36} {'lines':>8} {'characters':>11} {'of class limit':>15}")
+    for class_name in class_names:
+        with open(os.path.join(output_dir, f"{class_name}.cls"), 'r') as f:
+            content = f.read()
+        total += len(content)
+        print(f"{class_name:<36} {content.count(chr(10)):>8} {len(content):>11} "
+              f"{len(content) / APEX_CLASS_CHAR_LIMIT:>15.1%}")
+    print(f"{'total':<36} {'':>8} {total:>11} {total / APEX_ORG_CHAR_LIMIT:>12.1%} of org limit")
+
+
+def generate_spec(spec_file: str, output_dir: str, manifest_dir: str, incremental: bool, pool=None,
+                  include: Optional[List[str]] = None, shard_models: bool = False,
+                  python_dir: Optional[str] = None, cache: Optional[SpecCache] = None):
+    """Generate DocrioModels.cls and DocrioService.cls (and optionally the Python modules) for one spec"""
+    # Parse and resolve the spec once (or load it compiled from the cache); all backends share the IR.
+    # include tree-shakes down to the selected operations and the models they reach; shard_models
+    # splits models into per-tag outer classes plus a common class for shared schemas.
+    load = cache.load if cache is not None else DocrioSpec.load
+    spec = load(spec_file, include, shard_models)
+    if include:
+        if not spec.endpoints:
+            raise SystemExit(f"--include matched no operations in {spec_file}")
+        report_tree_shaking(load(spec_file), spec)
+
+    models_manifest = None
+    service_manifest = None
+    python_manifest = None
+    python_models_manifest = None
+    python_validators_manifest = None
+    if incremental:
+        models_manifest = CodegenManifest(os.path.join(manifest_dir, 'DocrioModels.manifest.json'),
+                                          *generator_sources('generate_docrio_models.py'))
+        service_manifest = CodegenManifest(os.path.join(manifest_dir, 'DocrioService.manifest.json'),
+                                           *generator_sources('generate_docrio_service.py'))
+        models_manifest.load()
+        service_manifest.load()
+        if python_dir:
+            python_manifest = CodegenManifest(os.path.join(manifest_dir, 'DocrioPythonClient.manifest.json'),
+                                              *generator_sources('generate_docrio_python.py'))
+            python_manifest.load()
+            python_models_manifest = CodegenManifest(
+                os.path.join(manifest_dir, 'DocrioPythonModels.manifest.json'),
+                *generator_sources('generate_docrio_python.py', 'generate_docrio_python_models.py'))
+            python_models_manifest.load()
+            python_validators_manifest = CodegenManifest(
+                os.path.join(manifest_dir, 'DocrioPythonValidators.manifest.json'),
+                *generator_sources('generate_docrio_python.py', 'generate_docrio_python_validators.py'))
+            python_validators_manifest.load()
+
+    models = ApexGenerator(spec, models_manifest)
+    models.output_dir = output_dir
+    model_classes = models.generate(pool)
+    service = ServiceGenerator(spec, service_manifest)
+    service.output_dir = output_dir
+    service.generate(pool)
+    # Switching between single and sharded models moves every model to another outer class
+    for class_name in retire_model_classes(output_dir, model_classes):
+        print(f"Removed {class_name}.cls, which no longer holds any model")
+    generated = model_classes + ['DocrioService', 'DocrioBulkJob']
+    for class_name in update_model_references(output_dir, spec, generated):
+        print(f"Updated model references in {class_name}.cls")
+    if shard_models:
+        report_size_budget(output_dir, generated)
+    if python_dir:
+        client = PythonClientGenerator(spec, python_manifest)
+        client.output_dir = python_dir
+        client.generate(pool)
+        python_models = PythonModelGenerator(spec, python_models_manifest)
+        python_models.output_dir = python_dir
+        python_models.generate(pool)
+        python_validators = PythonValidatorGenerator(spec, python_validators_manifest)
+        python_validators.output_dir = python_dir
+        python_validators.generate(pool)
+
+    if incremental:
+        models_manifest.save()
+        service_manifest.save()
+        print(models_manifest.summary(f"{spec_file} DocrioModels"))
+        print(service_manifest.summary(f"{spec_file} DocrioService"))
+        if python_manifest is not None:
+            python_manifest.save()
+            print(python_manifest.summary(f"{spec_file} Python client"))
+            python_models_manifest.save()
+            print(python_models_manifest.summary(f"{spec_file} Python models"))
+            python_validators_manifest.save()
+            print(python_validators_manifest.summary(f"{spec_file} Python validators"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate DocrioModels.cls and DocrioService.cls from swagger.json')
+    parser.add_argument('--spec', action='append', metavar='PATH[=OUTPUT_DIR]',
+                        help=f"OpenAPI spec to generate from (repeatable; default swagger.json={DEFAULT_OUTPUT_DIR})")
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only re-render inner classes and service methods whose inputs changed since the last run')
+    parser.add_argument('--manifest-dir', default='.codegen',
+                        help='Directory holding the fragment manifests used by --incremental')
+    parser.add_argument('--spec-cache', default=os.path.join('.codegen', 'specs'), metavar='DIR',
+                        help='Directory caching compiled specs between runs, keyed by spec and generator hashes')
+    parser.add_argument('--no-spec-cache', action='store_true',
+                        help='Always parse and resolve the spec instead of using the compiled-spec cache')
+    parser.add_argument('--include', action='append', metavar='SELECTOR',
+                        help='Only generate operations matching a path prefix (/files), an operationId or method '
+                             'name, or case-insensitively a tag, tag word or first path segment (Files, Search); '
+                             'repeatable, plus the models they reach')
+    parser.add_argument('--shard-models', action='store_true',
+                        help='Emit per-tag model classes (e.g. DocrioArchivalToolModels) plus DocrioCommonModels '
+                             'instead of one DocrioModels class, and report their sizes')
+    parser.add_argument('--python-client', nargs='?', const=DEFAULT_PYTHON_DIR, metavar='DIR',
+                        help=f"Also generate the Python client, models and validators modules into DIR "
+                             f"(default {DEFAULT_PYTHON_DIR})")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Worker processes for rendering classes and methods (0 = one per core)')
+    args = parser.parse_args()
+
+    targets = parse_spec_targets(args.spec)
+    cache = None if args.no_spec_cache else SpecCache(args.spec_cache, *spec_cache_sources())
+    pool = create_pool(args.jobs)
+    try:
+        for spec_file, output_dir in targets:
+            manifest_dir = args.manifest_dir
+            python_dir = args.python_client
+            if len(targets) > 1:
+                # Keep each spec's fragments (and Python clients) apart
+                spec_name = os.path.splitext(os.path.basename(spec_file))[0]
+                manifest_dir = os.path.join(manifest_dir, spec_name)
+                if python_dir:
+                    python_dir = os.path.join(python_dir, spec_name)
+            generate_spec(spec_file, output_dir, manifest_dir, args.incremental, pool, args.include,
+                          args.shard_models, python_dir, cache)
+        if cache is not None:
+            # Saved after generating, so entries include what the backends resolved while preparing
+            cache.save()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+if __name__ == '__main__':
+    main()
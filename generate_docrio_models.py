@@ -1,15 +1,23 @@
-import json
 import os
 import re
-import string
-import random
-from typing import Dict, List, Any
+from concurrent.futures import Executor
+from typing import Dict, List, Any, Optional, Set
+
+from codegen_emitter import CodeEmitter, StreamingOutput
+from codegen_manifest import CodegenManifest, content_hash, write_if_changed
+from codegen_parallel import RenderTask, render_fragments
+from docrio_spec import MODELS_CLASS, DocrioSpec
 
 class ApexGenerator:
-    def __init__(self):
+    def __init__(self, spec: DocrioSpec, manifest: Optional[CodegenManifest] = None):
         self.types = {}  # Store all encountered types
         self.output_dir = 'force-app/main/default/classes'
-        self.schemas = {}
+        self.spec = spec
+        self.schemas = spec.schemas
+        self.anonymous_types: Dict[str, dict] = {}  # Interned inline object shapes by class name
+        self.anonymous_owners: Dict[str, Set[str]] = {}  # Outer classes whose models use each shape
+        self.prepared = False
+        self.manifest = manifest  # Fragment cache for incremental mode (None = full rebuild)
         
     def sanitize_property_name(self, prop_name: str) -> str:
         """Convert any property name into a valid Apex identifier"""
@@ -55,11 +63,6 @@ class ApexGenerator:
         """Check if a field name is a Salesforce API name"""
         return '__' in field_name or field_name.endswith('__c')
 
-    def load_swagger(self, swagger_file: str):
-        with open(swagger_file, 'r') as f:
-            swagger = json.load(f)
-            self.schemas = swagger['components']['schemas']
-            
     def register_type(self, type_name: str, schema: dict) -> str:
         """Register a type in our dictionary and return its Apex type name"""
         if type_name in self.types:
@@ -67,11 +70,11 @@ class ApexGenerator:
             
         if isinstance(schema, str):
             # Handle case where schema is just a string reference
-            return f"DocrioModels.{schema}"
+            return self.spec.qualified_model(schema)
             
         if schema.get('type') == 'object':
             # This is a complex type that needs an inner class
-            apex_type = f"DocrioModels.{type_name}"
+            apex_type = self.spec.qualified_model(type_name)
             self.types[type_name] = apex_type
             # Process its properties when generating the class
             return apex_type
@@ -89,7 +92,7 @@ class ApexGenerator:
                 ref_schema = self.schemas.get(ref_type)
                 if ref_schema:
                     self.register_type(ref_type, ref_schema)
-            return f"DocrioModels.{ref_type}"
+            return self.spec.qualified_model(ref_type)
             
         # Handle primitive types
         type_map = {
@@ -100,36 +103,83 @@ class ApexGenerator:
         }
         return type_map.get(schema.get('type'), 'Object')
 
-    def get_apex_type(self, schema: dict, parent_class: str = None) -> str:
-        """Get the Apex type for a schema, with context-aware anonymous object handling"""
+    def anonymous_shape(self, schema: Any) -> Any:
+        """Reduce an inline schema to the parts that affect generated code, with sorted properties"""
+        if not isinstance(schema, dict):
+            return schema
+        if '$ref' in schema:
+            return {'$ref': schema['$ref']}
+        shape = {'type': schema.get('type')}
+        if 'properties' in schema:
+            shape['properties'] = {
+                name: self.anonymous_shape(schema['properties'][name])
+                for name in sorted(schema['properties'])
+            }
+        if 'items' in schema:
+            shape['items'] = self.anonymous_shape(schema['items'])
+        return shape
+
+    def intern_anonymous_type(self, schema: dict, owner: Optional[str] = None) -> str:
+        """Return the single shared class for an inline object shape, registering it on first sight.
+
+        The class name is derived from a hash of the shape, so identical inline objects
+        anywhere in the spec map to one class and the name is stable across runs. owner is
+        the outer class of the model using the shape; it decides where the shape is emitted.
+        """
+        shape = self.anonymous_shape(schema)
+        type_name = f"Anonymous{content_hash(shape)[:8].upper()}"
+        existing = self.anonymous_types.get(type_name)
+        if existing is None:
+            self.anonymous_types[type_name] = shape
+            self.anonymous_owners[type_name] = set()
+        elif existing != shape:
+            raise ValueError(f"Anonymous class name collision for {type_name}")
+        if existing is None or (owner is not None and owner not in self.anonymous_owners[type_name]):
+            if owner is not None:
+                self.anonymous_owners[type_name].add(owner)
+            # Intern nested inline objects too, so every shape (and its owners) is known before emitting
+            self.collect_anonymous_types(shape, owner)
+        return f"{self.anonymous_class(type_name)}.{type_name}"
+
+    def anonymous_class(self, type_name: str) -> str:
+        """Outer class for an anonymous shape: its only owner, or the common class if shared"""
+        owners = self.anonymous_owners.get(type_name, set())
+        return next(iter(owners)) if len(owners) == 1 else self.spec.common_model_class
+
+    def collect_anonymous_types(self, schema: Any, owner: Optional[str] = None):
+        """Intern every inline object shape reachable from a schema's properties or array items"""
+        if not isinstance(schema, dict):
+            return
+        candidates = list(schema.get('properties', {}).values())
+        if schema.get('type') == 'array':
+            candidates.append(schema)
+        for prop_schema in candidates:
+            if not isinstance(prop_schema, dict):
+                continue
+            # Unwrap arrays (of arrays) down to their item schema
+            while prop_schema.get('type') == 'array' and isinstance(prop_schema.get('items'), dict):
+                prop_schema = prop_schema['items']
+            if prop_schema.get('type') == 'object' and 'properties' in prop_schema:
+                self.intern_anonymous_type(prop_schema, owner)
+
+    def get_apex_type(self, schema: dict) -> str:
+        """Get the Apex type for a schema, mapping inline objects to their interned anonymous class"""
         if isinstance(schema, str):
             # Handle case where schema is just a string reference
-            return f"DocrioModels.{schema}"
+            return self.spec.qualified_model(schema)
             
         if '$ref' in schema:
             ref_type = schema['$ref'].split('/')[-1]
-            return self.types.get(ref_type, f"DocrioModels.{ref_type}")
+            return self.types.get(ref_type, self.spec.qualified_model(ref_type))
             
         if schema.get('type') == 'object':
-            # For anonymous objects, return a nested class reference
+            # Anonymous objects share one top-level class per distinct shape
             if 'properties' in schema:
-                # Create a name with Anonymous + 5 random characters
-                random_chars = ''.join(random.choices(string.ascii_uppercase + string.digits, k=5))
-                type_name = f"Anonymous{random_chars}"
-                # If we have a parent class context, return nested reference
-                if parent_class:
-                    return f"{parent_class}.{type_name}"
-                else:
-                    # Fallback to global registration (for top-level schemas)
-                    while type_name in self.types:
-                        random_chars = ''.join(random.choices(string.ascii_uppercase + string.digits, k=5))
-                        type_name = f"Anonymous{random_chars}"
-                    self.register_type(type_name, schema)
-                    return self.types[type_name]
+                return self.intern_anonymous_type(schema)
             return 'Map<String, Object>'
             
         if schema.get('type') == 'array' and 'items' in schema:
-            item_type = self.get_apex_type(schema['items'], parent_class)
+            item_type = self.get_apex_type(schema['items'])
             return f"List<{item_type}>"
             
         # Handle primitive types
@@ -167,81 +217,29 @@ class ApexGenerator:
         result += "         */"
         return result
 
-    def generate_nested_anonymous_classes(self, schema: dict, parent_class: str, indent_level: int = 2, generated_classes: set = None) -> tuple:
-        """Generate nested anonymous classes and return (nested_classes_content, property_type_mappings)"""
-        if generated_classes is None:
-            generated_classes = set()
-            
-        nested_content = ""
-        type_mappings = {}  # Maps property names to their anonymous class names
-        indent = "    " * indent_level
-        
-        if 'properties' in schema:
-            for prop_name, prop_schema in schema['properties'].items():
-                # Skip if prop_schema is a string reference (should not happen in inline anonymous objects)
-                if not isinstance(prop_schema, dict):
-                    continue
-                    
-                if prop_schema.get('type') == 'object' and 'properties' in prop_schema:
-                    # Generate anonymous class name
-                    random_chars = ''.join(random.choices(string.ascii_uppercase + string.digits, k=5))
-                    anon_class_name = f"Anonymous{random_chars}"
-                    
-                    # Ensure uniqueness and prevent infinite recursion
-                    class_signature = str(sorted(prop_schema['properties'].keys()))
-                    if class_signature not in generated_classes:
-                        generated_classes.add(class_signature)
-                        type_mappings[prop_name] = anon_class_name
-                        
-                        # Generate the nested class recursively
-                        nested_content += self.generate_inner_class(anon_class_name, prop_schema, indent_level, generated_classes)
-                        
-                elif prop_schema.get('type') == 'array' and 'items' in prop_schema:
-                    items = prop_schema['items']
-                    if isinstance(items, dict) and items.get('type') == 'object' and 'properties' in items:
-                        # Generate anonymous class name for array items
-                        random_chars = ''.join(random.choices(string.ascii_uppercase + string.digits, k=5))
-                        anon_class_name = f"Anonymous{random_chars}"
-                        
-                        # Ensure uniqueness and prevent infinite recursion
-                        class_signature = str(sorted(items['properties'].keys()))
-                        if class_signature not in generated_classes:
-                            generated_classes.add(class_signature)
-                            type_mappings[f"{prop_name}_items"] = anon_class_name
-                            
-                            # Generate the nested class recursively
-                            nested_content += self.generate_inner_class(anon_class_name, items, indent_level, generated_classes)
-                            
-        return nested_content, type_mappings
+    def generate_inner_class(self, class_name: str, schema: dict, indent_level: int = 1) -> str:
+        """Generate an inner class definition as a string"""
+        out = CodeEmitter()
+        self.emit_inner_class(out, class_name, schema, indent_level)
+        return out.getvalue()
 
-    def generate_inner_class(self, class_name: str, schema: dict, indent_level: int = 1, generated_classes: set = None) -> str:
-        """Generate an inner class definition with proper nesting support"""
+    def emit_inner_class(self, out: CodeEmitter, class_name: str, schema: dict, indent_level: int = 1):
+        """Emit an inner class definition"""
         if isinstance(schema, str):
             # If schema is just a string reference, look it up
             schema = self.schemas.get(schema, {'type': 'object'})
         
-        if generated_classes is None:
-            generated_classes = set()
-        
-        indent = "    " * indent_level
-        
-        # First, generate all nested anonymous classes
-        nested_content, type_mappings = self.generate_nested_anonymous_classes(schema, class_name, indent_level + 1, generated_classes)
-        
-        # Start class definition
-        class_content = f"\n{indent}public class {class_name} {{"
-        
-        # Add nested anonymous classes first
-        class_content += nested_content
+        level = indent_level
+        indent = out.indent_unit * level
         
-        # Generate properties
-        properties_content = ""
-        constructor_content = f"\n{indent}    public {class_name}() {{"
-        serialization_content = ""
-        deserialization_content = ""
+        # Members are collected in separate buffers and emitted in order at the end
+        properties = CodeEmitter()
+        constructor = CodeEmitter()
+        serialization = CodeEmitter()
+        deserialization = CodeEmitter()
+        constructor.line(level + 1, f"public {class_name}() {{")
         
         if 'properties' in schema:
-            required = schema.get('required', [])
             for prop_name, prop_schema in schema['properties'].items():
                 # Sanitize the property name for Apex
                 apex_prop_name = self.sanitize_property_name(prop_name)
@@ -250,123 +248,159 @@ class ApexGenerator:
                 if isinstance(prop_schema, dict) and 'description' in prop_schema:
                     comment = self.format_description(prop_schema['description'])
                     if comment:
-                        properties_content += f"\n{comment.replace('        ', indent + '    ')}"
+                        properties.write(f"\n{comment.replace('        ', indent + '    ')}")
                 
                 if self.is_salesforce_field(prop_name):
                     # For Salesforce API fields, create a DocrioField property
                     apex_name = self.get_apex_friendly_name(prop_name)
-                    properties_content += f"\n{indent}    public DocrioField {apex_name} {{ get; set; }}"
-                    constructor_content += f"\n{indent}        this.{apex_name} = new DocrioField('{prop_name}');"
-                    # Add to serialization content
-                    serialization_content += f"\n{indent}        if({apex_name} != null) jsonMap.put('{prop_name}', {apex_name}.toJson());"
-                    # Add to deserialization content
-                    deserialization_content += f"""
-{indent}        if(jsonMap.containsKey('{prop_name}')) {{
-{indent}            obj.{apex_name}.setValue((String)jsonMap.get('{prop_name}'));
-{indent}        }}"""
+                    properties.line(level + 1, f"public DocrioField {apex_name} {{ get; set; }}")
+                    constructor.line(level + 2, f"this.{apex_name} = new DocrioField('{prop_name}');")
+                    serialization.line(level + 2, f"if({apex_name} != null) jsonMap.put('{prop_name}', {apex_name}.toJson());")
+                    deserialization.line(level + 2, f"if(jsonMap.containsKey('{prop_name}')) {{")
+                    deserialization.line(level + 3, f"obj.{apex_name}.setValue((String)jsonMap.get('{prop_name}'));")
+                    deserialization.line(level + 2, "}")
                 else:
-                    # Determine property type
-                    if prop_name in type_mappings:
-                        # This property has an anonymous nested class
-                        prop_type = type_mappings[prop_name]
-                    elif isinstance(prop_schema, dict) and prop_schema.get('type') == 'array' and f"{prop_name}_items" in type_mappings:
-                        # This is an array with anonymous item type
-                        item_type = type_mappings[f"{prop_name}_items"]
-                        prop_type = f"List<{item_type}>"
-                    else:
-                        # Use regular type resolution
-                        prop_type = self.get_apex_type(prop_schema, class_name)
-                        
-                    properties_content += f"\n{indent}    public {prop_type} {apex_prop_name} {{ get; set; }}"
-                    # Add to serialization content
-                    serialization_content += f"\n{indent}        if({apex_prop_name} != null) jsonMap.put('{prop_name}', {apex_prop_name});"
-                    # Add to deserialization content
-                    deserialization_content += f"""
-{indent}        if(jsonMap.containsKey('{prop_name}')) {{
-{indent}            obj.{apex_prop_name} = ({prop_type})jsonMap.get('{prop_name}');
-{indent}        }}"""
+                    # Determine property type (inline objects resolve to interned anonymous classes)
+                    prop_type = self.get_apex_type(prop_schema)
+                    properties.line(level + 1, f"public {prop_type} {apex_prop_name} {{ get; set; }}")
+                    serialization.line(level + 2, f"if({apex_prop_name} != null) jsonMap.put('{prop_name}', {apex_prop_name});")
+                    deserialization.line(level + 2, f"if(jsonMap.containsKey('{prop_name}')) {{")
+                    deserialization.line(level + 3, f"obj.{apex_prop_name} = ({prop_type})jsonMap.get('{prop_name}');")
+                    deserialization.line(level + 2, "}")
         
-        # Add properties to class
-        class_content += properties_content
+        # Class header, properties and constructor
+        out.line(level, f"public class {class_name} {{")
+        out.extend(properties)
+        out.extend(constructor)
+        out.line(level + 1, "}")
         
-        # Add constructor
-        constructor_content += f"\n{indent}    }}"
-        class_content += constructor_content
+        # Serialization method
+        out.write("\n")
+        out.line(level + 1, "public Map<String, Object> toJson() {")
+        out.line(level + 2, "Map<String, Object> jsonMap = new Map<String, Object>();")
+        out.extend(serialization)
+        out.line(level + 2, "return jsonMap;")
+        out.line(level + 1, "}")
         
-        # Add serialization method
-        class_content += f"""
-
-{indent}    public Map<String, Object> toJson() {{
-{indent}        Map<String, Object> jsonMap = new Map<String, Object>();"""
-        class_content += serialization_content
-        class_content += f"""
-{indent}        return jsonMap;
-{indent}    }}"""
-        
-        # Add deserialization method
-        class_content += f"""
-
-{indent}    public static {class_name} fromJson(Map<String, Object> jsonMap) {{
-{indent}        {class_name} obj = new {class_name}();"""
-        class_content += deserialization_content
-        class_content += f"""
-{indent}        return obj;
-{indent}    }}"""
+        # Deserialization method
+        out.write("\n")
+        out.line(level + 1, f"public static {class_name} fromJson(Map<String, Object> jsonMap) {{")
+        out.line(level + 2, f"{class_name} obj = new {class_name}();")
+        out.extend(deserialization)
+        out.line(level + 2, "return obj;")
+        out.line(level + 1, "}")
                 
         # Close class
-        class_content += f"\n{indent}}}"
-        return class_content
+        out.line(level, "}")
+
+    def prepare(self):
+        """Register all types and intern every inline object shape before rendering"""
+        if self.prepared:
+            return
+        resolved = self.spec.resolved.get('apex_models')
+        if resolved is not None:
+            # Loaded with the spec from the compiled-spec cache
+            self.types, self.anonymous_types, self.anonymous_owners = resolved
+        else:
+            for type_name, schema in self.schemas.items():
+                self.register_type(type_name, schema)
+                self.collect_anonymous_types(schema, self.spec.model_class(type_name))
+            self.spec.resolved['apex_models'] = (self.types, self.anonymous_types, self.anonymous_owners)
+        self.prepared = True
+
+    def property_types(self, schema: dict) -> Dict[str, str]:
+        """Apex types of a schema's properties; a class's output depends on these besides its schema"""
+        return {
+            name: self.get_apex_type(prop_schema)
+            for name, prop_schema in schema.get('properties', {}).items()
+            if isinstance(prop_schema, dict)
+        }
+
+    def class_tasks(self) -> List[RenderTask]:
+        """Render tasks for every inner class, in output order"""
+        # Top-level schemas in spec order, then each distinct anonymous shape once, in name order
+        args = [('schema', name) for name, schema in self.schemas.items() if schema.get('type') == 'object']
+        args += [('anonymous', name) for name in sorted(self.anonymous_types)]
+        tasks = []
+        for task in args:
+            schema = self.task_schema(task)
+            inputs = {'name': task[1], 'schema': schema, 'types': self.property_types(schema)}
+            tasks.append((f"schema:{task[1]}", inputs, task))
+        return tasks
+
+    def task_schema(self, task: tuple) -> dict:
+        """Schema behind a class_tasks() argument"""
+        kind, type_name = task
+        return self.anonymous_types[type_name] if kind == 'anonymous' else self.schemas[type_name]
+
+    def task_class(self, task: tuple) -> str:
+        """Outer class a class_tasks() argument is emitted into"""
+        kind, type_name = task
+        return self.anonymous_class(type_name) if kind == 'anonymous' else self.spec.model_class(type_name)
 
-    def generate_model_classes(self):
-        """Generate all model classes as inner classes"""
-        class_content = """/**
+    def render_task(self, task: tuple) -> str:
+        """Render one inner class from a class_tasks() argument"""
+        return self.generate_inner_class(task[1], self.task_schema(task))
+
+    def model_class_names(self) -> List[str]:
+        """Outer model classes that will be generated (one unless models are sharded)"""
+        self.prepare()
+        return sorted({self.task_class(task) for _, _, task in self.class_tasks()} or {self.spec.common_model_class})
+
+    def generate_model_classes(self, out: CodeEmitter, pool: Optional[Executor] = None,
+                               outer_class: str = MODELS_CLASS):
+        """Emit the model classes belonging to one outer class as its inner classes"""
+        out.write(f"""/**
  * Generated Docrio API models
  */
-public class DocrioModels {
-"""
-        # First pass: Register all types
-        for type_name, schema in self.schemas.items():
-            self.register_type(type_name, schema)
-            
-        # Second pass: Generate inner classes (top-level schemas only - no anonymous flattening)
-        for type_name, schema in self.schemas.items():
-            if schema.get('type') == 'object':
-                class_content += self.generate_inner_class(type_name, schema)
-                
-        class_content += "}\n"
-        return class_content
+public class {outer_class} {{
+""")
+        self.prepare()
+        tasks = [task for task in self.class_tasks() if self.task_class(task[2]) == outer_class]
+        for fragment in render_fragments(self, tasks, pool):
+            out.write(fragment)
+        out.write("}\n")
 
-    def generate_service_class(self):
-        """Generate the service class with API methods"""
-        # Service class generation code here...
-        pass
+    def open_output(self, filename: str) -> StreamingOutput:
+        """Open a streaming writer for a class in the output directory, and write its meta.xml"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        filepath = os.path.join(self.output_dir, filename)
+        self.write_meta(filepath)
+        return StreamingOutput(filepath)
 
-    def write_file(self, filename: str, content: str):
-        """Write content to a file in the output directory"""
+    def write_file(self, filename: str, content: str) -> bool:
+        """Write content to a file in the output directory, skipping files whose bytes are unchanged"""
         os.makedirs(self.output_dir, exist_ok=True)
         filepath = os.path.join(self.output_dir, filename)
-        with open(filepath, 'w') as f:
-            f.write(content)
-        
-        # Also write the meta.xml file
+        changed = write_if_changed(filepath, content)
+        self.write_meta(filepath)
+        return changed
+
+    def write_meta(self, filepath: str):
+        """Write the meta.xml file accompanying a generated class"""
         meta_content = """<?xml version="1.0" encoding="UTF-8"?>
 <ApexClass xmlns="http://soap.sforce.com/2006/04/metadata">
     <apiVersion>57.0</apiVersion>
     <status>Active</status>
 </ApexClass>"""
-        with open(f"{filepath}-meta.xml", 'w') as f:
-            f.write(meta_content)
+        write_if_changed(f"{filepath}-meta.xml", meta_content)
+
+    def generate(self, pool: Optional[Executor] = None) -> List[str]:
+        """Generate all model classes, optionally rendering inner classes across a process pool.
 
-    def generate(self):
-        """Generate all Apex classes"""
-        # Generate and write model classes
-        models_content = self.generate_model_classes()
-        self.write_file('DocrioModels.cls', models_content)
+        Returns the names of the outer classes written.
+        """
+        class_names = self.model_class_names()
+        for outer_class in class_names:
+            # Stream model classes straight to disk
+            with self.open_output(f"{outer_class}.cls") as out:
+                self.generate_model_classes(out, pool, outer_class)
+        return class_names
 
 def main():
-    generator = ApexGenerator()
-    generator.load_swagger('swagger.json')
-    generator.generate()
+    # Model and service generation share one compiled spec; see generate_docrio.py
+    from generate_docrio import main as generate_main
+    generate_main()
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
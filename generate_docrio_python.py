@@ -0,0 +1,346 @@
+import keyword
+import os
+import re
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional
+
+from codegen_emitter import CodeEmitter, StreamingOutput
+from codegen_manifest import CodegenManifest
+from codegen_parallel import RenderTask, render_fragments
+from docrio_spec import DocrioSpec, ref_name
+
+DEFAULT_PYTHON_DIR = 'docrio_client'
+PYTHON_TYPES = {'string': 'str', 'integer': 'int', 'number': 'float', 'boolean': 'bool'}
+MAX_LINE_LENGTH = 110
+
+
+class PythonClientGenerator:
+    """Generates an asyncio Python client (docrio_client/client.py) from the compiled spec"""
+
+    def __init__(self, spec: DocrioSpec, manifest: Optional[CodegenManifest] = None):
+        self.output_dir = DEFAULT_PYTHON_DIR
+        self.spec = spec
+        self.manifest = manifest  # Fragment cache for incremental mode (None = full rebuild)
+
+    def python_name(self, name: str) -> str:
+        """Turn a parameter name into a valid Python identifier, keeping it as close to the spec as possible"""
+        identifier = re.sub(r'\W', '_', name)
+        if identifier[:1].isdigit():
+            identifier = f"_{identifier}"
+        if keyword.iskeyword(identifier) or identifier in ('self', 'client'):
+            identifier = f"{identifier}_"
+        return identifier
+
+    def python_type(self, schema: Any) -> str:
+        """Annotation for a parameter or body schema"""
+        schema = self.spec.resolve_schema(schema) if isinstance(schema, dict) else None
+        if not isinstance(schema, dict):
+            return 'Any'
+        if schema.get('type') == 'array':
+            return f"List[{self.python_type(schema.get('items'))}]"
+        if schema.get('type') == 'object':
+            return 'Dict[str, Any]'
+        return PYTHON_TYPES.get(schema.get('type'), 'Any')
+
+    def request_validator(self, endpoint: Dict) -> str:
+        """Name of the validators.py schema a request body is checked against"""
+        schema = endpoint['request_schema']
+        if '$ref' in schema:
+            return ref_name(schema['$ref'])
+        return f"{endpoint['method_name'][0].upper()}{endpoint['method_name'][1:]}Body"
+
+    def get_response_type(self, endpoint: Dict) -> str:
+        """Annotation for the parsed response of an operation"""
+        if endpoint['response_code'] is None:
+            return 'None'
+        if endpoint['response_schema'] is None:
+            return 'Any'
+        return self.python_type(endpoint['response_schema'])
+
+    def response_model(self, endpoint: Dict) -> Optional[str]:
+        """Component schema name the response is an instance (or list) of, for the docstring"""
+        schema = endpoint['response_schema']
+        if schema is None:
+            return None
+        if schema.get('type') == 'array':
+            schema = schema.get('items', {})
+        return ref_name(schema['$ref']) if '$ref' in schema else None
+
+    def base_url(self) -> str:
+        """Default base URL: the first server in the spec, with its variables set to their defaults"""
+        servers = self.spec.swagger.get('servers') or [{}]
+        url = servers[0].get('url', '')
+        for name, variable in servers[0].get('variables', {}).items():
+            url = url.replace(f"{{{name}}}", str(variable.get('default', '')))
+        return url.rstrip('/')
+
+    def build_path(self, path: str, names: Dict[str, str]) -> str:
+        """Convert a URL template into a Python expression with quoted path parameters"""
+        if '{' not in path:
+            return repr(path)
+        expression = re.sub(r'{([^}]+)}', lambda m: f"{{quote(str({names[m.group(1)]}), safe='')}}", path)
+        return f'f"{expression}"'
+
+    def generate_endpoint_method(self, endpoint: Dict) -> str:
+        """Generate a single endpoint coroutine as a string"""
+        out = CodeEmitter()
+        self.emit_endpoint_method(out, endpoint)
+        return out.getvalue()
+
+    def endpoint_arguments(self, endpoint: Dict) -> List[Dict[str, Any]]:
+        """Arguments of an endpoint coroutine: path parameters, then query parameters, then the body"""
+        arguments = []
+        for param in re.findall(r'{([^}]+)}', endpoint['path']):
+            arguments.append({'name': self.python_name(param), 'spec_name': param, 'kind': 'path',
+                              'annotation': 'str', 'required': True})
+        for param in endpoint['parameters']:
+            if param.get('in') == 'query':
+                arguments.append({'name': self.python_name(param['name']), 'spec_name': param['name'],
+                                  'kind': 'query', 'annotation': self.python_type(param.get('schema')),
+                                  'required': bool(param.get('required'))})
+        if endpoint['request_schema'] is not None:
+            arguments.append({'name': 'requestBody', 'spec_name': 'requestBody', 'kind': 'body',
+                              'annotation': self.python_type(endpoint['request_schema']),
+                              'required': bool(endpoint['operation']['requestBody'].get('required'))})
+        return arguments
+
+    def write_signature(self, out: CodeEmitter, name: str, params: List[str], response_type: str,
+                        definition: str = 'async def'):
+        """Write a def line, one argument per line when it would be too long"""
+        signature = f"    {definition} {name}("
+        args = ', '.join(['self'] + params)
+        if len(signature) + len(args) + len(response_type) + 6 > MAX_LINE_LENGTH:
+            # One argument per line, aligned with the opening parenthesis
+            args = f",\n{' ' * len(signature)}".join(['self'] + params)
+        out.write(f"\n{signature}{args}) -> {response_type}:\n")
+
+    def emit_endpoint_method(self, out: CodeEmitter, endpoint: Dict):
+        """Emit a single endpoint coroutine, followed by its batched and paginated variants if it has them"""
+        operation = endpoint['operation']
+        http_method = endpoint['method'].upper()
+        arguments = self.endpoint_arguments(endpoint)
+
+        # Required arguments come first: path parameters, then required query parameters and body
+        params = [f"{arg['name']}: {arg['annotation']}" for arg in arguments if arg['required']]
+        params.extend(f"{arg['name']}: Optional[{arg['annotation']}] = None" for arg in arguments if not arg['required'])
+        response_type = self.get_response_type(endpoint)
+        self.write_signature(out, endpoint['method_name'], params, response_type)
+
+        summary = operation.get('summary', f"{http_method} {endpoint['path']}").strip().replace('"""', "'''")
+        model = self.response_model(endpoint)
+        if model is not None:
+            out.write(f'        """{summary}\n\n        Returns the parsed {model} response.\n        """\n')
+        else:
+            out.write(f'        """{summary}"""\n')
+
+        path_names = {arg['spec_name']: arg['name'] for arg in arguments if arg['kind'] == 'path'}
+        query = [(arg['spec_name'], arg['name']) for arg in arguments if arg['kind'] == 'query']
+        call = [repr(http_method), self.build_path(endpoint['path'], path_names)]
+        if query:
+            call.append(f"query={{{', '.join(f'{spec_name!r}: {name}' for spec_name, name in query)}}}")
+        if any(arg['kind'] == 'body' for arg in arguments):
+            call.append('body=requestBody')
+        body = next((arg for arg in arguments if arg['kind'] == 'body'), None)
+        if body is not None:
+            condition = 'self.validate_requests' if body['required'] else \
+                'self.validate_requests and requestBody is not None'
+            out.write(f"        if {condition}:\n"
+                      f"            validators.validate_{self.request_validator(endpoint)}(requestBody)\n")
+        keyword_return = '' if response_type == 'None' else 'return '
+        line = f"        {keyword_return}await self.transport.request({', '.join(call)})"
+        if query and len(line) > MAX_LINE_LENGTH:
+            # Build the query mapping on its own, one parameter per line
+            out.write("        query = {\n")
+            out.write(',\n'.join(f"            {spec_name!r}: {name}" for spec_name, name in query))
+            out.write("\n        }\n")
+            call[2] = 'query=query'
+            line = f"        {keyword_return}await self.transport.request({', '.join(call)})"
+        # Instrumentation records name the call by its operation
+        operation = f"operation={endpoint['operation_id'] or endpoint['method_name']!r}"
+        if len(line) + len(operation) + 2 > MAX_LINE_LENGTH:
+            opening = line.index('(') + 1
+            line = f"{line[:-1]},\n{' ' * opening}{operation})"
+        else:
+            line = f"{line[:-1]}, {operation})"
+        out.write(f"{line}\n")
+
+        if endpoint['id_list_parameter'] or endpoint['array_body']:
+            self.emit_batched_method(out, endpoint, arguments, response_type)
+        if endpoint['pagination']:
+            self.emit_paginated_method(out, endpoint, arguments)
+
+    def emit_batched_method(self, out: CodeEmitter, endpoint: Dict, arguments: List[Dict[str, Any]],
+                            response_type: str):
+        """Emit <method>Batched: splits an Ids list or array body into chunks sent concurrently"""
+        method = endpoint['method_name']
+        if endpoint['id_list_parameter']:
+            batched = next(arg for arg in arguments
+                           if arg['kind'] == 'query' and arg['spec_name'] == endpoint['id_list_parameter'])
+            batched_annotation = 'Sequence[str]'
+            chunked = f"chunk_ids({batched['name']}, batch_size)"
+            chunk_value = "','.join(chunk)"
+            default_size = 'MAX_IDS_PER_REQUEST'
+            merge = f"merge_id_responses({batched['name']}, responses)"
+            description = (f"{method} for any number of {batched['name']}, sent in concurrent chunks; "
+                           "Records come back in input order")
+        else:
+            batched = next(arg for arg in arguments if arg['kind'] == 'body')
+            batched_annotation = f"Sequence[{batched['annotation'][len('List['):-1]}]"
+            chunked = 'chunk_items(requestBody, batch_size)'
+            chunk_value = 'list(chunk)'
+            default_size = 'MAX_ITEMS_PER_REQUEST'
+            merge = 'merge_responses(responses)'
+            description = (f"{method} for any number of items, sent in concurrent chunks; "
+                           "responses are merged in input order")
+
+        # The batched argument is always required; everything else is passed through unchanged
+        others = [arg for arg in arguments if arg is not batched]
+        params = [f"{arg['name']}: {arg['annotation']}" for arg in others if arg['required']]
+        params.insert(len([arg for arg in others if arg['kind'] == 'path']),
+                      f"{batched['name']}: {batched_annotation}")
+        params.extend(f"{arg['name']}: Optional[{arg['annotation']}] = None" for arg in others if not arg['required'])
+        params.extend([f"batch_size: int = {default_size}", 'concurrency: Optional[int] = None'])
+        self.write_signature(out, f"{method}Batched", params, response_type)
+        out.write(f'        """{description}"""\n')
+
+        passed = [f"{batched['name']}={chunk_value}"] + [f"{arg['name']}={arg['name']}" for arg in others]
+        call = f"                                      lambda chunk: self.{method}("
+        if len(call) + len(', '.join(passed)) + 2 > MAX_LINE_LENGTH:
+            # One keyword argument per line, aligned with the opening parenthesis
+            passed = [f",\n{' ' * len(call)}".join(passed)]
+        out.write(f"        responses = await run_batches({chunked},\n")
+        out.write(f"{call}{', '.join(passed)}),\n")
+        out.write("                                      concurrency or default_concurrency(self.transport.pool))\n")
+        if response_type == 'None':
+            return
+        out.write(f"        return {merge}\n")
+
+    def emit_paginated_method(self, out: CodeEmitter, endpoint: Dict, arguments: List[Dict[str, Any]]):
+        """Emit <method>Iter: a lazy iterator over the records of every page, following the Offset* cursor"""
+        method = endpoint['method_name']
+        pagination = endpoint['pagination']
+        offsets = [arg for arg in arguments if arg['spec_name'] in pagination['offsets']]
+        others = [arg for arg in arguments if arg not in offsets]
+        params = [f"{arg['name']}: {arg['annotation']}" for arg in others if arg['required']]
+        params.extend(f"{arg['name']}: Optional[{arg['annotation']}] = None" for arg in others if not arg['required'])
+        params.append('prefetch: bool = True')
+        self.write_signature(out, f"{method}Iter", params, 'AsyncIterator[Dict[str, Any]]', 'def')
+        page_size = f" ({pagination['page_size']} per page)" if pagination['page_size'] else ''
+        out.write(f'        """{pagination["items"]} of every {method} page, fetched lazily{page_size}.\n\n'
+                  '        With prefetch, the next page loads while this one is consumed.\n        """\n')
+
+        passed = [f"{arg['name']}={arg['name']}" for arg in others]
+        passed.extend(f"{arg['name']}=offset.get({arg['spec_name']!r})" for arg in offsets)
+        call = f"        return paginate(lambda offset: self.{method}("
+        if len(call) + len(', '.join(passed)) + 2 > MAX_LINE_LENGTH:
+            # One keyword argument per line, aligned with the opening parenthesis
+            passed = [f",\n{' ' * len(call)}".join(passed)]
+        out.write(f"{call}{', '.join(passed)}),\n")
+        out.write(f"                        {pagination['cursor']!r}, {pagination['items']!r}, "
+                  f"{tuple(pagination['offsets'])!r}, prefetch)\n")
+
+    def prepare(self):
+        """Nothing to precompute; coroutines only depend on the compiled spec"""
+
+    def method_tasks(self) -> List[RenderTask]:
+        """Render tasks for every endpoint coroutine, in output (tag) order"""
+        index_of = {id(endpoint): i for i, endpoint in enumerate(self.spec.endpoints)}
+        tasks = []
+        for tag, endpoints in sorted(self.spec.endpoints_by_tag.items()):
+            for endpoint in endpoints:
+                # Parameters are resolved; annotations depend on the schemas their $refs point at
+                schemas = [param.get('schema') for param in endpoint['parameters']]
+                schemas.extend([endpoint['request_schema'], endpoint['response_schema']])
+                inputs = {
+                    'path': endpoint['path'],
+                    'method': endpoint['method'],
+                    'operation': endpoint['operation'],
+                    'parameters': endpoint['parameters'],
+                    'types': [self.python_type(schema) for schema in schemas]
+                }
+                tasks.append((f"operation:{endpoint['method'].upper()} {endpoint['path']}", inputs,
+                              index_of[id(endpoint)]))
+        return tasks
+
+    def render_task(self, task: int) -> str:
+        """Render one endpoint coroutine from a method_tasks() argument"""
+        return self.generate_endpoint_method(self.spec.endpoints[task])
+
+    def generate_client_module(self, out: CodeEmitter, pool: Optional[Executor] = None):
+        """Emit the complete client module"""
+        out.write(f'''"""Generated Docrio API async client; regenerate with generate_docrio.py --python-client"""
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+from urllib.parse import quote
+
+from docrio_client import validators
+from docrio_client.auth import TokenProvider
+from docrio_client.batching import (MAX_IDS_PER_REQUEST, MAX_ITEMS_PER_REQUEST, chunk_ids, chunk_items,
+                                    default_concurrency, merge_id_responses, merge_responses, run_batches)
+from docrio_client.pagination import paginate
+from docrio_client.transport import DocrioTransport
+
+DEFAULT_BASE_URL = {self.base_url()!r}
+
+
+class DocrioAsyncClient:
+    """Asynchronous Docrio API client with one coroutine per operation.
+
+    Every call goes through one pooled keep-alive DocrioTransport; limit and
+    limit_per_host (passed through to the transport) cap the connections in use.
+    Request bodies are checked against their schema before sending unless
+    validate_requests is False; invalid ones raise RequestValidationError.
+    An instrumentation callable (e.g. a MetricsRecorder), also passed through to
+    the transport, receives one record per call, named by its operation.
+    access_token is either a token string or a TokenProvider, whose token is
+    reused until it nears expiry and refreshed once when a call gets a 401.
+    A scheduler (a RequestScheduler) paces calls per operation family and retries
+    throttled idempotent calls, and a cache (a ResponseCache) reuses responses of
+    read-mostly operations and collapses identical concurrent reads.
+    """
+
+    def __init__(self, access_token: Union[str, TokenProvider], api_key: str,
+                 base_url: str = DEFAULT_BASE_URL, transport: Optional[DocrioTransport] = None,
+                 validate_requests: bool = True, **transport_options: Any):
+        headers = {{'X-API-KEY': api_key}}
+        if isinstance(access_token, TokenProvider):
+            transport_options['auth'] = access_token
+        else:
+            headers['Authorization'] = f"Bearer {{access_token}}"
+        self.transport = transport or DocrioTransport(base_url, headers, **transport_options)
+        self.validate_requests = validate_requests
+
+    async def __aenter__(self) -> 'DocrioAsyncClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the pooled connections"""
+        await self.transport.close()
+''')
+
+        # Render coroutines (possibly in parallel), then write them grouped by tag
+        fragments = render_fragments(self, self.method_tasks(), pool)
+        for tag, endpoints in sorted(self.spec.endpoints_by_tag.items()):
+            out.write(f"\n    # {tag} Methods\n")
+            for _ in endpoints:
+                out.write(next(fragments))
+
+    def open_output(self, filename: str) -> StreamingOutput:
+        """Open a streaming writer for a module in the output directory"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        return StreamingOutput(os.path.join(self.output_dir, filename))
+
+    def generate(self, pool: Optional[Executor] = None):
+        """Generate the client module, streaming it straight to disk"""
+        with self.open_output('client.py') as out:
+            self.generate_client_module(out, pool)
+
+def main():
+    # All backends share one compiled spec; see generate_docrio.py
+    from generate_docrio import main as generate_main
+    generate_main()
+
+if __name__ == '__main__':
+    main()
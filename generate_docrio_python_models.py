@@ -0,0 +1,274 @@
+import os
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Tuple
+
+from codegen_emitter import CodeEmitter, StreamingOutput
+from codegen_manifest import CodegenManifest, content_hash
+from codegen_parallel import RenderTask, render_fragments
+from docrio_spec import DocrioSpec, ref_name
+from generate_docrio_python import DEFAULT_PYTHON_DIR, MAX_LINE_LENGTH, PYTHON_TYPES, PythonClientGenerator
+
+
+class PythonModelGenerator:
+    """Generates slotted Python model classes (docrio_client/models.py) from the compiled spec.
+
+    Every object schema in components.schemas becomes a class with __slots__ and a
+    generated straight-line from_json/to_json pair, so decoding a response is one
+    attribute store per property with no reflection. Inline objects are interned by
+    shape exactly like the Apex models, so they get the same Anonymous<hash> names.
+    A property declared as a single referenced record also decodes from a list of
+    them, since the API returns lists for some (e.g. FilesRelatedGetResponse.Records).
+    """
+
+    def __init__(self, spec: DocrioSpec, manifest: Optional[CodegenManifest] = None):
+        self.output_dir = DEFAULT_PYTHON_DIR
+        self.spec = spec
+        self.manifest = manifest  # Fragment cache for incremental mode (None = full rebuild)
+        self.names = PythonClientGenerator(spec)  # Shared identifier rules
+        self.anonymous_types: Dict[str, dict] = {}  # Interned inline object shapes by class name
+        self.prepared = False
+
+    def anonymous_shape(self, schema: Any) -> Any:
+        """Reduce an inline schema to the parts that affect generated code, with sorted properties"""
+        if not isinstance(schema, dict):
+            return schema
+        if '$ref' in schema:
+            return {'$ref': schema['$ref']}
+        shape = {'type': schema.get('type')}
+        if 'properties' in schema:
+            shape['properties'] = {
+                name: self.anonymous_shape(schema['properties'][name])
+                for name in sorted(schema['properties'])
+            }
+        if 'items' in schema:
+            shape['items'] = self.anonymous_shape(schema['items'])
+        return shape
+
+    def intern_anonymous_type(self, schema: dict) -> str:
+        """Return the shared class name for an inline object shape, registering it and its nested shapes"""
+        shape = self.anonymous_shape(schema)
+        type_name = f"Anonymous{content_hash(shape)[:8].upper()}"
+        existing = self.anonymous_types.get(type_name)
+        if existing is None:
+            self.anonymous_types[type_name] = shape
+            for prop_schema in shape.get('properties', {}).values():
+                self.annotation(prop_schema)  # Interns inline objects in properties and array items
+        elif existing != shape:
+            raise ValueError(f"Anonymous class name collision for {type_name}")
+        return type_name
+
+    def model_type(self, schema: Any) -> Optional[str]:
+        """Model class a schema decodes into, or None if its values are kept as parsed"""
+        if not isinstance(schema, dict):
+            return None
+        if '$ref' in schema:
+            name = ref_name(schema['$ref'])
+            if name in self.spec.model_names:
+                return name
+            return self.model_type(self.spec.resolve_schema(schema))
+        if schema.get('type') == 'object' and schema.get('properties'):
+            return self.intern_anonymous_type(schema)
+        return None
+
+    def item_schema(self, schema: Any) -> Any:
+        """Item schema of an array schema (following $refs to array schemas), or None if not an array"""
+        schema = self.spec.resolve_schema(schema) if isinstance(schema, dict) else None
+        if isinstance(schema, dict) and schema.get('type') == 'array':
+            return schema.get('items')
+        return None
+
+    def annotation(self, schema: Any) -> str:
+        """Annotation of a model attribute"""
+        model = self.model_type(schema)
+        if model is not None:
+            return f"'{model}'"
+        items = self.item_schema(schema)
+        if items is not None:
+            return f"List[{self.annotation(items)}]"
+        schema = self.spec.resolve_schema(schema) if isinstance(schema, dict) else None
+        if not isinstance(schema, dict):
+            return 'Any'
+        if schema.get('type') == 'object':
+            return 'Dict[str, Any]'
+        return PYTHON_TYPES.get(schema.get('type'), 'Any')
+
+    def decode_expression(self, schema: Any, value: str, depth: int = 0) -> Optional[str]:
+        """Expression decoding a non-null parsed value, or None if it is kept as it is"""
+        model = self.model_type(schema)
+        if model is not None:
+            return f"{model}.from_json({value})"
+        items = self.item_schema(schema)
+        if items is None:
+            return None
+        item = f"item{depth or ''}"
+        inner = self.decode_expression(items, item, depth + 1)
+        return None if inner is None else f"[{inner} for {item} in {value}]"
+
+    def encode_expression(self, schema: Any, value: str, depth: int = 0) -> Optional[str]:
+        """Expression encoding a non-null attribute back to JSON values, or None if it is stored as it is"""
+        if self.model_type(schema) is not None:
+            return f"{value}.to_json()"
+        items = self.item_schema(schema)
+        if items is None:
+            return None
+        item = f"item{depth or ''}"
+        inner = self.encode_expression(items, item, depth + 1)
+        return None if inner is None else f"[{inner} for {item} in {value}]"
+
+    def single_record(self, schema: Any) -> bool:
+        """True for a property declared as one referenced record; the API sends a list of them for some"""
+        if not isinstance(schema, dict) or '$ref' not in schema:
+            return False
+        return ref_name(schema['$ref']) in self.spec.model_names
+
+    def fields(self, schema: dict) -> List[Tuple[str, str, Any]]:
+        """(attribute, JSON property, schema) for each property of an object schema"""
+        fields = []
+        for prop_name, prop_schema in schema.get('properties', {}).items():
+            attribute = self.names.python_name(prop_name)
+            if attribute.startswith('__'):
+                # Leading double underscores would be name-mangled inside the class body
+                attribute = f"f{attribute}"
+            fields.append((attribute, prop_name, prop_schema))
+        attributes = [attribute for attribute, _, _ in fields]
+        if len(set(attributes)) != len(attributes):
+            raise ValueError(f"Properties of {schema} map to clashing attribute names")
+        return fields
+
+    def write_wrapped(self, out: CodeEmitter, head: str, items: List[str], tail: str):
+        """Write head + items + tail, one item per line (aligned with head) when it would be too long"""
+        joined = ', '.join(items)
+        if len(head) + len(joined) + len(tail) > MAX_LINE_LENGTH:
+            joined = f",\n{' ' * len(head)}".join(items)
+        out.write(f"{head}{joined}{tail}\n")
+
+    def generate_model_class(self, class_name: str, schema: dict) -> str:
+        """Generate a single model class as a string"""
+        out = CodeEmitter()
+        self.emit_model_class(out, class_name, schema)
+        return out.getvalue()
+
+    def emit_model_class(self, out: CodeEmitter, class_name: str, schema: dict):
+        """Emit a slotted class with straight-line from_json/to_json for an object schema"""
+        fields = self.fields(schema)
+        description = (schema.get('description') or '').strip().split('\n')[0].replace('"""', "'''")
+        out.write(f"\n\nclass {class_name}:\n")
+        out.write(f'    """{description or f"{class_name} model"}"""\n')
+        self.write_wrapped(out, '    __slots__ = (', [repr(attribute) for attribute, _, _ in fields],
+                           ',)' if len(fields) == 1 else ')')
+
+        if fields:
+            params = [f"{attribute}: Optional[{self.annotation(prop_schema)}] = None"
+                      for attribute, _, prop_schema in fields]
+            out.write('\n')
+            self.write_wrapped(out, '    def __init__(', ['self', '*'] + params, '):')
+            for attribute, _, _ in fields:
+                out.write(f"        self.{attribute} = {attribute}\n")
+
+        out.write(f"\n    @classmethod\n    def from_json(cls, data: Dict[str, Any]) -> '{class_name}':\n")
+        out.write('        """Decode a parsed JSON object; missing properties are None"""\n')
+        out.write('        obj = _new(cls)\n')
+        if fields:
+            out.write('        get = data.get\n')
+        for attribute, prop_name, prop_schema in fields:
+            decode = self.decode_expression(prop_schema, 'value')
+            if decode is None:
+                out.write(f"        obj.{attribute} = get({prop_name!r})\n")
+                continue
+            out.write(f"        value = get({prop_name!r})\n")
+            if self.single_record(prop_schema):
+                each = self.decode_expression(prop_schema, 'item')
+                out.write(f"        if value.__class__ is list:\n"
+                          f"            value = [{each} for item in value]\n"
+                          f"        elif value is not None:\n")
+            else:
+                out.write("        if value is not None:\n")
+            out.write(f"            value = {decode}\n        obj.{attribute} = value\n")
+        out.write('        return obj\n')
+
+        out.write('\n    def to_json(self) -> Dict[str, Any]:\n')
+        out.write('        """Encode as a JSON-ready dict, leaving out properties that are None"""\n')
+        out.write('        data = {}\n')
+        for attribute, prop_name, prop_schema in fields:
+            encode = self.encode_expression(prop_schema, 'value')
+            out.write(f"        value = self.{attribute}\n")
+            if self.single_record(prop_schema):
+                out.write(f"        if value.__class__ is list:\n"
+                          f"            data[{prop_name!r}] = [item.to_json() for item in value]\n"
+                          f"        elif value is not None:\n")
+            else:
+                out.write("        if value is not None:\n")
+            out.write(f"            data[{prop_name!r}] = {encode or 'value'}\n")
+        out.write('        return data\n')
+
+    def prepare(self):
+        """Intern every inline object shape before rendering"""
+        if self.prepared:
+            return
+        resolved = self.spec.resolved.get('python_models')
+        if resolved is not None:
+            # Loaded with the spec from the compiled-spec cache
+            self.anonymous_types = resolved
+        else:
+            for name in self.model_names():
+                for prop_schema in self.spec.schemas[name].get('properties', {}).values():
+                    self.annotation(prop_schema)
+            self.spec.resolved['python_models'] = self.anonymous_types
+        self.prepared = True
+
+    def model_names(self) -> List[str]:
+        """Component schemas that become model classes, in spec order"""
+        return [name for name in self.spec.schemas if name in self.spec.model_names]
+
+    def class_tasks(self) -> List[RenderTask]:
+        """Render tasks for every model class: component schemas in spec order, then anonymous shapes"""
+        args = [('schema', name) for name in self.model_names()]
+        args += [('anonymous', name) for name in sorted(self.anonymous_types)]
+        tasks = []
+        for task in args:
+            schema = self.task_schema(task)
+            # Output also depends on which properties decode into models, and into which
+            types = {name: self.annotation(prop) for name, prop in schema.get('properties', {}).items()}
+            tasks.append((f"schema:{task[1]}", {'name': task[1], 'schema': schema, 'types': types}, task))
+        return tasks
+
+    def task_schema(self, task: tuple) -> dict:
+        """Schema behind a class_tasks() argument"""
+        kind, type_name = task
+        return self.anonymous_types[type_name] if kind == 'anonymous' else self.spec.schemas[type_name]
+
+    def render_task(self, task: tuple) -> str:
+        """Render one model class from a class_tasks() argument"""
+        return self.generate_model_class(task[1], self.task_schema(task))
+
+    def generate_models_module(self, out: CodeEmitter, pool: Optional[Executor] = None):
+        """Emit the complete models module"""
+        out.write('''"""Generated Docrio API models; regenerate with generate_docrio.py --python-client"""
+from typing import Any, Dict, List, Optional
+
+_new = object.__new__
+''')
+        self.prepare()
+        for fragment in render_fragments(self, self.class_tasks(), pool):
+            out.write(fragment)
+        out.write('\n\n# Model class of each components.schemas object schema\nMODELS = {\n')
+        out.write(''.join(f"    {name!r}: {name},\n" for name in self.model_names()))
+        out.write('}\n')
+
+    def open_output(self, filename: str) -> StreamingOutput:
+        """Open a streaming writer for a module in the output directory"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        return StreamingOutput(os.path.join(self.output_dir, filename))
+
+    def generate(self, pool: Optional[Executor] = None):
+        """Generate the models module, streaming it straight to disk"""
+        with self.open_output('models.py') as out:
+            self.generate_models_module(out, pool)
+
+def main():
+    # All backends share one compiled spec; see generate_docrio.py
+    from generate_docrio import main as generate_main
+    generate_main()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+import os
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional
+
+from codegen_emitter import CodeEmitter, StreamingOutput
+from codegen_manifest import CodegenManifest, content_hash
+from codegen_parallel import RenderTask, render_fragments
+from docrio_spec import DocrioSpec, placeholder_property, ref_name, schema_refs
+from generate_docrio_python import DEFAULT_PYTHON_DIR, MAX_LINE_LENGTH, PythonClientGenerator
+
+# isinstance() arguments and error wording for each JSON type
+TYPE_CHECKS = {
+    'string': ('str', 'a string'),
+    'integer': ('int', 'an integer'),
+    'number': ('(int, float)', 'a number'),
+    'boolean': ('bool', 'a boolean'),
+    'array': ('(list, tuple)', 'an array'),
+    'object': ('dict', 'an object'),
+}
+
+
+def message_path(text: str) -> str:
+    """Escape a property name for use inside a generated f-string"""
+    return text.replace('{', '{{').replace('}', '}}').replace("'", "\\'")
+
+
+def error_line(indent: str, message: str) -> str:
+    """errors.append() of an f-string message, split before its ': ' when the line would be too long"""
+    line = f"{indent}errors.append(f'{message}')\n"
+    if len(line) <= MAX_LINE_LENGTH + 1:
+        return line
+    where, _, problem = message.rpartition(': ')
+    return f"{indent}errors.append(f'{where}'\n{indent}              f': {problem}')\n"
+
+
+class PythonValidatorGenerator:
+    """Generates request body validators (docrio_client/validators.py) from the compiled spec.
+
+    Each request body schema is compiled into straight-line checks of its required
+    properties, JSON types, patterns and enums, with loops only for array items and
+    map values. Component schemas get a check_<Name>(value, path, errors) function that
+    others call, plus validate_<Name>(value), which the generated client calls before
+    sending and which raises RequestValidationError listing every problem found.
+    """
+
+    def __init__(self, spec: DocrioSpec, manifest: Optional[CodegenManifest] = None):
+        self.output_dir = DEFAULT_PYTHON_DIR
+        self.spec = spec
+        self.manifest = manifest  # Fragment cache for incremental mode (None = full rebuild)
+        self.names = PythonClientGenerator(spec)  # Validator names are shared with the client
+
+    def body_endpoints(self) -> List[Dict[str, Any]]:
+        """Endpoints with a JSON request body, in spec order"""
+        return [endpoint for endpoint in self.spec.endpoints if endpoint['request_schema'] is not None]
+
+    def component_names(self) -> List[str]:
+        """Component schemas reachable from any request body, in spec order"""
+        roots = set()
+        for endpoint in self.body_endpoints():
+            roots |= schema_refs(endpoint['request_schema'])
+        reachable, _ = self.spec.reachable_schemas(roots)
+        return [name for name in self.spec.schemas if name in reachable]
+
+    def emit_checks(self, out: CodeEmitter, schema: Any, value: str, path: str, level: int, depth: int = 0,
+                    guard: Optional[str] = None, keyword: str = 'if'):
+        """Emit statements appending to errors what is wrong with a value.
+
+        With a guard, the checks only run if it holds. keyword 'elif' continues an if
+        statement written by the caller.
+        """
+        if not isinstance(schema, dict):
+            return
+        if '$ref' in schema:
+            name = ref_name(schema['$ref'])
+            if name in self.spec.schemas:
+                if guard is not None or keyword == 'elif':
+                    opener = f"if {guard}:" if guard is not None else 'else:'
+                    out.write(f"{'    ' * level}{opener}\n")
+                    level += 1
+                out.write(f"{'    ' * level}check_{name}({value}, f'{path}', errors)\n")
+            return
+        kind = schema.get('type', 'object' if 'properties' in schema else None)
+        if kind not in TYPE_CHECKS:
+            return
+        instance, expected = TYPE_CHECKS[kind]
+        invalid = f"not isinstance({value}, {instance})"
+        if kind in ('integer', 'number'):
+            invalid = f"{invalid} or isinstance({value}, bool)"
+
+        # Checks that only make sense once the type is right; without any, the guard joins the type check
+        inner = level + 1 if guard is not None else level
+        indent = '    ' * inner
+        follow = CodeEmitter()
+        if 'enum' in schema:
+            follow.write(f"{indent}elif {value} not in {tuple(schema['enum'])!r}:\n")
+            allowed = message_path(repr(schema['enum']))
+            follow.write(error_line(f"{indent}    ", f"{path}: must be one of {allowed}"))
+        if kind == 'string' and 'pattern' in schema:
+            constant = f"PATTERN_{content_hash(schema['pattern'])[:8].upper()}"
+            follow.write(f"{indent}elif not {constant}.search({value}):\n")
+            pattern = message_path(schema['pattern'])
+            follow.write(error_line(f"{indent}    ", f"{path}: does not match {pattern}"))
+        body = CodeEmitter()
+        if kind == 'array' and isinstance(schema.get('items'), dict):
+            index, item = f"index{depth + 1}", f"item{depth + 1}"
+            self.emit_checks(body, schema['items'], item, f"{path}[{{{index}}}]", inner + 2, depth + 1)
+            if body.chunks:
+                follow.write(f"{indent}else:\n{indent}    for {index}, {item} in enumerate({value}):\n")
+        elif kind == 'object':
+            self.emit_object_checks(body, schema, value, path, inner + 1, depth)
+            if body.chunks:
+                follow.write(f"{indent}else:\n")
+        follow.extend(body)
+
+        if guard is not None and not follow.chunks:
+            out.write(f"{'    ' * level}if {guard} and ({invalid}):\n" if ' or ' in invalid else
+                      f"{'    ' * level}if {guard} and {invalid}:\n")
+            out.write(error_line(f"{'    ' * level}    ", f"{path}: expected {expected}"))
+            return
+        if guard is not None:
+            out.write(f"{'    ' * level}if {guard}:\n")
+        out.write(f"{indent}{keyword} {invalid}:\n")
+        out.write(error_line(f"{indent}    ", f"{path}: expected {expected}"))
+        out.extend(follow)
+
+    def emit_object_checks(self, out: CodeEmitter, schema: Dict[str, Any], value: str, path: str, level: int,
+                           depth: int):
+        """Emit checks that required properties are present and that present ones are valid"""
+        indent = '    ' * level
+        required = set(self.spec.required_properties(schema))
+        properties = schema.get('properties', {})
+        declared = [name for name in properties if not placeholder_property(name)]
+        field = f"field{depth + 1}"
+        for name in declared:
+            checks = CodeEmitter()
+            prop_path = f"{path}.{message_path(name)}"
+            if name in required:
+                self.emit_checks(checks, properties[name], field, prop_path, level, depth + 1, keyword='elif')
+            else:
+                self.emit_checks(checks, properties[name], field, prop_path, level, depth + 1,
+                                 guard=f"{field} is not None")
+            if not checks.chunks and name not in required:
+                continue
+            out.write(f"{indent}{field} = {value}.get({name!r})\n")
+            if name in required:
+                out.write(f"{indent}if {field} is None:\n")
+                out.write(error_line(f"{indent}    ", f"{prop_path}: required"))
+            out.extend(checks)
+
+        # Placeholder keys and additionalProperties describe every other key of the object
+        others = next((properties[name] for name in properties if placeholder_property(name)),
+                      schema.get('additionalProperties'))
+        checks = CodeEmitter()
+        key, item = f"key{depth + 1}", f"item{depth + 1}"
+        self.emit_checks(checks, others, item, f"{path}.{{{key}}}", level + 1, depth + 1)
+        if checks.chunks:
+            out.write(f"{indent}for {key}, {item} in {value}.items():\n")
+            if declared:
+                out.write(f"{indent}    if {key} in {tuple(declared)!r}:\n{indent}        continue\n")
+            out.extend(checks)
+
+    def patterns(self, schema: Any) -> List[str]:
+        """Every string pattern inside a schema (not following $refs), in a stable order"""
+        found = []
+        stack = [schema]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                if node.get('type') == 'string' and isinstance(node.get('pattern'), str):
+                    found.append(node['pattern'])
+                stack.extend(value for key, value in node.items() if key != 'example')
+            elif isinstance(node, list):
+                stack.extend(node)
+        return sorted(set(found))
+
+    def generate_validator(self, name: str, schema: Any) -> str:
+        """Generate the check_/validate_ pair for one schema as a string"""
+        out = CodeEmitter()
+        self.emit_validator(out, name, schema)
+        return out.getvalue()
+
+    def emit_validator(self, out: CodeEmitter, name: str, schema: Any):
+        """Emit check_<name>, which appends problems to errors, and validate_<name>, which raises them"""
+        for pattern in self.patterns(schema):
+            out.write(f"\nPATTERN_{content_hash(pattern)[:8].upper()} = re.compile({pattern!r})\n")
+        out.write(f"\n\ndef check_{name}(value: Any, path: str, errors: List[str]):\n")
+        out.write(f'    """Append what is wrong with a {name} value to errors"""\n')
+        body = CodeEmitter()
+        self.emit_checks(body, schema, 'value', '{path}', 1)
+        if body.chunks:
+            out.extend(body)
+        else:
+            out.write('    pass\n')
+        out.write(f"\n\ndef validate_{name}(value: Any, path: str = 'requestBody'):\n")
+        out.write(f'    """Raise RequestValidationError unless value is a valid {name}"""\n')
+        out.write('    errors: List[str] = []\n')
+        out.write(f"    if value is None:\n        errors.append(f'{{path}}: required')\n")
+        out.write(f"    else:\n        check_{name}(value, path, errors)\n")
+        out.write('    if errors:\n        raise RequestValidationError(errors)\n')
+
+    def prepare(self):
+        """Nothing to precompute; validators only depend on the compiled spec"""
+
+    def validator_tasks(self) -> List[RenderTask]:
+        """Render tasks: reachable component schemas in spec order, then inline request bodies"""
+        tasks = [(f"schema:{name}", {'name': name, 'schema': self.spec.schemas[name]}, ('schema', name))
+                 for name in self.component_names()]
+        for endpoint in self.body_endpoints():
+            if '$ref' not in endpoint['request_schema']:
+                name = self.names.request_validator(endpoint)
+                tasks.append((f"body:{name}", {'name': name, 'schema': endpoint['request_schema']},
+                              ('body', endpoint['method_name'])))
+        return tasks
+
+    def render_task(self, task: tuple) -> str:
+        """Render one validator from a validator_tasks() argument"""
+        kind, name = task
+        if kind == 'schema':
+            return self.generate_validator(name, self.spec.schemas[name])
+        endpoint = next(endpoint for endpoint in self.body_endpoints() if endpoint['method_name'] == name)
+        return self.generate_validator(self.names.request_validator(endpoint), endpoint['request_schema'])
+
+    def generate_validators_module(self, out: CodeEmitter, pool: Optional[Executor] = None):
+        """Emit the complete validators module"""
+        tasks = self.validator_tasks()
+        # re is only needed by validators that check a string pattern
+        uses_patterns = any(self.patterns(inputs['schema']) for _, inputs, _ in tasks)
+        out.write('''"""Generated Docrio API request validators; regenerate with generate_docrio.py --python-client"""
+''' + ('import re\n' if uses_patterns else '') + '''from typing import Any, List
+
+
+class RequestValidationError(ValueError):
+    """Raised before sending a request whose body does not match its schema"""
+
+    def __init__(self, errors: List[str]):
+        super().__init__('; '.join(errors))
+        self.errors = errors
+''')
+        for fragment in render_fragments(self, tasks, pool):
+            out.write(fragment)
+
+    def open_output(self, filename: str) -> StreamingOutput:
+        """Open a streaming writer for a module in the output directory"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        return StreamingOutput(os.path.join(self.output_dir, filename))
+
+    def generate(self, pool: Optional[Executor] = None):
+        """Generate the validators module, streaming it straight to disk"""
+        with self.open_output('validators.py') as out:
+            self.generate_validators_module(out, pool)
+
+def main():
+    # All backends share one compiled spec; see generate_docrio.py
+    from generate_docrio import main as generate_main
+    generate_main()
+
+if __name__ == '__main__':
+    main()
@@ -1,47 +1,139 @@
-import json
 import os
 import re
-from typing import Dict, List, Optional, Set, Tuple
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from codegen_emitter import CodeEmitter, StreamingOutput
+from codegen_manifest import CodegenManifest, write_if_changed
+from codegen_parallel import RenderTask, render_fragments
+from docrio_spec import DocrioSpec, ref_name
+from generate_docrio_models import ApexGenerator
+
+# Return type for responses without a matching model; DocrioClient.doCallout already parses these
+UNTYPED_RESPONSE = 'Map<String, Object>'
+# List-shaped operations that get a DocrioBulkJob wrapper: (method, path) -> the request body list to chunk
+BULK_OPERATIONS = {
+    ('post', '/files/checkout'): 'Ids',
+    ('post', '/files/checkin'): 'Ids',
+    ('post', '/files/share'): 'Ids',
+    ('post', '/files/associates'): 'fileRelationships',
+    ('delete', '/files/associates'): 'fileRelationships',
+    ('post', '/move'): 'Ids',
+    ('post', '/copy'): 'Records',
+}
+# Defaults emitted into DocrioBulkJob
+BULK_ITEMS_PER_REQUEST = 100
+BULK_REQUESTS_PER_JOB = 25
+# A bulk job sends no further chunk after this long; Apex allows 120 s of callouts per transaction
+BULK_MAX_JOB_MILLIS = 90000
+# Callouts allowed per Apex transaction
+APEX_CALLOUT_LIMIT = 100
+# The bulk chunk math as expression trees: (operator, operand, ...) with 'min', '+' or '-', and
+# operands that are nested trees, integers or Apex terms. apex_expression() renders them into
+# DocrioBulkJob and bulk_job_plan() evaluates the same trees, so the two cannot drift apart.
+BULK_CHUNK_END = ('min', ('+', 'start', 'size'), 'items.size()')
+BULK_JOB_BUDGET = ('min', 'requestLimit', ('-', 'Limits.getLimitCallouts()', 'Limits.getCallouts()', 1))
+BULK_JOB_LAST = ('min', 'chunks.size()', ('+', 'first', 'budget'))
+
+Expression = Union[str, int, tuple]
+
+
+def apex_expression(node: Expression) -> str:
+    """Apex source of an expression tree"""
+    if not isinstance(node, tuple):
+        return str(node)
+    operator, *operands = node
+    if operator == 'min':
+        return f"Math.min({', '.join(apex_expression(operand) for operand in operands)})"
+    # Nested arithmetic is parenthesized, so the tree's grouping survives Apex precedence
+    rendered = [f"({apex_expression(operand)})" if isinstance(operand, tuple) and operand[0] != 'min'
+                else apex_expression(operand) for operand in operands]
+    return f" {operator} ".join(rendered)
+
+
+def evaluate_expression(node: Expression, values: Dict[str, int]) -> int:
+    """Value of an expression tree, given a value for each Apex term it uses"""
+    if isinstance(node, int):
+        return node
+    if isinstance(node, str):
+        return values[node]
+    operator, *operands = node
+    results = [evaluate_expression(operand, values) for operand in operands]
+    if operator == 'min':
+        return min(results)
+    if operator == '+':
+        return sum(results)
+    return results[0] - sum(results[1:])
+
+
+def bulk_job_plan(total: int, items_per_request: int = BULK_ITEMS_PER_REQUEST,
+                  requests_per_job: int = BULK_REQUESTS_PER_JOB,
+                  callout_limit: int = APEX_CALLOUT_LIMIT) -> List[List[int]]:
+    """Items in each chunk sent by each chained DocrioBulkJob for a list of total items"""
+    chunks = []
+    for start in range(0, total, items_per_request):
+        values = {'start': start, 'size': items_per_request, 'items.size()': total}
+        chunks.append(evaluate_expression(BULK_CHUNK_END, values) - start)
+    # A job has made no callouts when it takes its budget
+    budget = evaluate_expression(BULK_JOB_BUDGET, {'requestLimit': requests_per_job,
+                                                   'Limits.getLimitCallouts()': callout_limit,
+                                                   'Limits.getCallouts()': 0})
+    if budget < 1:
+        raise ValueError(f"A bulk job must be allowed at least one request, not {budget}")
+    jobs = []
+    first = 0
+    while first < len(chunks):
+        values = {'chunks.size()': len(chunks), 'first': first, 'budget': budget}
+        last = evaluate_expression(BULK_JOB_LAST, values)
+        jobs.append(chunks[first:last])
+        first = last
+    return jobs
+
 
 class ServiceGenerator:
-    def __init__(self):
+    def __init__(self, spec: DocrioSpec, manifest: Optional[CodegenManifest] = None):
         self.output_dir = 'force-app/main/default/classes'
-        self.swagger_data = {}
-        self.docrio_models: Set[str] = set()  # Set of available model class names
-        
-    def load_swagger(self, swagger_file: str):
-        """Load and parse the swagger.json file"""
-        with open(swagger_file, 'r') as f:
-            self.swagger_data = json.load(f)
-            
-    def load_docrio_models(self, models_file: str):
-        """Parse DocrioModels.cls to get available model classes"""
-        with open(models_file, 'r') as f:
-            content = f.read()
-            
-        # Find all inner class definitions
-        class_pattern = r'public\s+class\s+(\w+)\s*{'
-        self.docrio_models = set(re.findall(class_pattern, content))
-            
-    def get_response_type(self, operation: Dict) -> str:
+        self.spec = spec
+        self.docrio_models: Set[str] = spec.model_names  # Set of available model class names
+        self.manifest = manifest  # Fragment cache for incremental mode (None = full rebuild)
+        self.naming = ApexGenerator(spec)  # Apex property names of model fields
+
+    def request_model(self, endpoint: Dict) -> Optional[str]:
+        """Component schema of an operation's request body, if it is a generated model"""
+        schema = endpoint['request_schema']
+        if schema is not None and '$ref' in schema and ref_name(schema['$ref']) in self.docrio_models:
+            return ref_name(schema['$ref'])
+        return None
+
+    def required_checks(self, model_name: str) -> List[Tuple[str, str]]:
+        """(null test, JSON name) for each property a request body model requires"""
+        checks = []
+        for name in self.spec.required_properties(self.spec.schemas[model_name]):
+            if self.naming.is_salesforce_field(name):
+                # DocrioField properties are always set; their value is what may be missing
+                field = self.naming.get_apex_friendly_name(name)
+                checks.append((f"requestBody?.{field}?.getValue() == null", name))
+            else:
+                checks.append((f"requestBody?.{self.naming.sanitize_property_name(name)} == null", name))
+        return checks
+
+    def get_response_type(self, endpoint: Dict) -> str:
         """Determine the return type for an operation"""
-        success_codes = ['200', '201', '202', '204']
-        for code in success_codes:
-            if code in operation.get('responses', {}):
-                response = operation['responses'][code]
-                if 'content' in response and 'application/json' in response['content']:
-                    schema = response['content']['application/json']['schema']
-                    if '$ref' in schema:
-                        model_name = schema['$ref'].split('/')[-1]
-                        if model_name in self.docrio_models:
-                            return f"DocrioModels.{model_name}"
-                    elif schema.get('type') == 'array' and 'items' in schema:
-                        if '$ref' in schema['items']:
-                            model_name = schema['items']['$ref'].split('/')[-1]
-                            if model_name in self.docrio_models:
-                                return f"List<DocrioModels.{model_name}>"
-                return 'Map<String, Object>'  # Default for unrecognized JSON responses
-        return 'void'  # No content or no success response defined
+        if endpoint['response_code'] is None:
+            return 'void'  # No success response defined
+        schema = endpoint['response_schema']
+        if schema is None:
+            return UNTYPED_RESPONSE  # Non-JSON success response
+        if '$ref' in schema:
+            model_name = ref_name(schema['$ref'])
+            if model_name in self.docrio_models:
+                return self.spec.qualified_model(model_name)
+        elif schema.get('type') == 'array' and 'items' in schema:
+            if '$ref' in schema['items']:
+                model_name = ref_name(schema['items']['$ref'])
+                if model_name in self.docrio_models:
+                    return f"List<{self.spec.qualified_model(model_name)}>"
+        return UNTYPED_RESPONSE  # Default for unrecognized JSON responses
 
     def extract_url_params(self, path: str) -> List[str]:
         """Extract parameter names from URL template, preserving exact names"""
@@ -70,14 +162,18 @@ class ServiceGenerator:
         return ' + '.join(segments)
 
     def generate_endpoint_method(self, endpoint: Dict) -> str:
-        """Generate a single endpoint method"""
+        """Generate a single endpoint method as a string"""
+        out = CodeEmitter()
+        self.emit_endpoint_method(out, endpoint)
+        return out.getvalue()
+
+    def emit_endpoint_method(self, out: CodeEmitter, endpoint: Dict):
+        """Emit a single endpoint method"""
         operation = endpoint['operation']
         path = endpoint['path']
         http_method = endpoint['method'].upper()
         
-        # Generate method name
-        parts = [p for p in path.strip('/').split('/') if not p.startswith('{')]
-        method_name = f"{http_method.lower()}{''.join(p.capitalize() for p in parts)}"
+        method_name = endpoint['method_name']
         
         # Collect parameters
         params = []
@@ -111,125 +207,361 @@ class ServiceGenerator:
         # Request body
         request_body = None
         if 'requestBody' in operation:
-            content = operation['requestBody']['content']
-            if 'application/json' in content:
-                schema = content['application/json']['schema']
+            schema = endpoint['request_schema']
+            if schema is not None:
                 if '$ref' in schema:
-                    model_name = schema['$ref'].split('/')[-1]
+                    model_name = ref_name(schema['$ref'])
                     if model_name in self.docrio_models:
-                        request_body = f"DocrioModels.{model_name}"
+                        request_body = self.spec.qualified_model(model_name)
                         params.append(f"{request_body} requestBody")
                         desc = operation['requestBody'].get('description', 'The request payload')
                         param_docs.append(f"     * @param requestBody {desc}")
         
         # Generate method documentation
-        method_content = "    /**\n"
+        out.write("    /**\n")
         if 'summary' in operation:
-            method_content += f"     * {operation['summary']}\n"
+            out.write(f"     * {operation['summary']}\n")
         if 'description' in operation:
             desc = operation['description'].replace('\n', '\n     * ')
-            method_content += f"     * {desc}\n"
+            out.write(f"     * {desc}\n")
         if param_docs:
-            method_content += "     *\n" + "\n".join(param_docs) + "\n"
-        response_type = self.get_response_type(operation)
+            out.write("     *\n")
+            for doc in param_docs:
+                out.write(f"{doc}\n")
+        response_type = self.get_response_type(endpoint)
         if response_type != 'void':
-            method_content += f"     * @return {response_type}\n"
-        method_content += "     */\n"
+            out.write(f"     * @return {response_type}\n")
+        out.write("     */\n")
         
         # Generate method signature
-        method_content += f"    public static {response_type} {method_name}({', '.join(params)}) {{\n"
+        out.write(f"    public static {response_type} {method_name}({', '.join(params)}) {{\n")
         
-        # Generate method body
-        method_content += "        DocrioClient client = new DocrioClient();\n"
-        method_content += f"        Map<String, Object> response = client.doCallout('{http_method}', {self.build_url_string(path, param_names)}, "
+        # Generate method body; required properties are checked before spending a callout
+        model_name = self.request_model(endpoint) if request_body else None
+        if model_name and self.required_checks(model_name):
+            out.write(f"        validate{model_name}(requestBody);\n")
+        body_arg = "requestBody != null ? JSON.serialize(requestBody) : null" if request_body else "null"
+        callout_args = (f"'{http_method}', {self.build_url_string(path, param_names)}, "
+                        f"{body_arg}, 'application/json'")
+        # Callouts are reported to the instrumentation sink under the operation's name
+        operation_id = endpoint['operation_id'] or method_name
+        out.write(f"        DocrioClient client = new DocrioClient().withOperation('{operation_id}');\n")
         
-        # Add request body if present
-        if request_body:
-            method_content += "requestBody != null ? JSON.serialize(requestBody) : null"
+        # Typed responses are deserialized straight from the raw body, so it is parsed only once.
+        # A blank success body still yields an empty instance, never null, as doCallout's
+        # {'success' => true} map did before.
+        if response_type == 'void':
+            out.write(f"        client.doCalloutRaw({callout_args});\n")
+        elif response_type == UNTYPED_RESPONSE:
+            out.write(f"        return client.doCallout({callout_args});\n")
         else:
-            method_content += "null"
-            
-        method_content += ", 'application/json');\n\n"
-        
-        # Add response handling
-        if response_type != 'void':
-            method_content += "        if(response != null) {\n"
-            method_content += f"            return ({response_type})JSON.deserialize(JSON.serialize(response), {response_type}.class);\n"
-            method_content += "        }\n"
-            method_content += "        return null;\n"
+            out.write(f"        String responseBody = client.doCalloutRaw({callout_args});\n\n")
+            out.write("        if(String.isBlank(responseBody)) {\n")
+            out.write("            responseBody = '{}';\n")
+            out.write("        }\n")
+            out.write(f"        return ({response_type})JSON.deserialize(responseBody, {response_type}.class);\n")
             
-        method_content += "    }\n\n"
-        return method_content
+        out.write("    }\n\n")
 
-    def generate_service_class(self) -> str:
-        """Generate the complete service class"""
-        paths = self.swagger_data.get('paths', {})
-        
+    def referenced_models(self, endpoint: Dict) -> List[str]:
+        """List the schema names an operation's request and response bodies point at"""
+        refs = []
+        for schema in (endpoint['request_schema'], endpoint['response_schema']):
+            if schema is None:
+                continue
+            if schema.get('type') == 'array':
+                schema = schema.get('items', {})
+            if '$ref' in schema:
+                refs.append(ref_name(schema['$ref']))
+        return refs
+
+    def prepare(self):
+        """Nothing to precompute; service methods only depend on the compiled spec"""
+
+    def method_tasks(self) -> List[RenderTask]:
+        """Render tasks for every endpoint method, in output (tag) order"""
+        index_of = {id(endpoint): i for i, endpoint in enumerate(self.spec.endpoints)}
+        tasks = []
+        for tag, endpoints in sorted(self.spec.endpoints_by_tag.items()):
+            for endpoint in endpoints:
+                # A method's output depends on its operation and on which referenced models exist
+                refs = self.referenced_models(endpoint)
+                inputs = {
+                    'path': endpoint['path'],
+                    'method': endpoint['method'],
+                    'operation': endpoint['operation'],
+                    'models': {ref: self.spec.qualified_model(ref) if ref in self.docrio_models else None
+                               for ref in refs},
+                    'required': {ref: self.spec.required_properties(self.spec.schemas[ref])
+                                 for ref in refs if ref in self.docrio_models}
+                }
+                tasks.append((f"operation:{endpoint['method'].upper()} {endpoint['path']}", inputs,
+                              index_of[id(endpoint)]))
+        return tasks
+
+    def render_task(self, task: int) -> str:
+        """Render one endpoint method from a method_tasks() argument"""
+        return self.generate_endpoint_method(self.spec.endpoints[task])
+
+    def generate_service_class(self, out: CodeEmitter, pool: Optional[Executor] = None):
+        """Emit the complete service class"""
         # Start the service class
-        class_content = """/**
+        out.write("""/**
  * Generated Docrio API service layer
  */
 public class DocrioService {
-"""
-        
-        # Group endpoints by tag
-        endpoints_by_tag = {}
-        for path, methods in paths.items():
-            for method, operation in methods.items():
-                tags = operation.get('tags', ['Default'])
-                for tag in tags:
-                    if tag not in endpoints_by_tag:
-                        endpoints_by_tag[tag] = []
-                    endpoints_by_tag[tag].append({
-                        'path': path,
-                        'method': method,
-                        'operation': operation
-                    })
+""")
         
-        # Generate methods grouped by tag
-        for tag, endpoints in sorted(endpoints_by_tag.items()):
+        # Render methods (possibly in parallel), then write them grouped by tag
+        fragments = render_fragments(self, self.method_tasks(), pool)
+        for tag, endpoints in sorted(self.spec.endpoints_by_tag.items()):
             # Add tag as comment
-            class_content += f"\n    // {tag} Methods\n"
-            
-            # Generate each endpoint method
+            out.write(f"\n    // {tag} Methods\n")
+            for _ in endpoints:
+                out.write(next(fragments))
+
+        # One validator per request body model with required properties, in order of first use
+        validated = []
+        for tag, endpoints in sorted(self.spec.endpoints_by_tag.items()):
             for endpoint in endpoints:
-                class_content += self.generate_endpoint_method(endpoint)
+                model_name = self.request_model(endpoint)
+                if model_name and model_name not in validated and self.required_checks(model_name):
+                    validated.append(model_name)
+        if validated:
+            out.write("    // Request Validators\n")
+        for model_name in validated:
+            self.emit_validator(out, model_name)
         
         # Close class
-        class_content += "}\n"
-        return class_content
+        out.write("}\n")
+
+    def emit_validator(self, out: CodeEmitter, model_name: str):
+        """Emit validate<Model>, which throws before the callout if required properties are missing"""
+        model_type = self.spec.qualified_model(model_name)
+        out.write(f"    private static void validate{model_name}({model_type} requestBody) {{\n")
+        out.write("        List<String> missing = new List<String>();\n")
+        for test, name in self.required_checks(model_name):
+            out.write(f"        if({test}) missing.add('{name}');\n")
+        out.write("        if(!missing.isEmpty()) {\n")
+        message = f"'{model_name} is missing required properties: '"
+        out.write(f"            throw new DocrioClient.DocrioException(\n"
+                  f"                {message} + String.join(missing, ', '));\n")
+        out.write("        }\n")
+        out.write("    }\n\n")
+
+    def bulk_endpoints(self) -> List[Tuple[Dict, str]]:
+        """(endpoint, Apex name of the list to chunk) for each bulk operation in the spec, in tag order"""
+        found = []
+        for tag, endpoints in sorted(self.spec.endpoints_by_tag.items()):
+            for endpoint in endpoints:
+                list_property = BULK_OPERATIONS.get((endpoint['method'], endpoint['path']))
+                model_name = self.request_model(endpoint)
+                if list_property is None or model_name is None:
+                    continue
+                if list_property in self.spec.resolve_schema(self.spec.schemas[model_name]).get('properties', {}):
+                    found.append((endpoint, self.naming.sanitize_property_name(list_property)))
+        return found
+
+    def emit_bulk_wrapper(self, out: CodeEmitter, endpoint: Dict, list_property: str):
+        """Emit the DocrioBulkJob method that chunks an operation's request body list and enqueues it"""
+        operation = endpoint['operation']
+        method_name = endpoint['method_name']
+        model_type = self.spec.qualified_model(self.request_model(endpoint))
+        out.write("    /**\n")
+        if 'summary' in operation:
+            out.write(f"     * {operation['summary'].rstrip('.')}, for any number of {list_property}\n")
+        out.write(f"     * Sends {list_property} in chunks of itemsPerRequest from chained Queueables\n")
+        out.write("     *\n")
+        out.write(f"     * @param requestBody The request payload; its {list_property} list is split into chunks\n")
+        out.write("     * @param handler Receives the aggregated Result (may be null)\n")
+        out.write("     * @return Id The first Queueable job\n")
+        out.write("     */\n")
+        out.write(f"    public static Id {method_name}({model_type} requestBody, ResultHandler handler) {{\n")
+        out.write(f"        List<String> chunks = chunkBodies(requestBody, '{list_property}', itemsPerRequest);\n")
+        operation_id = endpoint['operation_id'] or method_name
+        out.write(f"        return enqueue('{operation_id}', '{endpoint['method'].upper()}', "
+                  f"'{endpoint['path']}', chunks, handler);\n")
+        out.write("    }\n\n")
+
+    def generate_bulk_class(self, out: CodeEmitter):
+        """Emit DocrioBulkJob: bulk wrappers plus the Queueable and Finalizer that run them"""
+        items_per_job = sum(bulk_job_plan(BULK_ITEMS_PER_REQUEST * BULK_REQUESTS_PER_JOB)[0])
+        out.write(f"""/**
+ * Generated Docrio API bulk jobs
+ * Each wrapper splits the list in a request body into chunks of itemsPerRequest items
+ * and sends them from chained Queueables. A job makes at most requestsPerJob callouts,
+ * keeps one callout for the token request and stops early before the callout time
+ * limit. Its Finalizer enqueues the next job while chunks remain; once every chunk has
+ * been sent, or one has failed, it passes the aggregated Result to the ResultHandler.
+ */
+public class DocrioBulkJob implements Queueable, Database.AllowsCallouts {{
+    
+    // Items per request, and requests per Queueable; read when a wrapper is called.
+    // With the defaults one job sends up to {items_per_job} items
+    public static Integer itemsPerRequest = {BULK_ITEMS_PER_REQUEST};
+    public static Integer requestsPerJob = {BULK_REQUESTS_PER_JOB};
+    // A job sends no further chunk after this long (callouts may take 120 s per transaction)
+    private static final Long MAX_JOB_MILLIS = {BULK_MAX_JOB_MILLIS};
+    
+    private String method;
+    private String path;
+    // Serialized request body of each chunk
+    private List<String> chunks;
+    private Integer requestLimit;
+    private ResultHandler handler;
+    @TestVisible
+    private Result result;
+""")
+        bulk = self.bulk_endpoints()
+        if bulk:
+            out.write("\n    // Bulk Wrappers\n")
+        for endpoint, list_property in bulk:
+            self.emit_bulk_wrapper(out, endpoint, list_property)
+        out.write(f"""    private DocrioBulkJob(String operationId, String method, String path, List<String> chunks,
+                          ResultHandler handler) {{
+        this.method = method;
+        this.path = path;
+        this.chunks = chunks;
+        this.requestLimit = requestsPerJob;
+        this.handler = handler;
+        this.result = new Result();
+        this.result.operationId = operationId;
+        this.result.chunkCount = chunks.size();
+    }}
+    
+    /**
+     * Sends the next chunks, as many as this transaction's callout limits allow
+     */
+    public void execute(QueueableContext context) {{
+        System.attachFinalizer(new ChainFinalizer(this));
+        result.jobCount++;
+        Long started = System.currentTimeMillis();
+        Integer budget = {apex_expression(BULK_JOB_BUDGET)};
+        Integer first = result.responses.size();
+        Integer last = {apex_expression(BULK_JOB_LAST)};
+        DocrioClient client = new DocrioClient().withOperation(result.operationId);
+        for (Integer i = first; i < last; i++) {{
+            // The first chunk is always sent, so every job makes progress
+            if (i > first && System.currentTimeMillis() - started > MAX_JOB_MILLIS) {{
+                break;
+            }}
+            result.responses.add(client.doCalloutRaw(method, path, chunks[i], 'application/json'));
+        }}
+    }}
+    
+    /**
+     * Serialized copies of requestBody whose listProperty holds at most size items each
+     */
+    @TestVisible
+    private static List<String> chunkBodies(Object requestBody, String listProperty, Integer size) {{
+        Map<String, Object> body = requestBody != null
+            ? (Map<String, Object>) JSON.deserializeUntyped(JSON.serialize(requestBody)) : null;
+        List<Object> items = body != null ? (List<Object>) body.get(listProperty) : null;
+        if (items == null || items.isEmpty()) {{
+            throw new DocrioClient.DocrioException(listProperty + ' must list at least one item');
+        }}
+        List<String> chunks = new List<String>();
+        for (Integer start = 0; start < items.size(); start += size) {{
+            List<Object> chunk = new List<Object>();
+            for (Integer i = start; i < {apex_expression(BULK_CHUNK_END)}; i++) {{
+                chunk.add(items[i]);
+            }}
+            body.put(listProperty, chunk);
+            chunks.add(JSON.serialize(body));
+        }}
+        return chunks;
+    }}
+    
+    private static Id enqueue(String operationId, String method, String path, List<String> chunks,
+                              ResultHandler handler) {{
+        return System.enqueueJob(new DocrioBulkJob(operationId, method, path, chunks, handler));
+    }}
+    
+    /**
+     * Receives the Result of a bulk operation; implementations must be serializable
+     */
+    public interface ResultHandler {{
+        void handle(Result result);
+    }}
+    
+    /**
+     * Response body of every chunk sent, in order, and the error that stopped the rest
+     */
+    public class Result {{
+        public String operationId;
+        public Integer chunkCount;
+        public Integer jobCount = 0;
+        public List<String> responses = new List<String>();
+        public String failure;
+        
+        public Boolean isComplete() {{
+            return failure == null && responses.size() == chunkCount;
+        }}
+    }}
+    
+    /**
+     * Chains the next job while chunks remain, then hands the Result to the handler
+     */
+    public class ChainFinalizer implements Finalizer {{
+        private DocrioBulkJob job;
+        
+        public ChainFinalizer(DocrioBulkJob job) {{
+            this.job = job;
+        }}
+        
+        public void execute(FinalizerContext context) {{
+            Result result = job.result;
+            if (context.getResult() == ParentJobResult.UNHANDLED_EXCEPTION) {{
+                result.failure = context.getException().getMessage();
+            }} else if (result.responses.size() < result.chunkCount) {{
+                System.enqueueJob(job);
+                return;
+            }}
+            if (job.handler != null) {{
+                job.handler.handle(result);
+            }}
+        }}
+    }}
+}}
+""")
 
-    def write_file(self, filename: str, content: str):
-        """Write content to a file and its meta.xml"""
+    def open_output(self, filename: str) -> StreamingOutput:
+        """Open a streaming writer for a class in the output directory, and write its meta.xml"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        filepath = os.path.join(self.output_dir, filename)
+        self.write_meta(filepath)
+        return StreamingOutput(filepath)
+
+    def write_file(self, filename: str, content: str) -> bool:
+        """Write content to a file and its meta.xml, skipping files whose bytes are unchanged"""
         os.makedirs(self.output_dir, exist_ok=True)
         filepath = os.path.join(self.output_dir, filename)
         
-        with open(filepath, 'w') as f:
-            f.write(content)
-            
+        changed = write_if_changed(filepath, content)
+        self.write_meta(filepath)
+        return changed
+
+    def write_meta(self, filepath: str):
+        """Write the meta.xml file accompanying a generated class"""
         meta_content = """<?xml version="1.0" encoding="UTF-8"?>
 <ApexClass xmlns="http://soap.sforce.com/2006/04/metadata">
     <apiVersion>57.0</apiVersion>
     <status>Active</status>
 </ApexClass>"""
         
-        with open(f"{filepath}-meta.xml", 'w') as f:
-            f.write(meta_content)
+        write_if_changed(f"{filepath}-meta.xml", meta_content)
 
-    def generate(self):
-        """Generate the service class"""
-        service_content = self.generate_service_class()
-        self.write_file('DocrioService.cls', service_content)
+    def generate(self, pool: Optional[Executor] = None):
+        """Generate the service and bulk job classes, streaming them straight to disk"""
+        with self.open_output('DocrioService.cls') as out:
+            self.generate_service_class(out, pool)
+        with self.open_output('DocrioBulkJob.cls') as out:
+            self.generate_bulk_class(out)
 
 def main():
-    generator = ServiceGenerator()
-    
-    # Load both swagger.json and DocrioModels.cls
-    generator.load_swagger('swagger.json')
-    generator.load_docrio_models('force-app/main/default/classes/DocrioModels.cls')
-    
-    # Generate service class
-    generator.generate()
+    # Model and service generation share one compiled spec; see generate_docrio.py
+    from generate_docrio import main as generate_main
+    generate_main()
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from docrio_spec import DocrioSpec  # noqa: E402
+
+SWAGGER_FILE = os.path.join(ROOT, 'swagger.json')
+CLASSES_DIR = os.path.join(ROOT, 'force-app', 'main', 'default', 'classes')
+
+
+@pytest.fixture(scope='session')
+def spec() -> DocrioSpec:
+    return DocrioSpec.load(SWAGGER_FILE)
@@ -0,0 +1,81 @@
+"""Tests for interned anonymous model classes: stable names and one class per inline shape."""
+import json
+import os
+import re
+import subprocess
+import sys
+
+from codegen_emitter import CodeEmitter
+from conftest import ROOT, SWAGGER_FILE
+from docrio_spec import DocrioSpec
+from generate_docrio_models import ApexGenerator
+
+ANONYMOUS_CLASS = re.compile(r"public class (Anonymous[0-9A-F]{8}) \{")
+# Prints the anonymous class names generated from swagger.json, for runs under another hash seed
+LIST_NAMES = ("import sys; sys.path.insert(0, 'tests'); "
+              "from test_anonymous_models import anonymous_classes, load_swagger; "
+              "print(' '.join(anonymous_classes(load_swagger())))")
+
+
+def load_swagger() -> dict:
+    with open(SWAGGER_FILE, 'r') as f:
+        return json.load(f)
+
+
+def generated_models(swagger: dict) -> str:
+    out = CodeEmitter()
+    ApexGenerator(DocrioSpec(swagger)).generate_model_classes(out)
+    return out.getvalue()
+
+
+def anonymous_classes(swagger: dict) -> list:
+    return ANONYMOUS_CLASS.findall(generated_models(swagger))
+
+
+def reverse_properties(schema):
+    """A copy of schema with every properties map in reverse order"""
+    if isinstance(schema, list):
+        return [reverse_properties(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    copy = {key: reverse_properties(value) for key, value in schema.items()}
+    if isinstance(copy.get('properties'), dict):
+        copy['properties'] = dict(reversed(list(copy['properties'].items())))
+    return copy
+
+
+def test_names_are_stable_across_runs_and_property_order():
+    names = anonymous_classes(load_swagger())
+    assert names and len(set(names)) == len(names)
+    assert anonymous_classes(load_swagger()) == names
+    swagger = load_swagger()
+    swagger['components'] = reverse_properties(swagger['components'])
+    assert sorted(anonymous_classes(swagger)) == sorted(names)
+    # A fresh interpreter with a different string hash seed names them the same way
+    for seed in ('1', '2'):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        output = subprocess.run([sys.executable, '-c', LIST_NAMES], cwd=ROOT, env=env, check=True,
+                                capture_output=True, text=True).stdout
+        assert output.split() == names
+
+
+def test_identical_inline_objects_share_one_class():
+    owner = {'type': 'object', 'properties': {'Id': {'type': 'string'}, 'Name': {'type': 'string'}}}
+    swagger = {
+        'openapi': '3.0.0',
+        'info': {'title': 'Owners', 'version': '1'},
+        'paths': {},
+        'components': {'schemas': {
+            'Folder': {'type': 'object', 'properties': {'Owner': owner}},
+            # Same shape with its properties in another order and a description, which does not affect the class
+            'Matter': {'type': 'object', 'properties': {'Lead': dict(reverse_properties(owner), description='Lead'),
+                                                        'Team': {'type': 'array', 'items': owner}}},
+        }},
+    }
+    source = generated_models(swagger)
+    names = ANONYMOUS_CLASS.findall(source)
+    assert len(names) == 1
+    qualified = f"DocrioModels.{names[0]}"
+    assert f"public {qualified} Owner" in source
+    assert f"public {qualified} Lead" in source
+    assert f"public List<{qualified}> Team" in source
@@ -0,0 +1,100 @@
+"""Tests for access token caching, reuse and refresh-on-401."""
+import asyncio
+
+import pytest
+
+from docrio_client import DocrioApiError, DocrioAsyncClient, MetricsRecorder, SalesforceTokenProvider
+from docrio_mock_server import TOKEN_PATH, MockDocrioServer
+
+FILE_ID = 'a1D000000000001AAA'
+
+
+def token_provider(server: MockDocrioServer, **options) -> SalesforceTokenProvider:
+    return SalesforceTokenProvider(f"{server.origin}{TOKEN_PATH}", 'client-id', 'client-secret',
+                                   'user@example.com', 'password', **options)
+
+
+def test_token_is_fetched_once_and_reused(spec):
+    async def scenario():
+        server = MockDocrioServer(spec)
+        async with server as base_url:
+            provider = token_provider(server)
+            async with DocrioAsyncClient(provider, 'key', base_url) as client:
+                for _ in range(10):
+                    await client.getFiles(Ids=FILE_ID)
+            await provider.close()
+        return server.stats()['requests'], provider
+
+    requests, provider = asyncio.run(scenario())
+    assert requests['oauthToken'] == 1
+    assert requests['getFiles'] == 10
+    assert provider.fetches == 1
+
+
+def test_concurrent_calls_share_one_fetch(spec):
+    async def scenario():
+        server = MockDocrioServer(spec, latency='fixed:20')
+        async with server as base_url:
+            provider = token_provider(server)
+            async with DocrioAsyncClient(provider, 'key', base_url) as client:
+                await asyncio.gather(*(client.getFiles(Ids=FILE_ID) for _ in range(20)))
+            await provider.close()
+        return server.stats()['requests']
+
+    requests = asyncio.run(scenario())
+    assert requests['oauthToken'] == 1
+    assert requests['getFiles'] == 20
+
+
+def test_rejected_token_is_refreshed_and_retried_once(spec):
+    recorder = MetricsRecorder()
+
+    async def scenario():
+        server = MockDocrioServer(spec)
+        async with server as base_url:
+            provider = token_provider(server)
+            async with DocrioAsyncClient(provider, 'key', base_url, instrumentation=recorder) as client:
+                await client.getFiles(Ids=FILE_ID)
+                server.revoke_tokens()
+                await asyncio.gather(*(client.getFiles(Ids=FILE_ID) for _ in range(3)))
+            await provider.close()
+        return server.stats()
+
+    stats = asyncio.run(scenario())
+    # The three rejected calls share one refresh
+    assert stats['requests']['oauthToken'] == 2
+    assert stats['statuses'][401] == 3
+    files = recorder.snapshot()['operations']['getFiles']
+    assert files['statuses'] == {'200': 4} and files['retries'] == 3
+
+
+def test_expiring_token_is_replaced_before_use(spec):
+    async def scenario():
+        # Tokens live 60 seconds, inside the default five-minute refresh margin
+        server = MockDocrioServer(spec, token_ttl=60)
+        async with server as base_url:
+            provider = token_provider(server)
+            async with DocrioAsyncClient(provider, 'key', base_url) as client:
+                for _ in range(3):
+                    await client.getFiles(Ids=FILE_ID)
+            await provider.close()
+        return server.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats['requests']['oauthToken'] == 3
+    assert 401 not in stats['statuses']
+
+
+def test_token_request_failure_raises(spec):
+    async def scenario():
+        server = MockDocrioServer(spec)
+        async with server:
+            provider = SalesforceTokenProvider(f"{server.origin}{TOKEN_PATH}", '', '', 'user', 'password')
+            try:
+                await provider.token()
+            finally:
+                await provider.close()
+
+    with pytest.raises(DocrioApiError) as error:
+        asyncio.run(scenario())
+    assert error.value.status == 400
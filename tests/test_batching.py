@@ -0,0 +1,70 @@
+"""Tests for Ids-list and array-body batching in the Python client."""
+import asyncio
+from urllib.parse import quote
+
+from docrio_client import DocrioAsyncClient
+from docrio_client.batching import chunk_ids, chunk_items, merge_id_responses, merge_responses, run_batches
+from docrio_mock_server import MockDocrioServer
+
+
+def test_chunk_ids_respects_count_and_encoded_length():
+    ids = [f"a1E{i:015d}" for i in range(450)]
+    chunks = chunk_ids(ids, max_ids=200)
+    assert [len(chunk) for chunk in chunks] == [200, 200, 50]
+    assert [record_id for chunk in chunks for record_id in chunk] == ids
+
+    # 18 characters plus a 3-character %2C separator: 100 characters fit four Ids
+    chunks = chunk_ids(ids[:10], max_ids=200, max_length=100)
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert all(len(quote(','.join(chunk), safe='')) <= 100 for chunk in chunks)
+    assert chunk_ids([]) == []
+
+
+def test_chunk_items():
+    assert chunk_items(list(range(7)), 3) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_merge_keeps_input_order_without_mutating_chunks():
+    first = {'Records': [{'Id': 'b'}, {'Id': 'a'}], 'Total': 2}
+    second = {'Records': [{'Id': 'c'}], 'Total': 1}
+    merged = merge_id_responses(['a', 'b', 'c'], [first, second])
+    assert [record['Id'] for record in merged['Records']] == ['a', 'b', 'c']
+    assert merged['Total'] == 2
+    assert [record['Id'] for record in first['Records']] == ['b', 'a']
+
+    merged = merge_responses([{'Successes': [1], 'Failures': []}, None, {'Successes': [2], 'Failures': ['x']}])
+    assert merged == {'Successes': [1, 2], 'Failures': ['x']}
+    assert merge_responses([{'a.txt': {}}, {'b.txt': {}}]) == {'a.txt': {}, 'b.txt': {}}
+
+
+def test_run_batches_bounds_concurrency_and_keeps_order():
+    active = {'now': 0, 'peak': 0}
+
+    async def call(chunk):
+        active['now'] += 1
+        active['peak'] = max(active['peak'], active['now'])
+        await asyncio.sleep(0.01 if chunk[0] % 2 else 0)
+        active['now'] -= 1
+        return chunk[0]
+
+    results = asyncio.run(run_batches(chunk_items(list(range(20)), 2), call, 3))
+    assert results == list(range(0, 20, 2))
+    assert active['peak'] <= 3
+
+
+def test_batched_read_against_mock_server(spec):
+    ids = [f"a1E{i:015d}" for i in range(1000)]
+
+    async def scenario():
+        server = MockDocrioServer(spec)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url, limit_per_host=4) as client:
+                info = await client.getFilesInfoBatched(ids, batch_size=100)
+                created = await client.postFilesBatched([{'Name': f"{i}.txt"} for i in range(25)], batch_size=10)
+        return server.stats(), info, created
+
+    stats, info, created = asyncio.run(scenario())
+    assert stats['requests']['getFilesInfo'] == 10
+    assert [record['Id'] for record in info['Records']] == ids
+    assert stats['requests']['postFiles'] == 3
+    assert list(created) == [f"{i}.txt" for i in range(25)]
@@ -0,0 +1,98 @@
+"""Golden-file tests for the generated DocrioBulkJob class: wrappers, chunk math and chaining."""
+import os
+import re
+
+import pytest
+
+from conftest import CLASSES_DIR, SWAGGER_FILE
+from docrio_spec import DocrioSpec
+from generate_docrio_service import (BULK_CHUNK_END, BULK_ITEMS_PER_REQUEST, BULK_JOB_BUDGET, BULK_JOB_LAST,
+                                      BULK_MAX_JOB_MILLIS, BULK_OPERATIONS, BULK_REQUESTS_PER_JOB,
+                                      ServiceGenerator, apex_expression, bulk_job_plan, evaluate_expression)
+
+WRAPPER_PATTERN = re.compile(r"    public static Id (\w+)\(([\w.]+) requestBody, ResultHandler handler\) \{\n"
+                             r"        List<String> chunks = chunkBodies\(requestBody, '(\w+)', itemsPerRequest\);\n"
+                             r"        return enqueue\('(\w+)', '([A-Z]+)', '([^']+)', chunks, handler\);\n")
+
+
+def generated_bulk_class(spec: DocrioSpec, output_dir: str) -> str:
+    generator = ServiceGenerator(spec)
+    generator.output_dir = output_dir
+    generator.generate()
+    with open(os.path.join(output_dir, 'DocrioBulkJob.cls'), 'r') as f:
+        return f.read()
+
+
+@pytest.fixture(scope='module')
+def bulk_source(spec, tmp_path_factory) -> str:
+    return generated_bulk_class(spec, str(tmp_path_factory.mktemp('bulk')))
+
+
+def test_matches_checked_in_class(bulk_source):
+    with open(os.path.join(CLASSES_DIR, 'DocrioBulkJob.cls'), 'r') as f:
+        assert bulk_source == f.read()
+
+
+def test_every_bulk_operation_has_a_wrapper(spec, bulk_source):
+    wrappers = {match.group(1): match.groups()[1:] for match in WRAPPER_PATTERN.finditer(bulk_source)}
+    expected = {endpoint['method_name']: endpoint for endpoint in spec.endpoints
+                if (endpoint['method'], endpoint['path']) in BULK_OPERATIONS}
+    assert set(wrappers) == set(expected) and len(wrappers) == len(BULK_OPERATIONS)
+    for name, (model_type, list_property, operation_id, method, path) in wrappers.items():
+        endpoint = expected[name]
+        assert model_type == f"DocrioModels.{endpoint['request_schema']['$ref'].split('/')[-1]}"
+        assert list_property == BULK_OPERATIONS[(endpoint['method'], endpoint['path'])]
+        assert (operation_id, method, path) == (name, endpoint['method'].upper(), endpoint['path'])
+
+
+def test_chunk_math_is_emitted_from_the_expression_trees(bulk_source):
+    assert f"public static Integer itemsPerRequest = {BULK_ITEMS_PER_REQUEST};" in bulk_source
+    assert f"public static Integer requestsPerJob = {BULK_REQUESTS_PER_JOB};" in bulk_source
+    assert f"private static final Long MAX_JOB_MILLIS = {BULK_MAX_JOB_MILLIS};" in bulk_source
+    assert f"for (Integer i = start; i < {apex_expression(BULK_CHUNK_END)}; i++) {{" in bulk_source
+    assert f"Integer budget = {apex_expression(BULK_JOB_BUDGET)};" in bulk_source
+    assert f"Integer last = {apex_expression(BULK_JOB_LAST)};" in bulk_source
+    assert 'Integer budget = Math.min(requestLimit, Limits.getLimitCallouts() - Limits.getCallouts() - 1);' \
+        in bulk_source
+
+
+def test_expressions_render_and_evaluate_with_the_same_grouping():
+    tree = ('min', 'a', ('-', 'b', ('+', 'c', 1)))
+    assert apex_expression(tree) == 'Math.min(a, b - (c + 1))'
+    assert evaluate_expression(tree, {'a': 10, 'b': 8, 'c': 3}) == 4
+
+
+@pytest.mark.parametrize('total, jobs', [
+    (1, [[1]]),
+    (100, [[100]]),
+    (101, [[100, 1]]),
+    (2500, [[100] * 25]),
+    (5050, [[100] * 25, [100] * 25, [50]]),
+])
+def test_chunk_math(total, jobs):
+    assert bulk_job_plan(total) == jobs
+
+
+def test_budget_keeps_a_callout_for_the_token():
+    # With a high requestsPerJob, the platform callout limit decides and the token request still fits
+    jobs = bulk_job_plan(20000, requests_per_job=500)
+    assert [len(job) for job in jobs] == [99, 99, 2]
+    with pytest.raises(ValueError):
+        bulk_job_plan(10, requests_per_job=0)
+
+
+def test_finalizer_chains_until_every_chunk_is_sent(bulk_source):
+    execute = bulk_source[bulk_source.index('public void execute(QueueableContext context)'):]
+    assert execute.index('System.attachFinalizer(new ChainFinalizer(this));') < execute.index('doCalloutRaw')
+    finalizer = bulk_source[bulk_source.index('public void execute(FinalizerContext context)'):]
+    failure = finalizer.index('ParentJobResult.UNHANDLED_EXCEPTION')
+    chain = finalizer.index('} else if (result.responses.size() < result.chunkCount) {')
+    enqueue = finalizer.index('System.enqueueJob(job);\n                return;')
+    handle = finalizer.index('job.handler.handle(result);')
+    assert failure < chain < enqueue < handle
+
+
+def test_tree_shaken_spec_only_wraps_included_operations(tmp_path):
+    spec = DocrioSpec.load(SWAGGER_FILE, include=['/move'])
+    source = generated_bulk_class(spec, str(tmp_path))
+    assert [match.group(1) for match in WRAPPER_PATTERN.finditer(source)] == ['postMove']
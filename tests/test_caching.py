@@ -0,0 +1,112 @@
+"""Tests for the read response cache, its invalidation and in-flight coalescing."""
+import asyncio
+
+from docrio_client import DocrioAsyncClient, ResponseCache
+from docrio_client.caching import record_ids
+from docrio_mock_server import MockDocrioServer
+
+FILE_A = 'a1D000000000001AAA'
+FILE_B = 'a1D000000000002AAA'
+RECORD = 'a0B000000000001AAA'
+
+
+def run(spec, cache, scenario, **server_options):
+    """Run scenario(client) against a mock server and return its request counts"""
+    async def main():
+        server = MockDocrioServer(spec, **server_options)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url, cache=cache) as client:
+                await scenario(client)
+        return server.stats()['requests']
+
+    return asyncio.run(main())
+
+
+def test_record_ids():
+    body = {'Ids': [FILE_A], 'RelatedRecordId': RECORD, 'Name': 'a1D000000000009AAA',
+            'Records': [{'Id': FILE_B, 'FileIds': 'x, y'}]}
+    assert record_ids(body) == {FILE_A, FILE_B, RECORD, 'x', 'y'}
+    assert record_ids({'Ids': f"{FILE_A},{FILE_B}"}) == {FILE_A, FILE_B}
+
+
+def test_repeated_reads_are_served_from_the_cache(spec):
+    cache = ResponseCache()
+    results = []
+
+    async def scenario(client):
+        for _ in range(3):
+            results.append(await client.getFilesInfo(Ids=FILE_A))
+        results[0]['Records'].clear()
+        results.append(await client.getFilesInfo(FILE_A, None))
+        await client.getFilesInfo(Ids=FILE_B)
+
+    requests = run(spec, cache, scenario)
+    assert requests['getFilesInfo'] == 2
+    # Each caller gets its own parsed copy
+    assert results[1] == results[2] == results[3] and results[3]['Records']
+    assert cache.snapshot()['hits'] == 3 and cache.snapshot()['misses'] == 2
+
+
+def test_concurrent_identical_reads_share_one_request(spec):
+    cache = ResponseCache()
+
+    async def scenario(client):
+        # getFiles is not cached (its signed URLs expire) but concurrent calls are still coalesced
+        pages = await asyncio.gather(*(client.getFiles(Ids=FILE_A) for _ in range(10)))
+        assert all(page == pages[0] for page in pages)
+        await client.getFiles(Ids=FILE_A)
+
+    requests = run(spec, cache, scenario, latency='fixed:20')
+    assert requests['getFiles'] == 2
+    assert cache.snapshot()['coalesced'] == 9 and cache.snapshot()['entries'] == 0
+
+
+def test_mutations_invalidate_entries_with_the_same_ids(spec):
+    cache = ResponseCache()
+
+    async def scenario(client):
+        await client.getFilesInfo(Ids=FILE_A)
+        await client.getFilesInfo(Ids=FILE_B)
+        await client.getFavorites(RECORD)
+        await client.patchFiles({'Id': FILE_A, 'Name': 'renamed.pdf'})
+        await client.getFilesInfo(Ids=FILE_A)
+        await client.getFilesInfo(Ids=FILE_B)
+        await client.getFavorites(RECORD)
+        await client.postMove({'Ids': [FILE_B], 'RelatedRecordId': RECORD})
+        await client.getFilesInfo(Ids=FILE_B)
+        await client.getFavorites(RECORD)
+
+    requests = run(spec, cache, scenario)
+    assert requests['getFilesInfo'] == 4
+    assert requests['getFavorites'] == 2
+
+
+def test_reads_overlapping_a_mutation_are_not_stored(spec):
+    cache = ResponseCache()
+
+    async def scenario(client):
+        read = asyncio.ensure_future(client.getFilesInfo(Ids=FILE_A))
+        await asyncio.sleep(0.005)
+        await client.patchFiles({'Id': FILE_A, 'Name': 'renamed.pdf'})
+        await read
+        await client.getFilesInfo(Ids=FILE_A)
+
+    requests = run(spec, cache, scenario, operation_latency={'getFilesInfo': 'fixed:30'})
+    assert requests['getFilesInfo'] == 2
+
+
+def test_entries_expire_and_are_bounded(spec):
+    cache = ResponseCache(max_entries=2, ttls={'getFilesInfo': 0.05})
+
+    async def scenario(client):
+        await client.getFilesInfo(Ids=FILE_A)
+        await asyncio.sleep(0.06)
+        await client.getFilesInfo(Ids=FILE_A)
+        await client.getFilesInfo(Ids=FILE_B)
+        await client.getFilesInfo(Ids=RECORD)
+        # FILE_A was least recently used, so it made room for RECORD
+        await client.getFilesInfo(Ids=FILE_A)
+
+    requests = run(spec, cache, scenario)
+    assert requests['getFilesInfo'] == 5
+    assert cache.snapshot()['evicted'] == 2 and len(cache.entries) == 2
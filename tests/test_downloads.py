@@ -0,0 +1,80 @@
+"""Tests for streaming bulk downloads against the mock Docrio server."""
+import asyncio
+import os
+
+from docrio_client import DocrioAsyncClient
+from docrio_client.downloads import PART_SUFFIX, BulkDownloader, default_file_name
+from docrio_client.transport import STREAM_CHUNK_SIZE, DocrioTransport
+from docrio_mock_server import MockDocrioServer
+
+SIZE = 3 * STREAM_CHUNK_SIZE + 17
+IDS = [f"a1E{i:015d}" for i in range(30)]
+
+
+def test_bodies_stream_to_the_sink_in_bounded_chunks(spec):
+    async def scenario():
+        async with MockDocrioServer(spec, download_size=SIZE) as base_url:
+            transport = DocrioTransport(base_url, {'Authorization': 'Bearer token', 'X-API-KEY': 'key'})
+            url = (await transport.request('GET', '/files', {'Ids': IDS[0]}))['Records'][0]['SignedUrl']
+            chunks = []
+            response = await transport.send('GET', url, default_headers=False, sink=chunks.append)
+            await transport.close()
+            return response, chunks
+
+    response, chunks = asyncio.run(scenario())
+    assert response.status == 200 and response.body == b''
+    assert sum(len(chunk) for chunk in chunks) == SIZE
+    assert max(len(chunk) for chunk in chunks) <= STREAM_CHUNK_SIZE
+
+
+def test_bulk_download_then_skip_on_rerun(spec, tmp_path):
+    async def scenario():
+        server = MockDocrioServer(spec, download_size=SIZE)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                downloader = BulkDownloader(client, str(tmp_path), concurrency=4, batch_size=10)
+                first = await downloader.download(IDS)
+                downloads = server.stats()['requests']['signedUrl']
+                second = await downloader.download(IDS)
+        return server.stats(), first, downloads, second
+
+    stats, first, downloads, second = asyncio.run(scenario())
+    assert first == {'downloaded': 30, 'skipped': 0, 'bytes': 30 * SIZE, 'failed': {}}
+    assert stats['requests']['getFilesInfo'] == 6
+    assert second['skipped'] == 30 and second['downloaded'] == 0
+    assert stats['requests']['signedUrl'] == downloads == 30
+    names = sorted(os.listdir(tmp_path))
+    assert len(names) == 30 and not any(name.endswith(PART_SUFFIX) for name in names)
+    assert all(os.path.getsize(tmp_path / name) == SIZE for name in names)
+
+
+def test_truncated_file_is_downloaded_again(spec, tmp_path):
+    async def scenario():
+        async with MockDocrioServer(spec, download_size=SIZE) as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                downloader = BulkDownloader(client, str(tmp_path))
+                await downloader.download(IDS[:2])
+                path = tmp_path / sorted(os.listdir(tmp_path))[0]
+                path.write_bytes(b'partial')
+                return path, await downloader.download(IDS[:2])
+
+    path, summary = asyncio.run(scenario())
+    assert summary['downloaded'] == 1 and summary['skipped'] == 1
+    assert os.path.getsize(path) == SIZE
+
+
+def test_expired_urls_are_signed_again(spec, tmp_path):
+    async def scenario():
+        server = MockDocrioServer(spec, latency='fixed:30', signed_url_ttl=0.05, download_size=1024)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                summary = await BulkDownloader(client, str(tmp_path), concurrency=1).download(IDS[:4])
+        return server.stats(), summary
+
+    stats, summary = asyncio.run(scenario())
+    assert summary['downloaded'] == 4 and not summary['failed']
+    assert stats['requests']['getFiles'] > 1
+
+
+def test_default_file_name_is_safe():
+    assert default_file_name({'Id': 'a1E', 'Name': 'bills/2024: jan?.pdf'}) == 'a1E_bills_2024_ jan_.pdf'
@@ -0,0 +1,74 @@
+"""Tests for incremental regeneration: fragment manifests, unchanged-file skipping and streamed output."""
+import json
+import os
+
+from codegen_emitter import CodeEmitter
+from codegen_manifest import CodegenManifest
+from conftest import SWAGGER_FILE
+from docrio_spec import MODELS_CLASS, DocrioSpec
+from generate_docrio import generator_sources
+from generate_docrio_models import ApexGenerator
+from generate_docrio_service import ServiceGenerator
+
+# Backdated mtime; files the second run leaves alone keep it
+OLD_MTIME = 1_000_000_000
+
+
+def load_swagger() -> dict:
+    with open(SWAGGER_FILE, 'r') as f:
+        return json.load(f)
+
+
+def generate(swagger: dict, output_dir: str, manifest_dir: str):
+    """One incremental run of the Apex backends; returns the models and service manifests"""
+    spec = DocrioSpec(swagger)
+    models_manifest = CodegenManifest(os.path.join(manifest_dir, 'DocrioModels.manifest.json'),
+                                      *generator_sources('generate_docrio_models.py'))
+    service_manifest = CodegenManifest(os.path.join(manifest_dir, 'DocrioService.manifest.json'),
+                                       *generator_sources('generate_docrio_service.py'))
+    for manifest, backend in ((models_manifest, ApexGenerator), (service_manifest, ServiceGenerator)):
+        manifest.load()
+        generator = backend(spec, manifest)
+        generator.output_dir = output_dir
+        generator.generate()
+        manifest.save()
+    return models_manifest, service_manifest
+
+
+def test_one_schema_edit_rerenders_one_fragment(tmp_path):
+    output_dir, manifest_dir = str(tmp_path / 'classes'), str(tmp_path / '.codegen')
+    swagger = load_swagger()
+    generate(swagger, output_dir, manifest_dir)
+    files = sorted(os.listdir(output_dir))
+    for name in files:
+        os.utime(os.path.join(output_dir, name), (OLD_MTIME, OLD_MTIME))
+    with open(os.path.join(manifest_dir, 'DocrioModels.manifest.json'), 'r') as f:
+        before = json.load(f)['fragments']
+
+    swagger['components']['schemas']['MovePostRequest']['properties']['Note'] = {'type': 'string'}
+    models_manifest, service_manifest = generate(swagger, output_dir, manifest_dir)
+
+    assert models_manifest.misses == 1 and models_manifest.hits == len(before) - 1
+    assert [key for key, entry in models_manifest.fragments.items()
+            if before[key]['hash'] != entry['hash']] == ['schema:MovePostRequest']
+    assert service_manifest.misses == 0
+    changed = [name for name in files if os.path.getmtime(os.path.join(output_dir, name)) != OLD_MTIME]
+    assert changed == ['DocrioModels.cls']
+    assert not [name for name in os.listdir(output_dir) if name.endswith('.tmp')]
+
+
+def test_streamed_output_matches_in_memory_rendering(tmp_path):
+    output_dir, manifest_dir = str(tmp_path / 'classes'), str(tmp_path / '.codegen')
+    swagger = load_swagger()
+    generate(swagger, output_dir, manifest_dir)
+    # The second run is assembled from cached fragments
+    generate(swagger, output_dir, manifest_dir)
+
+    spec = DocrioSpec(swagger)
+    models = CodeEmitter()
+    ApexGenerator(spec).generate_model_classes(models, outer_class=MODELS_CLASS)
+    service = CodeEmitter()
+    ServiceGenerator(spec).generate_service_class(service)
+    for filename, emitter in (('DocrioModels.cls', models), ('DocrioService.cls', service)):
+        with open(os.path.join(output_dir, filename), 'rb') as f:
+            assert f.read() == emitter.getvalue().encode('utf-8')
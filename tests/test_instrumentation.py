@@ -0,0 +1,88 @@
+"""Tests for per-operation instrumentation and the MetricsRecorder histograms."""
+import asyncio
+import json
+
+import pytest
+
+from docrio_client import DocrioApiError, DocrioAsyncClient, Histogram, MetricsRecorder
+from docrio_mock_server import MockDocrioServer
+from test_python_client import RecordingServer
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram((1, 10, 100))
+    for value in (0.5, 3, 4, 5, 6, 7, 8, 9, 50, 500):
+        histogram.add(value)
+    assert histogram.counts == [1, 7, 1, 1]
+    assert (histogram.count, histogram.min, histogram.max) == (10, 0.5, 500)
+    assert histogram.quantile(0.5) == 10
+    assert histogram.quantile(0.9) == 100
+    assert histogram.quantile(1.0) == 500
+    assert histogram.to_json()['buckets'] == [[1, 1], [10, 7], [100, 1], ['+Inf', 1]]
+    assert Histogram((1,)).quantile(0.5) is None
+
+
+def test_calls_are_recorded_per_operation(spec, tmp_path):
+    recorder = MetricsRecorder()
+    calls = []
+
+    def sink(call):
+        calls.append(call)
+        recorder(call)
+
+    async def scenario():
+        server = MockDocrioServer(spec, operation_latency={'getFiles': 'fixed:30'})
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url, instrumentation=sink) as client:
+                for _ in range(3):
+                    await client.getFiles(Ids='a1D000000000001AAA')
+                await client.postMerge({'Templates': [{'SourceId': 'a1D000000000001AAA'}]})
+
+    asyncio.run(scenario())
+    assert set(calls[0]) == {'operation', 'method', 'path', 'status', 'seconds', 'request_bytes',
+                             'response_bytes', 'retries', 'error'}
+    snapshot = recorder.snapshot()['operations']
+    # The slow operation comes first
+    assert list(snapshot) == ['getFiles', 'postMerge']
+    files = snapshot['getFiles']
+    assert files['latency_ms']['count'] == 3 and files['latency_ms']['min'] >= 30
+    assert files['statuses'] == {'200': 3} and files['errors'] == 0
+    assert files['request_bytes']['sum'] == 0 and files['response_bytes']['min'] > 0
+    assert snapshot['postMerge']['request_bytes']['sum'] == calls[-1]['request_bytes'] > 0
+
+    path = tmp_path / 'metrics.json'
+    recorder.export(str(path))
+    assert json.loads(path.read_text()) == json.loads(json.dumps(recorder.snapshot()))
+    assert recorder.report()[1].startswith('getFiles')
+
+
+def test_failed_calls_are_recorded(spec):
+    recorder = MetricsRecorder()
+
+    async def scenario():
+        server = MockDocrioServer(spec, error_rate=1.0)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url, instrumentation=recorder) as client:
+                with pytest.raises(DocrioApiError):
+                    await client.getMergeSchema('a1D000000000001AAA')
+
+    asyncio.run(scenario())
+    stats = recorder.snapshot()['operations']['getMergeSchema']
+    assert stats['errors'] == 1
+    assert all(status.startswith('5') for status in stats['statuses'])
+
+
+def test_snapshot_is_pushed_to_a_collector():
+    recorder = MetricsRecorder()
+    recorder({'operation': 'getFiles', 'method': 'GET', 'path': '/files', 'status': 200, 'seconds': 0.01,
+              'request_bytes': 0, 'response_bytes': 100, 'retries': 0, 'error': None})
+
+    async def scenario():
+        collector = RecordingServer()
+        async with collector as base_url:
+            await recorder.push(f"{base_url}/metrics")
+        return collector.requests
+
+    requests = asyncio.run(scenario())
+    assert [(request['method'], request['target']) for request in requests] == [('POST', '/v1/metrics')]
+    assert requests[0]['headers']['content-type'] == 'application/json'
@@ -0,0 +1,185 @@
+"""Tests for the multiplexed job poller."""
+import asyncio
+import json
+
+import pytest
+
+from docrio_client import DocrioAsyncClient, RequestValidationError
+from docrio_client.jobs import JobFailedError, JobPoller, read_statuses
+from docrio_mock_server import MockDocrioServer
+
+
+class StatusClient:
+    """Stands in for DocrioAsyncClient with scripted combine statuses"""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    async def postFilesCombineComplete(self, requestBody):
+        self.calls += 1
+        status = self.statuses.pop(0)
+        if status == 'missing':
+            return {'Errors': {requestBody['Id']: 'File Id is not found'}, 'Statuses': []}
+        return {'Errors': {}, 'Statuses': [{'jobId': requestBody['Id'], 'status': status}]}
+
+
+def test_read_statuses_shapes():
+    assert read_statuses({'status': 'COMPLETE', 'externalJobId': 'j1'}, ['j1'])['j1'][0] == 'COMPLETE'
+    entry = {'jobId': 'abc', 'status': 'COMPLETED'}
+    listed = read_statuses({'jobStatuses': [entry]}, ['unzip/abc', 'unzip/def'])
+    assert listed == {'unzip/abc': ('COMPLETED', entry), 'unzip/def': (None, None)}
+    errors = read_statuses({'Errors': {'f1': 'Cannot find file'}, 'Statuses': []}, ['f1'])
+    assert errors['f1'] == ('ERROR', {'Error': 'Cannot find file'})
+
+
+def test_thousands_of_jobs_share_batched_status_checks(spec):
+    async def scenario():
+        server = MockDocrioServer(spec, job_polls=2)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                poller = JobPoller(client, min_interval=0.01, max_interval=0.05, seed=1)
+                unzip = [poller.track('unzip', f"unzip/{i:05d}") for i in range(2000)]
+                archives = [poller.track('archive', f"archive-{i}") for i in range(20)]
+                done = []
+                poller.track('pdf_convert', 'a1Y000000000001AAA', callback=done.append)
+                await poller.run()
+                return server.stats(), await asyncio.gather(*unzip), await asyncio.gather(*archives), done
+
+    stats, unzip, archives, done = asyncio.run(scenario())
+    assert all(result['status'] == 'COMPLETED' for result in unzip)
+    assert all(result['status'] == 'COMPLETE' for result in archives)
+    assert done[0].status == 'SUCCESS'
+    # 2000 unzip jobs in batches of 100, checked three times each
+    assert stats['requests']['postUnzipStatus'] <= 3 * 20 + 10
+    assert stats['requests']['getArchiveStatus'] == 3 * 20
+
+
+def test_backoff_grows_while_status_stands_still():
+    async def scenario():
+        poller = JobPoller(StatusClient(['QUEUED', 'QUEUED', 'QUEUED', 'RUNNING', 'COMPLETED']),
+                           min_interval=0.01, max_interval=1.0, backoff=2.0, coalesce=0)
+        future = poller.track('combine', 'a14000000000001AAA')
+        job = poller.jobs[('combine', 'a14000000000001AAA')]
+        intervals = []
+        while poller.jobs:
+            job.next_poll = 0.0
+            poller.push(job)
+            await poller.poll_due()
+            intervals.append(job.interval)
+        return intervals, await future
+
+    intervals, result = asyncio.run(scenario())
+    # First sighting counts as progress; repeats double; a new status resets
+    assert intervals[:4] == [0.01, 0.02, 0.04, 0.01]
+    assert result['status'] == 'COMPLETED'
+
+
+def test_failed_jobs_raise():
+    async def scenario():
+        poller = JobPoller(StatusClient(['missing']), min_interval=0.001)
+        future = poller.track('combine', 'a14000000000001AAA')
+        await poller.run()
+        return await future
+
+    with pytest.raises(JobFailedError) as error:
+        asyncio.run(scenario())
+    assert error.value.status == 'ERROR'
+
+
+def test_raising_callback_does_not_stop_the_batch(caplog):
+    class UnzipClient:
+        async def postUnzipStatus(self, requestBody):
+            statuses = {'unzip/a': 'COMPLETED', 'unzip/b': 'COMPLETED', 'unzip/c': 'RUNNING'}
+            return {'jobStatuses': [{'jobId': job_id, 'status': statuses[job_id]}
+                                    for job_id in requestBody['jobIds']]}
+
+    def broken(job):
+        raise RuntimeError('callback failed')
+
+    async def scenario():
+        done = []
+        poller = JobPoller(UnzipClient(), min_interval=0.001, coalesce=1.0, on_complete=done.append)
+        first = poller.track('unzip', 'unzip/a', callback=broken)
+        second = poller.track('unzip', 'unzip/b')
+        poller.track('unzip', 'unzip/c')
+        await poller.poll_due()
+        return await first, await second, done, poller
+
+    first, second, done, poller = asyncio.run(scenario())
+    assert first['status'] == second['status'] == 'COMPLETED'
+    assert [job.job_id for job in done] == ['unzip/a', 'unzip/b']
+    # The running job is still scheduled, so a later round polls it again
+    assert list(poller.jobs) == [('unzip', 'unzip/c')]
+    assert [key for _, _, key in poller.schedule] == [('unzip', 'unzip/c')]
+    assert 'callback failed' in caplog.text
+
+
+def test_job_with_a_bad_param_fails_on_its_own(spec, tmp_path):
+    state_file = str(tmp_path / 'jobs.json')
+
+    async def scenario():
+        server = MockDocrioServer(spec, job_polls=1)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                poller = JobPoller(client, state_file, min_interval=0.001, coalesce=1.0)
+                with pytest.raises(ValueError, match='ShareId'):
+                    poller.track('externallink_zip', 'zip-1')
+                archive = poller.track('archive', 'archive-1')
+                # IsArchived must be a string, so the status request body fails validation
+                zipped = poller.track('folder_zip', 'zip-2', {'IsArchived': True})
+                await poller.run()
+                results = await asyncio.gather(archive, zipped, return_exceptions=True)
+        return results, poller
+
+    (archive, zipped), poller = asyncio.run(scenario())
+    assert archive['status'] == 'COMPLETE'
+    assert isinstance(zipped, RequestValidationError)
+    assert not poller.jobs
+
+
+def test_saved_jobs_missing_params_are_dropped(tmp_path):
+    state_file = tmp_path / 'jobs.json'
+    state_file.write_text(json.dumps({'jobs': [{'kind': 'externallink_zip', 'job_id': 'zip-1'},
+                                               {'kind': 'archive', 'job_id': 'archive-1'}]}))
+
+    async def scenario():
+        return JobPoller(StatusClient([]), str(state_file))
+
+    assert list(asyncio.run(scenario()).jobs) == [('archive', 'archive-1')]
+
+
+def test_polling_resumes_from_saved_state(spec, tmp_path):
+    state_file = str(tmp_path / 'jobs.json')
+
+    async def scenario():
+        server = MockDocrioServer(spec, job_polls=3)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                first = JobPoller(client, state_file, min_interval=0.01)
+                for i in range(5):
+                    first.track('split', f"a14{i:015d}")
+                first.track('externallink_zip', 'zip-1', {'ShareId': 'share-1'})
+                await asyncio.sleep(0.02)
+                await first.poll_due()
+                # The process "restarts": a new poller picks the jobs up from the state file
+                second = JobPoller(client, state_file, min_interval=0.01)
+                resumed = len(second.jobs)
+                zipped = second.track('externallink_zip', 'zip-1')
+                await second.run()
+                polls = dict(server.job_checks)
+        return resumed, await zipped, polls, second
+
+    resumed, zipped, polls, second = asyncio.run(scenario())
+    assert resumed == 6
+    assert zipped['Status'] == 'COMPLETED'
+    assert polls['zip-1'] == 4
+    assert not second.jobs
+
+
+def test_unknown_kind_is_rejected():
+    async def scenario():
+        JobPoller(StatusClient([])).track('transcode', 'job-1')
+
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
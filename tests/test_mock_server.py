@@ -0,0 +1,204 @@
+"""Tests for the spec-driven mock Docrio server."""
+import asyncio
+import random
+import re
+
+import pytest
+
+from conftest import SWAGGER_FILE
+from docrio_client import DocrioApiError, DocrioAsyncClient, DocrioTransport
+from docrio_mock_server import LatencyModel, MockDocrioServer, SyntheticData, server_from_args
+from docrio_spec import DocrioSpec
+
+# Operations that need state created by an earlier call; covered by the flow tests below
+STATEFUL = {('put', '/multipart'), ('put', '/multipart/refresh')}
+PYTHON_TYPES = {'string': str, 'integer': int, 'number': (int, float), 'boolean': bool,
+                'array': list, 'object': dict}
+
+
+def conforms(spec: DocrioSpec, value, schema, depth: int = 0) -> bool:
+    """Structural check that a value matches a schema's types and required properties"""
+    schema = spec.resolve_schema(schema)
+    if not isinstance(schema, dict) or depth > 10:
+        return True
+    kind = schema.get('type', 'object' if 'properties' in schema else None)
+    if kind is None:
+        return True
+    if not isinstance(value, PYTHON_TYPES[kind]):
+        return False
+    if kind == 'array':
+        return all(conforms(spec, item, schema.get('items'), depth + 1) for item in value)
+    if kind == 'object':
+        properties = schema.get('properties', {})
+        return (all(name in value for name in schema.get('required', []))
+                and all(conforms(spec, value[name], prop, depth + 1)
+                        for name, prop in properties.items() if name in value))
+    return True
+
+
+def run(scenario):
+    return asyncio.run(scenario())
+
+
+def test_every_operation_returns_a_conforming_response(spec):
+    data = SyntheticData(spec, random.Random(1))
+
+    async def scenario():
+        async with MockDocrioServer(spec) as base_url:
+            transport = DocrioTransport(base_url, {'Authorization': 'Bearer token', 'X-API-KEY': 'key'})
+            results = []
+            for endpoint in spec.endpoints:
+                if (endpoint['method'], endpoint['path']) in STATEFUL:
+                    continue
+                path = re.sub(r'{[^}]+}', 'a1E000000000001AAA', endpoint['path'])
+                query = {param['name']: data.value(param.get('schema')) for param in endpoint['parameters']
+                         if param.get('in') == 'query' and param.get('required')}
+                body = data.value(endpoint['request_schema']) if endpoint['request_schema'] else None
+                result = await transport.request(endpoint['method'].upper(), path, query, body)
+                results.append((endpoint, result))
+            await transport.close()
+            return results
+
+    for endpoint, result in run(scenario):
+        if endpoint['pagination'] is not None:
+            # The spec declares a single paged record; the API returns an array of them
+            items = endpoint['pagination']['items']
+            schema = spec.resolve_schema(endpoint['response_schema'])['properties'][items]
+            assert all(conforms(spec, record, schema) for record in result.pop(items)), endpoint['method_name']
+        if endpoint['response_schema'] is not None:
+            assert conforms(spec, result, endpoint['response_schema']), endpoint['method_name']
+
+
+def test_ids_reads_return_one_record_per_id_in_order(spec):
+    ids = [f"a1E{i:015d}" for i in range(5)]
+
+    async def scenario():
+        async with MockDocrioServer(spec) as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                return await client.getFilesInfo(','.join(ids))
+
+    assert [record['Id'] for record in run(scenario)['Records']] == ids
+
+
+def test_signed_url_upload_flow(spec):
+    async def scenario():
+        server = MockDocrioServer(spec)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                created = await client.postFiles([{'Name': 'a.txt'}, {'Name': 'b.txt'}])
+                uploaded = await client.transport.send('PUT', created['a.txt']['SignedUrl'], b'hello')
+                completed = await client.postFilesComplete({'Ids': [created['a.txt']['Id'], created['b.txt']['Id']]})
+                downloads = await client.getFiles(created['a.txt']['Id'])
+                downloaded = await client.transport.send('GET', downloads['Records'][0]['SignedUrl'])
+        return created, uploaded, completed, downloaded
+
+    created, uploaded, completed, downloaded = run(scenario)
+    assert uploaded.status == 200
+    assert [record['Id'] for record in completed['Successes']] == [created['a.txt']['Id']]
+    assert completed['Failures'] == [created['b.txt']['Id']]
+    assert downloaded.body == b'hello'
+
+
+def test_multipart_flow_with_refresh(spec):
+    async def scenario():
+        async with MockDocrioServer(spec) as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                started = (await client.postMultipart([{'Name': 'big.bin', 'Parts': 3,
+                                                        'litify_docs__File_Type__c': 'application/pdf'}]))['big.bin']
+                refreshed = (await client.putMultipartRefresh({'Id': started['Id'], 'UploadId': started['UploadId'],
+                                                               'StartIndex': 1, 'EndIndex': 3}))['big.bin']
+                urls = started['SignedUrls'][:1] + refreshed['SignedUrls']
+                parts = []
+                for number, (url, chunk) in enumerate(zip(urls, (b'one-', b'two-', b'three')), 1):
+                    response = await client.transport.send('PUT', url, chunk)
+                    parts.append({'PartNumber': number, 'ETag': response.headers['etag']})
+                completed = await client.postMultipartComplete({
+                    'Ids': [started['Id']], started['Id']: {'UploadId': started['UploadId'], 'Parts': parts}})
+                downloads = await client.getFiles(started['Id'])
+                downloaded = await client.transport.send('GET', downloads['Records'][0]['SignedUrl'])
+        return started, refreshed, completed, downloaded
+
+    started, refreshed, completed, downloaded = run(scenario)
+    assert len(started['SignedUrls']) == 3
+    assert len(refreshed['SignedUrls']) == 2
+    assert [record['Id'] for record in completed['Successes']] == [started['Id']]
+    assert downloaded.body == b'one-two-three'
+
+
+def test_expired_signed_urls_are_rejected(spec):
+    async def scenario():
+        async with MockDocrioServer(spec, signed_url_ttl=0.05) as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                created = await client.postFiles([{'Name': 'a.txt'}])
+                await asyncio.sleep(0.1)
+                return await client.transport.send('PUT', created['a.txt']['SignedUrl'], b'late')
+
+    assert run(scenario).status == 403
+
+
+def test_throttling_answers_429_with_retry_after(spec):
+    async def scenario():
+        async with MockDocrioServer(spec, rate_limit=5, retry_after=2) as base_url:
+            transport = DocrioTransport(base_url, {'Authorization': 'Bearer token', 'X-API-KEY': 'key'})
+            responses = [await transport.send('GET', f"{base_url}/folders?Id=a1E000000000001AAA") for _ in range(8)]
+            await transport.close()
+            return responses
+
+    responses = run(scenario)
+    assert [response.status for response in responses[:5]] == [200] * 5
+    throttled = [response for response in responses[5:] if response.status == 429]
+    assert throttled
+    assert int(throttled[0].headers['retry-after']) >= 1
+
+
+def test_command_line_sets_the_retry_after_of_injected_429s():
+    async def scenario():
+        server = server_from_args(['--spec', SWAGGER_FILE, '--port', '0', '--throttle-rate', '1',
+                                   '--retry-after', '6.5'])
+        async with server as base_url:
+            transport = DocrioTransport(base_url, {'Authorization': 'Bearer token', 'X-API-KEY': 'key'})
+            response = await transport.send('GET', f"{base_url}/folders?Id=a1E000000000001AAA")
+            await transport.close()
+            return response
+
+    response = run(scenario)
+    assert response.status == 429 and response.headers['retry-after'] == '7'
+
+
+def test_injected_errors_and_missing_auth(spec):
+    async def scenario():
+        async with MockDocrioServer(spec, error_rate=1.0) as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                with pytest.raises(DocrioApiError) as server_error:
+                    await client.getFolders('a1E000000000001AAA')
+            anonymous = DocrioTransport(base_url)
+            with pytest.raises(DocrioApiError) as auth_error:
+                await anonymous.request('GET', '/folders', {'Id': 'a1E000000000001AAA'})
+            await anonymous.close()
+        return server_error.value.status, auth_error.value.status
+
+    assert run(scenario) == (500, 401)
+
+
+def test_connection_cap_bounds_concurrent_connections(spec):
+    async def scenario():
+        server = MockDocrioServer(spec, latency='fixed:10', max_connections=3)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url, limit_per_host=10) as client:
+                await asyncio.gather(*(client.getVersions('a1E000000000001AAA') for _ in range(30)))
+        return server.stats()
+
+    stats = run(scenario)
+    assert stats['requests']['getVersions'] == 30
+    assert stats['peak_connections'] <= 3
+
+
+def test_latency_models():
+    rng = random.Random(0)
+    assert LatencyModel('fixed:25').sample(rng) == 0.025
+    assert all(0.01 <= LatencyModel('uniform:10:20').sample(rng) <= 0.02 for _ in range(100))
+    assert all(LatencyModel('normal:1:50').sample(rng) >= 0 for _ in range(100))
+    samples = sorted(LatencyModel('lognormal:40:0.5').sample(rng) for _ in range(1001))
+    assert 0.03 < samples[500] < 0.05
+    with pytest.raises(ValueError):
+        LatencyModel('pareto:1')
@@ -0,0 +1,85 @@
+"""Tests for the lazy Offset* paginators of the generated Python client."""
+import asyncio
+
+from docrio_client import DocrioAsyncClient
+from docrio_client.pagination import next_offset, page_items, paginate
+from docrio_mock_server import MockDocrioServer
+
+RELATED_ID = 'a0U000000000001AAA'
+
+
+def test_cursor_helpers():
+    page = {'Records': [{'Id': '1'}], 'NextBatch': {'OffsetId': '1', 'OffsetValue': 'A.pdf'}}
+    assert next_offset(page, 'NextBatch', ['OffsetId', 'OffsetValue']) == {'OffsetId': '1', 'OffsetValue': 'A.pdf'}
+    assert next_offset({'Records': [], 'NextBatch': {}}, 'NextBatch', ['OffsetId']) is None
+    assert page_items({'Records': {'Id': '1'}}, 'Records') == [{'Id': '1'}]
+    assert page_items({}, 'Records') == []
+
+
+def test_stuck_cursor_stops():
+    calls = []
+
+    async def fetch(offset):
+        calls.append(offset)
+        return {'Records': [{'Id': '1'}], 'NextBatch': {'OffsetId': '1'}}
+
+    async def scenario():
+        return [record async for record in paginate(fetch, 'NextBatch', 'Records', ['OffsetId'])]
+
+    assert len(asyncio.run(scenario())) == 2
+    assert calls == [{}, {'OffsetId': '1'}]
+
+
+def test_iterator_walks_every_page_in_order(spec):
+    async def scenario():
+        server = MockDocrioServer(spec, related_files=250)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                names = [record['Name'] async for record in
+                         client.getFilesRelatedIter(RELATED_ID, MaxFiles=40, Fields='Name')]
+                descending = [record async for record in
+                              client.getFilesRelatedIter(RELATED_ID, SortDirection='DESC', MaxFiles=100)]
+        return server.stats(), names, descending
+
+    stats, names, descending = asyncio.run(scenario())
+    assert names == [f"File {number:06d}.pdf" for number in range(250)]
+    assert [record['Name'] for record in descending] == names[::-1]
+    assert stats['requests']['getFilesRelated'] == 7 + 3
+
+
+def test_projection_keeps_only_requested_fields(spec):
+    async def scenario():
+        async with MockDocrioServer(spec, related_files=5) as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                return [record async for record in client.getFilesRelatedIter(RELATED_ID, Fields='Name,OwnerId')]
+
+    assert all(set(record) == {'Id', 'Name', 'OwnerId'} for record in asyncio.run(scenario()))
+
+
+def test_prefetch_overlaps_page_latency(spec):
+    async def walk(prefetch):
+        async with MockDocrioServer(spec, related_files=100, latency='fixed:40') as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                started = asyncio.get_running_loop().time()
+                async for _ in client.getFilesRelatedIter(RELATED_ID, MaxFiles=20, prefetch=prefetch):
+                    # Per-record work: 20 records take as long as one page request
+                    await asyncio.sleep(0.002)
+                return asyncio.get_running_loop().time() - started
+
+    serial, overlapped = asyncio.run(walk(False)), asyncio.run(walk(True))
+    assert overlapped < serial * 0.8
+
+
+def test_abandoned_iteration_cancels_the_prefetch(spec):
+    async def scenario():
+        server = MockDocrioServer(spec, related_files=100, latency='fixed:20')
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                pages = client.getFilesRelatedIter(RELATED_ID, MaxFiles=10)
+                async for _ in pages:
+                    break
+                await pages.aclose()
+                await asyncio.sleep(0.05)
+        return server.stats()
+
+    assert asyncio.run(scenario())['requests']['getFilesRelated'] <= 2
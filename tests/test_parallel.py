@@ -0,0 +1,43 @@
+"""Parallel generation must write exactly what a serial run writes."""
+import os
+
+import pytest
+
+from codegen_parallel import create_pool
+from conftest import SWAGGER_FILE
+from generate_docrio import generate_spec
+
+
+def generated_files(tmp_path, name: str, jobs: int, shard_models: bool) -> dict:
+    """Run every backend with jobs workers and return {relative path: bytes} of what it wrote"""
+    output_dir = tmp_path / name
+    pool = create_pool(jobs)
+    batches = []
+    if pool is not None:
+        submit = pool.submit
+        pool.submit = lambda *args: batches.append(args) or submit(*args)
+    try:
+        generate_spec(SWAGGER_FILE, str(output_dir / 'classes'), str(output_dir / '.codegen'), False, pool,
+                      shard_models=shard_models, python_dir=str(output_dir / 'python'))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    # Make sure the parallel run really rendered in the workers
+    assert bool(batches) == (jobs != 1)
+    files = {}
+    for directory, _, names in os.walk(output_dir):
+        for filename in names:
+            path = os.path.join(directory, filename)
+            with open(path, 'rb') as f:
+                files[os.path.relpath(path, output_dir)] = f.read()
+    return files
+
+
+@pytest.mark.parametrize('shard_models', [False, True])
+def test_parallel_output_is_identical_to_serial(tmp_path, shard_models):
+    serial = generated_files(tmp_path, 'serial', 1, shard_models)
+    parallel = generated_files(tmp_path, 'parallel', 2, shard_models)
+    assert 'classes/DocrioService.cls' in serial and 'python/validators.py' in serial
+    assert sorted(parallel) == sorted(serial)
+    for path, content in serial.items():
+        assert parallel[path] == content, path
@@ -0,0 +1,142 @@
+"""Golden-file and transport tests for the generated asyncio Python client."""
+import asyncio
+import json
+import os
+
+import pytest
+
+from conftest import ROOT
+from docrio_client import DocrioApiError, DocrioAsyncClient
+from generate_docrio_python import PythonClientGenerator
+
+
+class RecordingServer:
+    """Minimal keep-alive HTTP/1.1 server that echoes each request as JSON"""
+
+    def __init__(self, delay: float = 0.0, chunked: bool = False, status: int = 200):
+        self.delay = delay
+        self.chunked = chunked
+        self.status = status
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+        self.requests = []
+        self.server = None
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get('content-length', '0')))
+            method, target, _ = request_line.decode('latin-1').split(' ')
+            self.requests.append({'method': method, 'target': target, 'headers': headers})
+
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            await asyncio.sleep(self.delay)
+            self.active -= 1
+
+            payload = json.dumps({'method': method, 'target': target,
+                                  'body': json.loads(body) if body else None}).encode('utf-8')
+            head = f"HTTP/1.1 {self.status} OK\r\nContent-Type: application/json\r\n"
+            if self.chunked:
+                half = len(payload) // 2
+                writer.write(f"{head}Transfer-Encoding: chunked\r\n\r\n".encode('latin-1'))
+                for part in (payload[:half], payload[half:]):
+                    writer.write(f"{len(part):x}\r\n".encode('latin-1') + part + b'\r\n')
+                writer.write(b'0\r\n\r\n')
+            else:
+                writer.write(f"{head}Content-Length: {len(payload)}\r\n\r\n".encode('latin-1') + payload)
+            await writer.drain()
+        writer.close()
+
+    async def __aenter__(self) -> str:
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/v1"
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+def test_matches_checked_in_module(spec, tmp_path):
+    generator = PythonClientGenerator(spec)
+    generator.output_dir = str(tmp_path)
+    generator.generate()
+    with open(os.path.join(tmp_path, 'client.py'), 'r') as generated:
+        with open(os.path.join(ROOT, 'docrio_client', 'client.py'), 'r') as checked_in:
+            assert generated.read() == checked_in.read()
+
+
+def test_one_coroutine_per_operation(spec):
+    for endpoint in spec.endpoints:
+        method = getattr(DocrioAsyncClient, endpoint['method_name'])
+        assert asyncio.iscoroutinefunction(method), endpoint['method_name']
+
+
+def test_requests_carry_auth_query_and_body():
+    async def scenario():
+        server = RecordingServer()
+        async with server as base_url:
+            async with DocrioAsyncClient('token-123', 'key-456', base_url) as client:
+                info = await client.getFilesInfo('a1e000000000001AAA,a1e000000000002ABA')
+                status = await client.getArchiveStatus('job/1')
+                created = await client.postFolders({'Name': 'Folder'})
+        return server, info, status, created
+
+    server, info, status, created = asyncio.run(scenario())
+    assert info['target'] == '/v1/files/info?Ids=a1e000000000001AAA%2Ca1e000000000002ABA'
+    assert status['target'] == '/v1/archive/status/job%2F1'
+    assert created == {'method': 'POST', 'target': '/v1/folders', 'body': {'Name': 'Folder'}}
+    headers = server.requests[0]['headers']
+    assert headers['authorization'] == 'Bearer token-123'
+    assert headers['x-api-key'] == 'key-456'
+
+
+def test_concurrent_calls_share_bounded_keep_alive_connections():
+    async def scenario():
+        server = RecordingServer(delay=0.01)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url, limit=20, limit_per_host=4) as client:
+                results = await asyncio.gather(*(client.getVersions(f"a1e{i:015d}") for i in range(60)))
+                pool = client.transport.pool
+        return server, results, pool
+
+    server, results, pool = asyncio.run(scenario())
+    assert [result['target'] for result in results] == [f"/v1/versions?Id=a1e{i:015d}" for i in range(60)]
+    assert server.max_active <= 4
+    assert server.connections == pool.opened <= 4
+    assert pool.reused == 60 - pool.opened
+
+
+def test_chunked_responses_are_decoded():
+    async def scenario():
+        async with RecordingServer(chunked=True) as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                return await asyncio.gather(client.getHistory('a1e000000000001AAA'),
+                                            client.getHistory('a1e000000000002ABA'))
+
+    first, second = asyncio.run(scenario())
+    assert first['target'] == '/v1/history?Id=a1e000000000001AAA'
+    assert second['target'] == '/v1/history?Id=a1e000000000002ABA'
+
+
+def test_error_status_raises():
+    async def scenario():
+        async with RecordingServer(status=429) as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                await client.getFolders('a1e000000000001AAA')
+
+    with pytest.raises(DocrioApiError) as error:
+        asyncio.run(scenario())
+    assert error.value.status == 429
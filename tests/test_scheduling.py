@@ -0,0 +1,103 @@
+"""Tests for the per-family rate limiter and retry scheduler."""
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+
+from docrio_client import DocrioApiError, DocrioAsyncClient, FamilyLimiter, MetricsRecorder, RequestScheduler
+from docrio_client.scheduling import operation_family, retry_after_seconds
+from docrio_mock_server import MockDocrioServer
+
+FILE_ID = 'a1D000000000001AAA'
+
+
+def test_retry_after_parsing():
+    assert retry_after_seconds('3') == 3.0
+    assert retry_after_seconds('-1') == 0.0
+    assert 55 <= retry_after_seconds(formatdate(time.time() + 60, usegmt=True)) <= 60
+    assert retry_after_seconds('soon') is None
+    assert retry_after_seconds(None) is None
+
+
+def test_operation_family():
+    assert operation_family('/files/info') == 'files'
+    assert operation_family('/archive/status/job-1') == 'archive'
+    assert operation_family('/') == '/'
+
+
+def test_limit_grows_additively_and_halves_once_per_burst():
+    async def scenario():
+        limiter = FamilyLimiter(concurrency=4, max_concurrency=8)
+        epochs = [await limiter.acquire() for _ in range(4)]
+        for epoch in epochs:
+            await limiter.release(epoch, ok=True)
+        grown = limiter.limit
+        # Four calls in flight are all throttled: only the first cuts the limit
+        epochs = [await limiter.acquire() for _ in range(4)]
+        for epoch in epochs:
+            await limiter.release(epoch, ok=False)
+        return grown, limiter
+
+    grown, limiter = asyncio.run(scenario())
+    assert 4.9 < grown < 5.0
+    assert limiter.limit == grown / 2
+    assert limiter.throttled == 4 and limiter.active == 0
+
+
+def test_idempotent_calls_are_retried_until_they_succeed(spec):
+    scheduler = RequestScheduler(backoff=0.001, max_retries=20, seed=1)
+    recorder = MetricsRecorder()
+
+    async def scenario():
+        server = MockDocrioServer(spec, throttle_rate=0.3, error_rate=0.1, retry_after=0)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url, scheduler=scheduler,
+                                         instrumentation=recorder) as client:
+                await asyncio.gather(*(client.getFiles(Ids=FILE_ID) for _ in range(40)))
+        return server.stats()
+
+    stats = asyncio.run(scenario())
+    failures = stats['statuses'].get(429, 0) + stats['statuses'].get(500, 0)
+    assert failures > 0 and stats['statuses'][200] == 40
+    assert scheduler.retries == failures
+    assert recorder.snapshot()['operations']['getFiles']['retries'] == failures
+
+
+def test_non_idempotent_calls_are_not_retried(spec):
+    scheduler = RequestScheduler(backoff=0.001)
+
+    async def scenario():
+        server = MockDocrioServer(spec, throttle_rate=1.0, retry_after=0)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url, scheduler=scheduler) as client:
+                await client.postMerge({'Templates': [{'SourceId': FILE_ID}]})
+
+    with pytest.raises(DocrioApiError) as error:
+        asyncio.run(scenario())
+    assert error.value.status == 429
+    assert scheduler.retries == 0
+    assert scheduler.limiters['merge'].throttled == 1
+
+
+def test_throttled_family_backs_off_for_retry_after(spec):
+    scheduler = RequestScheduler(concurrency=16, backoff=0.001, seed=1)
+
+    async def scenario():
+        # 20 requests per second with a burst of 20; later requests get 429 with Retry-After: 1
+        server = MockDocrioServer(spec, rate_limit=20)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url, scheduler=scheduler) as client:
+                started = time.monotonic()
+                await asyncio.gather(*(client.getFiles(Ids=FILE_ID) for _ in range(30)))
+                elapsed = time.monotonic() - started
+        return server.stats(), elapsed
+
+    stats, elapsed = asyncio.run(scenario())
+    assert stats['statuses'][200] == 30
+    assert elapsed >= 1.0
+    # Once throttled, the family pauses instead of hammering: at most the calls already in flight get a 429
+    assert stats['statuses'][429] <= 16
+    files = scheduler.snapshot()['families']['files']
+    assert files['throttled'] == stats['statuses'][429]
+    assert files['limit'] < 16
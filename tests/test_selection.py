@@ -0,0 +1,83 @@
+"""Tests for --include operation selection, the reachability walk and the tree-shaking report."""
+import pytest
+
+from docrio_spec import DocrioSpec
+from generate_docrio import measure_output, report_tree_shaking
+from generate_docrio_models import ApexGenerator
+
+
+def ref(name: str) -> dict:
+    return {'$ref': f"#/components/schemas/{name}"}
+
+
+def json_body(schema: dict) -> dict:
+    return {'content': {'application/json': {'schema': schema}}}
+
+
+# A tree whose nodes list their children, a chain of three schemas that loops back, and an unrelated operation
+TREE_SWAGGER = {
+    'openapi': '3.0.0',
+    'info': {'title': 'Trees', 'version': '1'},
+    'paths': {
+        '/tree': {'post': {'tags': ['Trees'], 'operationId': 'postTree', 'requestBody': json_body(ref('Node')),
+                           'responses': {'200': dict(json_body(ref('Node')), description='ok')}}},
+        '/loop': {'get': {'tags': ['Loops'], 'operationId': 'getLoop',
+                          'responses': {'200': dict(json_body(ref('First')), description='ok')}}},
+        '/other': {'get': {'tags': ['Other'], 'operationId': 'getOther',
+                           'responses': {'200': dict(json_body(ref('Other')), description='ok')}}},
+    },
+    'components': {'schemas': {
+        'Node': {'type': 'object', 'properties': {'Name': {'type': 'string'},
+                                                  'Children': {'type': 'array', 'items': ref('Node')}}},
+        'First': {'type': 'object', 'properties': {'Next': ref('Second')}},
+        'Second': {'type': 'object', 'properties': {'Next': ref('Third')}},
+        'Third': {'type': 'object', 'properties': {'Back': ref('First'), 'Leaf': ref('Other')}},
+        'Other': {'type': 'object', 'properties': {'Value': {'type': 'string'}}},
+    }},
+}
+
+
+def test_self_referencing_schema_is_reached_once():
+    spec = DocrioSpec(TREE_SWAGGER)
+    assert spec.reachable_schemas(['Node']) == ({'Node'}, [['Node', 'Node']])
+    subset = spec.select(['Trees'])
+    assert [endpoint['method_name'] for endpoint in subset.endpoints] == ['postTree']
+    assert subset.model_names == {'Node'}
+    node_class = ApexGenerator(subset).generate_inner_class('Node', subset.schemas['Node'])
+    assert 'public List<DocrioModels.Node> Children' in node_class
+
+
+def test_longer_cycles_are_walked_to_their_leaves():
+    reachable, cycles = DocrioSpec(TREE_SWAGGER).reachable_schemas(['First'])
+    assert reachable == {'First', 'Second', 'Third', 'Other'}
+    assert cycles == [['First', 'Second', 'Third', 'First']]
+
+
+def test_report_counts_what_narrowing_saved(capsys):
+    full = DocrioSpec(TREE_SWAGGER)
+    subset = full.select(['/tree'])
+    (full_lines, full_chars), (kept_lines, kept_chars) = measure_output(full), measure_output(subset)
+    report_tree_shaking(full, subset)
+    report = capsys.readouterr().out.splitlines()
+    assert report[0] == 'Kept 1/3 operations and 1/5 model classes'
+    assert report[1].startswith(f"Saved {full_lines - kept_lines} lines and {full_chars - kept_chars} characters")
+    assert report[2] == '$ref cycle: Node -> Node'
+
+
+def test_selectors(spec):
+    def selected(*include):
+        return {endpoint['method_name'] for endpoint in spec.select(include).endpoints}
+
+    by_path = selected('/files', '/search')
+    assert by_path and selected('Files', 'Search') == by_path == selected('files', 'SEARCH')
+    assert selected('File Management') == selected('file management') == selected('File')
+    assert selected('Archival') == selected('Archival Tool')
+    assert selected('postMove') == {'postMove'}
+    # Selectors are whole words or path segments, not substrings
+    assert not selected('Fil') and not selected('/file')
+
+
+@pytest.mark.parametrize('include, models', [(['Loops'], {'First', 'Second', 'Third', 'Other'}),
+                                             (['getOther'], {'Other'})])
+def test_selection_keeps_only_reachable_models(include, models):
+    assert DocrioSpec(TREE_SWAGGER).select(include).model_names == models
@@ -0,0 +1,65 @@
+"""Golden-file tests for the generated DocrioService class."""
+import os
+import re
+
+import pytest
+
+from conftest import CLASSES_DIR, SWAGGER_FILE
+from docrio_spec import DocrioSpec
+from generate_docrio_service import UNTYPED_RESPONSE, ServiceGenerator
+
+METHOD_PATTERN = re.compile(r'    public static (.+?) (\w+)\(.*?\) \{\n(.*?)\n    \}\n', re.S)
+
+
+def generated_service(spec: DocrioSpec, output_dir: str) -> str:
+    generator = ServiceGenerator(spec)
+    generator.output_dir = output_dir
+    generator.generate()
+    with open(os.path.join(output_dir, 'DocrioService.cls'), 'r') as f:
+        return f.read()
+
+
+def service_methods(source: str):
+    return [(match.group(1), match.group(2), match.group(3)) for match in METHOD_PATTERN.finditer(source)]
+
+
+@pytest.fixture(scope='module')
+def service_source(spec, tmp_path_factory) -> str:
+    return generated_service(spec, str(tmp_path_factory.mktemp('service')))
+
+
+def test_matches_checked_in_class(service_source):
+    with open(os.path.join(CLASSES_DIR, 'DocrioService.cls'), 'r') as f:
+        assert service_source == f.read()
+
+
+def test_every_operation_has_a_method(spec, service_source):
+    names = [name for _, name, _ in service_methods(service_source)]
+    assert names == [endpoint['method_name'] for tag in sorted(spec.endpoints_by_tag)
+                     for endpoint in spec.endpoints_by_tag[tag]]
+
+
+def test_no_method_reserializes_a_response(service_source):
+    assert 'JSON.serialize(response)' not in service_source
+    for _, name, body in service_methods(service_source):
+        assert 'JSON.serialize(response' not in body, name
+
+
+def test_typed_methods_deserialize_the_raw_body(service_source):
+    for return_type, name, body in service_methods(service_source):
+        if return_type == 'void':
+            assert 'client.doCalloutRaw(' in body, name
+            assert 'JSON.deserialize' not in body, name
+        elif return_type == UNTYPED_RESPONSE:
+            assert 'return client.doCallout(' in body, name
+        else:
+            assert 'String responseBody = client.doCalloutRaw(' in body, name
+            assert f"JSON.deserialize(responseBody, {return_type}.class)" in body, name
+            assert 'JSON.deserializeUntyped' not in body, name
+
+
+def test_sharded_service_references_sharded_models(tmp_path):
+    spec = DocrioSpec.load(SWAGGER_FILE, sharded=True)
+    source = generated_service(spec, str(tmp_path))
+    assert 'DocrioModels.' not in source
+    assert 'JSON.serialize(response)' not in source
@@ -0,0 +1,31 @@
+"""Switching to and from sharded models retires stale model classes and moves references with them."""
+import filecmp
+import os
+import re
+import shutil
+
+from conftest import CLASSES_DIR, SWAGGER_FILE
+from generate_docrio import generate_spec
+
+REFERENCE = re.compile(r"\b(Docrio\w*Models)\.(\w+)")
+
+
+def test_sharding_round_trip(tmp_path):
+    output_dir = str(tmp_path / 'classes')
+    shutil.copytree(CLASSES_DIR, output_dir)
+
+    generate_spec(SWAGGER_FILE, output_dir, str(tmp_path / '.codegen'), False, shard_models=True)
+    assert not os.path.exists(os.path.join(output_dir, 'DocrioModels.cls'))
+    assert not os.path.exists(os.path.join(output_dir, 'DocrioModels.cls-meta.xml'))
+    with open(os.path.join(output_dir, 'DocrioClientTest.cls'), 'r') as f:
+        references = set(REFERENCE.findall(f.read()))
+    assert references and all(outer != 'DocrioModels' for outer, _ in references)
+    # Every reference in the hand-written test names a class that holds the model
+    for outer, name in references:
+        with open(os.path.join(output_dir, f"{outer}.cls"), 'r') as f:
+            assert f"public class {name} {{" in f.read()
+
+    generate_spec(SWAGGER_FILE, output_dir, str(tmp_path / '.codegen'), False)
+    comparison = filecmp.dircmp(output_dir, CLASSES_DIR)
+    assert not comparison.left_only and not comparison.right_only
+    assert not filecmp.cmpfiles(output_dir, CLASSES_DIR, comparison.common_files, shallow=False)[1]
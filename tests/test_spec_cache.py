@@ -0,0 +1,95 @@
+"""Tests for the persistent compiled-spec cache."""
+import os
+import shutil
+
+from codegen_cache import SpecCache
+from conftest import CLASSES_DIR, SWAGGER_FILE
+from generate_docrio import spec_cache_sources
+from generate_docrio_models import ApexGenerator
+
+
+def generated_models(spec, output_dir) -> str:
+    generator = ApexGenerator(spec)
+    generator.output_dir = str(output_dir)
+    generator.generate()
+    with open(os.path.join(output_dir, 'DocrioModels.cls'), 'r') as f:
+        return f.read()
+
+
+def test_warm_load_skips_compiling_and_preparing(tmp_path):
+    cold = SpecCache(str(tmp_path / 'cache'), *spec_cache_sources())
+    spec = cold.load(SWAGGER_FILE)
+    generated_models(spec, tmp_path / 'cold')
+    cold.save()
+    assert (cold.hits, cold.misses) == (0, 1)
+
+    warm = SpecCache(str(tmp_path / 'cache'), *spec_cache_sources())
+    cached = warm.load(SWAGGER_FILE)
+    assert (warm.hits, warm.misses) == (1, 0)
+    assert 'apex_models' in cached.resolved
+    assert [e['method_name'] for e in cached.endpoints] == [e['method_name'] for e in spec.endpoints]
+    with open(os.path.join(CLASSES_DIR, 'DocrioModels.cls'), 'r') as f:
+        assert generated_models(cached, tmp_path / 'warm') == f.read()
+
+
+def test_sharded_and_narrowed_specs_are_separate_entries(tmp_path):
+    cache = SpecCache(str(tmp_path), *spec_cache_sources())
+    full = cache.load(SWAGGER_FILE)
+    subset = cache.load(SWAGGER_FILE, ['/files'], True)
+    cache.save()
+    again = SpecCache(str(tmp_path), *spec_cache_sources())
+    cached = again.load(SWAGGER_FILE, ['/files'], True)
+    assert again.hits == 1
+    assert cached.sharded and len(cached.endpoints) == len(subset.endpoints) < len(full.endpoints)
+    assert cached.model_classes == subset.model_classes
+
+
+def test_spec_or_generator_changes_miss(tmp_path):
+    spec_file = str(tmp_path / 'swagger.json')
+    shutil.copy(SWAGGER_FILE, spec_file)
+    generator_file = str(tmp_path / 'generator.py')
+    with open(generator_file, 'w') as f:
+        f.write('VERSION = 1\n')
+    cache = SpecCache(str(tmp_path / 'cache'), generator_file)
+    cache.load(spec_file)
+    cache.save()
+
+    with open(spec_file, 'a') as f:
+        f.write('\n')
+    edited = SpecCache(str(tmp_path / 'cache'), generator_file)
+    edited.load(spec_file)
+    assert edited.misses == 1
+    edited.save()
+
+    with open(generator_file, 'w') as f:
+        f.write('VERSION = 2\n')
+    upgraded = SpecCache(str(tmp_path / 'cache'), generator_file)
+    upgraded.load(spec_file)
+    assert upgraded.misses == 1
+
+
+def test_unreadable_entries_are_recompiled(tmp_path):
+    cache = SpecCache(str(tmp_path), *spec_cache_sources())
+    entry_file = cache.entry_file(SWAGGER_FILE, None, False)
+    with open(entry_file, 'wb') as f:
+        f.write(b'DOCRIOSPEC1\n\x80\x05truncated')
+    assert cache.load(SWAGGER_FILE).endpoints
+    assert cache.misses == 1
+    cache.save()
+    assert SpecCache(str(tmp_path), *spec_cache_sources()).read(entry_file) is not None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = SpecCache(str(tmp_path / 'cache'), *spec_cache_sources(), max_entries=2)
+    spec_files = []
+    for i in range(3):
+        spec_file = str(tmp_path / f"swagger{i}.json")
+        with open(SWAGGER_FILE, 'r') as source, open(spec_file, 'w') as f:
+            f.write(source.read() + ' ' * i)
+        spec_files.append(spec_file)
+        cache.load(spec_file)
+        cache.save()
+        os.utime(cache.entry_file(spec_file, None, False), (i, i))
+    cache.evict()
+    kept = sorted(os.listdir(tmp_path / 'cache'))
+    assert kept == sorted(os.path.basename(cache.entry_file(f, None, False)) for f in spec_files[1:])
@@ -0,0 +1,141 @@
+"""Tests for the multipart upload engine against the mock Docrio server."""
+import asyncio
+import os
+
+import pytest
+
+from docrio_client import DocrioAsyncClient
+from docrio_client.uploads import (JOURNAL_SUFFIX, MAX_PARTS, MultipartUploader, UploadJournal, part_count,
+                                   part_size_for)
+from docrio_mock_server import MockDocrioServer
+
+PART_SIZE = 64 * 1024
+
+
+class InterruptingUploader(MultipartUploader):
+    """Fails once a given number of parts were uploaded, like a process killed mid-upload"""
+
+    def __init__(self, client, fail_after: int, **options):
+        super().__init__(client, **options)
+        self.fail_after = fail_after
+
+    async def upload_part(self, body, number, urls, journal):
+        if self.parts_uploaded >= self.fail_after:
+            raise RuntimeError('interrupted')
+        await super().upload_part(body, number, urls, journal)
+
+
+class SlowUploader(MultipartUploader):
+    """Waits before every part so short-lived signed URLs expire"""
+
+    async def upload_part(self, body, number, urls, journal):
+        await asyncio.sleep(0.06)
+        await super().upload_part(body, number, urls, journal)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'big.bin'
+    path.write_bytes(os.urandom(PART_SIZE * 10 + 123))
+    return str(path)
+
+
+async def download(client, file_id):
+    records = (await client.getFiles(file_id))['Records']
+    return (await client.transport.send('GET', records[0]['SignedUrl'])).body
+
+
+def test_part_math():
+    assert part_count(0, PART_SIZE) == 1
+    assert part_count(PART_SIZE, PART_SIZE) == 1
+    assert part_count(PART_SIZE + 1, PART_SIZE) == 2
+    assert part_size_for(PART_SIZE * MAX_PARTS, PART_SIZE) == PART_SIZE
+    assert part_size_for(PART_SIZE * MAX_PARTS + 1, PART_SIZE) == PART_SIZE * 2
+
+
+def test_concurrent_upload_round_trips(spec, source):
+    async def scenario():
+        server = MockDocrioServer(spec, latency='fixed:5')
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                uploader = MultipartUploader(client, part_size=PART_SIZE, concurrency=4)
+                record = await uploader.upload(source, litify_docs__File_Type__c='application/octet-stream')
+                return server.stats(), uploader, record, await download(client, record['Id'])
+
+    stats, uploader, record, content = asyncio.run(scenario())
+    with open(source, 'rb') as file:
+        assert content == file.read()
+    assert record['Name'] == 'big.bin'
+    assert uploader.parts_uploaded == 11
+    assert stats['requests']['postMultipart'] == 1
+    assert not os.path.exists(source + JOURNAL_SUFFIX)
+
+
+def test_resume_uploads_only_missing_parts(spec, source):
+    async def scenario():
+        server = MockDocrioServer(spec)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                with pytest.raises(RuntimeError):
+                    await InterruptingUploader(client, 4, part_size=PART_SIZE, concurrency=1).upload(source)
+                journal = UploadJournal(source + JOURNAL_SUFFIX)
+                with open(journal.path) as f:
+                    journaled = len(f.read().splitlines()) - 1
+                uploader = MultipartUploader(client, part_size=PART_SIZE, concurrency=3)
+                record = await uploader.upload(source)
+                return server.stats(), journaled, uploader, await download(client, record['Id'])
+
+    stats, journaled, uploader, content = asyncio.run(scenario())
+    with open(source, 'rb') as file:
+        assert content == file.read()
+    assert journaled == 4
+    assert uploader.parts_uploaded == 11 - 4
+    assert stats['requests']['postMultipart'] == 1
+    assert stats['requests']['putMultipartRefresh'] >= 1
+
+
+def test_changed_file_starts_a_new_upload(spec, source):
+    async def scenario():
+        server = MockDocrioServer(spec)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                with pytest.raises(RuntimeError):
+                    await InterruptingUploader(client, 2, part_size=PART_SIZE).upload(source)
+                with open(source, 'ab') as file:
+                    file.write(b'appended')
+                uploader = MultipartUploader(client, part_size=PART_SIZE)
+                await uploader.upload(source)
+                return server.stats(), uploader
+
+    stats, uploader = asyncio.run(scenario())
+    assert stats['requests']['postMultipart'] == 2
+    assert uploader.parts_uploaded == 11
+
+
+def test_expiring_urls_are_refreshed_before_use(spec, source):
+    async def scenario():
+        server = MockDocrioServer(spec, signed_url_ttl=0.2)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                # URLs with less than 0.1s left are renewed before the part is sent
+                uploader = SlowUploader(client, part_size=PART_SIZE, concurrency=1, refresh_margin=0.1)
+                await uploader.upload(source)
+                return server.stats(), uploader
+
+    stats, uploader = asyncio.run(scenario())
+    assert uploader.refreshes >= 1
+    assert 403 not in stats['statuses']
+
+
+def test_rejected_urls_are_refreshed(spec, source):
+    async def scenario():
+        async with MockDocrioServer(spec, signed_url_ttl=0.05) as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                uploader = SlowUploader(client, part_size=PART_SIZE, concurrency=2, refresh_margin=0)
+                record = await uploader.upload(source)
+                return uploader, await download(client, record['Id'])
+
+    uploader, content = asyncio.run(scenario())
+    with open(source, 'rb') as file:
+        assert content == file.read()
+    assert uploader.refreshes >= 1
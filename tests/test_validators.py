@@ -0,0 +1,81 @@
+"""Golden-file and behaviour tests for the generated request body validators."""
+import asyncio
+import json
+import os
+import random
+
+import pytest
+
+from conftest import ROOT
+from docrio_client import DocrioAsyncClient, RequestValidationError, validators
+from docrio_mock_server import MockDocrioServer, SyntheticData
+from docrio_spec import DocrioSpec
+from generate_docrio_python_validators import PythonValidatorGenerator
+
+
+def test_matches_checked_in_module(spec, tmp_path):
+    generator = PythonValidatorGenerator(spec)
+    generator.output_dir = str(tmp_path)
+    generator.generate()
+    with open(os.path.join(tmp_path, 'validators.py'), 'r') as generated:
+        with open(os.path.join(ROOT, 'docrio_client', 'validators.py'), 'r') as checked_in:
+            assert generated.read() == checked_in.read()
+
+
+def test_synthetic_bodies_are_valid(spec):
+    data = SyntheticData(spec, random.Random(3), array_items=3)
+    for name in PythonValidatorGenerator(spec).component_names():
+        validators.__dict__[f"validate_{name}"](data.value(spec.schemas[name]))
+
+
+def test_every_problem_is_reported():
+    body = {'Templates': [{'SourceId': 5, 'Tags': {'Name': 1}}, 'template'], 'Flatten': 'yes'}
+    with pytest.raises(RequestValidationError) as error:
+        validators.validate_MergePostRequest(body)
+    assert 'requestBody.Templates[0].SourceId: expected a string' in error.value.errors
+    assert 'requestBody.Templates[0].Tags.Name: expected a string' in error.value.errors
+    assert 'requestBody.Templates[1]: expected an object' in error.value.errors
+    with pytest.raises(RequestValidationError, match='requestBody: required'):
+        validators.validate_FilesPutRequest(None)
+
+
+def test_placeholder_keys_describe_other_properties():
+    part = {'PartNumber': 1, 'ETag': 'e1'}
+    body = {'Ids': ['a1D000000000001AAA'], 'a1D000000000001AAA': {'UploadId': 'u1', 'Parts': [part]}}
+    validators.validate_MultipartFilesCompletePostRequest(body)
+    body['a1D000000000002AAA'] = {'Parts': 'all'}
+    with pytest.raises(RequestValidationError) as error:
+        validators.validate_MultipartFilesCompletePostRequest(body)
+    assert error.value.errors == ['requestBody.a1D000000000002AAA.UploadId: required',
+                                  'requestBody.a1D000000000002AAA.Parts: expected an array']
+
+
+def test_client_rejects_bodies_before_sending(spec):
+    async def scenario():
+        server = MockDocrioServer(spec)
+        async with server as base_url:
+            async with DocrioAsyncClient('token', 'key', base_url) as client:
+                for call, body in [(client.putFiles, {'Name': 'x'}), (client.postMerge, {'Templates': {}})]:
+                    with pytest.raises(RequestValidationError):
+                        await call(body)
+                rejected = sum(server.stats()['requests'].values())
+            async with DocrioAsyncClient('token', 'key', base_url, validate_requests=False) as client:
+                await client.putFiles({'Name': 'x'})
+                return rejected, server.stats()['requests']
+
+    rejected, requests = asyncio.run(scenario())
+    assert rejected == 0
+    assert requests == {'putFiles': 1}
+
+
+def test_re_is_only_imported_for_patterns(tmp_path):
+    with open(os.path.join(ROOT, 'swagger.json'), 'r') as f:
+        swagger = json.load(f)
+    swagger['components']['schemas']['FilesPutRequest']['properties']['Id']['pattern'] = '^a1D[0-9A-Za-z]{15}$'
+    generator = PythonValidatorGenerator(DocrioSpec(swagger))
+    generator.output_dir = str(tmp_path)
+    generator.generate()
+    with open(os.path.join(tmp_path, 'validators.py'), 'r') as generated:
+        assert '\nimport re\n' in generated.read()
+    with open(os.path.join(ROOT, 'docrio_client', 'validators.py'), 'r') as checked_in:
+        assert '\nimport re\n' not in checked_in.read()